@@ -0,0 +1,51 @@
+"""schedule_metrics_rollups
+
+Revision ID: 5d2c7e9a41f3
+Revises: 8bb1b518a5ae
+Create Date: 2026-10-19 10:12:07.318452
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+# revision identifiers, used by Alembic.
+revision: str = '5d2c7e9a41f3'
+down_revision: Union[str, Sequence[str], None] = '8bb1b518a5ae'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('schedule_metrics_rollups',
+    sa.Column('granularity', sqlmodel.sql.sqltypes.AutoString(length=16), nullable=False),
+    sa.Column('bucket_start', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('event_count', sa.Integer(), nullable=False),
+    sa.Column('error_count', sa.Integer(), nullable=False),
+    sa.Column('duration_sum_ms', sa.Integer(), nullable=False),
+    sa.Column('duration_samples', sa.Integer(), nullable=False),
+    sa.Column('wait_time_sum_ms', sa.Integer(), nullable=False),
+    sa.Column('wait_time_samples', sa.Integer(), nullable=False),
+    sa.Column('reservation_time_sum_ms', sa.Integer(), nullable=False),
+    sa.Column('reservation_time_samples', sa.Integer(), nullable=False),
+    sa.Column('queue_depth_delta', sa.Integer(), nullable=False),
+    sa.Column('queue_depth', sa.Integer(), nullable=False),
+    sa.Column('max_queue_depth', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('granularity', 'bucket_start')
+    )
+    op.create_table('schedule_metrics_status_rollups',
+    sa.Column('granularity', sqlmodel.sql.sqltypes.AutoString(length=16), nullable=False),
+    sa.Column('bucket_start', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('status', sqlmodel.sql.sqltypes.AutoString(length=32), nullable=False),
+    sa.Column('event_count', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('granularity', 'bucket_start', 'status')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('schedule_metrics_status_rollups')
+    op.drop_table('schedule_metrics_rollups')
@@ -0,0 +1,28 @@
+"""index_reservation_expires_at
+
+Revision ID: 9e4b1f6c2a87
+Revises: 5d2c7e9a41f3
+Create Date: 2026-10-19 11:02:44.905113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '9e4b1f6c2a87'
+down_revision: Union[str, Sequence[str], None] = '5d2c7e9a41f3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('asset_reservations', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_asset_reservations_expires_at'), ['expires_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('asset_reservations', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_asset_reservations_expires_at'))
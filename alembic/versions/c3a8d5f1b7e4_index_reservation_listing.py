@@ -0,0 +1,30 @@
+"""index_reservation_listing
+
+Revision ID: c3a8d5f1b7e4
+Revises: 9e4b1f6c2a87
+Create Date: 2026-10-19 14:21:37.516204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3a8d5f1b7e4'
+down_revision: Union[str, Sequence[str], None] = '9e4b1f6c2a87'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('asset_reservations', schema=None) as batch_op:
+        batch_op.create_index('ix_asset_reservations_status_created_at', ['status', 'created_at'], unique=False)
+        batch_op.create_index('ix_asset_reservations_redis_lock_key_created_at', ['redis_lock_key', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('asset_reservations', schema=None) as batch_op:
+        batch_op.drop_index('ix_asset_reservations_redis_lock_key_created_at')
+        batch_op.drop_index('ix_asset_reservations_status_created_at')
@@ -40,7 +40,9 @@ class GlobalDependencies:
     """Initialize global scheduler components."""
     if config is None:
       config = PraxisConfiguration()
-    self.asset_lock_manager = AssetLockManager(config.redis_url)
+    self.asset_lock_manager = AssetLockManager(
+      None if config.is_lite_mode else config.redis_url,
+    )
     await self.asset_lock_manager.initialize()
     logger.info("AssetLockManager initialized.")
 
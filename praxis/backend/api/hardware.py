@@ -24,10 +24,19 @@ from praxis.backend.utils.logging import get_logger
 logger = get_logger(__name__)
 router = APIRouter()
 
-# Singleton service instance
+# Fallback when the application has not started a monitoring instance
 _discovery_service = HardwareDiscoveryService()
 
 
+def get_discovery_service(request: Request) -> HardwareDiscoveryService:
+  """Dependency to get the hardware discovery service.
+
+  Prefers the monitoring instance started with the application, whose cached
+  device view is returned without scanning.
+  """
+  return getattr(request.app.state, "hardware_discovery_service", None) or _discovery_service
+
+
 def get_connection_manager(request: Request) -> HardwareConnectionManager:
   """Dependency to get the hardware connection manager.
 
@@ -180,10 +189,12 @@ class HeartbeatResponse(BaseModel):
   summary="Discover available hardware",
   description="Scan for connected hardware devices including serial ports, USB, network, and simulators.",
 )
-async def discover_hardware() -> DiscoveryResponse:
+async def discover_hardware(
+  discovery_service: Annotated[HardwareDiscoveryService, Depends(get_discovery_service)],
+) -> DiscoveryResponse:
   """Discover all available hardware devices."""
   try:
-    devices = await _discovery_service.discover_all()
+    devices = await discovery_service.discover_all()
 
     # Convert dataclasses to response models
     device_responses = [
@@ -230,9 +241,11 @@ async def discover_hardware() -> DiscoveryResponse:
   summary="Discover serial devices",
   description="Scan for devices connected via serial/USB ports.",
 )
-async def discover_serial() -> list[DiscoveredDeviceResponse]:
+async def discover_serial(
+  discovery_service: Annotated[HardwareDiscoveryService, Depends(get_discovery_service)],
+) -> list[DiscoveredDeviceResponse]:
   """Discover serial/USB connected devices."""
-  devices = await _discovery_service.discover_serial_ports()
+  devices = await discovery_service.discover_serial_ports()
   return [
     DiscoveredDeviceResponse(
       id=d.id,
@@ -256,9 +269,11 @@ async def discover_serial() -> list[DiscoveredDeviceResponse]:
   summary="List available simulators",
   description="Get list of available PyLabRobot simulator backends.",
 )
-async def discover_simulators() -> list[DiscoveredDeviceResponse]:
+async def discover_simulators(
+  discovery_service: Annotated[HardwareDiscoveryService, Depends(get_discovery_service)],
+) -> list[DiscoveredDeviceResponse]:
   """List available simulator backends."""
-  devices = await _discovery_service.discover_simulators()
+  devices = await discovery_service.discover_simulators()
   return [
     DiscoveredDeviceResponse(
       id=d.id,
@@ -141,6 +141,27 @@ router.include_router(
 )
 
 
+@router.post(
+  "/bulk",
+  response_model=list[MachineRead],
+  status_code=status.HTTP_201_CREATED,
+  tags=["Machines"],
+)
+async def create_machines_bulk(
+  objs_in: list[MachineCreate],
+  db: Annotated[AsyncSession, Depends(get_db)],
+) -> list[MachineRead]:
+  """Import many machines at once, linking their resource counterparts in bulk."""
+  try:
+    machines = await machine_service.create_many(db, objs_in=objs_in)
+  except ValueError as e:
+    raise HTTPException(
+      status_code=status.HTTP_400_BAD_REQUEST,
+      detail=str(e),
+    ) from e
+  return [MachineRead.model_validate(machine) for machine in machines]
+
+
 router.include_router(
   create_crud_router(
     service=machine_service,
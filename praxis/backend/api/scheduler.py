@@ -1,8 +1,9 @@
+import base64
 from datetime import datetime, timezone
-from typing import Annotated
+from typing import Annotated, Any
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -10,22 +11,21 @@ from praxis.backend.api.dependencies import get_db
 from praxis.backend.api.utils.crud_router_factory import create_crud_router
 from praxis.backend.models.domain.schedule import (
   AssetReservation,
+  AssetReservationListResponse,
+  AssetReservationRead,
   ReleaseReservationResponse,
-  ResourceReservationStatus,
   ScheduleEntry,
   ScheduleEntryCreate,
   ScheduleEntryRead,
   ScheduleEntryUpdate,
   SchedulePriorityUpdateRequest,
 )
-from praxis.backend.models.domain.schedule import (
-  AssetReservationCreate as AssetReservationListResponse,  # Wait, ListResponse is likely a list container or alias
-)
-from praxis.backend.models.domain.schedule import (
-  AssetReservationRead as AssetReservationResponse,
+from praxis.backend.models.enums import AssetReservationStatusEnum, AssetType, ScheduleStatusEnum
+from praxis.backend.services.scheduler import (
+  count_asset_reservations,
+  list_asset_reservations_page,
+  schedule_entry_service,
 )
-from praxis.backend.models.enums import AssetReservationStatusEnum, ScheduleStatusEnum
-from praxis.backend.services.scheduler import schedule_entry_service
 from praxis.backend.utils.errors import AccessionNotFoundError, PraxisError
 
 router = APIRouter()
@@ -98,17 +98,22 @@ async def update_priority(
   return updated_entry
 
 
-def _orm_status_to_api_status(model_status: AssetReservationStatusEnum) -> ResourceReservationStatus:
-  """Convert ORM enum to API enum."""
-  mapping = {
-    AssetReservationStatusEnum.PENDING: ResourceReservationStatus.PENDING,
-    AssetReservationStatusEnum.RESERVED: ResourceReservationStatus.RESERVED,
-    AssetReservationStatusEnum.ACTIVE: ResourceReservationStatus.ACTIVE,
-    AssetReservationStatusEnum.RELEASED: ResourceReservationStatus.RELEASED,
-    AssetReservationStatusEnum.EXPIRED: ResourceReservationStatus.EXPIRED,
-    AssetReservationStatusEnum.FAILED: ResourceReservationStatus.FAILED,
-  }
-  return mapping.get(model_status, ResourceReservationStatus.PENDING)
+def _encode_reservation_cursor(cursor: tuple[datetime, UUID]) -> str:
+  """Encode a reservation page cursor as an opaque URL-safe token."""
+  created_at, accession_id = cursor
+  return base64.urlsafe_b64encode(f"{created_at.isoformat()}|{accession_id}".encode()).decode()
+
+
+def _decode_reservation_cursor(token: str) -> tuple[datetime, UUID]:
+  """Decode a token from `_encode_reservation_cursor`."""
+  try:
+    created_at, accession_id = base64.urlsafe_b64decode(token.encode()).decode().split("|")
+    return datetime.fromisoformat(created_at), UUID(accession_id)
+  except ValueError as e:
+    raise HTTPException(
+      status_code=status.HTTP_400_BAD_REQUEST,
+      detail="Invalid reservation cursor",
+    ) from e
 
 
 @router.get(
@@ -119,6 +124,7 @@ def _orm_status_to_api_status(model_status: AssetReservationStatusEnum) -> Resou
 )
 async def list_reservations(
   db: Annotated[AsyncSession, Depends(get_db)],
+  *,
   include_released: bool = Query(
     default=False,
     description="Include released reservations in results",
@@ -127,78 +133,79 @@ async def list_reservations(
     default=None,
     description="Filter by specific asset key (e.g., 'asset:my_plate')",
   ),
+  protocol_run_accession_id: UUID | None = Query(
+    default=None,
+    description="Filter by the protocol run holding the reservation",
+  ),
+  asset_type: AssetType | None = Query(
+    default=None,
+    description="Filter by reserved asset type",
+  ),
+  created_after: datetime | None = Query(
+    default=None,
+    description="Only include reservations created at or after this time",
+  ),
+  created_before: datetime | None = Query(
+    default=None,
+    description="Only include reservations created before this time",
+  ),
+  limit: int = Query(default=100, ge=1, le=1000, description="Maximum reservations per page"),
+  cursor: str | None = Query(
+    default=None,
+    description="next_cursor from the previous page",
+  ),
 ) -> AssetReservationListResponse:
-  """List all asset reservations.
+  """List asset reservations, newest first, one page at a time.
 
   Admin endpoint for inspecting current reservation state. By default, only
   shows active reservations (PENDING, RESERVED, ACTIVE). Set include_released=true
-  to see all reservations including released ones.
+  to see all reservations including released ones. Counts cover every matching
+  reservation, not just the returned page.
   """
-  # Build query
-  query = select(AssetReservation)
-
-  # Filter by status unless include_released
-  if not include_released:
-    query = query.where(
-      AssetReservation.status.in_(
-        [
-          AssetReservationStatusEnum.PENDING,
-          AssetReservationStatusEnum.RESERVED,
-          AssetReservationStatusEnum.ACTIVE,
-        ]
-      )
-    )
-
-  # Filter by asset key if provided
-  if asset_key:
-    query = query.where(AssetReservation.redis_lock_key == asset_key)
-
-  # Order by most recent first
-  query = query.order_by(AssetReservation.created_at.desc())
-
-  result = await db.execute(query)
-  reservations = result.scalars().all()
-
-  # Count active reservations
-  active_count = sum(
-    1
-    for r in reservations
-    if r.status
-    in [
-      AssetReservationStatusEnum.PENDING,
-      AssetReservationStatusEnum.RESERVED,
-      AssetReservationStatusEnum.ACTIVE,
-    ]
+  filters: dict[str, Any] = {
+    "include_released": include_released,
+    "asset_key": asset_key,
+    "protocol_run_accession_id": protocol_run_accession_id,
+    "asset_type": asset_type,
+    "created_after": created_after,
+    "created_before": created_before,
+  }
+  reservations, next_cursor = await list_asset_reservations_page(
+    db,
+    limit=limit,
+    cursor=_decode_reservation_cursor(cursor) if cursor else None,
+    **filters,
   )
-
-  # Convert to response models
-  reservation_responses = [
-    AssetReservationResponse(
-      accession_id=r.accession_id,
-      created_at=r.created_at,
-      protocol_run_accession_id=r.protocol_run_accession_id,
-      schedule_entry_accession_id=r.schedule_entry_accession_id,
-      asset_type=r.asset_type.value if hasattr(r.asset_type, "value") else str(r.asset_type),
-      asset_name=r.asset_name,
-      asset_accession_id=r.asset_accession_id,
-      status=_orm_status_to_api_status(r.status),
-      redis_lock_key=r.redis_lock_key,
-      reserved_at=r.reserved_at,
-      released_at=r.released_at,
-      expires_at=r.expires_at,
-      required_capabilities=r.required_capabilities_json,
-      estimated_usage_duration_ms=r.estimated_usage_duration_ms,
-    )
-    for r in reservations
-  ]
+  total_count, active_count = await count_asset_reservations(db, **filters)
 
   return AssetReservationListResponse(
-    reservations=reservation_responses,
-    total_count=len(reservations),
+    reservations=[AssetReservationRead.model_validate(r) for r in reservations],
+    total_count=total_count,
     active_count=active_count,
+    next_cursor=_encode_reservation_cursor(next_cursor) if next_cursor else None,
   )
 
 
+@router.get(
+  "/reservations/expiry-metrics",
+  status_code=status.HTTP_200_OK,
+  tags=["Scheduler", "Reservations"],
+)
+async def get_reservation_expiry_metrics(request: Request) -> dict[str, Any]:
+  """Report how promptly the background sweeper is expiring reservations.
+
+  `last_lag_ms` and `max_lag_ms` measure how long past its `expires_at` the
+  most overdue reservation was when it got expired.
+  """
+  expiry_service = getattr(request.app.state, "reservation_expiry_service", None)
+  if expiry_service is None:
+    raise HTTPException(
+      status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+      detail="Reservation expiry service is not running.",
+    )
+  return expiry_service.metrics.as_dict()
+
+
 @router.delete(
   "/reservations/{asset_key:path}",
   response_model=ReleaseReservationResponse,
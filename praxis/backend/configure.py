@@ -199,11 +199,31 @@ class PraxisConfiguration:
     """Return the logging level."""
     return self._logging_section.get("level", "INFO")
 
+  @property
+  def logging_format(self) -> str:
+    """Return the log record format, "text" or "json"."""
+    return self._logging_section.get("format", "text")
+
   @property
   def log_file(self) -> str:
     """Return the log file path."""
     return self._logging_section.get("logfile", "/var/log/praxis/praxis.log")
 
+  @property
+  def _simulation_section(self) -> dict[str, str]:
+    """Return the 'simulation' section as a dictionary."""
+    return self._get_section_dict("simulation")
+
+  @property
+  def simulation_trace_cache_dir(self) -> str | None:
+    """Return the directory persisted protocol traces are kept in, if any."""
+    return self._simulation_section.get("trace_cache_dir") or None
+
+  @property
+  def simulation_workers(self) -> int:
+    """Return the number of worker processes used to simulate protocols."""
+    return int(self._simulation_section.get("workers", "1"))
+
   @property
   def _output_directories_section(self) -> dict[str, str]:
     """Return the 'output_directories' section as a dictionary."""
@@ -253,6 +273,11 @@ class PraxisConfiguration:
     dirs_str = self._protocol_directories_section.get("additional_directories", "")
     return [d.strip() for d in dirs_str.split(",") if d.strip()]
 
+  @property
+  def protocol_worktree_root(self) -> str | None:
+    """Return the directory Git protocol sources are checked out into, if any."""
+    return self._protocol_directories_section.get("worktree_root") or None
+
   @property
   def _protocol_discovery_section(self) -> dict[str, str]:
     """Return the 'protocol_discovery' section as a dictionary."""
@@ -1,31 +1,266 @@
-"""Asset lock manager for Praxis."""
+"""Lease-based asset lock manager for Praxis.
 
+Locks live in a shared `KeyValueStore` (Redis in production, in-memory in lite
+mode and tests) so every worker and API process sees the same locks:
+
+- Each lock is a lease: the record expires after `lease_seconds` unless the
+  holding process renews it. A background task renews every lease this manager
+  holds, so long protocol runs keep their assets while a crashed process loses
+  them after one lease period.
+- Each acquisition gets a fencing token from a per-asset counter. Tokens only
+  increase, so a downstream write can reject a stale holder whose lease lapsed.
+- Contended acquisition waits on a release notification (`PubSub`) instead of
+  polling, re-checking at most every `recheck_seconds` in case a holder died.
+- A per-run index of lock keys makes `release_all_protocol_locks` O(k) in the
+  number of locks the run holds.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
 import uuid
-from typing import Any
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlparse
 
 from praxis.backend.core.protocols.asset_lock_manager import IAssetLockManager
+from praxis.backend.core.storage import StorageBackend, StorageFactory
 from praxis.backend.models.pydantic_internals.runtime import AcquireAssetLock
+from praxis.backend.utils.logging import get_logger
+
+if TYPE_CHECKING:
+  from praxis.backend.core.storage import KeyValueStore, PubSub, Subscription
+
+logger = get_logger(__name__)
+
+DEFAULT_LEASE_SECONDS = 30
+"""Seconds a lock survives without renewal."""
+
+DEFAULT_RECHECK_SECONDS = 5.0
+"""Longest a contended waiter sleeps without re-checking the lock."""
+
+_LOCK_PREFIX = "asset_lock"
+_FENCE_PREFIX = "asset_lock_fence"
+_RUN_INDEX_PREFIX = "asset_lock_run"
+_RELEASE_CHANNEL_PREFIX = "asset_lock_released"
+
+
+@dataclass
+class AssetLease:
+  """A held asset lock."""
+
+  lock_key: str
+  """Composite `asset_type:asset_name` key"""
+
+  lock_data: AcquireAssetLock
+  """The acquisition request that produced this lease"""
+
+  fencing_token: int
+  """Monotonically increasing per asset; larger tokens are newer holders"""
+
+  record: dict[str, Any]
+  """Record stored in the key-value store, used for compare-and-set"""
+
+  expires_at: float
+  """Wall-clock time (seconds) the lease lapses unless renewed"""
 
 
 class AssetLockManager(IAssetLockManager):
-  """A simple in-memory asset lock manager."""
+  """Distributed, lease-based asset lock manager."""
+
+  def __init__(
+    self,
+    redis_url: str | None = None,
+    *,
+    store: KeyValueStore | None = None,
+    pubsub: PubSub | None = None,
+    lease_seconds: int = DEFAULT_LEASE_SECONDS,
+    recheck_seconds: float = DEFAULT_RECHECK_SECONDS,
+  ) -> None:
+    """Initialize the AssetLockManager.
+
+    Args:
+        redis_url: Redis URL for the shared lock store. Ignored if `store` is
+            given; without either, locks are kept in memory (single process).
+        store: Key-value store holding the lock records.
+        pubsub: Pub/sub used to wake waiters when a lock is released.
+        lease_seconds: Lease duration; held leases are renewed every third of it.
+        recheck_seconds: Upper bound on how long a waiter sleeps between checks.
 
-  def __init__(self, redis_url: str | None = None) -> None:
-    """Initialize the AssetLockManager."""
-    self._locks: dict[str, AcquireAssetLock] = {}
-    # Redis URL is ignored for in-memory implementation
+    """
+    if store is None:
+      backend = StorageBackend.REDIS if redis_url else StorageBackend.MEMORY
+      connection = _redis_connection_kwargs(redis_url) if redis_url else {}
+      store = StorageFactory.create_key_value_store(backend, **connection)
+      pubsub = pubsub or StorageFactory.create_pubsub(backend, **connection)
+    self._store = store
+    self._pubsub = pubsub or StorageFactory.create_pubsub(StorageBackend.MEMORY)
+    self.lease_seconds = lease_seconds
+    self.recheck_seconds = recheck_seconds
+    self._owner_id = uuid.uuid4().hex
+    self._locks: dict[str, AcquireAssetLock] = {}  # Locks held by this manager
+    self._leases: dict[str, AssetLease] = {}
+    self._renewal_task: asyncio.Task[None] | None = None
 
   async def initialize(self) -> None:
     """Initialize the asset lock manager."""
-    # No-op for in-memory implementation
+    # Verify the store is reachable before the first lock is needed.
+    await self._store.exists(f"{_LOCK_PREFIX}:__ping__")
+
+  async def close(self) -> None:
+    """Stop renewing leases. Held leases lapse after `lease_seconds`."""
+    if self._renewal_task is not None:
+      self._renewal_task.cancel()
+      with contextlib.suppress(asyncio.CancelledError):
+        await self._renewal_task
+      self._renewal_task = None
+
+  # ---------------------------------------------------------------------------
+  # Acquisition
+  # ---------------------------------------------------------------------------
 
   async def acquire_asset_lock(self, lock_data: AcquireAssetLock) -> bool:
-    """Acquire a lock on an asset."""
-    lock_key = f"{lock_data.asset_type}:{lock_data.asset_name}"
-    if lock_key in self._locks:
-      return False
+    """Acquire a lock on an asset.
+
+    Waits up to `lock_data.timeout_seconds` for a held lock to be released;
+    without a timeout, fails immediately if the asset is locked.
+    """
+    return await self.acquire_lease(lock_data) is not None
+
+  async def acquire_lease(
+    self,
+    lock_data: AcquireAssetLock,
+    wait_seconds: float | None = None,
+  ) -> AssetLease | None:
+    """Acquire a lock on an asset and return its lease.
+
+    Args:
+        lock_data: The acquisition request.
+        wait_seconds: How long to wait for a held lock. Defaults to
+            `lock_data.timeout_seconds` (no waiting if unset).
+
+    Returns:
+        The lease, or None if the asset stayed locked.
+
+    """
+    if wait_seconds is None:
+      wait_seconds = lock_data.timeout_seconds or 0
+    lock_key = _lock_key(lock_data.asset_type, lock_data.asset_name)
+    deadline = time.monotonic() + wait_seconds
+    subscription: Subscription | None = None
+    try:
+      while True:
+        lease = await self._try_acquire(lock_key, lock_data)
+        if lease is not None:
+          return lease
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+          return None
+        if subscription is None:
+          # Re-check once subscribed so a release in between is not missed.
+          subscription = self._pubsub.subscribe(_release_channel(lock_key))
+          continue
+        await self._wait_for_release(subscription, min(remaining, self.recheck_seconds))
+    finally:
+      if subscription is not None:
+        await subscription.unsubscribe()
+
+  async def _try_acquire(self, lock_key: str, lock_data: AcquireAssetLock) -> AssetLease | None:
+    """Make one attempt to take the lock; assign a fencing token on success."""
+    store_key = _store_key(lock_key)
+    record: dict[str, Any] = {
+      "lock": lock_data.model_dump(mode="json"),
+      "owner": self._owner_id,
+      "fencing_token": None,
+    }
+    if not await self._store.compare_and_set(store_key, None, record, self.lease_seconds):
+      return None
+    # The token is drawn while holding the lock, so every later holder (which
+    # can only acquire after this one releases) draws a larger token.
+    token = await self._store.increment(f"{_FENCE_PREFIX}:{lock_key}")
+    fenced = {**record, "fencing_token": token}
+    if not await self._store.compare_and_set(store_key, record, fenced, self.lease_seconds):
+      logger.warning("Lease on %s lapsed before it could be fenced.", lock_key)
+      return None
+
+    lease = AssetLease(
+      lock_key=lock_key,
+      lock_data=lock_data,
+      fencing_token=token,
+      record=fenced,
+      expires_at=time.time() + self.lease_seconds,
+    )
     self._locks[lock_key] = lock_data
-    return True
+    self._leases[lock_key] = lease
+    await self._update_run_index(lock_data.protocol_run_id, add=lock_key)
+    self._ensure_renewal_task()
+    logger.debug("Acquired %s (fencing token %d).", lock_key, token)
+    return lease
+
+  async def _wait_for_release(self, subscription: Subscription, timeout: float) -> None:
+    """Block until a release notification arrives or `timeout` elapses."""
+    with contextlib.suppress(asyncio.TimeoutError, StopAsyncIteration):
+      await asyncio.wait_for(subscription.__anext__(), timeout=timeout)
+
+  # ---------------------------------------------------------------------------
+  # Leases
+  # ---------------------------------------------------------------------------
+
+  async def renew_lease(self, lease: AssetLease) -> bool:
+    """Extend a lease by `lease_seconds`.
+
+    Returns:
+        False if the lease was lost (expired and possibly re-acquired by
+        someone else); the manager then forgets it.
+
+    """
+    renewed = await self._store.compare_and_set(
+      _store_key(lease.lock_key),
+      lease.record,
+      lease.record,
+      self.lease_seconds,
+    )
+    if renewed:
+      lease.expires_at = time.time() + self.lease_seconds
+    else:
+      logger.warning(
+        "Lost lease on %s (fencing token %d).",
+        lease.lock_key,
+        lease.fencing_token,
+      )
+      self._forget(lease.lock_key, lease)
+    return renewed
+
+  def get_lease(self, asset_type: str, asset_name: str) -> AssetLease | None:
+    """Return the lease this manager holds on an asset, if any."""
+    return self._leases.get(_lock_key(asset_type, asset_name))
+
+  def _ensure_renewal_task(self) -> None:
+    if self._renewal_task is None or self._renewal_task.done():
+      self._renewal_task = asyncio.create_task(self._renew_leases_loop())
+
+  async def _renew_leases_loop(self) -> None:
+    """Renew every held lease each third of a lease period until none remain."""
+    while self._leases:
+      await asyncio.sleep(self.lease_seconds / 3)
+      for lease in list(self._leases.values()):
+        try:
+          await self.renew_lease(lease)
+        except Exception:  # pylint: disable=broad-except
+          logger.exception("Error renewing lease on %s", lease.lock_key)
+
+  def _forget(self, lock_key: str, lease: AssetLease | None = None) -> None:
+    """Drop local bookkeeping for a lock (only `lease`, if given)."""
+    if lease is not None and self._leases.get(lock_key) is not lease:
+      return
+    self._leases.pop(lock_key, None)
+    self._locks.pop(lock_key, None)
+
+  # ---------------------------------------------------------------------------
+  # Release
+  # ---------------------------------------------------------------------------
 
   async def release_asset_lock(
     self,
@@ -34,37 +269,93 @@ class AssetLockManager(IAssetLockManager):
     reservation_id: uuid.UUID,
     protocol_run_id: uuid.UUID | None = None,
   ) -> bool:
-    """Release a lock on an asset."""
-    lock_key = f"{asset_type}:{asset_name}"
-    if lock_key in self._locks:
-      del self._locks[lock_key]
-      return True
-    return False
+    """Release a lock on an asset.
+
+    Only the reservation that acquired the lock can release it.
+    """
+    lock_key = _lock_key(asset_type, asset_name)
+    record = await self._store.get(_store_key(lock_key))
+    if record is None or record["lock"]["reservation_id"] != str(reservation_id):
+      local = self._locks.get(lock_key)
+      if local is not None and local.reservation_id == reservation_id:
+        self._forget(lock_key)  # Our lease lapsed; nothing left to release.
+      return False
+    return await self._release(lock_key, record)
 
   async def release_all_protocol_locks(self, protocol_run_id: uuid.UUID) -> int:
     """Release all locks held by a protocol run."""
-    keys_to_release = []
-    for key, lock in self._locks.items():
-      if lock.protocol_run_id == protocol_run_id:
-        keys_to_release.append(key)
-
+    index_key = _run_index_key(protocol_run_id)
+    lock_keys = await self._store.get(index_key) or []
     count = 0
-    for key in keys_to_release:
-      del self._locks[key]
-      count += 1
+    for lock_key in lock_keys:
+      record = await self._store.get(_store_key(lock_key))
+      if record is None or record["lock"]["protocol_run_id"] != str(protocol_run_id):
+        self._forget(lock_key)
+        continue
+      if await self._release(lock_key, record, update_index=False):
+        count += 1
+    await self._store.delete(index_key)
     return count
 
+  async def _release(
+    self,
+    lock_key: str,
+    record: dict[str, Any],
+    *,
+    update_index: bool = True,
+  ) -> bool:
+    """Delete a lock record if unchanged, then wake waiters."""
+    if not await self._store.compare_and_set(_store_key(lock_key), record, None):
+      return False
+    self._forget(lock_key)
+    if update_index:
+      await self._update_run_index(record["lock"]["protocol_run_id"], remove=lock_key)
+    await self._pubsub.publish(
+      _release_channel(lock_key),
+      {"lock_key": lock_key, "fencing_token": record["fencing_token"]},
+    )
+    logger.debug("Released %s (fencing token %s).", lock_key, record["fencing_token"])
+    return True
+
+  async def _update_run_index(
+    self,
+    protocol_run_id: uuid.UUID | str,
+    *,
+    add: str | None = None,
+    remove: str | None = None,
+  ) -> None:
+    """Add or remove a lock key in a run's index (optimistic compare-and-set)."""
+    index_key = _run_index_key(protocol_run_id)
+    while True:
+      current = await self._store.get(index_key)
+      keys = [key for key in (current or []) if key != remove]
+      if add is not None and add not in keys:
+        keys.append(add)
+      if keys == (current or []):
+        return
+      if await self._store.compare_and_set(index_key, current, keys or None):
+        return
+
+  # ---------------------------------------------------------------------------
+  # Status
+  # ---------------------------------------------------------------------------
+
   async def check_asset_availability(
     self,
     asset_type: str,
     asset_name: str,
   ) -> dict[str, Any] | None:
-    """Check if an asset is currently available."""
-    lock_key = f"{asset_type}:{asset_name}"
-    lock = self._locks.get(lock_key)
-    if lock:
-      return lock.model_dump(mode="json")
-    return None
+    """Check if an asset is currently available.
+
+    Returns:
+        None if the asset is free, otherwise the holder's lock data with its
+        fencing token.
+
+    """
+    record = await self._store.get(_store_key(_lock_key(asset_type, asset_name)))
+    if record is None:
+      return None
+    return {**record["lock"], "fencing_token": record["fencing_token"]}
 
   async def get_lock_status(
     self,
@@ -72,5 +363,39 @@ class AssetLockManager(IAssetLockManager):
     asset_name: str,
   ) -> AcquireAssetLock | None:
     """Get the lock status of an asset."""
-    lock_key = f"{asset_type}:{asset_name}"
-    return self._locks.get(lock_key)
+    lock_key = _lock_key(asset_type, asset_name)
+    record = await self._store.get(_store_key(lock_key))
+    if record is None:
+      return None
+    local = self._locks.get(lock_key)
+    if local is not None and str(local.reservation_id) == record["lock"]["reservation_id"]:
+      return local
+    return AcquireAssetLock.model_validate(record["lock"])
+
+
+def _lock_key(asset_type: str, asset_name: str) -> str:
+  return f"{asset_type}:{asset_name}"
+
+
+def _store_key(lock_key: str) -> str:
+  return f"{_LOCK_PREFIX}:{lock_key}"
+
+
+def _run_index_key(protocol_run_id: uuid.UUID | str) -> str:
+  return f"{_RUN_INDEX_PREFIX}:{protocol_run_id}"
+
+
+def _release_channel(lock_key: str) -> str:
+  return f"{_RELEASE_CHANNEL_PREFIX}:{lock_key}"
+
+
+def _redis_connection_kwargs(redis_url: str) -> dict[str, Any]:
+  """Translate a redis:// URL into `StorageFactory` connection arguments."""
+  parsed = urlparse(redis_url)
+  db = parsed.path.lstrip("/")
+  return {
+    "host": parsed.hostname or "localhost",
+    "port": parsed.port or 6379,
+    "db": int(db) if db else 0,
+    "password": parsed.password,
+  }
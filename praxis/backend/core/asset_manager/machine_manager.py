@@ -3,14 +3,20 @@
 
 import importlib
 import uuid
+from collections.abc import Iterable
 from typing import TYPE_CHECKING, Any
 
 from pylabrobot.resources import Deck
 
 from praxis.backend.models.domain.filters import SearchFilters
 from praxis.backend.models.domain.machine import Machine
+from praxis.backend.models.domain.protocol import AssetRequirement as AssetRequirementModel
 from praxis.backend.models.enums import MachineStatusEnum
-from praxis.backend.utils.errors import AssetAcquisitionError, AssetReleaseError
+from praxis.backend.utils.errors import (
+  AssetAcquisitionError,
+  AssetReleaseError,
+  WorkcellRuntimeError,
+)
 from praxis.backend.utils.logging import get_logger
 
 if TYPE_CHECKING:
@@ -47,7 +53,99 @@ class MachineManagerMixin:
       fqn_constraint,
       protocol_run_accession_id,
     )
+    selected_machine_model = await self._select_machine(
+      protocol_run_accession_id,
+      requested_asset_name_in_protocol,
+      fqn_constraint,
+    )
+
+    live_plr_machine = await self.workcell_runtime.initialize_machine(
+      selected_machine_model,
+    )
+    if not live_plr_machine:
+      await self.machine_svc.update_machine_status(
+        self.db,
+        selected_machine_model.accession_id,
+        MachineStatusEnum.ERROR,
+        status_details=f"Backend init failed for run {protocol_run_accession_id}.",
+      )
+      msg = f"Failed to initialize backend for machine '{selected_machine_model.name}'."
+      raise AssetAcquisitionError(
+        msg,
+      )
+
+    if (
+      selected_machine_model.status != MachineStatusEnum.IN_USE
+      or selected_machine_model.current_protocol_run_accession_id
+      != uuid.UUID(str(protocol_run_accession_id))
+    ):
+      updated_machine_model = await self.machine_svc.update_machine_status(
+        self.db,
+        selected_machine_model.accession_id,
+        MachineStatusEnum.IN_USE,
+        current_protocol_run_accession_id=uuid.UUID(str(protocol_run_accession_id)),
+        status_details=f"In use by run {protocol_run_accession_id}",
+      )
+      if not updated_machine_model:
+        msg = f"CRITICAL: Failed to update DB status for machine '{selected_machine_model.name}'."
+        raise AssetAcquisitionError(
+          msg,
+        )
+      selected_machine_model = updated_machine_model
+
+    logger.info(
+      "AM_ACQUIRE_MACHINE: Machine '%s' acquired for run '%s'.",
+      selected_machine_model.name,
+      protocol_run_accession_id,
+    )
+    return live_plr_machine, selected_machine_model.accession_id, "machine"
+
+  async def prepare_machines(
+    self,
+    protocol_run_accession_id: uuid.UUID,
+    asset_requirements: Iterable[AssetRequirementModel],
+  ) -> None:
+    """Start the machines a run needs concurrently, ahead of acquiring them.
+
+    Selects a machine for every requirement that is not a cataloged resource and
+    starts them together via ``initialize_machines``. The ``acquire_machine``
+    calls that follow find them already active. This is best effort: if any
+    machine fails to start, the runtime shuts the batch down again and each
+    requirement reports its own error when it is acquired.
+    """
+    selected: dict[uuid.UUID, Machine] = {}
+    for requirement in asset_requirements:
+      if await self.resource_type_definition_svc.get_by_name(self.db, name=requirement.fqn):
+        continue
+      try:
+        machine_model = await self._select_machine(
+          protocol_run_accession_id,
+          requirement.name,
+          requirement.fqn,
+        )
+      except AssetAcquisitionError:
+        continue
+      selected.setdefault(machine_model.accession_id, machine_model)
 
+    if len(selected) <= 1:
+      return
+    try:
+      await self.workcell_runtime.initialize_machines(selected.values())
+    except WorkcellRuntimeError as e:
+      logger.warning(
+        "AM_PREPARE_MACHINES: Concurrent start-up failed for run '%s': %s. "
+        "Falling back to starting machines one at a time.",
+        protocol_run_accession_id,
+        e,
+      )
+
+  async def _select_machine(
+    self,
+    protocol_run_accession_id: uuid.UUID,
+    requested_asset_name_in_protocol: str,
+    fqn_constraint: str,
+  ) -> Machine:
+    """Pick the machine to use for a requirement, without starting it."""
     try:
       module_path, class_name = fqn_constraint.rsplit(".", 1)
       module = importlib.import_module(module_path)
@@ -120,47 +218,7 @@ class MachineManagerMixin:
       raise AssetAcquisitionError(
         msg,
       )
-
-    live_plr_machine = await self.workcell_runtime.initialize_machine(
-      selected_machine_model,
-    )
-    if not live_plr_machine:
-      await self.machine_svc.update_machine_status(
-        self.db,
-        selected_machine_model.accession_id,
-        MachineStatusEnum.ERROR,
-        status_details=f"Backend init failed for run {protocol_run_accession_id}.",
-      )
-      msg = f"Failed to initialize backend for machine '{selected_machine_model.name}'."
-      raise AssetAcquisitionError(
-        msg,
-      )
-
-    if (
-      selected_machine_model.status != MachineStatusEnum.IN_USE
-      or selected_machine_model.current_protocol_run_accession_id
-      != uuid.UUID(str(protocol_run_accession_id))
-    ):
-      updated_machine_model = await self.machine_svc.update_machine_status(
-        self.db,
-        selected_machine_model.accession_id,
-        MachineStatusEnum.IN_USE,
-        current_protocol_run_accession_id=uuid.UUID(str(protocol_run_accession_id)),
-        status_details=f"In use by run {protocol_run_accession_id}",
-      )
-      if not updated_machine_model:
-        msg = f"CRITICAL: Failed to update DB status for machine '{selected_machine_model.name}'."
-        raise AssetAcquisitionError(
-          msg,
-        )
-      selected_machine_model = updated_machine_model
-
-    logger.info(
-      "AM_ACQUIRE_MACHINE: Machine '%s' acquired for run '%s'.",
-      selected_machine_model.name,
-      protocol_run_accession_id,
-    )
-    return live_plr_machine, selected_machine_model.accession_id, "machine"
+    return selected_machine_model
 
   async def release_machine(
     self,
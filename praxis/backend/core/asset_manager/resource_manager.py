@@ -2,12 +2,14 @@
 """Resource management logic for AssetManager."""
 
 import importlib
+import json
 import uuid
+from collections import Counter, defaultdict
+from collections.abc import Sequence
 from typing import TYPE_CHECKING, Any, cast
 
 from pylabrobot.resources import Deck as PLRDeck
 
-from praxis.backend.models.domain.filters import SearchFilters
 from praxis.backend.models.domain.resource import (
   Resource,
   ResourceDefinition,
@@ -85,44 +87,57 @@ class ResourceManagerMixin:
           msg,
         )
       return instance_model
-    filters = SearchFilters(
-      search_filters={
-        "fqn": fqn,
-        "status": ResourceStatusEnum.IN_USE,
-        "current_protocol_run_accession_id_filter": str(protocol_run_accession_id),
-      },
-      property_filters=property_constraints,
-    )
-    in_use_list = await self.resource_svc.get_multi(
+    candidates = await self.resource_svc.find_acquisition_candidates(
       self.db,
-      filters=filters,
-    )
-    if in_use_list:
-      return in_use_list[0]
-    filters = SearchFilters(
-      search_filters={"fqn": fqn, "status": ResourceStatusEnum.AVAILABLE_ON_DECK},
+      protocol_run_accession_id=protocol_run_accession_id,
+      fqn_counts={fqn: 1},
       property_filters=property_constraints,
     )
-    on_deck_list = await self.resource_svc.get_multi(
-      self.db,
-      filters=filters,
-    )
-    if on_deck_list:
-      return on_deck_list[0]
-    filters = SearchFilters(
-      search_filters={
-        "fqn": fqn,
-        "status": ResourceStatusEnum.AVAILABLE_IN_STORAGE,
-      },
-      property_filters=property_constraints,
-    )
-    in_storage_list = await self.resource_svc.get_multi(
-      self.db,
-      filters=filters,
-    )
-    if in_storage_list:
-      return in_storage_list[0]
-    return None
+    return next(iter(candidates[fqn]), None)
+
+  async def _find_resources_to_acquire(
+    self,
+    requests: Sequence[AcquireAsset],
+  ) -> list[Resource | None]:
+    """Resolve several resource requirements, allocating distinct instances.
+
+    User-chosen instances are checked individually. The remaining requirements
+    share one ranked candidate query per run and set of property constraints.
+    """
+    found: list[Resource | None] = [None] * len(requests)
+    claimed: set[uuid.UUID] = set()
+    groups: dict[tuple[uuid.UUID, str], list[int]] = defaultdict(list)
+    for index, request in enumerate(requests):
+      if request.instance_accession_id:
+        chosen = await self._find_resource_to_acquire(
+          request.protocol_run_accession_id,
+          request.fqn,
+          request.instance_accession_id,
+          request.property_constraints,
+        )
+        found[index] = chosen
+        if chosen:
+          claimed.add(chosen.accession_id)
+        continue
+      constraints_key = json.dumps(request.property_constraints or {}, sort_keys=True, default=str)
+      groups[(request.protocol_run_accession_id, constraints_key)].append(index)
+
+    for (protocol_run_accession_id, _), indices in groups.items():
+      wanted = Counter(requests[index].fqn for index in indices)
+      candidates = await self.resource_svc.find_acquisition_candidates(
+        self.db,
+        protocol_run_accession_id=protocol_run_accession_id,
+        fqn_counts=wanted,
+        property_filters=requests[indices[0]].property_constraints,
+        exclude_accession_ids=claimed,
+      )
+      pools = {fqn: iter(found_for_fqn) for fqn, found_for_fqn in candidates.items()}
+      for index in indices:
+        resource = next(pools[requests[index].fqn], None)
+        found[index] = resource
+        if resource:
+          claimed.add(resource.accession_id)
+    return found
 
   async def _update_resource_acquisition_status(
     self,
@@ -170,7 +185,28 @@ class ResourceManagerMixin:
       resource_data.instance_accession_id,
       resource_data.property_constraints,
     )
+    return await self._acquire_found_resource(resource_data, resource_to_acquire)
 
+  async def acquire_resources(
+    self,
+    requests: Sequence[AcquireAsset],
+  ) -> list[tuple[Any, uuid.UUID, str]]:
+    """Acquire resource instances for several requirements of a run at once.
+
+    Candidates for every requirement are resolved up front, so requirements
+    sharing a definition receive distinct instances.
+    """
+    resources = await self._find_resources_to_acquire(requests)
+    return [
+      await self._acquire_found_resource(resource_data, resource_to_acquire)
+      for resource_data, resource_to_acquire in zip(requests, resources, strict=True)
+    ]
+
+  async def _acquire_found_resource(
+    self,
+    resource_data: AcquireAsset,
+    resource_to_acquire: Resource | None,
+  ) -> tuple[Any, uuid.UUID, str]:
     if not resource_to_acquire:
       msg = f"No instance found for definition '{resource_data.fqn}' matching criteria for run '{resource_data.protocol_run_accession_id}'."
       raise AssetAcquisitionError(
@@ -3,7 +3,9 @@
 
 This module defines the async tasks for executing protocols in the background.
 It uses the dependency injection container to get the Celery app instance
-and to inject dependencies into the tasks.
+and to inject dependencies into the tasks. Async task bodies run on the
+worker-lifetime event loop from `celery_worker`, so connection pools and
+container singletons are reused across tasks instead of rebuilt per call.
 """
 
 from __future__ import annotations
@@ -16,10 +18,10 @@ from celery.utils.log import get_task_logger
 from dependency_injector.wiring import Provide, inject
 
 from praxis.backend.core.celery import celery_app
+from praxis.backend.core.celery_worker import run_in_worker_loop
 from praxis.backend.core.container import Container
 from praxis.backend.models import ProtocolRunStatusEnum
 from praxis.backend.services.state import PraxisState
-from praxis.backend.utils.async_run import run_sync
 from praxis.backend.utils.logging import get_logger
 
 if TYPE_CHECKING:
@@ -55,7 +57,7 @@ def execute_protocol_run_task(
   )
 
   try:
-    result = run_sync(
+    result = run_in_worker_loop(
       _execute_protocol_async(
         protocol_run_id,
         input_parameters,
@@ -72,7 +74,7 @@ def execute_protocol_run_task(
     error_msg = f"Protocol execution failed for run_id={protocol_run_id}: {e}"
     task_logger.exception(error_msg)
     try:
-      run_sync(
+      run_in_worker_loop(
         _update_run_status_on_error(
           protocol_run_id,
           str(e),
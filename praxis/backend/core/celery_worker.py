@@ -0,0 +1,272 @@
+"""Worker-lifetime event loop and warm resources for Celery workers.
+
+Celery tasks are synchronous, but the work they do (orchestration, database and
+Redis access) is async. Creating a fresh event loop per task forces every
+loop-bound resource, such as SQLAlchemy's async connection pool or the Redis
+client's connections, to be rebuilt on each call. This module keeps a single
+`BackgroundEventLoop` per worker process, started from Celery's worker signals,
+and warms the shared resources on it once so tasks only pay for their own work.
+
+Logging is configured from praxis.ini through Celery's `setup_logging` signal,
+so protocol runs log through the same background writer, format and run-context
+stamping as the API process instead of Celery's own root handlers.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from typing import TYPE_CHECKING, Any
+
+from celery.signals import (
+  setup_logging,
+  worker_process_init,
+  worker_process_shutdown,
+  worker_shutdown,
+)
+
+from praxis.backend.configure import PraxisConfiguration
+from praxis.backend.core.celery import celery_app
+from praxis.backend.core.container import Container
+from praxis.backend.utils import db as praxis_db
+from praxis.backend.utils.async_run import BackgroundEventLoop
+from praxis.backend.utils.logging import configure_logging, get_logger, shutdown_logging
+
+if TYPE_CHECKING:
+  import collections.abc
+
+  from celery import Celery
+
+logger = get_logger(__name__)
+
+# Providers resolved on the worker loop at startup so their instances (and any
+# connection pools they own) are created on, and bound to, that loop.
+WARM_CONTAINER_PROVIDERS: tuple[str, ...] = ("db_session_factory", "redis_client")
+
+_worker_loop: BackgroundEventLoop | None = None
+_worker_loop_pid: int | None = None
+_worker_loop_lock = threading.Lock()
+_warm_instances: dict[str, Any] = {}
+
+
+def attach_worker_container(app: Celery) -> Container:
+  """Return the app's DI container, creating and attaching one if needed.
+
+  `PraxisTask` and the `Provide[...]` markers in `celery_tasks` resolve through
+  ``app.container``; creating the container wires those modules.
+
+  Args:
+    app: The Celery application.
+
+  Returns:
+    The container attached to ``app``.
+
+  """
+  container = getattr(app, "container", None)
+  if container is None:
+    container = Container()
+    container.config.from_dict({"redis": {"url": PraxisConfiguration().redis_url}})
+    app.container = container
+  return container
+
+
+def discard_inherited_connections() -> None:
+  """Drop database connections pooled by the parent before the worker forked.
+
+  The pool is disposed with ``close=False`` so the parent's sockets are left
+  untouched; the child opens its own connections on first use.
+  """
+  engine = praxis_db._async_engine
+  if engine is not None:
+    engine.sync_engine.dispose(close=False)
+
+
+async def warm_worker_resources(app: Celery) -> None:
+  """Create long-lived resources on the worker loop.
+
+  Resolves the container singletons listed in `WARM_CONTAINER_PROVIDERS` and
+  opens one connection on the shared database engine so its pool is primed
+  before the first task arrives. Failures are logged and otherwise ignored;
+  tasks will create resources on demand.
+
+  Args:
+    app: The Celery application; a container is attached if it has none.
+
+  """
+  try:
+    container = attach_worker_container(app)
+  except Exception:
+    logger.warning("Could not attach a DI container to the Celery app.", exc_info=True)
+    container = None
+
+  if container is not None:
+    for provider_name in WARM_CONTAINER_PROVIDERS:
+      provider = getattr(container, provider_name, None)
+      if provider is None:
+        continue
+      try:
+        instance = provider()
+        _warm_instances[provider_name] = instance
+        ping = getattr(instance, "ping", None)
+        if ping is not None:
+          await ping()
+      except Exception:
+        logger.warning("Could not warm container provider '%s'.", provider_name, exc_info=True)
+
+  try:
+    async with praxis_db.async_engine.connect():
+      pass
+  except Exception:
+    logger.warning("Could not prime the database connection pool.", exc_info=True)
+
+
+async def release_worker_resources(app: Celery) -> None:
+  """Dispose of resources created by `warm_worker_resources`.
+
+  Only instances that warming actually created are closed.
+
+  Args:
+    app: The Celery application carrying the container.
+
+  """
+  for provider_name, instance in list(_warm_instances.items()):
+    aclose = getattr(instance, "aclose", None)
+    if aclose is not None:
+      try:
+        await aclose()
+      except Exception:
+        logger.debug("Error closing warm '%s'.", provider_name, exc_info=True)
+  _warm_instances.clear()
+
+  container = getattr(app, "container", None)
+  if container is not None:
+    try:
+      result = container.shutdown_resources()
+      if result is not None:
+        await result
+    except Exception:
+      logger.debug("Error shutting down container resources.", exc_info=True)
+
+  try:
+    await praxis_db.async_engine.dispose()
+  except Exception:
+    logger.debug("Error disposing database engine.", exc_info=True)
+
+
+def start_worker_loop(app: Celery | None = None, *, warm: bool = True) -> BackgroundEventLoop:
+  """Start (or return) this process's worker event loop.
+
+  The loop is tracked per process id, so a loop inherited across `fork` is
+  discarded and replaced rather than reused from a thread that no longer exists.
+
+  Args:
+    app: The Celery application whose resources should be warmed. Defaults to
+      the global Praxis Celery app.
+    warm: Whether to warm shared resources after starting the loop.
+
+  Returns:
+    The running worker loop.
+
+  """
+  global _worker_loop, _worker_loop_pid
+  with _worker_loop_lock:
+    pid = os.getpid()
+    if _worker_loop is not None and _worker_loop_pid == pid and _worker_loop.is_running:
+      return _worker_loop
+
+    loop = BackgroundEventLoop(name=f"praxis-celery-loop-{pid}")
+    loop.start()
+    _worker_loop = loop
+    _worker_loop_pid = pid
+
+  if warm:
+    try:
+      loop.run(warm_worker_resources(app or celery_app))
+    except Exception:
+      logger.warning("Warming worker resources failed.", exc_info=True)
+  logger.info("Started worker event loop in process %s.", pid)
+  return loop
+
+
+def stop_worker_loop(app: Celery | None = None) -> None:
+  """Release warm resources and stop this process's worker event loop.
+
+  Args:
+    app: The Celery application whose resources should be released. Defaults to
+      the global Praxis Celery app.
+
+  """
+  global _worker_loop, _worker_loop_pid
+  with _worker_loop_lock:
+    loop = _worker_loop
+    owned = _worker_loop_pid == os.getpid()
+    _worker_loop = None
+    _worker_loop_pid = None
+
+  if loop is None or not owned:
+    return
+  if loop.is_running:
+    try:
+      loop.run(release_worker_resources(app or celery_app), timeout=10.0)
+    except Exception:
+      logger.debug("Releasing worker resources failed.", exc_info=True)
+  loop.stop()
+  logger.info("Stopped worker event loop in process %s.", os.getpid())
+
+
+def get_worker_loop() -> BackgroundEventLoop:
+  """Return the worker loop, starting it lazily if no signal has started it yet.
+
+  Pools that do not emit `worker_process_init` (solo, threads) and direct task
+  invocation in tests go through this lazy path.
+  """
+  loop = _worker_loop
+  if loop is not None and _worker_loop_pid == os.getpid() and loop.is_running:
+    return loop
+  return start_worker_loop()
+
+
+def run_in_worker_loop(
+  coro: collections.abc.Coroutine[Any, Any, Any],
+  timeout: float | None = None,
+) -> Any:
+  """Run a coroutine on the worker loop and block until it completes.
+
+  Args:
+    coro: The coroutine to run.
+    timeout: Optional number of seconds to wait for the result.
+
+  Returns:
+    The coroutine's return value.
+
+  """
+  return get_worker_loop().run(coro, timeout=timeout)
+
+
+@setup_logging.connect
+def _on_setup_logging(**_kwargs: Any) -> None:
+  # Connecting this signal also stops Celery from installing its own handlers.
+  config = PraxisConfiguration()
+  configure_logging(
+    level=config.logging_level,
+    log_file=config.log_file,
+    json_format=config.logging_format == "json",
+  )
+
+
+@worker_process_init.connect
+def _on_worker_process_init(**_kwargs: Any) -> None:
+  discard_inherited_connections()
+  start_worker_loop()
+
+
+@worker_process_shutdown.connect
+def _on_worker_process_shutdown(**_kwargs: Any) -> None:
+  stop_worker_loop()
+  # Pool processes exit without running atexit hooks; write out queued records.
+  shutdown_logging()
+
+
+@worker_shutdown.connect
+def _on_worker_shutdown(**_kwargs: Any) -> None:
+  stop_worker_loop()
@@ -12,6 +12,7 @@ from celery import Celery
 from dependency_injector import containers, providers
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from praxis.backend.configure import PraxisConfiguration
 from praxis.backend.services.deck import DeckService
 from praxis.backend.services.deck_type_definition import DeckTypeDefinitionService
 from praxis.backend.services.machine import MachineService
@@ -140,8 +141,13 @@ class Container(containers.DeclarativeContainer):
     redis_client=redis_client,
   )
 
+  praxis_configuration: providers.Singleton[PraxisConfiguration] = providers.Singleton(
+    PraxisConfiguration,
+  )
+
   protocol_code_manager: providers.Singleton[ProtocolCodeManager] = providers.Singleton(
     ProtocolCodeManager,
+    worktree_root=praxis_configuration.provided.protocol_worktree_root,
   )
 
   file_system: providers.Singleton[IFileSystem] = providers.Singleton(RealFileSystem)
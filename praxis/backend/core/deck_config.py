@@ -11,9 +11,12 @@ Usage in protocol decorator:
     )
     def my_protocol(state: PraxisRunContext, deck: Deck):
         ...
+
+Built decks are cached as templates keyed by a hash of the layout; later
+builds of the same layout return a fresh copy of the template instead of
+re-resolving and re-instantiating every resource.
 """
 
-import importlib
 import json
 from pathlib import Path
 from typing import Any
@@ -21,9 +24,13 @@ from typing import Any
 from pydantic import BaseModel, Field
 
 from praxis.backend.utils.logging import get_logger
+from praxis.common.resource_templates import ResourceTemplateCache, layout_hash, resolve_class
 
 logger = get_logger(__name__)
 
+deck_template_cache = ResourceTemplateCache()
+"""Prebuilt decks keyed by `deck_layout_hash`."""
+
 
 class ResourcePlacement(BaseModel):
   """A resource placement specification within a deck layout.
@@ -111,34 +118,50 @@ def _import_class(fqn: str) -> type:
       fqn: Fully qualified name (e.g., 'pylabrobot.resources.Plate').
 
   Returns:
-      The imported class.
+      The imported class (memoized by `resolve_class`).
 
   Raises:
       ImportError: If the module or class cannot be imported.
 
   """
-  module_path, class_name = fqn.rsplit(".", 1)
-  module = importlib.import_module(module_path)
-  return getattr(module, class_name)
+  return resolve_class(fqn)
+
+
+def deck_layout_hash(config: DeckLayoutConfig) -> str:
+  """Hash the parts of a layout that determine the built deck."""
+  return layout_hash(config.model_dump(mode="json", exclude={"description", "version"}))
 
 
-def build_deck_from_config(config: DeckLayoutConfig) -> Any:
+def build_deck_from_config(config: DeckLayoutConfig, *, use_template: bool = True) -> Any:
   """Build a PLR Deck from configuration.
 
   This function instantiates the deck class and places all
-  specified resources according to the configuration.
+  specified resources according to the configuration. With `use_template`,
+  the first build of a layout is snapshotted and later builds return a copy
+  of that snapshot.
 
   Args:
       config: The deck layout configuration.
+      use_template: Whether to read from and populate `deck_template_cache`.
 
   Returns:
-      A fully configured PLR Deck instance.
+      A fully configured PLR Deck instance, never shared with other callers.
 
   Raises:
       ImportError: If deck or resource classes cannot be imported.
       ValueError: If placement fails due to invalid slots/positions.
 
   """
+  if not use_template:
+    return _build_deck(config)
+  return deck_template_cache.get_or_build(
+    deck_layout_hash(config),
+    lambda: _build_deck(config),
+  )
+
+
+def _build_deck(config: DeckLayoutConfig) -> Any:
+  """Instantiate a deck and its placements from scratch."""
   # Import and instantiate the deck class
   logger.info("Building deck from config: %s", config.deck_fqn)
 
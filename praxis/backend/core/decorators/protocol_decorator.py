@@ -48,7 +48,7 @@ from .models import (
   praxis_run_context_cv,
 )
 
-logger = get_logger(__name__)
+logger = get_logger(__name__, rate_limit=100)
 
 
 async def _prepare_function_arguments(
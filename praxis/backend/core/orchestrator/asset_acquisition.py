@@ -29,6 +29,10 @@ class AssetAcquisitionMixin:
     acquired_assets_details: dict[uuid.UUID, Any],
   ) -> None:
     """Acquire assets required by the protocol."""
+    await self.asset_manager.prepare_machines(
+      protocol_run_accession_id,
+      protocol_pydantic_def.assets,
+    )
     for asset_req_model in protocol_pydantic_def.assets:
       try:
         logger.info(
@@ -10,6 +10,7 @@ if TYPE_CHECKING:
   from praxis.backend.services.protocol_definition import ProtocolDefinitionCRUDService
   from praxis.backend.services.protocols import ProtocolRunService
 
+from praxis.backend.configure import PraxisConfiguration
 from praxis.backend.core.asset_manager import AssetManager
 from praxis.backend.core.orchestrator.asset_acquisition import AssetAcquisitionMixin
 from praxis.backend.core.orchestrator.error_handling import ErrorHandlingMixin
@@ -52,7 +53,7 @@ class Orchestrator(
         asset_manager: An instance of AssetManager for asset allocation.
         workcell_runtime: An instance of WorkcellRuntime to manage live PLR objects.
         protocol_code_manager: An instance of ProtocolCodeManager for code preparation.
-            If None, a new instance will be created.
+            If None, a new instance is created using the configured worktree root.
         protocol_run_service: Service for protocol run operations.
         protocol_definition_service: Service for protocol definition operations.
         scheduler: Instance of ProtocolScheduler for releasing reservations.
@@ -65,7 +66,9 @@ class Orchestrator(
     self.db_session_factory = db_session_factory
     self.asset_manager = asset_manager
     self.workcell_runtime = workcell_runtime
-    self.protocol_code_manager = protocol_code_manager or ProtocolCodeManager()
+    self.protocol_code_manager = protocol_code_manager or ProtocolCodeManager(
+      worktree_root=PraxisConfiguration().protocol_worktree_root,
+    )
     self.scheduler = scheduler
 
     if not protocol_run_service or not protocol_definition_service:
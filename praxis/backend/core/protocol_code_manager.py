@@ -6,18 +6,26 @@ This module is responsible for preparing protocol code for execution, including:
 - Module imports and reloading
 - Protocol function loading and validation
 - Source code path management
+- Caching of loaded protocol callables keyed by commit SHA or source hash
 
 This separates the code preparation concerns from the main Orchestrator,
 allowing for cleaner separation of responsibilities.
 """
 
+import ast
 import asyncio
 import contextlib
+import hashlib
 import importlib
+import importlib.util
 import os
+import re
 import subprocess
 import sys
+import time
+from collections import OrderedDict
 from collections.abc import Callable
+from dataclasses import dataclass
 from pathlib import Path
 
 from praxis.backend.models import (
@@ -28,6 +36,12 @@ from praxis.backend.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+FULL_COMMIT_SHA_PATTERN = re.compile(r"^[0-9a-f]{40}$")
+DEFAULT_MAX_CACHED_PROTOCOLS = 128
+
+ProtocolCacheKey = tuple[str, str, str, str]
+"""(source identity, content version, module name, function name)."""
+
 
 @contextlib.contextmanager
 def temporary_sys_path(path_to_add: str | None):
@@ -81,6 +95,64 @@ def temporary_sys_path(path_to_add: str | None):
       sys.path = original_sys_path
 
 
+def _hash_file(path: Path) -> str | None:
+  """Return the SHA-256 hex digest of a file, or None if it cannot be read."""
+  try:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+  except OSError:
+    return None
+
+
+def _imported_module_names(tree: ast.Module, module_name: str, is_package: bool) -> set[str]:
+  """Return the absolute names of the modules a parsed module may import.
+
+  `from a import b` yields both `a` and `a.b`, since `b` may be a submodule.
+  """
+  names: set[str] = set()
+  for node in ast.walk(tree):
+    if isinstance(node, ast.Import):
+      names.update(alias.name for alias in node.names)
+    elif isinstance(node, ast.ImportFrom):
+      if node.level:
+        package_parts = module_name.split(".")
+        if not is_package:
+          package_parts.pop()
+        if node.level - 1 > len(package_parts):
+          continue
+        base_parts = package_parts[: len(package_parts) - (node.level - 1)]
+        base = ".".join([*base_parts, node.module] if node.module else base_parts)
+      else:
+        base = node.module or ""
+      if not base:
+        continue
+      names.add(base)
+      names.update(f"{base}.{alias.name}" for alias in node.names if alias.name != "*")
+  return names
+
+
+@dataclass
+class ProtocolCodeCacheStats:
+  """Counters for the loaded-protocol cache and preparation latency."""
+
+  hits: int = 0
+  misses: int = 0
+  evictions: int = 0
+  prepare_count: int = 0
+  total_prepare_seconds: float = 0.0
+  last_prepare_seconds: float = 0.0
+
+  @property
+  def hit_rate(self) -> float:
+    """Fraction of cacheable lookups served from the cache."""
+    lookups = self.hits + self.misses
+    return self.hits / lookups if lookups else 0.0
+
+  @property
+  def mean_prepare_seconds(self) -> float:
+    """Mean wall time of `prepare_protocol_code` calls."""
+    return self.total_prepare_seconds / self.prepare_count if self.prepare_count else 0.0
+
+
 class ProtocolCodeManager:
   """Manages protocol code preparation and loading for execution.
 
@@ -88,12 +160,235 @@ class ProtocolCodeManager:
   including Git operations, module imports, and function loading. It provides
   a clean interface for the Orchestrator to get executable protocol functions
   without worrying about the underlying source management complexity.
+
+  Loaded callables are cached in-process. Git sources are keyed by the resolved
+  commit SHA (immutable content), file-system and direct-import sources by the
+  SHA-256 of every source file the module imports from its own source tree, so a
+  cache entry is only invalidated when the code it was loaded from changes. When `worktree_root` is set, each commit is checked
+  out once into its own `git worktree` under that directory and reused on disk,
+  so preparing a known commit needs no git subprocesses at all.
   """
 
-  def __init__(self) -> None:
-    """Initialize the Protocol Code Manager."""
+  def __init__(
+    self,
+    worktree_root: str | None = None,
+    max_cached_protocols: int = DEFAULT_MAX_CACHED_PROTOCOLS,
+  ) -> None:
+    """Initialize the Protocol Code Manager.
+
+    Args:
+        worktree_root: Optional directory for per-commit worktrees. When None,
+            Git sources are checked out in place in the repository's
+            `local_checkout_path`.
+        max_cached_protocols: Maximum number of loaded callables kept in memory.
+
+    """
+    self.worktree_root = worktree_root
+    self.max_cached_protocols = max_cached_protocols
+    self._loaded_protocols: OrderedDict[
+      ProtocolCacheKey,
+      tuple[Callable, FunctionProtocolDefinitionCreate],
+    ] = OrderedDict()
+    self.cache_stats = ProtocolCodeCacheStats()
     logger.info("ProtocolCodeManager initialized.")
 
+  # --- Loaded-protocol cache ---
+
+  def _get_cached_protocol(
+    self,
+    key: ProtocolCacheKey | None,
+  ) -> tuple[Callable, FunctionProtocolDefinitionCreate] | None:
+    """Look up a loaded protocol, recording a hit or miss."""
+    if key is None:
+      return None
+    entry = self._loaded_protocols.get(key)
+    if entry is None:
+      self.cache_stats.misses += 1
+      return None
+    self._loaded_protocols.move_to_end(key)
+    self.cache_stats.hits += 1
+    logger.debug("Protocol cache hit for %s.%s @ %s", key[2], key[3], key[1][:12])
+    return entry
+
+  def _store_cached_protocol(
+    self,
+    key: ProtocolCacheKey,
+    entry: tuple[Callable, FunctionProtocolDefinitionCreate],
+    module_reloaded: bool,
+  ) -> None:
+    """Store a loaded protocol, evicting entries it has made stale.
+
+    `importlib.reload` re-executes a module in place, so when the module object
+    was reused every other cached version of that module now shares the new
+    globals and must be dropped.
+    """
+    if module_reloaded:
+      for stale_key in [
+        k for k in self._loaded_protocols if k[2] == key[2] and k[:2] != key[:2]
+      ]:
+        del self._loaded_protocols[stale_key]
+        self.cache_stats.evictions += 1
+    self._loaded_protocols[key] = entry
+    self._loaded_protocols.move_to_end(key)
+    while len(self._loaded_protocols) > self.max_cached_protocols:
+      self._loaded_protocols.popitem(last=False)
+      self.cache_stats.evictions += 1
+
+  def invalidate_protocol_cache(self, module_name: str | None = None) -> int:
+    """Drop cached protocol callables.
+
+    Args:
+        module_name: If given, only entries loaded from this module are dropped.
+
+    Returns:
+        The number of entries removed.
+
+    """
+    if module_name is None:
+      removed = len(self._loaded_protocols)
+      self._loaded_protocols.clear()
+    else:
+      stale = [k for k in self._loaded_protocols if k[2] == module_name]
+      for key in stale:
+        del self._loaded_protocols[key]
+      removed = len(stale)
+    self.cache_stats.evictions += removed
+    return removed
+
+  @staticmethod
+  def _module_file_in(base_path: str, module_name: str) -> Path | None:
+    """Locate the source file for `module_name` under `base_path`."""
+    relative = Path(*module_name.split("."))
+    for candidate in (
+      Path(base_path) / relative.with_suffix(".py"),
+      Path(base_path) / relative / "__init__.py",
+    ):
+      if candidate.is_file():
+        return candidate
+    return None
+
+  @staticmethod
+  def _module_file_on_import_path(module_name: str) -> Path | None:
+    """Locate the source file for an importable module without importing it."""
+    module = sys.modules.get(module_name)
+    origin = getattr(module, "__file__", None) if module is not None else None
+    if origin is None:
+      try:
+        spec = importlib.util.find_spec(module_name)
+      except (ImportError, ValueError):
+        return None
+      origin = spec.origin if spec is not None else None
+    if not origin or not origin.endswith(".py"):
+      return None
+    return Path(origin)
+
+  @classmethod
+  def _import_closure(
+    cls,
+    module_file: Path | None,
+    module_name: str,
+    source_root: str | None = None,
+  ) -> dict[str, Path]:
+    """Map a module and what it imports from its own package to their files.
+
+    Imports are followed transitively but only within the module's package (or,
+    for a top-level module, among the top-level modules of `source_root`), so
+    shared and third-party code is never walked.
+
+    Args:
+        module_file: The module's source file. An empty mapping is returned if None.
+        module_name: The module's dotted name.
+        source_root: Directory the module is imported from, e.g. a file-system
+            source's base path. When None it is derived from `module_file`, and a
+            top-level module is hashed on its own.
+
+    Returns:
+        Source files keyed by module name.
+
+    """
+    if module_file is None:
+      return {}
+    package = module_name.rpartition(".")[0] if module_file.name != "__init__.py" else module_name
+    if source_root is None:
+      if not package:
+        return {module_name: module_file}
+      depth = module_name.count(".") + (1 if module_file.name == "__init__.py" else 0)
+      source_root = str(module_file.parents[depth])
+
+    closure: dict[str, Path] = {}
+    pending: list[tuple[str, Path]] = [(module_name, module_file)]
+    while pending:
+      name, path = pending.pop()
+      if name in closure:
+        continue
+      closure[name] = path
+      parts = name.split(".")
+      candidates = {".".join(parts[:i]) for i in range(1, len(parts))}
+      try:
+        tree = ast.parse(path.read_bytes(), filename=str(path))
+      except (OSError, SyntaxError, ValueError):
+        tree = None
+      if tree is not None:
+        for imported in _imported_module_names(tree, name, path.name == "__init__.py"):
+          imported_parts = imported.split(".")
+          candidates.update(".".join(imported_parts[:i]) for i in range(1, len(imported_parts) + 1))
+      for candidate in candidates - closure.keys():
+        if package and candidate != package and not candidate.startswith(package + "."):
+          continue
+        if not package and "." in candidate:
+          continue
+        candidate_file = cls._module_file_in(source_root, candidate)
+        if candidate_file is not None:
+          pending.append((candidate, candidate_file))
+    return closure
+
+  def _content_cache_key(
+    self,
+    source_identity: str,
+    closure: dict[str, Path],
+    module_name: str,
+    function_name: str,
+  ) -> ProtocolCacheKey | None:
+    """Build a cache key from the hashes of a module's import closure."""
+    if not closure:
+      return None
+    digest = hashlib.sha256()
+    for name in sorted(closure):
+      file_hash = _hash_file(closure[name])
+      if file_hash is None:
+        return None
+      digest.update(f"{name}\0{file_hash}\n".encode())
+    return (source_identity, digest.hexdigest(), module_name, function_name)
+
+  @staticmethod
+  def _forget_imported_modules(module_name: str, closure: dict[str, Path]) -> None:
+    """Drop a module's imported dependencies from `sys.modules`.
+
+    Reloading a module does not reload what it imports, so dependencies are
+    imported afresh instead. The module itself and its parent packages stay, as
+    `importlib.reload` needs them.
+    """
+    parts = module_name.split(".")
+    keep = {".".join(parts[:i]) for i in range(1, len(parts) + 1)}
+    for name in closure.keys() - keep:
+      sys.modules.pop(name, None)
+
+  @staticmethod
+  def _purge_modules_outside(module_name: str, module_path: str) -> None:
+    """Drop imported modules of `module_name`'s package that live outside `module_path`.
+
+    Packages remember the directory they were imported from, so a module from
+    a different worktree must be imported fresh rather than reloaded in place.
+    """
+    root_package = module_name.split(".", 1)[0]
+    root = os.path.realpath(module_path)
+    for name in [
+      n for n in sys.modules if n == root_package or n.startswith(root_package + ".")
+    ]:
+      module_file = getattr(sys.modules[name], "__file__", None)
+      if module_file and not os.path.realpath(module_file).startswith(root + os.sep):
+        del sys.modules[name]
+
   async def _run_git_command(
     self,
     command: list[str],
@@ -298,7 +593,7 @@ class ProtocolCodeManager:
     checkout_path: str,
     commit_hash: str,
     repo_name_for_logging: str,
-  ) -> None:
+  ) -> str:
     """Checkout a specific commit and verify it's correct.
 
     Args:
@@ -306,6 +601,9 @@ class ProtocolCodeManager:
         commit_hash: The commit hash to checkout.
         repo_name_for_logging: Human-readable name for logging purposes.
 
+    Returns:
+        The full SHA of the checked-out commit.
+
     Raises:
         RuntimeError: If the checkout fails or verification fails.
 
@@ -341,6 +639,108 @@ class ProtocolCodeManager:
       commit_hash,
       current_commit,
     )
+    return current_commit
+
+  def _worktree_path(self, repo_name: str, commit_sha: str) -> Path:
+    """Directory of the cached worktree for a repository commit."""
+    safe_repo_name = re.sub(r"[^A-Za-z0-9_.-]", "_", repo_name) or "repo"
+    return Path(self.worktree_root or "") / safe_repo_name / commit_sha
+
+  async def _ensure_commit_worktree(
+    self,
+    checkout_path: str,
+    commit_sha: str,
+    repo_name_for_logging: str,
+  ) -> str:
+    """Create (once) a detached worktree for a commit and return its path.
+
+    Args:
+        checkout_path: Local path of the main Git repository.
+        commit_sha: The full commit SHA to check out.
+        repo_name_for_logging: Human-readable name for logging purposes.
+
+    Returns:
+        The path of the worktree containing the commit.
+
+    Raises:
+        RuntimeError: If the worktree cannot be created.
+
+    """
+    worktree_path = self._worktree_path(repo_name_for_logging, commit_sha)
+    if (worktree_path / ".git").exists():
+      return str(worktree_path)
+
+    logger.info(
+      "CODE-GIT: Creating worktree for commit '%s' of '%s' at '%s'...",
+      commit_sha,
+      repo_name_for_logging,
+      worktree_path,
+    )
+    worktree_path.parent.mkdir(parents=True, exist_ok=True)
+    await self._run_git_command(["git", "worktree", "prune"], cwd=checkout_path)
+    await self._run_git_command(
+      ["git", "worktree", "add", "--detach", str(worktree_path), commit_sha],
+      cwd=checkout_path,
+    )
+    return str(worktree_path)
+
+  async def _prepare_git_source(
+    self,
+    protocol_def_model: FunctionProtocolDefinition,
+  ) -> tuple[str, ProtocolCacheKey | None]:
+    """Make a Git source's commit importable and return its path and cache key."""
+    repo = protocol_def_model.source_repository
+    checkout_path = repo.local_checkout_path
+    commit_hash_to_checkout = protocol_def_model.commit_hash
+
+    if not checkout_path or not commit_hash_to_checkout or not repo.git_url:
+      msg = f"Incomplete Git source info for protocol '{protocol_def_model.name}'."
+      raise ValueError(
+        msg,
+      )
+
+    def cache_key(commit_sha: str) -> ProtocolCacheKey:
+      return (
+        repo.git_url,
+        commit_sha,
+        protocol_def_model.module_name,
+        protocol_def_model.function_name,
+      )
+
+    is_full_sha = bool(FULL_COMMIT_SHA_PATTERN.match(commit_hash_to_checkout))
+    if is_full_sha and cache_key(commit_hash_to_checkout) in self._loaded_protocols:
+      # The commit's content is immutable and already loaded: no git work needed.
+      module_path = (
+        str(self._worktree_path(repo.name, commit_hash_to_checkout))
+        if self.worktree_root is not None
+        else checkout_path
+      )
+      return module_path, cache_key(commit_hash_to_checkout)
+
+    if self.worktree_root is not None:
+      if is_full_sha and (self._worktree_path(repo.name, commit_hash_to_checkout) / ".git").exists():
+        return (
+          str(self._worktree_path(repo.name, commit_hash_to_checkout)),
+          cache_key(commit_hash_to_checkout),
+        )
+      await self._ensure_git_repo_and_fetch(repo.git_url, checkout_path, repo.name)
+      commit_sha = await self._run_git_command(
+        ["git", "rev-parse", commit_hash_to_checkout + "^{commit}"],
+        cwd=checkout_path,
+        suppress_output=True,
+      )
+      worktree_path = await self._ensure_commit_worktree(checkout_path, commit_sha, repo.name)
+      return worktree_path, cache_key(commit_sha)
+
+    await self._ensure_git_repo_and_fetch(repo.git_url, checkout_path, repo.name)
+    resolved_commit = await self._checkout_specific_commit(
+      checkout_path,
+      commit_hash_to_checkout,
+      repo.name,
+    )
+    if not isinstance(resolved_commit, str):
+      resolved_commit = commit_hash_to_checkout if is_full_sha else None
+    return checkout_path, cache_key(resolved_commit) if resolved_commit else None
 
   def _load_protocol_function(
     self,
@@ -452,27 +852,38 @@ class ProtocolCodeManager:
       protocol_def_model.name,
       protocol_def_model.version,
     )
+    started = time.perf_counter()
+    try:
+      return await self._prepare_protocol_code(protocol_def_model)
+    finally:
+      elapsed = time.perf_counter() - started
+      self.cache_stats.prepare_count += 1
+      self.cache_stats.total_prepare_seconds += elapsed
+      self.cache_stats.last_prepare_seconds = elapsed
+      logger.debug(
+        "Prepared protocol '%s' in %.3fs (cache hits=%d, misses=%d).",
+        protocol_def_model.name,
+        elapsed,
+        self.cache_stats.hits,
+        self.cache_stats.misses,
+      )
+
+  async def _prepare_protocol_code(
+    self,
+    protocol_def_model: FunctionProtocolDefinition,
+  ) -> tuple[Callable, FunctionProtocolDefinitionCreate]:
+    """Resolve, cache-check and load a protocol's code."""
     module_path_to_add_for_sys_path: str | None = None
+    cache_key: ProtocolCacheKey | None = None
+    closure: dict[str, Path] = {}
+    module_name = protocol_def_model.module_name
+    function_name = protocol_def_model.function_name
 
     # Handle Git repository sources
     if protocol_def_model.source_repository_accession_id and protocol_def_model.source_repository:
-      repo = protocol_def_model.source_repository
-      checkout_path = repo.local_checkout_path
-      commit_hash_to_checkout = protocol_def_model.commit_hash
-
-      if not checkout_path or not commit_hash_to_checkout or not repo.git_url:
-        msg = f"Incomplete Git source info for protocol '{protocol_def_model.name}'."
-        raise ValueError(
-          msg,
-        )
-
-      await self._ensure_git_repo_and_fetch(repo.git_url, checkout_path, repo.name)
-      await self._checkout_specific_commit(
-        checkout_path,
-        commit_hash_to_checkout,
-        repo.name,
+      module_path_to_add_for_sys_path, cache_key = await self._prepare_git_source(
+        protocol_def_model,
       )
-      module_path_to_add_for_sys_path = checkout_path
 
     # Handle file system sources
     elif protocol_def_model.file_system_source_accession_id and protocol_def_model.file_system_source:
@@ -483,6 +894,17 @@ class ProtocolCodeManager:
           msg,
         )
       module_path_to_add_for_sys_path = fs_source.base_path
+      closure = self._import_closure(
+        self._module_file_in(fs_source.base_path, module_name),
+        module_name,
+        fs_source.base_path,
+      )
+      cache_key = self._content_cache_key(
+        fs_source.base_path,
+        closure,
+        module_name,
+        function_name,
+      )
 
     # Handle protocols without explicit sources
     else:
@@ -490,26 +912,31 @@ class ProtocolCodeManager:
         "Protocol '%s' has no linked source. Attempting direct import.",
         protocol_def_model.name,
       )
+      closure = self._import_closure(
+        self._module_file_on_import_path(module_name),
+        module_name,
+      )
+      cache_key = self._content_cache_key("", closure, module_name, function_name)
+
+    cached = self._get_cached_protocol(cache_key)
+    if cached is not None:
+      return self._with_model_accession_id(protocol_def_model, *cached)
 
     # Load the actual function
     try:
+      if self.worktree_root is not None and module_path_to_add_for_sys_path:
+        self._purge_modules_outside(module_name, module_path_to_add_for_sys_path)
+      self._forget_imported_modules(module_name, closure)
+      module_reloaded = module_name in sys.modules
       func_wrapper, pydantic_def = self._load_protocol_function(
-        protocol_def_model.module_name,
-        protocol_def_model.function_name,
+        module_name,
+        function_name,
         module_path_to_add_for_sys_path,
       )
+      if cache_key is not None:
+        self._store_cached_protocol(cache_key, (func_wrapper, pydantic_def), module_reloaded)
 
-      if protocol_def_model.accession_id and (
-        not pydantic_def.accession_id or pydantic_def.accession_id != protocol_def_model.accession_id
-      ):
-        pydantic_def.accession_id = protocol_def_model.accession_id
-        logger.debug(
-          "Updated Pydantic definition DB ID for '%s' to %s",
-          pydantic_def.name,
-          protocol_def_model.accession_id,
-        )
-
-      return func_wrapper, pydantic_def
+      return self._with_model_accession_id(protocol_def_model, func_wrapper, pydantic_def)
 
     except Exception:
       logger.exception(
@@ -518,3 +945,27 @@ class ProtocolCodeManager:
         protocol_def_model.module_name,
       )
       raise
+
+  @staticmethod
+  def _with_model_accession_id(
+    protocol_def_model: FunctionProtocolDefinition,
+    func_wrapper: Callable,
+    pydantic_def: FunctionProtocolDefinitionCreate,
+  ) -> tuple[Callable, FunctionProtocolDefinitionCreate]:
+    """Align the loaded definition's accession ID with the ORM definition.
+
+    The definition may be shared through the loaded-protocol cache, so a copy is
+    returned rather than updating it in place.
+    """
+    if protocol_def_model.accession_id and (
+      not pydantic_def.accession_id or pydantic_def.accession_id != protocol_def_model.accession_id
+    ):
+      pydantic_def = pydantic_def.model_copy(
+        update={"accession_id": protocol_def_model.accession_id},
+      )
+      logger.debug(
+        "Updated Pydantic definition DB ID for '%s' to %s",
+        pydantic_def.name,
+        protocol_def_model.accession_id,
+      )
+    return func_wrapper, pydantic_def
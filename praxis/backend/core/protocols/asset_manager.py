@@ -1,6 +1,7 @@
 """AssetManager Protocol."""
 
 import uuid
+from collections.abc import Iterable
 from typing import Any, Protocol, runtime_checkable
 
 from pylabrobot.resources import Deck
@@ -28,6 +29,12 @@ class IAssetManager(Protocol):
     fqn_constraint: str,
   ) -> tuple[Any, uuid.UUID, str]: ...
 
+  async def prepare_machines(
+    self,
+    protocol_run_accession_id: uuid.UUID,
+    asset_requirements: Iterable[AssetRequirementModel],
+  ) -> None: ...
+
   async def acquire_resource(
     self,
     resource_data: AcquireAsset,
@@ -1,6 +1,7 @@
 """WorkcellRuntime Protocol."""
 
 import uuid
+from collections.abc import Iterable, Mapping
 from typing import Any, Protocol, runtime_checkable
 
 from pylabrobot.machines import Machine as PLRMachine
@@ -29,6 +30,12 @@ class IWorkcellRuntime(Protocol):
 
   async def initialize_machine(self, machine: Machine) -> PLRMachine: ...
 
+  async def initialize_machines(
+    self,
+    machines: Iterable[Machine],
+    dependencies: Mapping[uuid.UUID, Iterable[uuid.UUID]] | None = None,
+  ) -> dict[uuid.UUID, PLRMachine]: ...
+
   async def create_or_get_resource(
     self,
     resource: Resource,
@@ -50,7 +57,12 @@ class IWorkcellRuntime(Protocol):
 
   def get_active_deck(self, deck_accession_id: uuid.UUID) -> PLRDeck: ...
 
-  async def shutdown_machine(self, machine_accession_id: uuid.UUID) -> None: ...
+  async def shutdown_machine(
+    self,
+    machine_accession_id: uuid.UUID,
+    *,
+    keep_warm: bool | None = None,
+  ) -> None: ...
 
   async def assign_resource_to_deck(
     self,
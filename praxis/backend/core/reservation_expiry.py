@@ -0,0 +1,270 @@
+"""Background expiry of lapsed asset reservations.
+
+Reservations with an `expires_at` used to be expired only when somebody
+happened to call `cleanup_expired_reservations`. `ReservationExpiryService`
+keeps the upcoming deadlines in a min-heap and sleeps until the earliest one,
+then expires everything that is due with set-based `UPDATE ... RETURNING`
+statements (driven by the index on `expires_at`). For each batch it drops the
+runs from the reservation manager's cache and publishes one release event, so
+anything waiting on those assets can re-evaluate straight away.
+
+A periodic safety sweep also catches reservations whose deadline was never
+handed to this process (other workers, rows created through the API).
+
+Usage:
+    expiry = ReservationExpiryService(session_factory, pubsub=pubsub,
+                                      reservation_manager=manager)
+    await expiry.load()
+    expiry.start()
+    ...
+    await expiry.stop()
+
+"""
+
+import asyncio
+import contextlib
+import heapq
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from praxis.backend.models.domain.schedule import AssetReservation
+from praxis.backend.services.scheduler import ACTIVE_RESERVATION_STATUSES, expire_reservations
+from praxis.backend.utils.logging import get_logger
+
+if TYPE_CHECKING:
+  from praxis.backend.core.scheduler_resources import AssetReservationManager
+  from praxis.backend.core.storage import PubSub
+
+logger = get_logger(__name__)
+
+RESERVATION_RELEASED_CHANNEL = "asset_reservations:released"
+"""Pub/sub channel carrying one message per batch of released reservations."""
+
+DEFAULT_BATCH_SIZE = 500
+DEFAULT_SAFETY_SWEEP_SECONDS = 30.0
+
+
+def _as_utc(timestamp: datetime) -> datetime:
+  if timestamp.tzinfo is None:
+    return timestamp.replace(tzinfo=timezone.utc)
+  return timestamp.astimezone(timezone.utc)
+
+
+@dataclass
+class SweepMetrics:
+  """Counters describing how promptly reservations are being expired."""
+
+  sweeps: int = 0
+  expired_total: int = 0
+  last_sweep_at: datetime | None = None
+  last_sweep_duration_ms: float = 0.0
+  last_expired: int = 0
+  last_lag_ms: float = 0.0
+  """How long past its deadline the most overdue reservation of the last sweep was."""
+  max_lag_ms: float = 0.0
+  tracked_deadlines: int = 0
+  next_deadline: datetime | None = None
+
+  def as_dict(self) -> dict[str, Any]:
+    """Return the metrics as a JSON-friendly dict."""
+    return {
+      "sweeps": self.sweeps,
+      "expired_total": self.expired_total,
+      "last_sweep_at": self.last_sweep_at.isoformat() if self.last_sweep_at else None,
+      "last_sweep_duration_ms": self.last_sweep_duration_ms,
+      "last_expired": self.last_expired,
+      "last_lag_ms": self.last_lag_ms,
+      "max_lag_ms": self.max_lag_ms,
+      "tracked_deadlines": self.tracked_deadlines,
+      "next_deadline": self.next_deadline.isoformat() if self.next_deadline else None,
+    }
+
+
+class ReservationExpiryService:
+  """Expire asset reservations at their deadlines and announce the releases."""
+
+  def __init__(
+    self,
+    db_session_factory: async_sessionmaker[AsyncSession],
+    *,
+    pubsub: "PubSub | None" = None,
+    reservation_manager: "AssetReservationManager | None" = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    safety_sweep_seconds: float = DEFAULT_SAFETY_SWEEP_SECONDS,
+  ) -> None:
+    """Initialize the service.
+
+    Args:
+        db_session_factory: Factory for the sessions used to sweep.
+        pubsub: Where release events are published (optional).
+        reservation_manager: Manager whose cache is kept in step; new
+            reservations it makes with an `expires_at` are tracked here.
+        batch_size: Maximum reservations expired per statement.
+        safety_sweep_seconds: Longest sleep between sweeps, even when no
+            tracked deadline is due.
+
+    """
+    self.db_session_factory = db_session_factory
+    self.pubsub = pubsub
+    self.reservation_manager = reservation_manager
+    self.batch_size = batch_size
+    self.safety_sweep_seconds = safety_sweep_seconds
+    self.metrics = SweepMetrics()
+    self._deadlines: list[tuple[datetime, uuid.UUID]] = []
+    self._wake = asyncio.Event()
+    self._sweep_lock = asyncio.Lock()
+    self._task: asyncio.Task | None = None
+    self._stopping = False
+    if reservation_manager is not None:
+      reservation_manager.expiry_tracker = self
+
+  # --- Deadlines ---
+
+  def track(self, reservation_id: uuid.UUID, expires_at: datetime) -> None:
+    """Schedule a reservation to be expired at `expires_at`."""
+    expires_at = _as_utc(expires_at)
+    earliest = self._deadlines[0][0] if self._deadlines else None
+    heapq.heappush(self._deadlines, (expires_at, reservation_id))
+    if earliest is None or expires_at < earliest:
+      self._wake.set()  # Re-arm the sleeper for the earlier deadline
+
+  async def load(self) -> int:
+    """Track the deadlines of all active reservations in the database.
+
+    Returns:
+        The number of deadlines loaded.
+
+    """
+    async with self.db_session_factory() as db_session:
+      result = await db_session.execute(
+        select(AssetReservation.accession_id, AssetReservation.expires_at).where(
+          AssetReservation.expires_at.is_not(None),
+          AssetReservation.status.in_(ACTIVE_RESERVATION_STATUSES),
+        ),
+      )
+      rows = result.all()
+    self._deadlines = [(_as_utc(row.expires_at), row.accession_id) for row in rows]
+    heapq.heapify(self._deadlines)
+    self._wake.set()
+    logger.info("ReservationExpiry: Tracking %d reservation deadlines.", len(rows))
+    return len(rows)
+
+  def next_deadline(self) -> datetime | None:
+    """Return the earliest tracked deadline, if any."""
+    return self._deadlines[0][0] if self._deadlines else None
+
+  # --- Sweeping ---
+
+  async def sweep(self, now: datetime | None = None) -> int:
+    """Expire every reservation that is due and publish the releases.
+
+    Returns:
+        The number of reservations expired.
+
+    """
+    async with self._sweep_lock:
+      now = _as_utc(now) if now is not None else datetime.now(timezone.utc)
+      started = time.perf_counter()
+      expired = 0
+      max_lag_ms = 0.0
+      while True:
+        async with self.db_session_factory() as db_session:
+          rows = await expire_reservations(db_session, now, limit=self.batch_size)
+          await db_session.commit()
+        if rows:
+          expired += len(rows)
+          oldest = min(_as_utc(row.expires_at) for row in rows)
+          max_lag_ms = max(max_lag_ms, (now - oldest).total_seconds() * 1000)
+          await self._announce(rows)
+        if len(rows) < self.batch_size:
+          break
+
+      while self._deadlines and self._deadlines[0][0] <= now:
+        heapq.heappop(self._deadlines)
+      self._record(now, expired, max_lag_ms, started)
+    if expired:
+      logger.info(
+        "ReservationExpiry: Expired %d reservations (lag %.0f ms).",
+        expired,
+        max_lag_ms,
+      )
+    return expired
+
+  async def _announce(self, rows: list[Any]) -> None:
+    released = [
+      {
+        "reservation_id": str(row.accession_id),
+        "asset_key": row.redis_lock_key,
+        "protocol_run_id": str(row.protocol_run_accession_id),
+      }
+      for row in rows
+    ]
+    if self.reservation_manager is not None:
+      for row in rows:
+        self.reservation_manager.discard_cached_reservation(
+          row.redis_lock_key,
+          row.protocol_run_accession_id,
+        )
+    if self.pubsub is not None:
+      try:
+        await self.pubsub.publish(
+          RESERVATION_RELEASED_CHANNEL,
+          {"reason": "expired", "reservations": released},
+        )
+      except Exception:
+        # The releases are committed; subscribers will catch up on the next sweep.
+        logger.exception("ReservationExpiry: Failed to publish %d releases.", len(released))
+
+  def _record(self, now: datetime, expired: int, lag_ms: float, started: float) -> None:
+    metrics = self.metrics
+    metrics.sweeps += 1
+    metrics.expired_total += expired
+    metrics.last_sweep_at = now
+    metrics.last_sweep_duration_ms = (time.perf_counter() - started) * 1000
+    metrics.last_expired = expired
+    metrics.last_lag_ms = lag_ms
+    metrics.max_lag_ms = max(metrics.max_lag_ms, lag_ms)
+    metrics.tracked_deadlines = len(self._deadlines)
+    metrics.next_deadline = self.next_deadline()
+
+  # --- Background loop ---
+
+  def start(self) -> None:
+    """Start sweeping in the background."""
+    if self._task is None or self._task.done():
+      self._stopping = False
+      self._task = asyncio.create_task(self._run())
+
+  async def stop(self) -> None:
+    """Stop the background sweeper, letting a sweep in progress finish."""
+    if self._task is None:
+      return
+    self._stopping = True
+    self._wake.set()
+    await self._task
+    self._task = None
+
+  async def _run(self) -> None:
+    while not self._stopping:
+      try:
+        await self.sweep()
+        sleep_seconds = self._sleep_seconds()
+      except Exception:
+        logger.exception("ReservationExpiry: Sweep failed; retrying after the safety interval.")
+        sleep_seconds = self.safety_sweep_seconds
+      self._wake.clear()
+      with contextlib.suppress(asyncio.TimeoutError):
+        await asyncio.wait_for(self._wake.wait(), timeout=sleep_seconds)
+
+  def _sleep_seconds(self) -> float:
+    deadline = self.next_deadline()
+    if deadline is None:
+      return self.safety_sweep_seconds
+    until_due = (deadline - datetime.now(timezone.utc)).total_seconds()
+    return min(self.safety_sweep_seconds, max(0.0, until_due))
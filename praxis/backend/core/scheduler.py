@@ -1,6 +1,7 @@
 # pylint: disable=too-many-arguments,fixme
 """Protocol Scheduler - Manages protocol execution scheduling and asset allocation."""
 from .scheduler_core import ProtocolScheduler, TaskQueue
+from .scheduler_queue import PersistentScheduleQueue, QueuedSchedule, ScheduleQueue
 from .scheduler_resources import AssetReservationManager
 from .scheduler_state import ScheduleEntry
 
@@ -9,4 +10,7 @@ __all__ = [
     "ScheduleEntry",
     "AssetReservationManager",
     "TaskQueue",
+    "PersistentScheduleQueue",
+    "QueuedSchedule",
+    "ScheduleQueue",
 ]
@@ -5,6 +5,7 @@ from typing import Any, Protocol
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from praxis.backend.core.scheduler_queue import PersistentScheduleQueue
 from praxis.backend.core.scheduler_resources import AssetReservationManager
 from praxis.backend.core.scheduler_state import ScheduleEntry
 from praxis.backend.models.domain.filters import SearchFilters
@@ -17,7 +18,7 @@ from praxis.backend.models.domain.protocol import (
 from praxis.backend.models.domain.protocol import (
   AssetRequirement as AssetRequirementModel,
 )
-from praxis.backend.models.enums import ProtocolRunStatusEnum
+from praxis.backend.models.enums import ProtocolRunStatusEnum, ScheduleStatusEnum
 from praxis.backend.models.pydantic_internals.runtime import RuntimeAssetRequirement
 from praxis.backend.services.protocol_definition import ProtocolDefinitionCRUDService
 from praxis.backend.services.protocols import ProtocolRunService
@@ -25,7 +26,7 @@ from praxis.backend.utils.errors import AssetAcquisitionError, OrchestratorError
 from praxis.backend.utils.logging import get_logger
 from praxis.backend.utils.uuid import uuid7, generate_accession_id
 
-logger = get_logger(__name__)
+logger = get_logger(__name__, rate_limit=100)
 
 
 class TaskResult(Protocol):
@@ -51,13 +52,25 @@ class ProtocolScheduler:
     task_queue: TaskQueue,
     protocol_run_service: ProtocolRunService,
     protocol_definition_service: ProtocolDefinitionCRUDService,
+    schedule_queue: PersistentScheduleQueue | None = None,
   ) -> None:
-    """Initialize the Protocol Scheduler."""
+    """Initialize the Protocol Scheduler.
+
+    Args:
+        db_session_factory: Factory for database sessions.
+        task_queue: Queue that executes scheduled runs.
+        protocol_run_service: Service for protocol run records.
+        protocol_definition_service: Service for protocol definitions.
+        schedule_queue: Optional write-behind queue that records each run's
+            `ScheduleEntry` and its status transitions.
+
+    """
     self.db_session_factory = db_session_factory
     self.task_queue = task_queue
     self.protocol_run_service = protocol_run_service
     self.protocol_definition_service = protocol_definition_service
     self.asset_reservation_manager = AssetReservationManager(db_session_factory)
+    self.schedule_queue = schedule_queue
 
     self._active_schedules: dict[uuid.UUID, ScheduleEntry] = {}
     logger.info("ProtocolScheduler initialized with database-backed reservations.")
@@ -209,6 +222,18 @@ class ProtocolScheduler:
           estimated_duration_ms=None,
         )
         self._active_schedules[protocol_run_model.accession_id] = schedule_entry
+        if (
+          self.schedule_queue is not None
+          and self.schedule_queue.get_by_run(protocol_run_model.accession_id) is None
+        ):
+          self.schedule_queue.enqueue(
+            protocol_run_model.accession_id,
+            priority=schedule_entry.priority,
+            scheduled_at=schedule_entry.scheduled_at,
+            required_asset_count=len(requirements),
+            user_params_json=user_params,
+            initial_state_json=initial_state,
+          )
 
         await self.protocol_run_service.update(
           db=db_session,
@@ -243,6 +268,7 @@ class ProtocolScheduler:
         "Error scheduling protocol execution for run %s",
         protocol_run_id,
       )
+      self._record_schedule_status(protocol_run_id, ScheduleStatusEnum.FAILED)
       if isinstance(e, AssetAcquisitionError | OrchestratorError):
         raise
       msg = f"Failed to schedule protocol execution: {e!s}"
@@ -278,6 +304,7 @@ class ProtocolScheduler:
         schedule_entry = self._active_schedules[protocol_run_id]
         schedule_entry.status = "QUEUED"
         schedule_entry.celery_task_id = celery_task_id
+      self._record_schedule_status(protocol_run_id, ScheduleStatusEnum.CELERY_QUEUED)
 
     except Exception as e:
       error_str = str(e).lower()
@@ -291,6 +318,7 @@ class ProtocolScheduler:
           schedule_entry = self._active_schedules[protocol_run_id]
           schedule_entry.status = "RUNNING_DIRECT"
           schedule_entry.celery_task_id = None
+        self._record_schedule_status(protocol_run_id, ScheduleStatusEnum.EXECUTING)
         return True
 
       logger.exception(
@@ -316,6 +344,7 @@ class ProtocolScheduler:
       ]
       await self.asset_reservation_manager.release_reservations(asset_keys, protocol_run_id)
       del self._active_schedules[protocol_run_id]
+      self._record_schedule_status(protocol_run_id, ScheduleStatusEnum.CANCELLED)
       logger.info("Successfully cancelled scheduled run %s", protocol_run_id)
 
     except Exception:
@@ -327,6 +356,18 @@ class ProtocolScheduler:
     else:
       return True
 
+  def _record_schedule_status(
+    self,
+    protocol_run_id: uuid.UUID,
+    status: ScheduleStatusEnum,
+  ) -> None:
+    """Buffer a status change for the run's persisted schedule entry, if queued."""
+    if self.schedule_queue is None:
+      return
+    queued = self.schedule_queue.get_by_run(protocol_run_id)
+    if queued is not None:
+      self.schedule_queue.set_status(queued.accession_id, status)
+
   async def get_schedule_status(
     self,
     protocol_run_id: uuid.UUID,
@@ -391,6 +432,7 @@ class ProtocolScheduler:
         asset_keys_to_release, protocol_run_id
       )
       del self._active_schedules[protocol_run_id]
+      self._record_schedule_status(protocol_run_id, ScheduleStatusEnum.COMPLETED)
       logger.info(
         "Successfully completed scheduled run %s and released resources",
         protocol_run_id,
@@ -0,0 +1,634 @@
+# pylint: disable=too-many-arguments,fixme
+"""Batched write-behind persistence of schedule entries, with an in-memory queue.
+
+`PersistentScheduleQueue` records the `ScheduleEntry` rows, status and priority
+updates, and `ScheduleHistory` events of the runs `ProtocolScheduler` schedules.
+Every change is applied in memory immediately and recorded in a write-behind
+buffer; a background task (or an explicit `flush()`) persists the buffered
+writes in a single transaction per batch. A failing batch is retried with
+exponential backoff; once it has failed `max_flush_attempts` times, its entries
+are persisted one at a time and those that still fail are moved to
+`dead_letters`. Writes buffered but not yet flushed when the process dies are
+lost, so the durability window is one flush interval.
+
+Entries are kept in a `ScheduleQueue`, a heap ordered by priority, then
+`scheduled_at`, then submission order, with O(log n) enqueue, dequeue, removal
+and re-prioritization (removed or re-prioritized entries are dropped lazily
+when they surface). The ordering is bookkeeping only: `ProtocolScheduler`
+hands each run to the task queue as soon as it is scheduled and does not
+dispatch from `dequeue()`.
+
+The queue only tracks entries created by this process, and only until the run
+is handed to a worker (`HANDED_OFF_STATUSES`) or finishes; the worker reports
+the outcome from its own process. Entries written directly through
+`ScheduleEntryCRUDService` bypass the queue, and entries a previous process
+left waiting are not resumed on startup (a run may already have been handed to
+the task queue before its status change was flushed).
+"""
+
+import asyncio
+import contextlib
+import heapq
+import itertools
+import uuid
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from praxis.backend.models.domain.protocol import ProtocolRun
+from praxis.backend.models.domain.schedule import ScheduleEntry, ScheduleHistory
+from praxis.backend.models.enums import ScheduleHistoryEventEnum, ScheduleStatusEnum
+from praxis.backend.services.scheduler import build_schedule_event
+from praxis.backend.services.scheduler_metrics import WAITING_STATUSES, record_schedule_events
+from praxis.backend.utils.logging import get_logger
+from praxis.backend.utils.uuid import uuid7
+
+logger = get_logger(__name__)
+
+DEFAULT_FLUSH_INTERVAL = 0.5
+"""Seconds between write-behind flushes."""
+
+DEFAULT_MAX_BATCH_SIZE = 500
+"""Buffered writes that trigger an early flush."""
+
+DEFAULT_MAX_FLUSH_ATTEMPTS = 5
+"""Consecutive failed flushes before a batch is split up and poison writes dead-lettered."""
+
+DEFAULT_MAX_RETRY_DELAY = 30.0
+"""Upper bound in seconds for the backoff between failed flushes."""
+
+DEFAULT_DEAD_LETTER_LIMIT = 1000
+"""Dead-lettered write groups kept for inspection."""
+
+TERMINAL_STATUSES = frozenset(
+  {
+    ScheduleStatusEnum.COMPLETED,
+    ScheduleStatusEnum.FAILED,
+    ScheduleStatusEnum.CANCELLED,
+    ScheduleStatusEnum.CONFLICT,
+    ScheduleStatusEnum.TIMEOUT,
+  },
+)
+
+
+HANDED_OFF_STATUSES = frozenset({ScheduleStatusEnum.CELERY_QUEUED})
+"""Statuses whose run is finished by a worker process, so this process stops tracking it."""
+
+
+def _utcnow() -> datetime:
+  return datetime.now(timezone.utc)
+
+
+def _sort_time(value: datetime) -> datetime:
+  """Make naive timestamps (as returned by SQLite) comparable with aware ones."""
+  return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+
+
+@dataclass
+class QueuedSchedule:
+  """A schedule entry tracked by the queue."""
+
+  accession_id: uuid.UUID
+  protocol_run_accession_id: uuid.UUID
+  priority: int = 1
+  scheduled_at: datetime = field(default_factory=_utcnow)
+  status: ScheduleStatusEnum = ScheduleStatusEnum.QUEUED
+
+
+class ScheduleQueue:
+  """Priority queue of schedule entries keyed by (priority, scheduled_at)."""
+
+  def __init__(self) -> None:
+    """Initialize an empty queue."""
+    self._heap: list[tuple[int, datetime, int, uuid.UUID]] = []
+    self._entries: dict[uuid.UUID, QueuedSchedule] = {}
+    self._live_seq: dict[uuid.UUID, int] = {}
+    self._by_run: dict[uuid.UUID, uuid.UUID] = {}
+    self._counter = itertools.count()
+
+  def __len__(self) -> int:
+    return len(self._entries)
+
+  def __contains__(self, accession_id: object) -> bool:
+    return accession_id in self._entries
+
+  def get(self, accession_id: uuid.UUID) -> QueuedSchedule | None:
+    """Return the queued entry with this ID, if any."""
+    return self._entries.get(accession_id)
+
+  def get_by_run(self, protocol_run_accession_id: uuid.UUID) -> QueuedSchedule | None:
+    """Return the queued entry for a protocol run, if any."""
+    accession_id = self._by_run.get(protocol_run_accession_id)
+    return self._entries.get(accession_id) if accession_id is not None else None
+
+  def push(self, item: QueuedSchedule) -> None:
+    """Add an entry.
+
+    Raises:
+        ValueError: If the entry, or another entry for the same run, is queued.
+
+    """
+    if item.accession_id in self._entries or item.protocol_run_accession_id in self._by_run:
+      msg = f"Protocol run {item.protocol_run_accession_id} is already queued."
+      raise ValueError(msg)
+    self._entries[item.accession_id] = item
+    self._by_run[item.protocol_run_accession_id] = item.accession_id
+    self._push_key(item)
+
+  def pop(self) -> QueuedSchedule | None:
+    """Remove and return the next entry to run, or None if the queue is empty."""
+    while self._heap:
+      _, _, seq, accession_id = heapq.heappop(self._heap)
+      if self._live_seq.get(accession_id) == seq:
+        return self._forget(accession_id)
+    return None
+
+  def peek(self) -> QueuedSchedule | None:
+    """Return the next entry to run without removing it."""
+    while self._heap:
+      _, _, seq, accession_id = self._heap[0]
+      if self._live_seq.get(accession_id) == seq:
+        return self._entries[accession_id]
+      heapq.heappop(self._heap)
+    return None
+
+  def remove(self, accession_id: uuid.UUID) -> QueuedSchedule | None:
+    """Remove an entry wherever it is in the queue."""
+    if accession_id not in self._entries:
+      return None
+    item = self._forget(accession_id)
+    self._maybe_compact()
+    return item
+
+  def update_priority(self, accession_id: uuid.UUID, priority: int) -> QueuedSchedule | None:
+    """Change an entry's priority and move it accordingly."""
+    item = self._entries.get(accession_id)
+    if item is None:
+      return None
+    item.priority = priority
+    self._push_key(item)
+    self._maybe_compact()
+    return item
+
+  def ordered(self) -> list[QueuedSchedule]:
+    """Return the queued entries in dequeue order (O(n log n); for listing only)."""
+    return sorted(self._entries.values(), key=self._key)
+
+  def clear(self) -> None:
+    """Remove every entry."""
+    self._heap.clear()
+    self._entries.clear()
+    self._live_seq.clear()
+    self._by_run.clear()
+
+  @staticmethod
+  def _key(item: QueuedSchedule) -> tuple[int, datetime]:
+    return (-item.priority, _sort_time(item.scheduled_at))
+
+  def _push_key(self, item: QueuedSchedule) -> None:
+    seq = next(self._counter)
+    self._live_seq[item.accession_id] = seq
+    heapq.heappush(self._heap, (*self._key(item), seq, item.accession_id))
+
+  def _forget(self, accession_id: uuid.UUID) -> QueuedSchedule:
+    item = self._entries.pop(accession_id)
+    del self._live_seq[accession_id]
+    self._by_run.pop(item.protocol_run_accession_id, None)
+    return item
+
+  def _maybe_compact(self) -> None:
+    """Rebuild the heap once stale keys outnumber live ones."""
+    if len(self._heap) > 2 * len(self._entries) + 64:
+      self._heap = [key for key in self._heap if self._live_seq.get(key[3]) == key[2]]
+      heapq.heapify(self._heap)
+
+
+@dataclass
+class _WriteBatch:
+  """Writes buffered between two flushes."""
+
+  inserts: dict[uuid.UUID, dict[str, Any]] = field(default_factory=dict)
+  updates: dict[uuid.UUID, dict[str, Any]] = field(default_factory=dict)
+  history: list[ScheduleHistory] = field(default_factory=list)
+
+  def __len__(self) -> int:
+    return len(self.inserts) + len(self.updates) + len(self.history)
+
+  def set_fields(self, accession_id: uuid.UUID, **values: Any) -> None:
+    """Record column updates, folding them into a still-buffered insert."""
+    target = self.inserts.get(accession_id)
+    if target is None:
+      target = self.updates.setdefault(accession_id, {})
+    target.update(values)
+
+  def merge_newer(self, newer: "_WriteBatch") -> None:
+    """Fold writes buffered after this batch was taken back into it."""
+    self.inserts.update(newer.inserts)
+    for accession_id, values in newer.updates.items():
+      self.set_fields(accession_id, **values)
+    self.history.extend(newer.history)
+
+  def split(self) -> list["_WriteBatch"]:
+    """Split into one batch per schedule entry, so a poison write can be isolated."""
+    parts: dict[uuid.UUID, _WriteBatch] = {}
+    for accession_id, values in self.inserts.items():
+      parts.setdefault(accession_id, _WriteBatch()).inserts[accession_id] = values
+    for accession_id, values in self.updates.items():
+      parts.setdefault(accession_id, _WriteBatch()).updates[accession_id] = values
+    for event in self.history:
+      parts.setdefault(event.schedule_entry_accession_id, _WriteBatch()).history.append(event)
+    return list(parts.values())
+
+
+class PersistentScheduleQueue:
+  """`ScheduleQueue` kept in sync with the database through batched write-behind.
+
+  Usage:
+      queue = PersistentScheduleQueue(session_factory)
+      queue.start()
+      entry = queue.enqueue(run_id, priority=5)
+      next_entry = queue.dequeue()
+      ...
+      await queue.stop()  # flushes outstanding writes
+
+  """
+
+  def __init__(
+    self,
+    db_session_factory: async_sessionmaker[AsyncSession],
+    *,
+    flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+    max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+    max_flush_attempts: int = DEFAULT_MAX_FLUSH_ATTEMPTS,
+    max_retry_delay: float = DEFAULT_MAX_RETRY_DELAY,
+  ) -> None:
+    """Initialize the queue.
+
+    Args:
+        db_session_factory: Factory for the sessions used to flush.
+        flush_interval: Seconds between background flushes.
+        max_batch_size: Number of buffered writes that wakes the flusher early.
+        max_flush_attempts: Consecutive failed flushes after which the batch is
+            persisted entry by entry and the entries that still fail are
+            dead-lettered.
+        max_retry_delay: Upper bound in seconds for the backoff between
+            failed flushes.
+
+    """
+    self.db_session_factory = db_session_factory
+    self.flush_interval = flush_interval
+    self.max_batch_size = max_batch_size
+    self.max_flush_attempts = max_flush_attempts
+    self.max_retry_delay = max_retry_delay
+    self.dead_letters: deque[_WriteBatch] = deque(maxlen=DEFAULT_DEAD_LETTER_LIMIT)
+    self._failed_flushes = 0
+    self.queue = ScheduleQueue()
+    self._in_flight: dict[uuid.UUID, QueuedSchedule] = {}
+    self._in_flight_by_run: dict[uuid.UUID, uuid.UUID] = {}
+    self._pending = _WriteBatch()
+    self._flush_lock = asyncio.Lock()
+    self._wake = asyncio.Event()
+    self._flusher: asyncio.Task | None = None
+    self._stopping = False
+
+  def __len__(self) -> int:
+    return len(self.queue)
+
+  @property
+  def pending_writes(self) -> int:
+    """Number of buffered writes not yet persisted."""
+    return len(self._pending)
+
+  def get(self, accession_id: uuid.UUID) -> QueuedSchedule | None:
+    """Return a queued or dequeued-but-unfinished entry."""
+    return self.queue.get(accession_id) or self._in_flight.get(accession_id)
+
+  def get_by_run(self, protocol_run_accession_id: uuid.UUID) -> QueuedSchedule | None:
+    """Return the live entry for a protocol run, if any."""
+    item = self.queue.get_by_run(protocol_run_accession_id)
+    if item is not None:
+      return item
+    accession_id = self._in_flight_by_run.get(protocol_run_accession_id)
+    return self._in_flight.get(accession_id) if accession_id is not None else None
+
+  # --- Queue operations (in memory, persisted by the next flush) ---
+
+  def enqueue(
+    self,
+    protocol_run_accession_id: uuid.UUID,
+    *,
+    priority: int = 1,
+    scheduled_at: datetime | None = None,
+    **entry_fields: Any,
+  ) -> QueuedSchedule:
+    """Queue a protocol run and buffer its `ScheduleEntry` row.
+
+    Args:
+        protocol_run_accession_id: The run to schedule.
+        priority: Higher values are dequeued first.
+        scheduled_at: Tie-breaker among equal priorities (defaults to now).
+        **entry_fields: Additional `ScheduleEntry` columns (e.g. `user_params_json`).
+
+    Returns:
+        The queued entry.
+
+    Raises:
+        ValueError: If the run already has a live entry.
+
+    """
+    if self.get_by_run(protocol_run_accession_id) is not None:
+      msg = f"A schedule entry for protocol run '{protocol_run_accession_id}' already exists."
+      raise ValueError(msg)
+    item = QueuedSchedule(
+      accession_id=uuid7(),
+      protocol_run_accession_id=protocol_run_accession_id,
+      priority=priority,
+      scheduled_at=scheduled_at or _utcnow(),
+    )
+    self.queue.push(item)
+    self._pending.inserts[item.accession_id] = {
+      **entry_fields,
+      "accession_id": item.accession_id,
+      "protocol_run_accession_id": protocol_run_accession_id,
+      "priority": priority,
+      "scheduled_at": item.scheduled_at,
+      "status": ScheduleStatusEnum.QUEUED,
+    }
+    self._record_event(
+      item.accession_id,
+      ScheduleHistoryEventEnum.SCHEDULE_CREATED,
+      new_status=ScheduleStatusEnum.QUEUED,
+      event_details_json={"priority": priority},
+    )
+    return item
+
+  def dequeue(
+    self,
+    new_status: ScheduleStatusEnum = ScheduleStatusEnum.READY_TO_EXECUTE,
+  ) -> QueuedSchedule | None:
+    """Pop the next entry to run and move it to `new_status`."""
+    item = self.queue.pop()
+    if item is None:
+      return None
+    self._hold(item)
+    self._transition(item, new_status)
+    return item
+
+  def set_status(
+    self,
+    accession_id: uuid.UUID,
+    new_status: ScheduleStatusEnum,
+    *,
+    error_message: str | None = None,
+  ) -> QueuedSchedule | None:
+    """Move a live entry to `new_status`, taking it off the queue if it leaves waiting.
+
+    Entries reaching a terminal or handed-off status are forgotten once the
+    change is buffered.
+    """
+    item = self.get(accession_id)
+    if item is None:
+      return None
+    if new_status not in WAITING_STATUSES and self.queue.remove(accession_id) is not None:
+      self._hold(item)
+    if new_status in TERMINAL_STATUSES or new_status in HANDED_OFF_STATUSES:
+      self._release(accession_id)
+    self._transition(item, new_status, error_message=error_message)
+    return item
+
+  def update_priority(
+    self,
+    accession_id: uuid.UUID,
+    new_priority: int,
+    reason: str | None = None,
+  ) -> QueuedSchedule | None:
+    """Re-prioritize a queued entry."""
+    item = self.queue.get(accession_id)
+    if item is None:
+      return None
+    old_priority = item.priority
+    self.queue.update_priority(accession_id, new_priority)
+    self._pending.set_fields(accession_id, priority=new_priority)
+    self._record_event(
+      accession_id,
+      ScheduleHistoryEventEnum.PRIORITY_CHANGED,
+      event_details_json={
+        "old_priority": old_priority,
+        "new_priority": new_priority,
+        "reason": reason,
+      },
+    )
+    return item
+
+  # --- Persistence ---
+
+  async def flush(self) -> int:
+    """Persist every buffered write in one transaction.
+
+    Entries whose protocol run does not exist, or that already has a schedule
+    entry in the database, are rejected (dropped from the queue and logged)
+    rather than failing the batch. On any other error the batch is put back
+    and retried by the next flush; after `max_flush_attempts` consecutive
+    failures it is persisted one entry at a time instead, and the writes of
+    entries that still fail are moved to `dead_letters`.
+
+    Returns:
+        The number of writes persisted.
+
+    """
+    async with self._flush_lock:
+      batch, self._pending = self._pending, _WriteBatch()
+      if not batch:
+        return 0
+      try:
+        await self._persist(batch)
+      except Exception:
+        self._failed_flushes += 1
+        if self._failed_flushes < self.max_flush_attempts:
+          self._requeue(batch)
+          logger.exception(
+            "ScheduleQueue: Flush of %d writes failed (attempt %d of %d); will retry.",
+            len(batch),
+            self._failed_flushes,
+            self.max_flush_attempts,
+          )
+          raise
+        logger.exception(
+          "ScheduleQueue: Flush of %d writes failed %d times; persisting entries one by one.",
+          len(batch),
+          self._failed_flushes,
+        )
+        self._failed_flushes = 0
+        return await self._persist_isolated(batch)
+      except BaseException:
+        # E.g. `stop()` cancelled mid-flush: keep the writes so nothing is lost.
+        self._requeue(batch)
+        raise
+      self._failed_flushes = 0
+    logger.debug("ScheduleQueue: Flushed %d writes.", len(batch))
+    return len(batch)
+
+  async def _persist(self, batch: _WriteBatch) -> None:
+    """Write a batch in one transaction."""
+    async with self.db_session_factory() as db_session:
+      rejected = await self._reject_invalid_inserts(db_session, batch)
+      db_session.add_all(ScheduleEntry(**values) for values in batch.inserts.values())
+      if batch.updates:
+        await db_session.execute(
+          update(ScheduleEntry),
+          [{"accession_id": key, **values} for key, values in batch.updates.items()],
+        )
+      events = [
+        event for event in batch.history if event.schedule_entry_accession_id not in rejected
+      ]
+      db_session.add_all(events)
+      await record_schedule_events(db_session, events)
+      await db_session.commit()
+
+  async def _persist_isolated(self, batch: _WriteBatch) -> int:
+    """Persist a repeatedly failing batch entry by entry, dead-lettering poison writes."""
+    persisted = 0
+    for part in batch.split():
+      try:
+        await self._persist(part)
+      except Exception:
+        logger.exception(
+          "ScheduleQueue: Dead-lettering %d writes that cannot be persisted.",
+          len(part),
+        )
+        self.dead_letters.append(part)
+      else:
+        persisted += len(part)
+    return persisted
+
+  def _requeue(self, batch: _WriteBatch) -> None:
+    """Put a batch that was not persisted back in front of newer writes."""
+    batch.merge_newer(self._pending)
+    self._pending = batch
+
+  def _next_flush_delay(self) -> float:
+    """Seconds until the next background flush, backing off after failures."""
+    if not self._failed_flushes:
+      return self.flush_interval
+    return min(self.flush_interval * 2**self._failed_flushes, self.max_retry_delay)
+
+  def start(self) -> None:
+    """Start the background flusher."""
+    if self._flusher is None or self._flusher.done():
+      self._stopping = False
+      self._flusher = asyncio.create_task(self._flush_loop())
+
+  async def stop(self) -> None:
+    """Stop the background flusher and persist outstanding writes.
+
+    The flusher is asked to finish rather than cancelled, so a flush that is
+    in progress is never interrupted mid-statement.
+    """
+    if self._flusher is not None:
+      self._stopping = True
+      self._wake.set()
+      await self._flusher
+      self._flusher = None
+    await self.flush()
+
+  async def _flush_loop(self) -> None:
+    while not self._stopping:
+      with contextlib.suppress(asyncio.TimeoutError):
+        await asyncio.wait_for(self._wake.wait(), timeout=self._next_flush_delay())
+      self._wake.clear()
+      with contextlib.suppress(Exception):  # Logged by flush(); retried next round
+        await self.flush()
+
+  async def _reject_invalid_inserts(
+    self,
+    db_session: AsyncSession,
+    batch: _WriteBatch,
+  ) -> set[uuid.UUID]:
+    """Drop buffered inserts for unknown runs or runs that already have an entry."""
+    if not batch.inserts:
+      return set()
+    run_ids = {values["protocol_run_accession_id"] for values in batch.inserts.values()}
+    known_runs = set(
+      (
+        await db_session.execute(
+          select(ProtocolRun.accession_id).where(ProtocolRun.accession_id.in_(run_ids)),
+        )
+      ).scalars(),
+    )
+    scheduled_runs = set(
+      (
+        await db_session.execute(
+          select(ScheduleEntry.protocol_run_accession_id).where(
+            ScheduleEntry.protocol_run_accession_id.in_(run_ids),
+          ),
+        )
+      ).scalars(),
+    )
+    rejected: set[uuid.UUID] = set()
+    for accession_id, values in list(batch.inserts.items()):
+      run_id = values["protocol_run_accession_id"]
+      if run_id in known_runs and run_id not in scheduled_runs:
+        continue
+      reason = "protocol run not found" if run_id not in known_runs else "run already scheduled"
+      logger.error(
+        "ScheduleQueue: Dropping schedule entry %s for run %s (%s).",
+        accession_id,
+        run_id,
+        reason,
+      )
+      del batch.inserts[accession_id]
+      batch.updates.pop(accession_id, None)
+      self.queue.remove(accession_id)
+      self._release(accession_id)
+      rejected.add(accession_id)
+    return rejected
+
+  def _hold(self, item: QueuedSchedule) -> None:
+    """Track an entry that has left the queue but not yet finished."""
+    self._in_flight[item.accession_id] = item
+    self._in_flight_by_run[item.protocol_run_accession_id] = item.accession_id
+
+  def _release(self, accession_id: uuid.UUID) -> None:
+    item = self._in_flight.pop(accession_id, None)
+    if item is not None:
+      self._in_flight_by_run.pop(item.protocol_run_accession_id, None)
+
+  def _transition(
+    self,
+    item: QueuedSchedule,
+    new_status: ScheduleStatusEnum,
+    *,
+    error_message: str | None = None,
+  ) -> None:
+    previous_status, item.status = item.status, new_status
+    values: dict[str, Any] = {"status": new_status}
+    if error_message is not None:
+      values["last_error_message"] = error_message
+    if new_status == ScheduleStatusEnum.EXECUTING:
+      values["execution_started_at"] = _utcnow()
+    elif new_status in TERMINAL_STATUSES:
+      values["execution_completed_at"] = _utcnow()
+    self._pending.set_fields(item.accession_id, **values)
+    self._record_event(
+      item.accession_id,
+      ScheduleHistoryEventEnum.STATUS_CHANGED,
+      previous_status=previous_status,
+      new_status=new_status,
+      event_details_json={"error_details": error_message} if error_message else None,
+    )
+
+  def _record_event(
+    self,
+    schedule_entry_accession_id: uuid.UUID,
+    event_type: ScheduleHistoryEventEnum,
+    **values: Any,
+  ) -> None:
+    self._pending.history.append(
+      build_schedule_event(schedule_entry_accession_id, event_type, name=event_type.value, **values),
+    )
+    if len(self._pending) >= self.max_batch_size and not self._failed_flushes:
+      self._wake.set()
@@ -2,6 +2,7 @@
 """Manages asset reservations for protocol runs."""
 import uuid
 from datetime import datetime, timezone
+from typing import Protocol
 
 from sqlalchemy import and_, select
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
@@ -16,6 +17,14 @@ from praxis.backend.utils.uuid import uuid7
 logger = get_logger(__name__)
 
 
+class ExpiryTracker(Protocol):
+  """Receives the deadlines of reservations that expire."""
+
+  def track(self, reservation_id: uuid.UUID, expires_at: datetime) -> None:
+    """Schedule `reservation_id` to be expired at `expires_at`."""
+    ...
+
+
 class AssetReservationManager:
   """Manages asset reservations for protocol runs."""
 
@@ -23,6 +32,16 @@ class AssetReservationManager:
     """Initialize the AssetReservationManager."""
     self.db_session_factory = db_session_factory
     self._asset_reservations_cache: dict[str, set[uuid.UUID]] = {}
+    self.expiry_tracker: ExpiryTracker | None = None
+
+  def discard_cached_reservation(self, asset_key: str, protocol_run_id: uuid.UUID) -> None:
+    """Drop a run from the in-memory reservation cache for `asset_key`."""
+    runs = self._asset_reservations_cache.get(asset_key)
+    if runs is None:
+      return
+    runs.discard(protocol_run_id)
+    if not runs:
+      del self._asset_reservations_cache[asset_key]
 
   async def reserve_assets(
     self,
@@ -30,8 +49,13 @@ class AssetReservationManager:
     protocol_run_id: uuid.UUID,
     db_session: AsyncSession | None = None,
     schedule_entry_id: uuid.UUID | None = None,
+    expires_at: datetime | None = None,
   ) -> bool:
-    """Reserve assets for a protocol run."""
+    """Reserve assets for a protocol run.
+
+    Reservations given an `expires_at` are handed to the `expiry_tracker`, if
+    one is attached, and expired by it unless released first.
+    """
     logger.info(
       "Attempting to reserve %d assets for run %s",
       len(requirements),
@@ -55,11 +79,7 @@ class AssetReservationManager:
             logger.warning(error_msg)
             for res in created_reservations:
               await session.delete(res)
-              res_key = res.redis_lock_key
-              if res_key in self._asset_reservations_cache:
-                self._asset_reservations_cache[res_key].discard(protocol_run_id)
-                if not self._asset_reservations_cache[res_key]:
-                  del self._asset_reservations_cache[res_key]
+              self.discard_cached_reservation(res.redis_lock_key, protocol_run_id)
             raise AssetAcquisitionError(error_msg)
 
         existing_query = select(AssetReservation).where(
@@ -85,11 +105,7 @@ class AssetReservationManager:
           logger.warning(error_msg)
           for res in created_reservations:
             await session.delete(res)
-            res_key = res.redis_lock_key
-            if res_key in self._asset_reservations_cache:
-              self._asset_reservations_cache[res_key].discard(protocol_run_id)
-              if not self._asset_reservations_cache[res_key]:
-                del self._asset_reservations_cache[res_key]
+            self.discard_cached_reservation(res.redis_lock_key, protocol_run_id)
           raise AssetAcquisitionError(error_msg)
 
         reservation_id = uuid7()
@@ -105,6 +121,7 @@ class AssetReservationManager:
           lock_timeout_seconds=3600,
           status=AssetReservationStatusEnum.ACTIVE,
           released_at=None,
+          expires_at=expires_at,
         )
         session.add(reservation)
         created_reservations.append(reservation)
@@ -131,11 +148,11 @@ class AssetReservationManager:
 
     try:
       if db_session:
-        return await _do_reserve(db_session)
-      async with self.db_session_factory() as session:
-        result = await _do_reserve(session)
-        await session.commit()
-        return result
+        result = await _do_reserve(db_session)
+      else:
+        async with self.db_session_factory() as session:
+          result = await _do_reserve(session)
+          await session.commit()
     except AssetAcquisitionError:
       raise
     except Exception as e:
@@ -146,6 +163,11 @@ class AssetReservationManager:
       msg = f"Unexpected error during asset reservation: {e!s}"
       raise AssetAcquisitionError(msg) from e
 
+    if expires_at is not None and self.expiry_tracker is not None:
+      for reservation in created_reservations:
+        self.expiry_tracker.track(reservation.accession_id, expires_at)
+    return result
+
   async def release_reservations(
     self,
     asset_keys: list[str],
@@ -175,10 +197,7 @@ class AssetReservationManager:
           reservation.released_at = datetime.now(timezone.utc)
           logger.debug("Released reservation for asset %s in database", asset_key)
 
-        if asset_key in self._asset_reservations_cache:
-          self._asset_reservations_cache[asset_key].discard(protocol_run_id)
-          if not self._asset_reservations_cache[asset_key]:
-            del self._asset_reservations_cache[asset_key]
+        self.discard_cached_reservation(asset_key, protocol_run_id)
 
     if db_session:
       await _do_release(db_session)
@@ -17,6 +17,7 @@ Modules:
 - pipeline: Multi-level simulation orchestration
 - bounds_analyzer: Loop iteration analysis
 - failure_detector: Failure mode enumeration
+- trace_memo: Trace-once memoization of computation graphs
 """
 
 from praxis.backend.core.simulation.bounds_analyzer import (
@@ -58,6 +59,7 @@ from praxis.backend.core.simulation.simulator import (
   ProtocolSimulator,
   analyze_protocol,
   analyze_protocol_sync,
+  create_trace_memo,
   is_cache_valid,
 )
 from praxis.backend.core.simulation.state_models import (
@@ -88,6 +90,12 @@ from praxis.backend.core.simulation.stateful_tracers import (
   StatefulTracedWell,
   StatefulTracedWellCollection,
 )
+from praxis.backend.core.simulation.trace_memo import (
+  TracedStructure,
+  TraceMemo,
+  protocol_source_hash,
+  trace_memo_key,
+)
 
 __all__ = [
   # Method contracts
@@ -135,7 +143,13 @@ __all__ = [
   "ProtocolSimulator",
   "analyze_protocol",
   "analyze_protocol_sync",
+  "create_trace_memo",
   "is_cache_valid",
+  # Trace memo
+  "TracedStructure",
+  "TraceMemo",
+  "protocol_source_hash",
+  "trace_memo_key",
   # Graph replay (browser-compatible)
   "GraphReplayEngine",
   "GraphReplayResult",
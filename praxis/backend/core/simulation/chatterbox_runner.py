@@ -11,16 +11,27 @@ Architecture (v2 — Feb 2026):
 - resolve_resource(): generic resource resolution from type hints
   (mirrors web_bridge.resolve_parameters pattern)
 - ChatterboxProtocolRunner: orchestrates execution and result collection
+
+Deck layouts are built once per (layout, resource needs) as templates and
+deep-copied for each run. When a protocol is validated against several
+backends, the backend runs are spread over a small set of reusable worker
+processes with an optional per-run timeout, and the results are merged into
+one report.
 """
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import multiprocessing
+import os
 import time
 import traceback
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from enum import Enum
 from typing import TYPE_CHECKING, Any
 
+import cloudpickle
 from pylabrobot.liquid_handling import LiquidHandler
 from pylabrobot.liquid_handling.backends.chatterbox import (
     LiquidHandlerChatterboxBackend,
@@ -46,10 +57,13 @@ from pylabrobot.resources.opentrons.deck import OTDeck
 # NOTE: We do NOT import from praxis.backend.core.tracing.executor because
 # that triggers the SQLAlchemy import chain via backend.core.__init__.py.
 # Instead, MACHINE_TYPE_PATTERNS is inlined below.
+from praxis.common.resource_templates import ResourceTemplateCache, layout_hash, resolve_class
 from praxis.common.type_inspection import PLR_RESOURCE_TYPES, extract_resource_types
 
 if TYPE_CHECKING:
     from collections.abc import Callable
+    from multiprocessing.connection import Connection
+    from multiprocessing.context import BaseContext
 
 # =============================================================================
 # Machine Type Detection (inlined from executor.py)
@@ -103,6 +117,7 @@ class BackendResult:
     error: str | None = None
     traceback: str | None = None
     execution_time_ms: float = 0.0
+    timed_out: bool = False
 
 
 @dataclass
@@ -111,6 +126,8 @@ class ChatterboxExecutionResult:
 
     protocol_name: str
     results_by_backend: dict[str, BackendResult] = field(default_factory=dict)
+    wall_time_ms: float = 0.0
+    parallel: bool = False
 
     @property
     def all_passed(self) -> bool:
@@ -118,6 +135,26 @@ class ChatterboxExecutionResult:
             return False
         return all(r.passed for r in self.results_by_backend.values())
 
+    @property
+    def failed_backends(self) -> list[str]:
+        """Names of backends the protocol failed (or timed out) on."""
+        return sorted(
+            name for name, r in self.results_by_backend.items() if not r.passed
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable report."""
+        return {
+            "protocol_name": self.protocol_name,
+            "all_passed": self.all_passed,
+            "failed_backends": self.failed_backends,
+            "wall_time_ms": self.wall_time_ms,
+            "parallel": self.parallel,
+            "results_by_backend": {
+                name: asdict(r) for name, r in self.results_by_backend.items()
+            },
+        }
+
 
 # =============================================================================
 # Backend Registry
@@ -129,10 +166,7 @@ class ChatterboxExecutionResult:
 
 def _lazy_import(module_path: str, class_name: str) -> type:
     """Lazy import to avoid loading all PLR backends at module import time."""
-    import importlib
-
-    mod = importlib.import_module(module_path)
-    return getattr(mod, class_name)
+    return resolve_class(f"{module_path}.{class_name}")
 
 
 # Maps PLR machine type names → list of (backend_name, backend_class_or_path, kwargs)
@@ -308,8 +342,26 @@ class DeckFactory:
     Two strategies mirroring wizard-state.service.ts serializeToPython():
     - CARRIER_BASED: resources go into carriers assigned to deck rails (Hamilton)
     - SLOT_BASED: resources assigned directly to deck slots (OT-2)
+
+    Decks are built once per (layout type, resource needs) and kept as
+    templates in a `ResourceTemplateCache`; every setup receives its own copy,
+    so runs never share resource state (tips, volumes) and a new machine is
+    attached to each copy.
     """
 
+    def __init__(self) -> None:
+        self._templates = ResourceTemplateCache()
+
+    @property
+    def template_hits(self) -> int:
+        """Setups served from a cached deck template."""
+        return self._templates.hits
+
+    @property
+    def template_misses(self) -> int:
+        """Setups that had to build their deck from scratch."""
+        return self._templates.misses
+
     def create_setup(
         self,
         backend_name: str,
@@ -335,6 +387,47 @@ class DeckFactory:
             return self._create_slot_based_setup(backend_name, resource_needs)
         return self._create_carrier_based_setup(backend_name, resource_needs)
 
+    def warm(self, backend_names: list[str], resource_needs: dict[str, str]) -> None:
+        """Build the deck templates the given backends will need."""
+        for backend_name in backend_names:
+            if backend_name == "PlateReaderChatterboxBackend":
+                continue
+            layout_type = _BACKEND_DECK_TYPE.get(
+                backend_name, DeckLayoutType.CARRIER_BASED
+            )
+            self._get_template(layout_type, resource_needs)
+
+    def clear_templates(self) -> None:
+        """Drop all cached deck templates."""
+        self._templates.invalidate()
+
+    def _get_template(
+        self,
+        layout_type: DeckLayoutType,
+        resource_needs: dict[str, str],
+    ) -> tuple[Resource, dict[str, str]]:
+        """Return a fresh (deck, param_name → resource name) copy of a layout's template."""
+        key = layout_hash([layout_type.value, sorted(resource_needs.items())])
+        if layout_type == DeckLayoutType.SLOT_BASED:
+            return self._templates.get_or_build(
+                key, lambda: self._build_slot_based_deck(resource_needs)
+            )
+        return self._templates.get_or_build(
+            key, lambda: self._build_carrier_based_deck(resource_needs)
+        )
+
+    def _clone_template(
+        self,
+        layout_type: DeckLayoutType,
+        resource_needs: dict[str, str],
+    ) -> dict[str, Any]:
+        """Copy a deck template and look up its resources by name."""
+        deck, placements = self._get_template(layout_type, resource_needs)
+        result: dict[str, Any] = {"deck": deck}
+        for param_name, resource_name in placements.items():
+            result[param_name] = deck.get_resource(resource_name)
+        return result
+
     def _create_plate_reader_setup(self) -> dict[str, Any]:
         """Create a standalone PlateReader setup (no deck needed)."""
         backend = PlateReaderChatterboxBackend()
@@ -353,14 +446,8 @@ class DeckFactory:
         backend_name: str,
         resource_needs: dict[str, str],
     ) -> dict[str, Any]:
-        """Hamilton-style: resources in carriers on deck rails.
-
-        Mirrors serializeToPython() CASE 1 (carrier-placement):
-          carrier = PLT_CAR_L5AC_A00(name="plate_carrier")
-          deck.assign_child_resource(carrier, rails=N)
-          carrier[slot] = labware
-        """
-        deck = STARLetDeck()
+        """Hamilton-style: resources in carriers on deck rails."""
+        result = self._clone_template(DeckLayoutType.CARRIER_BASED, resource_needs)
 
         # Select backend class + kwargs from registry
         if backend_name == "STARChatterboxBackend":
@@ -370,16 +457,40 @@ class DeckFactory:
         else:
             backend = LiquidHandlerChatterboxBackend(num_channels=8)
 
-        lh = LiquidHandler(backend, deck=deck)
+        result["machine"] = LiquidHandler(backend, deck=result["deck"])
+        return result
+
+    def _create_slot_based_setup(
+        self,
+        backend_name: str,
+        resource_needs: dict[str, str],
+    ) -> dict[str, Any]:
+        """OT-2 style: resources directly on deck slots."""
+        result = self._clone_template(DeckLayoutType.SLOT_BASED, resource_needs)
+        backend = LiquidHandlerChatterboxBackend(num_channels=8)
+        result["machine"] = LiquidHandler(backend, deck=result["deck"])
+        return result
+
+    def _build_carrier_based_deck(
+        self,
+        resource_needs: dict[str, str],
+    ) -> tuple[Resource, dict[str, str]]:
+        """Build a Hamilton deck template.
 
-        result: dict[str, Any] = {"machine": lh, "deck": deck}
+        Mirrors serializeToPython() CASE 1 (carrier-placement):
+          carrier = PLT_CAR_L5AC_A00(name="plate_carrier")
+          deck.assign_child_resource(carrier, rails=N)
+          carrier[slot] = labware
+        """
+        deck = STARLetDeck()
+        placements: dict[str, str] = {}
 
         # -- Tip rack (always needed for LH protocols) ---------------------
         tip_car = TIP_CAR_480_A00(name="tip_carrier")
         tip_rack = hamilton_96_tiprack_1000uL_filter(name="tip_rack")
         tip_car[0] = tip_rack
         deck.assign_child_resource(tip_car, rails=1)
-        result["tip_rack"] = tip_rack
+        placements["tip_rack"] = tip_rack.name
 
         # -- Plate carrier for plate/trough resources ----------------------
         plt_car = PLT_CAR_L5AC_A00(name="plate_carrier")
@@ -395,38 +506,34 @@ class DeckFactory:
 
             if res_type == "TipRack":
                 # Already handled above; alias to the default tip rack
-                result[param_name] = tip_rack
+                placements[param_name] = tip_rack.name
             elif res_type == "Trough":
                 # Troughs don't go in plate carriers — assign directly to deck rails
                 deck.assign_child_resource(resource, rails=21)
-                result[param_name] = resource
+                placements[param_name] = resource.name
             elif carrier_slot < 5:
                 # Place in plate carrier (5 slots available on PLT_CAR_L5AC_A00)
                 plt_car[carrier_slot] = resource
-                result[param_name] = resource
+                placements[param_name] = resource.name
                 carrier_slot += 1
             else:
                 # Overflow: assign directly at rails
                 deck.assign_child_resource(resource, rails=25)
-                result[param_name] = resource
+                placements[param_name] = resource.name
 
-        return result
+        return deck, placements
 
-    def _create_slot_based_setup(
+    def _build_slot_based_deck(
         self,
-        backend_name: str,
         resource_needs: dict[str, str],
-    ) -> dict[str, Any]:
-        """OT-2 style: resources directly on deck slots.
+    ) -> tuple[Resource, dict[str, str]]:
+        """Build an OT-2 deck template.
 
         Mirrors serializeToPython() OTDeck path:
           deck.assign_child_at_slot(labware, slot_number)
         """
         deck = OTDeck()
-        backend = LiquidHandlerChatterboxBackend(num_channels=8)
-        lh = LiquidHandler(backend, deck=deck)
-
-        result: dict[str, Any] = {"machine": lh, "deck": deck}
+        placements: dict[str, str] = {}
 
         # OT-2 has 11 usable slots (1-11)
         slot_number = 1
@@ -439,10 +546,10 @@ class DeckFactory:
 
             if slot_number <= 11:
                 deck.assign_child_at_slot(resource, slot=slot_number)
-                result[param_name] = resource
+                placements[param_name] = resource.name
                 slot_number += 1
 
-        return result
+        return deck, placements
 
 
 # =============================================================================
@@ -450,21 +557,141 @@ class DeckFactory:
 # =============================================================================
 
 
+def _run_backend_job(
+    runner: ChatterboxProtocolRunner,
+    payload: bytes,
+    backend_name: str,
+) -> BackendResult:
+    """Run one pickled protocol against one backend in a fresh event loop.
+
+    Errors while unpickling the protocol are reported the same way as protocol
+    failures.
+    """
+    start = time.monotonic()
+    try:
+        protocol_func, parameter_types = cloudpickle.loads(payload)
+        return asyncio.run(
+            runner.run_single(protocol_func, parameter_types, backend_name)
+        )
+    except BaseException as e:
+        return BackendResult(
+            backend_name=backend_name,
+            passed=False,
+            error=f"{type(e).__name__}: {e}",
+            traceback=traceback.format_exc(),
+            execution_time_ms=(time.monotonic() - start) * 1000,
+        )
+
+
+def _backend_worker_main(factory: DeckFactory, conn: Connection) -> None:
+    """Entry point of a reusable backend worker process.
+
+    Runs ``(payload, backend_name)`` jobs received over `conn` until it gets
+    ``None`` or the pipe closes, sending each `BackendResult` back as a dict.
+    The worker keeps its own copy of the parent's deck templates and builds any
+    further templates once for all the jobs it serves.
+    """
+    runner = ChatterboxProtocolRunner(max_workers=1)
+    runner.factory = factory
+    try:
+        while True:
+            try:
+                job = conn.recv()
+            except EOFError:
+                break
+            if job is None:
+                break
+            conn.send(asdict(_run_backend_job(runner, *job)))
+    finally:
+        conn.close()
+
+
+class _BackendWorker:
+    """A worker process that runs backend jobs sent over a duplex pipe."""
+
+    def __init__(self, mp_context: BaseContext, factory: DeckFactory) -> None:
+        self.conn, child_conn = mp_context.Pipe()
+        self.process = mp_context.Process(
+            target=_backend_worker_main,
+            args=(factory, child_conn),
+            name="chatterbox-worker",
+            daemon=True,
+        )
+        try:
+            self.process.start()
+        except BaseException:
+            self.conn.close()
+            raise
+        finally:
+            child_conn.close()
+
+    def is_alive(self) -> bool:
+        return self.process.is_alive()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Ask the worker to exit, killing it if it does not within `timeout`."""
+        with contextlib.suppress(OSError):
+            self.conn.send(None)
+        self.conn.close()
+        self.process.join(timeout)
+        self.kill()
+
+    def kill(self) -> None:
+        """Stop the worker immediately, e.g. after a run timed out."""
+        self.conn.close()
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join(5.0)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+
+
 class ChatterboxProtocolRunner:
     """Executes protocols against real Chatterbox backends.
 
     Usage:
         runner = ChatterboxProtocolRunner()
 
-        # Run against ALL compatible backends
+        # Run against ALL compatible backends (on reusable worker processes)
         result = await runner.run_protocol_function(func, param_types)
 
         # Run against a SINGLE backend
         backend_result = await runner.run_single(func, param_types, "STARChatterboxBackend")
+
+        # Stop the idle worker processes
+        runner.close()
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        run_timeout: float | None = None,
+        mp_context: BaseContext | None = None,
+    ) -> None:
+        """Initialize the runner.
+
+        Args:
+            max_workers: Maximum number of backend runs executing at once in
+                worker processes. Defaults to the CPU count. ``1`` runs every
+                backend in-process, one after another.
+            run_timeout: Seconds a single backend run may take before it is
+                stopped and reported as failed. ``None`` disables the timeout.
+            mp_context: Multiprocessing context for worker processes. Defaults
+                to the platform default start method; ``spawn`` is supported.
+
+        """
         self.factory = DeckFactory()
+        self.max_workers = max_workers if max_workers is not None else os.cpu_count() or 1
+        self.run_timeout = run_timeout
+        self.mp_context = mp_context or multiprocessing.get_context()
+        self._idle_workers: list[_BackendWorker] = []
+
+    def close(self) -> None:
+        """Stop the idle worker processes kept for reuse."""
+        workers, self._idle_workers = self._idle_workers, []
+        for worker in workers:
+            worker.stop()
 
     def detect_machine_types(self, parameter_types: dict[str, str]) -> set[str]:
         """Inspect parameter types to determine which machine types a protocol needs.
@@ -523,19 +750,151 @@ class ChatterboxProtocolRunner:
         protocol_func: Callable,
         parameter_types: dict[str, str],
     ) -> ChatterboxExecutionResult:
-        """Run a protocol function against all compatible backends."""
+        """Run a protocol function against all compatible backends.
+
+        With more than one backend and ``max_workers > 1``, the backends run on
+        up to ``max_workers`` worker processes that are kept for later calls;
+        otherwise they run in-process one after another. Protocols that cannot
+        be pickled also fall back to in-process execution.
+
+        """
+        start = time.monotonic()
         machine_types = self.detect_machine_types(parameter_types)
         backend_names = self.resolve_backends(machine_types)
 
         protocol_name = getattr(protocol_func, "__name__", str(protocol_func))
         result = ChatterboxExecutionResult(protocol_name=protocol_name)
 
-        for backend_name in backend_names:
-            br = await self.run_single(protocol_func, parameter_types, backend_name)
-            result.results_by_backend[backend_name] = br
-
+        payload = None
+        if len(backend_names) > 1 and self.max_workers > 1:
+            payload = self._serialize_protocol(protocol_func, parameter_types)
+
+        if payload is not None:
+            result.parallel = True
+            self.factory.warm(backend_names, self.detect_resource_needs(parameter_types))
+            semaphore = asyncio.Semaphore(self.max_workers)
+            backend_results = await asyncio.gather(*(
+                self._run_in_worker(payload, backend_name, semaphore)
+                for backend_name in backend_names
+            ))
+        else:
+            backend_results = [
+                await self._run_with_timeout(protocol_func, parameter_types, backend_name)
+                for backend_name in backend_names
+            ]
+
+        for br in backend_results:
+            result.results_by_backend[br.backend_name] = br
+        result.wall_time_ms = (time.monotonic() - start) * 1000
         return result
 
+    @staticmethod
+    def _serialize_protocol(
+        protocol_func: Callable,
+        parameter_types: dict[str, str],
+    ) -> bytes | None:
+        """Pickle the protocol for worker processes, or None if it can't be."""
+        try:
+            return cloudpickle.dumps((protocol_func, parameter_types))
+        except Exception:
+            return None
+
+    def _timeout_result(self, backend_name: str, elapsed_ms: float) -> BackendResult:
+        return BackendResult(
+            backend_name=backend_name,
+            passed=False,
+            error=f"TimeoutError: run exceeded {self.run_timeout}s",
+            execution_time_ms=elapsed_ms,
+            timed_out=True,
+        )
+
+    async def _run_with_timeout(
+        self,
+        protocol_func: Callable,
+        parameter_types: dict[str, str],
+        backend_name: str,
+    ) -> BackendResult:
+        """Run one backend in-process, bounded by ``run_timeout``.
+
+        In-process runs can only be interrupted at an ``await``; use worker
+        processes for protocols that may block synchronously.
+        """
+        start = time.monotonic()
+        try:
+            return await asyncio.wait_for(
+                self.run_single(protocol_func, parameter_types, backend_name),
+                timeout=self.run_timeout,
+            )
+        except asyncio.TimeoutError:
+            return self._timeout_result(backend_name, (time.monotonic() - start) * 1000)
+
+    def _take_idle_worker(self) -> _BackendWorker | None:
+        """Pop a live idle worker, discarding dead ones.
+
+        Only called on the event-loop thread, so concurrent runs never race for
+        the idle list.
+        """
+        while self._idle_workers:
+            worker = self._idle_workers.pop()
+            if worker.is_alive():
+                return worker
+            worker.kill()
+        return None
+
+    def _start_worker(self) -> _BackendWorker:
+        """Start a new worker process (blocking; run in an executor)."""
+        return _BackendWorker(self.mp_context, self.factory)
+
+    def _release_worker(self, worker: _BackendWorker) -> None:
+        if len(self._idle_workers) < self.max_workers:
+            self._idle_workers.append(worker)
+        else:
+            worker.stop()
+
+    async def _run_in_worker(
+        self,
+        payload: bytes,
+        backend_name: str,
+        semaphore: asyncio.Semaphore,
+    ) -> BackendResult:
+        """Run one backend on a worker process, killing the worker on timeout."""
+        async with semaphore:
+            start = time.monotonic()
+            loop = asyncio.get_running_loop()
+            worker = self._take_idle_worker()
+            try:
+                if worker is None:
+                    worker = await loop.run_in_executor(None, self._start_worker)
+            except Exception as e:
+                return BackendResult(
+                    backend_name=backend_name,
+                    passed=False,
+                    error=f"WorkerStartError: {type(e).__name__}: {e}",
+                    traceback=traceback.format_exc(),
+                    execution_time_ms=(time.monotonic() - start) * 1000,
+                )
+            try:
+                worker.conn.send((payload, backend_name))
+                ready = await loop.run_in_executor(None, worker.conn.poll, self.run_timeout)
+                elapsed_ms = (time.monotonic() - start) * 1000
+                if not ready:
+                    await loop.run_in_executor(None, worker.kill)
+                    return self._timeout_result(backend_name, elapsed_ms)
+                data = worker.conn.recv()
+            except (EOFError, OSError):
+                await loop.run_in_executor(None, worker.kill)
+                return BackendResult(
+                    backend_name=backend_name,
+                    passed=False,
+                    error=f"WorkerError: worker exited with code {worker.process.exitcode}",
+                    execution_time_ms=(time.monotonic() - start) * 1000,
+                )
+            except BaseException:
+                worker.kill()
+                raise
+            self._release_worker(worker)
+            return BackendResult(**data)
+
     async def run_single(
         self,
         protocol_func: Callable,
@@ -159,17 +159,20 @@ class FailureModeDetector:
     self,
     max_states: int = 100,
     enable_pruning: bool = True,
+    simulator: HierarchicalSimulator | None = None,
   ) -> None:
     """Initialize the detector.
 
     Args:
         max_states: Maximum states to explore.
         enable_pruning: Whether to use early pruning.
+        simulator: Simulator to run each candidate state with. Sharing one with
+            the caller reuses its memoized structural traces.
 
     """
     self._max_states = max_states
     self._enable_pruning = enable_pruning
-    self._simulator = HierarchicalSimulator()
+    self._simulator = simulator or HierarchicalSimulator()
 
   async def detect(
     self,
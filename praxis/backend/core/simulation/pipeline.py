@@ -7,7 +7,10 @@ This module orchestrates multi-level protocol simulation:
 4. Exact state pass (Level 3) - numeric edge case detection
 
 The hierarchical approach enables efficient simulation by detecting
-issues at the cheapest level that can catch them.
+issues at the cheapest level that can catch them. The structural trace is
+state-independent, so it is memoized per protocol source hash and parameter
+signature (see `trace_memo`) and shared by every level, edge case and
+failure-detection state that simulates the same protocol.
 """
 
 from __future__ import annotations
@@ -27,6 +30,12 @@ from praxis.backend.core.simulation.stateful_tracers import (
   StatefulTracedMachine,
   StatefulTracedResource,
 )
+from praxis.backend.core.simulation.trace_memo import (
+  TracedStructure,
+  TraceMemo,
+  protocol_source_hash,
+  trace_memo_key,
+)
 from praxis.backend.core.tracing.executor import (
   ProtocolTracingExecutor,
   TracingError,
@@ -134,15 +143,25 @@ class HierarchicalSimulator:
   def __init__(
     self,
     deck_layout_type: DeckLayoutType = DeckLayoutType.CARRIER_BASED,
+    trace_memo: TraceMemo | None = None,
   ) -> None:
     """Initialize the simulator.
 
     Args:
         deck_layout_type: Type of deck layout for resource hierarchy.
+        trace_memo: Memo of structural traces. Share one instance between
+            simulators to trace each protocol once; defaults to a private
+            in-memory memo.
 
     """
     self._deck_layout_type = deck_layout_type
     self._base_executor = ProtocolTracingExecutor(deck_layout_type=deck_layout_type)
+    self._trace_memo = trace_memo if trace_memo is not None else TraceMemo()
+
+  @property
+  def trace_memo(self) -> TraceMemo:
+    """The memo of structural traces used by this simulator."""
+    return self._trace_memo
 
   async def simulate(
     self,
@@ -249,32 +268,47 @@ class HierarchicalSimulator:
   ) -> HierarchicalSimulationResult:
     """Level 0: Structural validation using base tracers.
 
-    Catches wrong methods, bad signatures, structural errors.
+    Catches wrong methods, bad signatures, structural errors. The trace is
+    looked up in the memo first and only executed on a miss.
     """
+    key = trace_memo_key(
+      protocol_source_hash(protocol_func),
+      parameter_types,
+      self._deck_layout_type.value,
+    )
+    traced = self._trace_memo.get(key)
+    if traced is None:
+      traced = await self._trace_structure(protocol_func, parameter_types)
+      self._trace_memo.put(key, traced)
+
+    if traced.structural_error is not None:
+      return HierarchicalSimulationResult(
+        passed=False,
+        structural_error=traced.structural_error,
+      )
+    return HierarchicalSimulationResult(
+      passed=True,
+      computation_graph=traced.computation_graph,
+    )
+
+  async def _trace_structure(
+    self,
+    protocol_func: Callable[..., Any],
+    parameter_types: dict[str, str],
+  ) -> TracedStructure:
+    """Trace the protocol with structural tracers and capture the outcome."""
     try:
       graph = await self._base_executor.trace_protocol(
         protocol_func=protocol_func,
         parameter_types=parameter_types,
       )
-      return HierarchicalSimulationResult(
-        passed=True,
-        computation_graph=graph.model_dump(),
-      )
+      return TracedStructure(computation_graph=graph.model_dump())
     except TracingError as e:
-      return HierarchicalSimulationResult(
-        passed=False,
-        structural_error=str(e),
-      )
+      return TracedStructure(structural_error=str(e))
     except AttributeError as e:
-      return HierarchicalSimulationResult(
-        passed=False,
-        structural_error=f"Unknown method or attribute: {e}",
-      )
+      return TracedStructure(structural_error=f"Unknown method or attribute: {e}")
     except Exception as e:
-      return HierarchicalSimulationResult(
-        passed=False,
-        structural_error=f"Unexpected error during tracing: {e}",
-      )
+      return TracedStructure(structural_error=f"Unexpected error during tracing: {e}")
 
   async def _run_with_state(
     self,
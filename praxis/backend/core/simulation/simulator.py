@@ -21,6 +21,7 @@ from praxis.backend.core.simulation.pipeline import (
   HierarchicalSimulator,
   InferredRequirement,
 )
+from praxis.backend.core.simulation.trace_memo import DEFAULT_MAX_ENTRIES, TraceMemo
 from praxis.backend.utils.async_run import run_sync
 from praxis.backend.utils.plr_static_analysis.resource_hierarchy import DeckLayoutType
 
@@ -30,10 +31,28 @@ if TYPE_CHECKING:
   from praxis.backend.utils.plr_static_analysis.models import ProtocolComputationGraph
 
 # Version string for cache invalidation
-# Bump this when simulation logic changes
+# Bump this when simulation logic changes. Persisted structural traces live in
+# a per-version directory of the trace memo, so bumping it invalidates them too.
 SIMULATION_VERSION = "1.0.0"
 
 
+def create_trace_memo(
+  cache_dir: str | None = None,
+  max_entries: int = DEFAULT_MAX_ENTRIES,
+) -> TraceMemo:
+  """Create a trace memo bound to the current SIMULATION_VERSION.
+
+  Args:
+      cache_dir: Optional directory for persisting traces across processes.
+      max_entries: Traces kept in memory before the least recently used is evicted.
+
+  Returns:
+      A TraceMemo whose persisted entries are namespaced by SIMULATION_VERSION.
+
+  """
+  return TraceMemo(version=SIMULATION_VERSION, cache_dir=cache_dir, max_entries=max_entries)
+
+
 # =============================================================================
 # Result Models
 # =============================================================================
@@ -124,6 +143,7 @@ class ProtocolSimulator:
     deck_layout_type: DeckLayoutType = DeckLayoutType.CARRIER_BASED,
     max_failure_states: int = 50,
     enable_failure_detection: bool = True,
+    trace_memo: TraceMemo | None = None,
   ) -> None:
     """Initialize the simulator.
 
@@ -131,13 +151,22 @@ class ProtocolSimulator:
         deck_layout_type: Type of deck layout for resource hierarchy.
         max_failure_states: Maximum states to explore for failure detection.
         enable_failure_detection: Whether to run failure mode detection.
+        trace_memo: Memo of structural traces shared by hierarchical simulation
+            and failure detection. Defaults to an in-memory memo.
 
     """
     self._deck_layout_type = deck_layout_type
     self._max_failure_states = max_failure_states
     self._enable_failure_detection = enable_failure_detection
-    self._simulator = HierarchicalSimulator(deck_layout_type=deck_layout_type)
-    self._detector = FailureModeDetector(max_states=max_failure_states)
+    self._trace_memo = trace_memo or create_trace_memo()
+    self._simulator = HierarchicalSimulator(
+      deck_layout_type=deck_layout_type,
+      trace_memo=self._trace_memo,
+    )
+    self._detector = FailureModeDetector(
+      max_states=max_failure_states,
+      simulator=self._simulator,
+    )
 
   async def analyze_protocol(
     self,
@@ -3,7 +3,7 @@
 This module provides state representations at three precision levels:
 1. Boolean: Fast, coarse-grained (has_liquid: bool)
 2. Symbolic: Medium, constraint-based (volume: "v1", constraints: ["v1 > 0"])
-3. Exact: Precise, numeric (volume: 150.0)
+3. Exact: Precise, numeric (volume: 150.0), backed by per-resource NumPy arrays
 
 The hierarchical approach enables efficient simulation by starting with
 fast boolean checks and only promoting to higher precision when needed.
@@ -11,9 +11,15 @@ fast boolean checks and only promoting to higher precision when needed.
 
 from __future__ import annotations
 
+from collections.abc import Iterator, Mapping
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+if TYPE_CHECKING:
+  from collections.abc import Callable
 
 
 class StateLevel(str, Enum):
@@ -274,55 +280,245 @@ class SymbolicLiquidState:
 # =============================================================================
 
 
-@dataclass
+DEFAULT_MAX_CAPACITY = 200.0
+"""Maximum capacity (µL) assumed for resources registered without one."""
+
+
+def split_resource_name(name: str) -> str:
+  """Return the parent resource of a well/spot name.
+
+  Tracer names for container elements look like ``plate['A1']``; everything
+  before the first ``[`` identifies the parent resource whose wells share one
+  volume array. Names without an index are their own parent.
+  """
+  bracket = name.find("[")
+  return name[:bracket] if bracket > 0 else name
+
+
+class _VolumeBlock:
+  """Volume and capacity arrays for the wells of one parent resource."""
+
+  __slots__ = ("index", "max_capacities", "size", "volumes")
+
+  def __init__(self, initial_size: int = 8) -> None:
+    self.index: dict[str, int] = {}
+    self.volumes = np.zeros(initial_size, dtype=np.float64)
+    self.max_capacities = np.full(initial_size, DEFAULT_MAX_CAPACITY, dtype=np.float64)
+    self.size = 0
+
+  def clone(self) -> _VolumeBlock:
+    block = _VolumeBlock.__new__(_VolumeBlock)
+    block.index = self.index.copy()
+    block.volumes = self.volumes.copy()
+    block.max_capacities = self.max_capacities.copy()
+    block.size = self.size
+    return block
+
+  def slot(self, name: str, max_capacity: float | None = None) -> int:
+    """Index of `name`, appending a slot (amortized O(1)) if it is new."""
+    i = self.index.get(name)
+    if i is not None:
+      return i
+    if self.size == len(self.volumes):
+      grow = max(8, self.size)
+      self.volumes = np.concatenate([self.volumes, np.zeros(grow)])
+      self.max_capacities = np.concatenate(
+        [self.max_capacities, np.full(grow, DEFAULT_MAX_CAPACITY)]
+      )
+    i = self.size
+    self.index[name] = i
+    self.volumes[i] = 0.0
+    self.max_capacities[i] = DEFAULT_MAX_CAPACITY if max_capacity is None else max_capacity
+    self.size += 1
+    return i
+
+
+class _WellView(Mapping[str, float]):
+  """Read-only, live name -> value mapping over the blocks of an `ExactLiquidState`.
+
+  Lookups resolve the well's block directly, so reading one well is O(1) no
+  matter how many wells the state holds.
+  """
+
+  __slots__ = ("_blocks", "_value")
+
+  def __init__(
+    self,
+    blocks: dict[str, _VolumeBlock],
+    value: Callable[[_VolumeBlock, int], float],
+  ) -> None:
+    self._blocks = blocks
+    self._value = value
+
+  def __getitem__(self, name: str) -> float:
+    block = self._blocks.get(split_resource_name(name))
+    i = None if block is None else block.index.get(name)
+    if i is None:
+      raise KeyError(name)
+    return self._value(block, i)
+
+  def __iter__(self) -> Iterator[str]:
+    for block in self._blocks.values():
+      yield from block.index
+
+  def __len__(self) -> int:
+    return sum(len(block.index) for block in self._blocks.values())
+
+  def __repr__(self) -> str:
+    return repr(dict(self.items()))
+
+
 class ExactLiquidState:
   """Precise numeric state for liquid tracking.
 
   Uses exact floating-point volumes for precise validation.
   Used for edge case detection after symbolic analysis identifies potential issues.
+
+  Volumes are stored in one NumPy array per parent resource (e.g. all wells of
+  ``plate``), so batches of aspirate/dispense/transfer operations are applied
+  with vectorized updates. `copy` returns a copy-on-write snapshot: blocks are
+  shared until either state writes to them, so snapshotting a 1536-well plate
+  between transitions costs O(resources) instead of O(wells).
+
+  The single-resource methods and the read-only `volumes`/`capacities`/
+  `max_capacities` views keep the interface used by `MethodContract` effects,
+  tracers and state resolution; write through `set_volume`/`register_resource`.
+  Remaining capacity is always ``max_capacity - volume``.
   """
 
-  volumes: dict[str, float] = field(default_factory=dict)
-  """Resource/well name -> exact volume in µL"""
+  __hash__ = None  # type: ignore[assignment]
+
+  def __init__(
+    self,
+    volumes: dict[str, float] | None = None,
+    capacities: dict[str, float] | None = None,
+    max_capacities: dict[str, float] | None = None,
+  ) -> None:
+    """Initialize the state from optional per-resource mappings.
+
+    Args:
+        volumes: Resource/well name -> exact volume in µL.
+        capacities: Resource/well name -> remaining capacity in µL. Used to
+            derive the maximum capacity when `max_capacities` omits a resource.
+        max_capacities: Resource/well name -> maximum capacity in µL.
+
+    """
+    self._blocks: dict[str, _VolumeBlock] = {}
+    self._owned: set[str] = set()
+    volumes = volumes or {}
+    capacities = capacities or {}
+    max_capacities = max_capacities or {}
+    for name in {*volumes, *capacities, *max_capacities}:
+      volume = volumes.get(name, 0.0)
+      if name in max_capacities:
+        max_capacity = max_capacities[name]
+      elif name in capacities:
+        max_capacity = capacities[name] + volume
+      else:
+        max_capacity = DEFAULT_MAX_CAPACITY
+      block, i = self._writable_slot(name, max_capacity)
+      block.volumes[i] = volume
+
+  # --- Block management ---
+
+  def _writable_block(self, parent: str) -> _VolumeBlock:
+    block = self._blocks.get(parent)
+    if block is None:
+      block = _VolumeBlock()
+      self._blocks[parent] = block
+      self._owned.add(parent)
+    elif parent not in self._owned:
+      block = block.clone()
+      self._blocks[parent] = block
+      self._owned.add(parent)
+    return block
+
+  def _writable_slot(self, name: str, max_capacity: float | None = None) -> tuple[_VolumeBlock, int]:
+    block = self._writable_block(split_resource_name(name))
+    return block, block.slot(name, max_capacity)
+
+  def _lookup(self, name: str) -> tuple[_VolumeBlock, int] | None:
+    block = self._blocks.get(split_resource_name(name))
+    if block is None:
+      return None
+    i = block.index.get(name)
+    return None if i is None else (block, i)
+
+  def register_resource(
+    self,
+    names: list[str],
+    max_capacity: float = DEFAULT_MAX_CAPACITY,
+    volume: float = 0.0,
+  ) -> None:
+    """Register many wells at once with a shared capacity and starting volume."""
+    for name in names:
+      block, i = self._writable_slot(name, max_capacity)
+      block.max_capacities[i] = max_capacity
+      block.volumes[i] = volume
+
+  # --- Read-only views ---
+
+  @property
+  def volumes(self) -> Mapping[str, float]:
+    """Resource/well name -> exact volume in µL."""
+    return _WellView(self._blocks, lambda block, i: float(block.volumes[i]))
+
+  @property
+  def capacities(self) -> Mapping[str, float]:
+    """Resource/well name -> remaining capacity in µL."""
+    return _WellView(
+      self._blocks, lambda block, i: float(block.max_capacities[i] - block.volumes[i])
+    )
+
+  @property
+  def max_capacities(self) -> Mapping[str, float]:
+    """Resource/well name -> maximum capacity in µL."""
+    return _WellView(self._blocks, lambda block, i: float(block.max_capacities[i]))
 
-  capacities: dict[str, float] = field(default_factory=dict)
-  """Resource/well name -> remaining capacity in µL"""
+  def resource_volumes(self, parent: str) -> np.ndarray:
+    """Volumes of all registered wells of a parent resource, in registration order."""
+    block = self._blocks.get(parent)
+    if block is None:
+      return np.zeros(0, dtype=np.float64)
+    return block.volumes[: block.size].copy()
 
-  max_capacities: dict[str, float] = field(default_factory=dict)
-  """Resource/well name -> maximum capacity in µL"""
+  # --- Single-resource operations ---
 
   def get_volume(self, resource: str, default: float = 0.0) -> float:
     """Get volume for a resource."""
-    return self.volumes.get(resource, default)
+    found = self._lookup(resource)
+    return default if found is None else float(found[0].volumes[found[1]])
 
-  def get_capacity(self, resource: str, default: float = 200.0) -> float:
+  def get_capacity(self, resource: str, default: float = DEFAULT_MAX_CAPACITY) -> float:
     """Get remaining capacity for a resource."""
-    return self.capacities.get(resource, default)
+    found = self._lookup(resource)
+    if found is None:
+      return default
+    block, i = found
+    return float(block.max_capacities[i] - block.volumes[i])
 
-  def set_volume(self, resource: str, volume: float, max_capacity: float = 200.0) -> None:
+  def set_volume(self, resource: str, volume: float, max_capacity: float = DEFAULT_MAX_CAPACITY) -> None:
     """Set volume for a resource."""
-    self.volumes[resource] = volume
-    self.max_capacities.setdefault(resource, max_capacity)
-    self.capacities[resource] = max_capacity - volume
+    existing = self._lookup(resource)
+    block, i = self._writable_slot(resource, max_capacity)
+    if existing is None:
+      block.max_capacities[i] = max_capacity
+    block.volumes[i] = volume
 
   def aspirate(self, resource: str, volume: float) -> bool:
     """Aspirate volume from resource. Returns True if successful."""
-    current = self.get_volume(resource)
-    if current < volume:
+    if self.get_volume(resource) < volume:
       return False
-    self.volumes[resource] = current - volume
-    max_cap = self.max_capacities.get(resource, 200.0)
-    self.capacities[resource] = max_cap - (current - volume)
+    block, i = self._writable_slot(resource)
+    block.volumes[i] -= volume
     return True
 
   def dispense(self, resource: str, volume: float) -> bool:
     """Dispense volume to resource. Returns True if successful."""
-    current = self.get_volume(resource)
-    capacity = self.get_capacity(resource)
-    if capacity < volume:
+    if self.get_capacity(resource) < volume:
       return False
-    self.volumes[resource] = current + volume
-    self.capacities[resource] = capacity - volume
+    block, i = self._writable_slot(resource)
+    block.volumes[i] += volume
     return True
 
   def transfer(self, source: str, dest: str, volume: float) -> bool:
@@ -331,17 +527,138 @@ class ExactLiquidState:
       return False
     if not self.dispense(dest, volume):
       # Rollback aspiration
-      self.volumes[source] = self.get_volume(source) + volume
+      block, i = self._writable_slot(source)
+      block.volumes[i] += volume
       return False
     return True
 
+  # --- Vectorized operations ---
+
+  def _apply_many(
+    self,
+    resources: list[str],
+    volumes: np.ndarray | list[float] | float,
+    sign: float,
+  ) -> np.ndarray:
+    """Apply signed volume changes, checking each against the pre-batch state.
+
+    Wells that are not registered yet are treated as empty with the default
+    capacity and are only registered when their operation succeeds.
+    """
+    amounts = np.broadcast_to(np.asarray(volumes, dtype=np.float64), (len(resources),))
+    success = np.zeros(len(resources), dtype=bool)
+    groups: dict[str, list[int]] = {}
+    for position, name in enumerate(resources):
+      groups.setdefault(split_resource_name(name), []).append(position)
+
+    op = self.aspirate if sign < 0 else self.dispense
+    for parent, positions in groups.items():
+      names = [resources[position] for position in positions]
+      if len(set(names)) != len(names):
+        # Repeated wells must see each other's effects: apply in order.
+        for position in positions:
+          success[position] = op(resources[position], float(amounts[position]))
+        continue
+      pos = np.asarray(positions)
+      amount = amounts[pos]
+      block = self._blocks.get(parent)
+      current = np.zeros(len(names))
+      max_capacity = np.full(len(names), DEFAULT_MAX_CAPACITY)
+      if block is not None:
+        for k, name in enumerate(names):
+          i = block.index.get(name)
+          if i is not None:
+            current[k] = block.volumes[i]
+            max_capacity[k] = block.max_capacities[i]
+      ok = current >= amount if sign < 0 else (max_capacity - current) >= amount
+      if not ok.any():
+        continue
+      block = self._writable_block(parent)
+      idx = np.asarray([block.slot(name) for name, good in zip(names, ok, strict=True) if good])
+      block.volumes[idx] += sign * amount[ok]
+      success[pos] = ok
+    return success
+
+  def aspirate_many(
+    self,
+    resources: list[str],
+    volumes: np.ndarray | list[float] | float,
+  ) -> np.ndarray:
+    """Aspirate from many wells at once.
+
+    Args:
+        resources: Well names to aspirate from.
+        volumes: Volume per well, or one volume for all.
+
+    Returns:
+        Boolean array marking which aspirations succeeded.
+
+    """
+    return self._apply_many(resources, volumes, -1.0)
+
+  def dispense_many(
+    self,
+    resources: list[str],
+    volumes: np.ndarray | list[float] | float,
+  ) -> np.ndarray:
+    """Dispense into many wells at once.
+
+    Args:
+        resources: Well names to dispense into.
+        volumes: Volume per well, or one volume for all.
+
+    Returns:
+        Boolean array marking which dispenses succeeded.
+
+    """
+    return self._apply_many(resources, volumes, 1.0)
+
+  def transfer_many(
+    self,
+    sources: list[str],
+    dests: list[str],
+    volumes: np.ndarray | list[float] | float,
+  ) -> np.ndarray:
+    """Transfer between paired wells at once (e.g. one column to the next).
+
+    Aspirations that succeed but whose dispense fails are rolled back, matching
+    the semantics of `transfer`.
+
+    Returns:
+        Boolean array marking which transfers succeeded.
+
+    """
+    amounts = np.broadcast_to(np.asarray(volumes, dtype=np.float64), (len(sources),)).copy()
+    aspirated = self.aspirate_many(sources, amounts)
+    dispensed = np.zeros(len(sources), dtype=bool)
+    if aspirated.any():
+      dispensed[aspirated] = self.dispense_many(
+        [d for d, ok in zip(dests, aspirated, strict=True) if ok], amounts[aspirated]
+      )
+    rollback = aspirated & ~dispensed
+    if rollback.any():
+      self.dispense_many(
+        [s for s, ok in zip(sources, rollback, strict=True) if ok], amounts[rollback]
+      )
+    return dispensed
+
   def copy(self) -> ExactLiquidState:
-    """Create a copy of this state."""
-    return ExactLiquidState(
-      volumes=self.volumes.copy(),
-      capacities=self.capacities.copy(),
-      max_capacities=self.max_capacities.copy(),
-    )
+    """Create a copy-on-write snapshot of this state."""
+    new_state = ExactLiquidState.__new__(ExactLiquidState)
+    new_state._blocks = self._blocks.copy()
+    new_state._owned = set()
+    # Both states now share every block; whichever writes first clones it.
+    self._owned = set()
+    return new_state
+
+  def __eq__(self, other: object) -> bool:
+    if not isinstance(other, ExactLiquidState):
+      return NotImplemented
+    return self.volumes == other.volumes and self.max_capacities == other.max_capacities
+
+  def __repr__(self) -> str:
+    wells = sum(block.size for block in self._blocks.values())
+    return f"ExactLiquidState(resources={len(self._blocks)}, wells={wells})"
 
 
 # =============================================================================
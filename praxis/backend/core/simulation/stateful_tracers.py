@@ -347,44 +347,53 @@ class StatefulTracedMachine(TracedMachine):
     if contract.aspirates_from:
       resource = arg_map.get(contract.aspirates_from)
       if resource:
-        resource_name = self._get_resource_name(resource)
+        names = self._get_resource_names(resource)
         if isinstance(liquid_state, BooleanLiquidState):
-          liquid_state.aspirate(resource_name)
+          for name in names:
+            liquid_state.aspirate(name)
         elif isinstance(liquid_state, SymbolicLiquidState):
           vol_arg = arg_map.get(contract.aspirate_volume_arg, 50)
           vol_symbol = str(vol_arg) if not isinstance(vol_arg, TracedValue) else "vol"
-          liquid_state.aspirate(resource_name, vol_symbol)
+          for name in names:
+            liquid_state.aspirate(name, vol_symbol)
         elif isinstance(liquid_state, ExactLiquidState):
-          vol = self._get_numeric_value(arg_map.get(contract.aspirate_volume_arg), 50.0)
-          liquid_state.aspirate(resource_name, vol)
+          vols = self._get_numeric_values(
+            arg_map.get(contract.aspirate_volume_arg), len(names), 50.0
+          )
+          liquid_state.aspirate_many(names, vols)
 
     if contract.dispenses_to:
       resource = arg_map.get(contract.dispenses_to)
       if resource:
-        resource_name = self._get_resource_name(resource)
+        names = self._get_resource_names(resource)
         if isinstance(liquid_state, BooleanLiquidState):
-          liquid_state.dispense(resource_name)
+          for name in names:
+            liquid_state.dispense(name)
         elif isinstance(liquid_state, SymbolicLiquidState):
           vol_arg = arg_map.get(contract.dispense_volume_arg, 50)
           vol_symbol = str(vol_arg) if not isinstance(vol_arg, TracedValue) else "vol"
-          liquid_state.dispense(resource_name, vol_symbol)
+          for name in names:
+            liquid_state.dispense(name, vol_symbol)
         elif isinstance(liquid_state, ExactLiquidState):
-          vol = self._get_numeric_value(arg_map.get(contract.dispense_volume_arg), 50.0)
-          liquid_state.dispense(resource_name, vol)
+          vols = self._get_numeric_values(
+            arg_map.get(contract.dispense_volume_arg), len(names), 50.0
+          )
+          liquid_state.dispense_many(names, vols)
 
     if contract.transfers_from_to:
       source_arg, dest_arg = contract.transfers_from_to
       source = arg_map.get(source_arg)
       dest = arg_map.get(dest_arg)
       if source and dest:
-        source_name = self._get_resource_name(source)
-        dest_name = self._get_resource_name(dest)
+        source_names = self._get_resource_names(source)
+        dest_names = self._get_resource_names(dest)
         if isinstance(liquid_state, BooleanLiquidState):
-          liquid_state.transfer(source_name, dest_name)
+          for source_name, dest_name in zip(source_names, dest_names, strict=False):
+            liquid_state.transfer(source_name, dest_name)
         elif isinstance(liquid_state, ExactLiquidState):
-          # For transfer, use a default volume if not specified
-          vol = 50.0  # Default transfer volume
-          liquid_state.transfer(source_name, dest_name, vol)
+          # Pair wells one to one; use a default volume as none is specified.
+          pairs = min(len(source_names), len(dest_names))
+          liquid_state.transfer_many(source_names[:pairs], dest_names[:pairs], 50.0)
 
   def _build_arg_map(
     self,
@@ -431,6 +440,19 @@ class StatefulTracedMachine(TracedMachine):
       return value
     return str(value)
 
+  def _get_resource_names(self, value: Any) -> list[str]:
+    """Extract one name per channel from a resource argument or list of them."""
+    if isinstance(value, list | tuple):
+      return [self._get_resource_name(item) for item in value]
+    return [self._get_resource_name(value)]
+
+  def _get_numeric_values(self, value: Any, count: int, default: float) -> list[float]:
+    """Extract one numeric value per channel, repeating a scalar for every channel."""
+    if isinstance(value, list | tuple):
+      values = [self._get_numeric_value(item, default) for item in value[:count]]
+      return values + [default] * (count - len(values))
+    return [self._get_numeric_value(value, default)] * count
+
   def _get_numeric_value(self, value: Any, default: float) -> float:
     """Extract numeric value from an argument."""
     if value is None:
@@ -0,0 +1,258 @@
+"""Trace-once memoization of protocol computation graphs.
+
+Tracing a protocol with structural tracers (Level 0 of the hierarchical
+pipeline) depends only on the protocol's code and its parameter signature, not
+on the simulation state. The hierarchical simulator, however, is invoked once per
+candidate initial state by the failure detector and again by the simulator
+facade, so the same graph would otherwise be rebuilt many times per protocol.
+
+`TraceMemo` stores the outcome of a structural trace (the serialized graph or the
+structural error) keyed by the protocol source hash, the parameter signature and
+the deck layout. At most `DEFAULT_MAX_ENTRIES` traces are kept in memory, least
+recently used first out. When a cache directory is given, entries are also
+persisted as JSON under a subdirectory named after the simulation version, so
+bumping `SIMULATION_VERSION` invalidates every persisted trace.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import inspect
+import json
+import logging
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from praxis.backend.utils.plr_static_analysis.models import ProtocolComputationGraph
+
+if TYPE_CHECKING:
+  import os
+  from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 256
+"""Number of traces a `TraceMemo` keeps in memory."""
+
+
+# =============================================================================
+# Keys
+# =============================================================================
+
+
+def protocol_source_hash(protocol_func: Callable[..., Any]) -> str:
+  """Compute a stable hash identifying a protocol function's code.
+
+  Uses the function's source text when available and falls back to its
+  bytecode and constants (e.g. for functions defined in a REPL). The content of
+  the module file defining the function is included as well, so editing a helper
+  or constant the protocol uses also changes the hash.
+
+  Args:
+      protocol_func: The protocol function.
+
+  Returns:
+      SHA-256 hex digest of the function's code.
+
+  """
+  func = inspect.unwrap(protocol_func)
+  try:
+    payload = inspect.getsource(func).encode()
+  except (OSError, TypeError):
+    code = getattr(func, "__code__", None)
+    if code is None:
+      payload = repr(func).encode()
+    else:
+      payload = code.co_code + repr(code.co_consts).encode() + repr(code.co_names).encode()
+  qualname = getattr(func, "__qualname__", getattr(func, "__name__", ""))
+  digest = hashlib.sha256(qualname.encode() + b"\0" + payload)
+  module_hash = _module_file_hash(func)
+  if module_hash is not None:
+    digest.update(b"\0" + module_hash.encode())
+  return digest.hexdigest()
+
+
+def _module_file_hash(func: Callable[..., Any]) -> str | None:
+  """Return the SHA-256 of the file defining `func`, or None if it has none."""
+  try:
+    source_file = inspect.getsourcefile(func)
+  except TypeError:
+    return None
+  if source_file is None:
+    return None
+  try:
+    return hashlib.sha256(Path(source_file).read_bytes()).hexdigest()
+  except OSError:
+    return None
+
+
+def trace_memo_key(
+  source_hash: str,
+  parameter_types: dict[str, str],
+  deck_layout_type: str,
+) -> str:
+  """Build the memo key for a protocol trace.
+
+  Args:
+      source_hash: Hash of the protocol's code.
+      parameter_types: Mapping of parameter names to type hints.
+      deck_layout_type: Deck layout used for parental chain inference.
+
+  Returns:
+      A hex digest usable as a dictionary key and file name.
+
+  """
+  signature = json.dumps(sorted(parameter_types.items()), separators=(",", ":"))
+  return hashlib.sha256(f"{source_hash}|{signature}|{deck_layout_type}".encode()).hexdigest()
+
+
+# =============================================================================
+# Memo
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class TracedStructure:
+  """Outcome of a structural trace."""
+
+  computation_graph: dict[str, Any] | None = None
+  """Serialized ProtocolComputationGraph, if tracing succeeded"""
+
+  structural_error: str | None = None
+  """Structural error message, if tracing failed"""
+
+  def to_dict(self) -> dict[str, Any]:
+    """Convert to a JSON-serializable dictionary."""
+    return {
+      "computation_graph": self.computation_graph,
+      "structural_error": self.structural_error,
+    }
+
+  @classmethod
+  def from_dict(cls, data: dict[str, Any]) -> TracedStructure:
+    """Reconstruct from a dictionary produced by `to_dict`.
+
+    A graph read back from JSON is re-validated, so it is dumped exactly like a
+    freshly traced one (enum members rather than their values, and so on).
+    """
+    graph = data.get("computation_graph")
+    if graph is not None:
+      graph = ProtocolComputationGraph.model_validate(graph).model_dump()
+    return cls(
+      computation_graph=graph,
+      structural_error=data.get("structural_error"),
+    )
+
+
+class TraceMemo:
+  """In-memory (optionally disk-backed) memo of structural traces.
+
+  Usage:
+      memo = TraceMemo(version=SIMULATION_VERSION, cache_dir=".praxis/traces")
+      key = trace_memo_key(protocol_source_hash(func), parameter_types, "carrier_based")
+      traced = memo.get(key)
+      if traced is None:
+          traced = ...  # trace the protocol
+          memo.put(key, traced)
+
+  """
+
+  def __init__(
+    self,
+    version: str | None = None,
+    cache_dir: str | os.PathLike[str] | None = None,
+    max_entries: int = DEFAULT_MAX_ENTRIES,
+  ) -> None:
+    """Initialize the memo.
+
+    Args:
+        version: Simulation version the entries belong to. Required for
+            persistence so stale traces are never read after an upgrade.
+        cache_dir: Optional directory for persisted entries.
+        max_entries: Traces kept in memory; the least recently used is evicted.
+            Persisted entries are not affected.
+
+    """
+    self._version = version
+    self._max_entries = max(1, max_entries)
+    self._entries: OrderedDict[str, TracedStructure] = OrderedDict()
+    self._lock = threading.Lock()
+    self._cache_dir: Path | None = None
+    if cache_dir is not None:
+      if version is None:
+        msg = "TraceMemo requires a version to persist traces."
+        raise ValueError(msg)
+      self._cache_dir = Path(cache_dir) / version
+    self.hits = 0
+    self.misses = 0
+
+  @property
+  def version(self) -> str | None:
+    """Simulation version of the memo's entries."""
+    return self._version
+
+  def __len__(self) -> int:
+    return len(self._entries)
+
+  def _entry_path(self, key: str) -> Path | None:
+    return self._cache_dir / f"{key}.json" if self._cache_dir is not None else None
+
+  def get(self, key: str) -> TracedStructure | None:
+    """Return the memoized trace for `key`, loading it from disk if needed."""
+    with self._lock:
+      traced = self._entries.get(key)
+      if traced is not None:
+        self._entries.move_to_end(key)
+    if traced is None:
+      traced = self._load(key)
+      if traced is not None:
+        self._remember(key, traced)
+    if traced is None:
+      self.misses += 1
+    else:
+      self.hits += 1
+    return traced
+
+  def put(self, key: str, traced: TracedStructure) -> None:
+    """Memoize a trace and persist it when a cache directory is configured."""
+    self._remember(key, traced)
+    self._store(key, traced)
+
+  def _remember(self, key: str, traced: TracedStructure) -> None:
+    with self._lock:
+      self._entries[key] = traced
+      self._entries.move_to_end(key)
+      while len(self._entries) > self._max_entries:
+        self._entries.popitem(last=False)
+
+  def clear(self) -> None:
+    """Drop in-memory entries (persisted entries are kept)."""
+    with self._lock:
+      self._entries.clear()
+
+  def _load(self, key: str) -> TracedStructure | None:
+    path = self._entry_path(key)
+    if path is None or not path.is_file():
+      return None
+    try:
+      return TracedStructure.from_dict(json.loads(path.read_text()))
+    except (OSError, ValueError):
+      logger.warning("Ignoring unreadable trace memo entry %s", path, exc_info=True)
+      return None
+
+  def _store(self, key: str, traced: TracedStructure) -> None:
+    path = self._entry_path(key)
+    if path is None:
+      return
+    try:
+      path.parent.mkdir(parents=True, exist_ok=True)
+      fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+      with open(fd, "w", closefd=True) as tmp:
+        json.dump(traced.to_dict(), tmp, default=str)
+      Path(tmp_name).replace(path)
+    except (OSError, TypeError, ValueError):
+      logger.warning("Could not persist trace memo entry %s", path, exc_info=True)
@@ -29,10 +29,29 @@ Frontend StateSnapshot Format:
         "on_deck": ["resource_name", ...],
         "raw_plr_state": {...}
     }
+
+Well names are resolved to ``(parent, well_id)`` by a single pattern compiled at
+import and memoized per name, since the same few thousand names recur in every
+snapshot of a loaded deck.
 """
 
+import functools
+import re
 from typing import Any
 
+WELL_NAME_CACHE_SIZE = 16384
+"""Maximum number of resource names whose well resolution is memoized."""
+
+# Rows A-P cover plates up to 384 wells. 1536-well plates continue with Q-Z and
+# AA-AF, which PLR always names in upper case.
+_WELL_ID = r"(?:(?-i:A[A-F]|[Q-Z])|[A-P])\d{1,2}"
+
+# "plate_A1", "plate_well_A1" and a standalone "A1" (no parent group).
+_WELL_NAME = re.compile(rf"^(?:(?P<parent>.+?)(?:_well)?_)?(?P<well>{_WELL_ID})$", re.IGNORECASE)
+
+# Any name ending in a well ID, such as "plateA1".
+_WELL_SUFFIX = re.compile(rf"{_WELL_ID}$", re.IGNORECASE)
+
 
 def extract_tip_state(plr_state: dict[str, Any]) -> dict[str, Any]:
     """Extract tip state from PLR state.
@@ -97,15 +116,30 @@ def extract_liquid_volumes(plr_state: dict[str, Any]) -> dict[str, dict[str, flo
                 # Try to extract parent plate name from resource name
                 # Well names typically follow patterns like "plate_name_A1" or just "A1"
                 # For now, use flat structure with resource name as key
-                parent_name = _infer_parent_name(resource_name)
-                well_id = _infer_well_id(resource_name)
+                parent_name, well_id = _resolve_well_name(resource_name)
+                liquids.setdefault(parent_name, {})[well_id] = volume
+
+    return liquids
 
-                if parent_name not in liquids:
-                    liquids[parent_name] = {}
 
-                liquids[parent_name][well_id] = volume
+@functools.lru_cache(maxsize=WELL_NAME_CACHE_SIZE)
+def _resolve_well_name(resource_name: str) -> tuple[str, str]:
+    """Resolve a resource name to its parent plate name and well ID.
 
-    return liquids
+    Args:
+        resource_name: Full resource name
+
+    Returns:
+        Tuple of (parent name, well ID); see `_infer_parent_name` and
+        `_infer_well_id` for the fallbacks.
+
+    """
+    match = _WELL_NAME.match(resource_name)
+    if match:
+        return match.group("parent") or "unknown_plate", match.group("well").upper()
+
+    suffix = _WELL_SUFFIX.search(resource_name)
+    return resource_name, suffix.group(0).upper() if suffix else resource_name
 
 
 def _infer_parent_name(resource_name: str) -> str:
@@ -114,6 +148,7 @@ def _infer_parent_name(resource_name: str) -> str:
     Common naming patterns:
     - "plate_name_A1" -> "plate_name"
     - "source_plate_well_A1" -> "source_plate"
+    - "plate_well_AF48" -> "plate" (1536-well)
     - "A1" -> "unknown_plate"
 
     Args:
@@ -123,20 +158,7 @@ def _infer_parent_name(resource_name: str) -> str:
         Inferred parent plate name
 
     """
-    # Check for common well identifier patterns at the end
-    import re
-
-    # Pattern: anything ending in _[A-H][1-12] or _well_[A-H][1-12]
-    match = re.match(r"^(.+?)(?:_well)?_([A-P]\d{1,2})$", resource_name, re.IGNORECASE)
-    if match:
-        return match.group(1)
-
-    # If no pattern match, check if it looks like a standalone well ID
-    if re.match(r"^[A-P]\d{1,2}$", resource_name, re.IGNORECASE):
-        return "unknown_plate"
-
-    # Otherwise, treat the whole name as the resource identifier
-    return resource_name
+    return _resolve_well_name(resource_name)[0]
 
 
 def _infer_well_id(resource_name: str) -> str:
@@ -149,14 +171,7 @@ def _infer_well_id(resource_name: str) -> str:
         Well identifier (e.g., "A1") or the full resource name if no pattern matches
 
     """
-    import re
-
-    # Pattern: extract [A-H][1-12] from end of name
-    match = re.search(r"([A-P]\d{1,2})$", resource_name, re.IGNORECASE)
-    if match:
-        return match.group(1).upper()
-
-    return resource_name
+    return _resolve_well_name(resource_name)[1]
 
 
 def get_on_deck_resources(plr_state: dict[str, Any]) -> list[str]:
@@ -40,6 +40,7 @@ class InMemoryKeyValueStore:
   def __init__(self) -> None:
     """Initialize the in-memory store."""
     self._data: dict[str, tuple[Any, float | None]] = {}  # value, expiry time
+    self._hashes: dict[str, dict[str, tuple[Any, float | None]]] = {}  # field -> value, expiry
     self._lock = asyncio.Lock()
     self._cleanup_task: asyncio.Task | None = None
     self._closed = False
@@ -62,6 +63,8 @@ class InMemoryKeyValueStore:
           for key in expired:
             del self._data[key]
             logger.debug("TTL expired for key: %s", key)
+          for key in list(self._hashes):
+            self._live_fields(key, now)
       except asyncio.CancelledError:
         break
       except Exception:
@@ -95,17 +98,19 @@ class InMemoryKeyValueStore:
   async def delete(self, key: str) -> bool:
     """Delete a key."""
     async with self._lock:
+      had_hash = bool(self._live_fields(key, time.time()))
+      self._hashes.pop(key, None)
       if key in self._data:
         del self._data[key]
         logger.debug("Deleted key: %s", key)
         return True
-      return False
+      return had_hash
 
   async def exists(self, key: str) -> bool:
     """Check if a key exists."""
     async with self._lock:
       if key not in self._data:
-        return False
+        return bool(self._live_fields(key, time.time()))
       _, expiry = self._data[key]
       if expiry is not None and expiry <= time.time():
         del self._data[key]
@@ -120,8 +125,93 @@ class InMemoryKeyValueStore:
       for key, (_, expiry) in self._data.items():
         if (expiry is None or expiry > now) and fnmatch.fnmatch(key, pattern):
           result.append(key)
+      result.extend(
+        key
+        for key in list(self._hashes)
+        if self._live_fields(key, now) and fnmatch.fnmatch(key, pattern)
+      )
       return result
 
+  async def compare_and_set(
+    self,
+    key: str,
+    expected: Any | None,
+    value: Any | None,
+    ttl_seconds: int | None = None,
+  ) -> bool:
+    """Atomically replace a value if it still equals `expected`."""
+    await self._start_cleanup_task()
+    now = time.time()
+    async with self._lock:
+      current = None
+      if key in self._data:
+        current, expiry = self._data[key]
+        if expiry is not None and expiry <= now:
+          del self._data[key]
+          current = None
+      if current != expected:
+        return False
+      if value is None:
+        self._data.pop(key, None)
+      else:
+        self._data[key] = (value, now + ttl_seconds if ttl_seconds is not None else None)
+      return True
+
+  def _live_fields(self, key: str, now: float) -> dict[str, tuple[Any, float | None]]:
+    """Drop a hash's expired fields (and the hash once empty); caller holds the lock."""
+    fields = self._hashes.get(key)
+    if fields is None:
+      return {}
+    for field, (_, expiry) in list(fields.items()):
+      if expiry is not None and expiry <= now:
+        del fields[field]
+    if not fields:
+      del self._hashes[key]
+    return fields
+
+  async def hset(
+    self,
+    key: str,
+    field: str,
+    value: Any,
+    ttl_seconds: int | None = None,
+  ) -> None:
+    """Store one field of a hash, with an optional per-field TTL."""
+    await self._start_cleanup_task()
+    expiry = time.time() + ttl_seconds if ttl_seconds is not None else None
+    async with self._lock:
+      self._hashes.setdefault(key, {})[field] = (value, expiry)
+
+  async def hget(self, key: str, field: str) -> Any | None:
+    """Retrieve one field of a hash."""
+    async with self._lock:
+      entry = self._live_fields(key, time.time()).get(field)
+      return entry[0] if entry is not None else None
+
+  async def hgetall(self, key: str) -> dict[str, Any]:
+    """Retrieve every live field of a hash."""
+    async with self._lock:
+      return {field: value for field, (value, _) in self._live_fields(key, time.time()).items()}
+
+  async def hdel(self, key: str, *fields: str) -> int:
+    """Delete fields of a hash."""
+    async with self._lock:
+      live = self._live_fields(key, time.time())
+      deleted = sum(live.pop(field, None) is not None for field in fields)
+      if key in self._hashes and not live:
+        del self._hashes[key]
+      return deleted
+
+  async def increment(self, key: str, amount: int = 1) -> int:
+    """Atomically increment an integer counter."""
+    async with self._lock:
+      current, expiry = self._data.get(key, (0, None))
+      if expiry is not None and expiry <= time.time():
+        current, expiry = 0, None
+      new_value = int(current) + amount
+      self._data[key] = (new_value, expiry)
+      return new_value
+
   async def close(self) -> None:
     """Close the store and stop cleanup task."""
     self._closed = True
@@ -130,23 +220,32 @@ class InMemoryKeyValueStore:
       with contextlib.suppress(asyncio.CancelledError):
         await self._cleanup_task
     self._data.clear()
+    self._hashes.clear()
     logger.info("InMemoryKeyValueStore closed")
 
 
 class InMemorySubscription:
   """A subscription to an in-memory pub/sub channel."""
 
-  def __init__(self, channel: str, queue: asyncio.Queue[Any]) -> None:
+  def __init__(
+    self,
+    channel: str,
+    queue: asyncio.Queue[Any],
+    on_unsubscribe: Callable[[str, asyncio.Queue[Any]], None] | None = None,
+  ) -> None:
     """Initialize the subscription.
 
     Args:
         channel: The channel name.
         queue: The queue to receive messages from.
+        on_unsubscribe: Called with the channel and queue on unsubscribe, so
+            the pub/sub can stop delivering to it.
 
     """
     self._channel = channel
     self._queue = queue
     self._closed = False
+    self._on_unsubscribe = on_unsubscribe
 
   def __aiter__(self) -> AsyncIterator[Any]:
     """Return self as async iterator."""
@@ -167,6 +266,8 @@ class InMemorySubscription:
   async def unsubscribe(self) -> None:
     """Unsubscribe from the channel."""
     self._closed = True
+    if self._on_unsubscribe is not None:
+      self._on_unsubscribe(self._channel, self._queue)
     # Put sentinel to unblock waiting readers
     with contextlib.suppress(asyncio.QueueFull):
       self._queue.put_nowait(StopAsyncIteration)
@@ -205,7 +306,17 @@ class InMemoryPubSub:
       self._channels[channel] = []
     self._channels[channel].append(queue)
     logger.debug("Subscribed to channel: %s", channel)
-    return InMemorySubscription(channel, queue)
+    return InMemorySubscription(channel, queue, self._remove_subscriber)
+
+  def _remove_subscriber(self, channel: str, queue: asyncio.Queue[Any]) -> None:
+    """Stop delivering messages to an unsubscribed queue."""
+    subscribers = self._channels.get(channel)
+    if subscribers is None:
+      return
+    with contextlib.suppress(ValueError):
+      subscribers.remove(queue)
+    if not subscribers:
+      del self._channels[channel]
 
   async def close(self) -> None:
     """Close all subscriptions."""
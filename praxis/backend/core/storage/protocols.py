@@ -93,6 +93,104 @@ class KeyValueStore(Protocol):
     """
     ...
 
+  async def compare_and_set(
+    self,
+    key: str,
+    expected: Any | None,
+    value: Any | None,
+    ttl_seconds: int | None = None,
+  ) -> bool:
+    """Atomically replace a value if it still equals `expected`.
+
+    This is the building block for leases and locks: `expected=None` means
+    "only if the key is absent" (set-if-not-exists) and `value=None` deletes
+    the key (compare-and-delete).
+
+    Args:
+        key: The key to update.
+        expected: The value the key must currently hold, or None for absent.
+        value: The new value, or None to delete the key.
+        ttl_seconds: Optional time-to-live for the new value.
+
+    Returns:
+        True if the key held `expected` and was updated.
+
+    """
+    ...
+
+  async def hset(
+    self,
+    key: str,
+    field: str,
+    value: Any,
+    ttl_seconds: int | None = None,
+  ) -> None:
+    """Store one field of a hash, with an optional per-field TTL.
+
+    Writers of different fields never contend, and an expired field is
+    dropped on its own while the rest of the hash stays. `delete(key)`
+    removes the whole hash.
+
+    Args:
+        key: The hash key.
+        field: The field to store.
+        value: The value to store (must be JSON-serializable).
+        ttl_seconds: Optional time-to-live of this field in seconds.
+
+    """
+    ...
+
+  async def hget(self, key: str, field: str) -> Any | None:
+    """Retrieve one field of a hash.
+
+    Args:
+        key: The hash key.
+        field: The field to look up.
+
+    Returns:
+        The stored value, or None if the field doesn't exist or has expired.
+
+    """
+    ...
+
+  async def hgetall(self, key: str) -> dict[str, Any]:
+    """Retrieve every live field of a hash.
+
+    Args:
+        key: The hash key.
+
+    Returns:
+        Mapping of field to value, without expired fields.
+
+    """
+    ...
+
+  async def hdel(self, key: str, *fields: str) -> int:
+    """Delete fields of a hash.
+
+    Args:
+        key: The hash key.
+        *fields: The fields to delete.
+
+    Returns:
+        Number of live fields deleted.
+
+    """
+    ...
+
+  async def increment(self, key: str, amount: int = 1) -> int:
+    """Atomically increment an integer counter, creating it at 0 if absent.
+
+    Args:
+        key: The counter key.
+        amount: The amount to add.
+
+    Returns:
+        The counter value after incrementing.
+
+    """
+    ...
+
   async def close(self) -> None:
     """Close the connection and release resources.
 
@@ -9,6 +9,7 @@ Uses redis.asyncio for async operations.
 import asyncio
 import json
 import logging
+import time
 from collections.abc import AsyncIterator
 from typing import Any
 
@@ -22,7 +23,10 @@ logger = logging.getLogger(__name__)
 class RedisKeyValueStore:
   """Redis-backed key-value store.
 
-  Wraps redis.asyncio.Redis to conform to the KeyValueStore protocol.
+  Wraps redis.asyncio.Redis to conform to the KeyValueStore protocol. Hash
+  fields with a TTL keep their deadlines in a sorted set at
+  ``"{key}:deadlines"``; expired fields are hidden on read and pruned
+  afterwards, so no Redis 7.4 field expiry is required.
   """
 
   def __init__(
@@ -100,7 +104,7 @@ class RedisKeyValueStore:
   async def delete(self, key: str) -> bool:
     """Delete a key."""
     client = await self._get_client()
-    result = await client.delete(key)
+    result = await client.delete(key, self._deadlines_key(key))
     return result > 0
 
   async def exists(self, key: str) -> bool:
@@ -115,6 +119,143 @@ class RedisKeyValueStore:
     raw_keys = await client.keys(pattern)
     return [k.decode() if isinstance(k, bytes) else k for k in raw_keys]
 
+  async def compare_and_set(
+    self,
+    key: str,
+    expected: Any | None,
+    value: Any | None,
+    ttl_seconds: int | None = None,
+  ) -> bool:
+    """Atomically replace a value if it still equals `expected`.
+
+    Set-if-absent maps to a single `SET NX`; other cases use an optimistic
+    WATCH/MULTI transaction, so a concurrent writer makes this return False.
+    """
+    client = await self._get_client()
+    if expected is None and value is not None:
+      return bool(await client.set(key, json.dumps(value), ex=ttl_seconds, nx=True))
+
+    from redis.exceptions import WatchError
+
+    async with client.pipeline(transaction=True) as pipe:
+      try:
+        await pipe.watch(key)
+        data = await pipe.get(key)
+        current = None
+        if data is not None:
+          try:
+            current = json.loads(data)
+          except json.JSONDecodeError:
+            current = data.decode() if isinstance(data, bytes) else data
+        if current != expected:
+          await pipe.unwatch()
+          return False
+        pipe.multi()
+        if value is None:
+          pipe.delete(key)
+        else:
+          pipe.set(key, json.dumps(value), ex=ttl_seconds)
+        await pipe.execute()
+      except WatchError:
+        return False
+    return True
+
+  @staticmethod
+  def _deadlines_key(key: str) -> str:
+    return f"{key}:deadlines"
+
+  @staticmethod
+  def _decode(data: Any) -> Any:
+    try:
+      return json.loads(data)
+    except json.JSONDecodeError:
+      return data.decode() if isinstance(data, bytes) else data
+
+  async def hset(
+    self,
+    key: str,
+    field: str,
+    value: Any,
+    ttl_seconds: int | None = None,
+  ) -> None:
+    """Store one field of a hash, with an optional per-field TTL."""
+    client = await self._get_client()
+    deadlines = self._deadlines_key(key)
+    async with client.pipeline(transaction=True) as pipe:
+      pipe.hset(key, field, json.dumps(value))
+      if ttl_seconds is None:
+        pipe.zrem(deadlines, field)
+      else:
+        pipe.zadd(deadlines, {field: time.time() + ttl_seconds})
+      await pipe.execute()
+
+  async def hget(self, key: str, field: str) -> Any | None:
+    """Retrieve one field of a hash."""
+    client = await self._get_client()
+    async with client.pipeline(transaction=True) as pipe:
+      pipe.hget(key, field)
+      pipe.zscore(self._deadlines_key(key), field)
+      data, deadline = await pipe.execute()
+    if data is None or (deadline is not None and deadline <= time.time()):
+      return None
+    return self._decode(data)
+
+  async def hgetall(self, key: str) -> dict[str, Any]:
+    """Retrieve every live field of a hash, then prune expired ones."""
+    client = await self._get_client()
+    now = time.time()
+    async with client.pipeline(transaction=True) as pipe:
+      pipe.hgetall(key)
+      pipe.zrangebyscore(self._deadlines_key(key), "-inf", now)
+      raw, expired = await pipe.execute()
+    if expired:
+      await self._prune_fields(client, key, now)
+    expired_fields = set(expired)
+    return {
+      field.decode() if isinstance(field, bytes) else field: self._decode(data)
+      for field, data in raw.items()
+      if field not in expired_fields
+    }
+
+  async def _prune_fields(self, client: Any, key: str, now: float) -> None:
+    """Delete fields whose deadline passed, unless a writer refreshed one meanwhile."""
+    from redis.exceptions import WatchError
+
+    deadlines = self._deadlines_key(key)
+    async with client.pipeline(transaction=True) as pipe:
+      try:
+        await pipe.watch(deadlines)
+        expired = await pipe.zrangebyscore(deadlines, "-inf", now)
+        if not expired:
+          await pipe.unwatch()
+          return
+        pipe.multi()
+        pipe.hdel(key, *expired)
+        pipe.zrem(deadlines, *expired)
+        await pipe.execute()
+      except WatchError:
+        return
+
+  async def hdel(self, key: str, *fields: str) -> int:
+    """Delete fields of a hash."""
+    if not fields:
+      return 0
+    client = await self._get_client()
+    deadlines = self._deadlines_key(key)
+    async with client.pipeline(transaction=True) as pipe:
+      for field in fields:
+        pipe.zscore(deadlines, field)
+      pipe.hdel(key, *fields)
+      pipe.zrem(deadlines, *fields)
+      *scores, deleted, _ = await pipe.execute()
+    now = time.time()
+    return deleted - sum(score is not None and score <= now for score in scores)
+
+  async def increment(self, key: str, amount: int = 1) -> int:
+    """Atomically increment an integer counter."""
+    client = await self._get_client()
+    return int(await client.incrby(key, amount))
+
   async def close(self) -> None:
     """Close the Redis connection."""
     if self._client is not None:
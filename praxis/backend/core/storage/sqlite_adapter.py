@@ -80,6 +80,16 @@ class SqliteKeyValueStore:
         ON kv_store(expires_at)
         WHERE expires_at IS NOT NULL
       """)
+      # Hash fields, each with its own expiration
+      await self._conn.execute("""
+        CREATE TABLE IF NOT EXISTS kv_hash (
+          key TEXT NOT NULL,
+          field TEXT NOT NULL,
+          value TEXT NOT NULL,
+          expires_at REAL,
+          PRIMARY KEY (key, field)
+        )
+      """)
       await self._conn.commit()
       logger.info("SQLite KeyValueStore initialized: %s", self._path)
 
@@ -101,6 +111,10 @@ class SqliteKeyValueStore:
             "DELETE FROM kv_store WHERE expires_at IS NOT NULL AND expires_at <= ?",
             (now,),
           )
+          await conn.execute(
+            "DELETE FROM kv_hash WHERE expires_at IS NOT NULL AND expires_at <= ?",
+            (now,),
+          )
           await conn.commit()
           if cursor.rowcount > 0:
             logger.debug("Cleaned up %d expired keys", cursor.rowcount)
@@ -196,9 +210,10 @@ class SqliteKeyValueStore:
         "DELETE FROM kv_store WHERE key = ?",
         (key,),
       )
+      hash_cursor = await conn.execute("DELETE FROM kv_hash WHERE key = ?", (key,))
       await conn.commit()
 
-      deleted = cursor.rowcount > 0
+      deleted = cursor.rowcount > 0 or hash_cursor.rowcount > 0
       if deleted:
         logger.debug("Deleted key: %s", key)
       return deleted
@@ -260,6 +275,189 @@ class SqliteKeyValueStore:
 
       return result
 
+  async def compare_and_set(
+    self,
+    key: str,
+    expected: Any | None,
+    value: Any | None,
+    ttl_seconds: int | None = None,
+  ) -> bool:
+    """Atomically replace a value if it still equals `expected`.
+
+    Args:
+        key: The key to update.
+        expected: The value the key must currently hold, or None for absent.
+        value: The new value, or None to delete the key.
+        ttl_seconds: Optional time-to-live for the new value.
+
+    Returns:
+        True if the key held `expected` and was updated.
+
+    """
+    async with self._lock:
+      conn = await self._ensure_connection()
+      now = time.time()
+
+      cursor = await conn.execute(
+        """
+        SELECT value FROM kv_store
+        WHERE key = ?
+        AND (expires_at IS NULL OR expires_at > ?)
+        """,
+        (key, now),
+      )
+      row = await cursor.fetchone()
+      current = json.loads(row[0]) if row is not None else None
+      if current != expected:
+        return False
+
+      if value is None:
+        await conn.execute("DELETE FROM kv_store WHERE key = ?", (key,))
+      else:
+        expires_at = now + ttl_seconds if ttl_seconds is not None else None
+        await conn.execute(
+          """
+          INSERT OR REPLACE INTO kv_store (key, value, expires_at)
+          VALUES (?, ?, ?)
+          """,
+          (key, json.dumps(value), expires_at),
+        )
+      await conn.commit()
+      return True
+
+  async def increment(self, key: str, amount: int = 1) -> int:
+    """Atomically increment an integer counter.
+
+    Args:
+        key: The counter key.
+        amount: The amount to add.
+
+    Returns:
+        The counter value after incrementing.
+
+    """
+    async with self._lock:
+      conn = await self._ensure_connection()
+      now = time.time()
+
+      cursor = await conn.execute(
+        """
+        SELECT value FROM kv_store
+        WHERE key = ?
+        AND (expires_at IS NULL OR expires_at > ?)
+        """,
+        (key, now),
+      )
+      row = await cursor.fetchone()
+      new_value = (int(json.loads(row[0])) if row is not None else 0) + amount
+      await conn.execute(
+        "INSERT OR REPLACE INTO kv_store (key, value, expires_at) VALUES (?, ?, NULL)",
+        (key, json.dumps(new_value)),
+      )
+      await conn.commit()
+      return new_value
+
+  async def hset(
+    self,
+    key: str,
+    field: str,
+    value: Any,
+    ttl_seconds: int | None = None,
+  ) -> None:
+    """Store one field of a hash, with an optional per-field TTL.
+
+    Args:
+        key: The hash key.
+        field: The field to store.
+        value: The value to store (must be JSON-serializable).
+        ttl_seconds: Optional time-to-live of this field in seconds.
+
+    """
+    async with self._lock:
+      conn = await self._ensure_connection()
+      expires_at = time.time() + ttl_seconds if ttl_seconds is not None else None
+      await conn.execute(
+        """
+        INSERT OR REPLACE INTO kv_hash (key, field, value, expires_at)
+        VALUES (?, ?, ?, ?)
+        """,
+        (key, field, json.dumps(value), expires_at),
+      )
+      await conn.commit()
+
+  async def hget(self, key: str, field: str) -> Any | None:
+    """Retrieve one field of a hash.
+
+    Args:
+        key: The hash key.
+        field: The field to look up.
+
+    Returns:
+        The stored value, or None if the field doesn't exist or has expired.
+
+    """
+    async with self._lock:
+      conn = await self._ensure_connection()
+      cursor = await conn.execute(
+        """
+        SELECT value FROM kv_hash
+        WHERE key = ? AND field = ?
+        AND (expires_at IS NULL OR expires_at > ?)
+        """,
+        (key, field, time.time()),
+      )
+      row = await cursor.fetchone()
+      return json.loads(row[0]) if row is not None else None
+
+  async def hgetall(self, key: str) -> dict[str, Any]:
+    """Retrieve every live field of a hash.
+
+    Args:
+        key: The hash key.
+
+    Returns:
+        Mapping of field to value, without expired fields.
+
+    """
+    async with self._lock:
+      conn = await self._ensure_connection()
+      cursor = await conn.execute(
+        """
+        SELECT field, value FROM kv_hash
+        WHERE key = ?
+        AND (expires_at IS NULL OR expires_at > ?)
+        """,
+        (key, time.time()),
+      )
+      return {field: json.loads(value) for field, value in await cursor.fetchall()}
+
+  async def hdel(self, key: str, *fields: str) -> int:
+    """Delete fields of a hash.
+
+    Args:
+        key: The hash key.
+        *fields: The fields to delete.
+
+    Returns:
+        Number of live fields deleted.
+
+    """
+    if not fields:
+      return 0
+    async with self._lock:
+      conn = await self._ensure_connection()
+      placeholders = ", ".join("?" for _ in fields)
+      cursor = await conn.execute(
+        f"""
+        DELETE FROM kv_hash
+        WHERE key = ? AND field IN ({placeholders})
+        AND (expires_at IS NULL OR expires_at > ?)
+        """,  # noqa: S608 - placeholders only
+        (key, *fields, time.time()),
+      )
+      await conn.commit()
+      return cursor.rowcount
+
   async def close(self) -> None:
     """Close the database connection and release resources.
 
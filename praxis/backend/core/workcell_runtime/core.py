@@ -8,6 +8,7 @@ from praxis.backend.core.protocols.workcell import IWorkcell
 from praxis.backend.core.protocols.workcell_runtime import IWorkcellRuntime
 from praxis.backend.core.workcell_runtime.deck_manager import DeckManagerMixin
 from praxis.backend.core.workcell_runtime.machine_manager import MachineManagerMixin
+from praxis.backend.core.workcell_runtime.machine_pool import MachinePool
 from praxis.backend.core.workcell_runtime.resource_manager import ResourceManagerMixin
 from praxis.backend.core.workcell_runtime.state_sync import StateSyncMixin
 from praxis.backend.services.deck import DeckService
@@ -52,8 +53,24 @@ class WorkcellRuntime(
     resource_service: ResourceService,
     deck_type_definition_service: DeckTypeDefinitionService,
     workcell_service: WorkcellService,
+    machine_pool: MachinePool | None = None,
   ) -> None:
-    """Initialize the WorkcellRuntime."""
+    """Initialize the WorkcellRuntime.
+
+    Args:
+        db_session_factory: Factory for database sessions used to persist
+            machine, resource, and workcell state.
+        workcell: The workcell whose live PyLabRobot objects are managed.
+        deck_service: Service for deck records.
+        machine_service: Service for machine records.
+        resource_service: Service for resource records.
+        deck_type_definition_service: Service for deck type definitions.
+        workcell_service: Service for workcell records.
+        machine_pool: Optional keep-warm pool. When given, machines shut down
+            after a run stay set up and are reused by the next run if their
+            configuration is unchanged.
+
+    """
     self.db_session_factory = db_session_factory
     self.deck_svc = deck_service
     self.machine_svc = machine_service
@@ -65,8 +82,10 @@ class WorkcellRuntime(
     self._active_decks: dict[uuid.UUID, Deck] = {}
     self._last_initialized_deck_object: Deck | None = None
     self._last_initialized_deck_orm_accession_id: uuid.UUID | None = None
+    self._machine_pool = machine_pool
 
     self._main_workcell = workcell
     self._workcell_db_accession_id: uuid.UUID | None = None
     self._state_sync_task: asyncio.Task | None = None
+    self._machine_pool_task: asyncio.Task[None] | None = None
     logger.info("WorkcellRuntime initialized.")
@@ -8,6 +8,8 @@ from typing import TYPE_CHECKING, Any, cast
 from pylabrobot.resources import Coordinate, Deck
 
 if TYPE_CHECKING:
+  from sqlalchemy.ext.asyncio import AsyncSession
+
   from praxis.backend.core.workcell_runtime.core import WorkcellRuntime
 
 from praxis.backend.core.workcell_runtime.utils import log_workcell_runtime_errors
@@ -17,6 +19,7 @@ from praxis.backend.models import (
   ResourceStatusEnum,
 )
 from praxis.backend.models.domain.filters import SearchFilters
+from praxis.backend.services.deck_type_definition import DeckGeometry, deck_geometry_registry
 from praxis.backend.utils.errors import WorkcellRuntimeError
 from praxis.backend.utils.logging import get_logger
 
@@ -26,7 +29,30 @@ COORDINATE_TUPLE_LENGTH = 3
 
 
 class DeckManagerMixin:
-  """Mixin for managing decks in WorkcellRuntime."""
+  """Mixin for managing decks in WorkcellRuntime.
+
+  Deck type geometry is read through `deck_geometry_registry`, so the type
+  definition and its positions are fetched once per deck type (until the type
+  is re-synced) rather than on every position lookup.
+  """
+
+  async def _get_deck_geometry(
+    self,
+    db_session: "AsyncSession",
+    deck_type_id: uuid.UUID,
+  ) -> DeckGeometry | None:
+    """Return the cached geometry of a deck type, loading it on a miss."""
+    runtime = cast("WorkcellRuntime", self)
+    geometry = deck_geometry_registry.get(deck_type_id)
+    if geometry is not None:
+      return geometry
+    definition = await runtime.deck_type_definition_svc.get(
+      db=db_session,
+      accession_id=deck_type_id,
+    )
+    if definition is None:
+      return None
+    return deck_geometry_registry.put(DeckGeometry.from_definition(definition))
 
   def get_active_deck_accession_id(self, deck: Deck) -> uuid.UUID:
     """Retrieve the ORM ID of an active PyLabRobot Deck instance."""
@@ -138,17 +164,17 @@ class DeckManagerMixin:
         msg = f"Deck ORM ID {deck_orm_accession_id} does not have a valid deck type definition."
         raise WorkcellRuntimeError(msg)
 
-      deck_type_definition_model = await runtime.deck_type_definition_svc.get(
-        db=db_session,
-        accession_id=deck_orm_type_definition_accession_id,
+      deck_geometry = await runtime._get_deck_geometry(
+        db_session,
+        deck_orm_type_definition_accession_id,
       )
 
-      if deck_type_definition_model is None:
+      if deck_geometry is None:
         msg = f"Deck type definition for deck ORM ID {deck_orm_accession_id} not found in database."
         raise WorkcellRuntimeError(msg)
 
       positioning_config = PositioningConfig.model_validate(
-        deck_type_definition_model.positioning_config_json,
+        deck_geometry.positioning_config_json,
       )
 
       final_location_for_plr: Coordinate
@@ -164,7 +190,7 @@ class DeckManagerMixin:
       elif position_accession_id is not None:
         final_location_for_plr = await runtime._get_calculated_location(
           target_deck=target_deck,
-          deck_type_id=deck_type_definition_model.accession_id,
+          deck_type_id=deck_geometry.deck_type_id,
           position_accession_id=position_accession_id,
           positioning_config=positioning_config,
         )
@@ -266,11 +292,10 @@ class DeckManagerMixin:
 
       response_positions: list[dict[str, Any]] = []
 
-      resources_on_deck: list[Resource] = await runtime.resource_svc.get_multi(
-        db=db_session,
-        filters=SearchFilters(
-          search_filters={"location_machine_accession_id": deck_model.accession_id},
-        ),
+      # One query: placed resources with their definitions joined in.
+      resources_on_deck: list[Resource] = await runtime.resource_svc.list_on_deck(
+        db_session,
+        deck_accession_id=deck_model.accession_id,
       )
 
       for lw_instance in resources_on_deck:
@@ -370,118 +395,106 @@ class DeckManagerMixin:
         deck_type_id,
       )
       if isinstance(position_accession_id, str | int | uuid.UUID):
-        async with runtime.db_session_factory() as db_session:
-          deck_type_definition = await runtime.deck_type_definition_svc.get(
-            db=db_session,
-            accession_id=deck_type_id,
-          )
-          if not deck_type_definition:
-            msg = f"Deck type definition with ID {deck_type_id} not found."
-            raise WorkcellRuntimeError(msg)
-          all_deck_position_definitions = deck_type_definition.positions
-          found_position_def = next(
-            (
-              p
-              for p in all_deck_position_definitions
-              if p.position_accession_id == str(position_accession_id)
-              or p.position_accession_id == int(position_accession_id)
-            ),
-            None,
-          )
-          if (
-            found_position_def
-            and found_position_def.nominal_x_mm
-            and found_position_def.nominal_y_mm
-          ):
-            return Coordinate(
-              x=found_position_def.nominal_x_mm,
-              y=found_position_def.nominal_y_mm,
-              z=found_position_def.nominal_z_mm
-              if found_position_def.nominal_z_mm is not None
-              else 0.0,
-            )
-          msg = (
-            f"Position '{position_accession_id}' not found in predefined deck position "
-            f"definitions for deck type ID {deck_type_id}."
-          )
-          raise WorkcellRuntimeError(
-            msg,
+        deck_geometry = deck_geometry_registry.get(deck_type_id)
+        if deck_geometry is None:
+          async with runtime.db_session_factory() as db_session:
+            deck_geometry = await runtime._get_deck_geometry(db_session, deck_type_id)
+        if deck_geometry is None:
+          msg = f"Deck type definition with ID {deck_type_id} not found."
+          raise WorkcellRuntimeError(msg)
+        found_position_def = deck_geometry.get_position(position_accession_id)
+        if (
+          found_position_def
+          and found_position_def.nominal_x_mm
+          and found_position_def.nominal_y_mm
+        ):
+          return Coordinate(
+            x=found_position_def.nominal_x_mm,
+            y=found_position_def.nominal_y_mm,
+            z=found_position_def.nominal_z_mm
+            if found_position_def.nominal_z_mm is not None
+            else 0.0,
           )
-      else:
         msg = (
-          f"No positioning configuration provided for deck type ID "
-          f"{deck_type_id}. Cannot determine position location."
-        )
-        raise WorkcellRuntimeError(
-          msg,
+          f"Position '{position_accession_id}' not found in predefined deck position "
+          f"definitions for deck type ID {deck_type_id}."
         )
-    else:
-      method_name = positioning_config.method_name
-      arg_name = positioning_config.arg_name
-      arg_type = positioning_config.arg_type
-      method_params = positioning_config.params or {}
-
-      position_method = getattr(target_deck, method_name, None)
-      if position_method is None or not callable(position_method):
-        msg = f"Deck does not have a valid position method '{method_name}' as configured."
         raise WorkcellRuntimeError(
           msg,
         )
+      msg = (
+        f"No positioning configuration provided for deck type ID "
+        f"{deck_type_id}. Cannot determine position location."
+      )
+      raise WorkcellRuntimeError(
+        msg,
+      )
+    method_name = positioning_config.method_name
+    arg_name = positioning_config.arg_name
+    arg_type = positioning_config.arg_type
+    method_params = positioning_config.params or {}
+
+    position_method = getattr(target_deck, method_name, None)
+    if position_method is None or not callable(position_method):
+      msg = f"Deck does not have a valid position method '{method_name}' as configured."
+      raise WorkcellRuntimeError(
+        msg,
+      )
 
-      converted_position_arg: str | int
-      if arg_type == "int":
-        try:
-          converted_position_arg = int(position_accession_id)
-        except (ValueError, TypeError) as e:
-          msg = (
-            f"Expected integer for position_accession_id '{position_accession_id}' for method "
-            f"'{method_name}' but got invalid type/value: {e}"
-          )
-          raise TypeError(
-            msg,
-          ) from e
-      else:
-        converted_position_arg = str(position_accession_id)
-
+    converted_position_arg: str | int
+    if arg_type == "int":
       try:
-        sig = inspect.signature(position_method)
-        bound_args = sig.bind_partial(**method_params)
-        bound_args.arguments[arg_name] = converted_position_arg
-        bound_args.apply_defaults()
-        calculated_location = position_method(*bound_args.args, **bound_args.kwargs)
-
-      except TypeError as e:
+        converted_position_arg = int(position_accession_id)
+      except (ValueError, TypeError) as e:
         msg = (
-          f"Error calling PLR method '{method_name}' with arguments "
-          f"'{arg_name}={converted_position_arg}' and params '{method_params}': {e}. "
-          "Check if method signature matches configuration."
+          f"Expected integer for position_accession_id '{position_accession_id}' for method "
+          f"'{method_name}' but got invalid type/value: {e}"
         )
-        raise WorkcellRuntimeError(
-          msg,
-        ) from e
-      except Exception as e:  # pylint: disable=broad-except
-        logger.exception("Unexpected error when calling PLR method '%s'", method_name)
-        msg = f"Unexpected error when calling PLR method '{method_name}': {e}"
-        raise WorkcellRuntimeError(
+        raise TypeError(
           msg,
         ) from e
+    else:
+      converted_position_arg = str(position_accession_id)
 
-      if not isinstance(calculated_location, Coordinate):
-        if (
-          isinstance(calculated_location, tuple)
-          and len(calculated_location) == COORDINATE_TUPLE_LENGTH
-        ):
-          calculated_location = Coordinate(
-            x=calculated_location[0],
-            y=calculated_location[1],
-            z=calculated_location[2],
-          )
-        else:
-          msg = (
-            f"Expected PLR method '{method_name}' to return a Coordinate or (x,y,z) "
-            f"tuple, but got {type(calculated_location)}: {calculated_location}"
-          )
-          raise TypeError(
-            msg,
-          )
-      return calculated_location
+    try:
+      sig = inspect.signature(position_method)
+      bound_args = sig.bind_partial(**method_params)
+      bound_args.arguments[arg_name] = converted_position_arg
+      bound_args.apply_defaults()
+      calculated_location = position_method(*bound_args.args, **bound_args.kwargs)
+
+    except TypeError as e:
+      msg = (
+        f"Error calling PLR method '{method_name}' with arguments "
+        f"'{arg_name}={converted_position_arg}' and params '{method_params}': {e}. "
+        "Check if method signature matches configuration."
+      )
+      raise WorkcellRuntimeError(
+        msg,
+      ) from e
+    except Exception as e:  # pylint: disable=broad-except
+      logger.exception("Unexpected error when calling PLR method '%s'", method_name)
+      msg = f"Unexpected error when calling PLR method '{method_name}': {e}"
+      raise WorkcellRuntimeError(
+        msg,
+      ) from e
+
+    if not isinstance(calculated_location, Coordinate):
+      if (
+        isinstance(calculated_location, tuple)
+        and len(calculated_location) == COORDINATE_TUPLE_LENGTH
+      ):
+        calculated_location = Coordinate(
+          x=calculated_location[0],
+          y=calculated_location[1],
+          z=calculated_location[2],
+        )
+      else:
+        msg = (
+          f"Expected PLR method '{method_name}' to return a Coordinate or (x,y,z) "
+          f"tuple, but got {type(calculated_location)}: {calculated_location}"
+        )
+        raise TypeError(
+          msg,
+        )
+    return calculated_location
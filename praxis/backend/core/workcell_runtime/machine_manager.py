@@ -1,9 +1,11 @@
 # pylint: disable=too-many-arguments, broad-except, fixme
 """Machine management for WorkcellRuntime."""
 
+import asyncio
+import contextlib
 import inspect
 import uuid
-from collections.abc import Awaitable, Callable
+from collections.abc import Callable, Iterable, Mapping
 from typing import TYPE_CHECKING, Any, cast
 
 from pylabrobot.machines import Machine
@@ -14,25 +16,41 @@ if TYPE_CHECKING:
 
   from praxis.backend.core.workcell_runtime.core import WorkcellRuntime
 
+from praxis.backend.core.workcell_runtime.machine_pool import (
+  MachinePool,
+  machine_config_fingerprint,
+)
 from praxis.backend.core.workcell_runtime.utils import (
   get_class_from_fqn,
   log_workcell_runtime_errors,
 )
-from praxis.backend.models import Machine, MachineStatusEnum
+from praxis.backend.models import Machine as MachineModel
+from praxis.backend.models import MachineStatusEnum
 from praxis.backend.utils.errors import WorkcellRuntimeError
 from praxis.backend.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
 
+async def _call_maybe_async(method: Callable[[], Any]) -> None:
+  """Call a PLR lifecycle method (setup/stop), awaiting it if it is a coroutine."""
+  result = method()
+  if inspect.isawaitable(result):
+    await result
+
+
 class MachineManagerMixin:
   """Mixin for managing machines in WorkcellRuntime."""
 
+  _machine_pool: MachinePool | None = None
+  """Keep-warm pool; when set, shutdowns park set-up machines for reuse."""
+  _machine_pool_task: asyncio.Task[None] | None = None
+
   @log_workcell_runtime_errors(
     prefix="WorkcellRuntime: Error initializing machine",
     suffix=" - Ensure the machine ORM is valid, the class, and machine is connected.",
   )
-  async def initialize_machine(self, machine_model: Machine) -> Machine:
+  async def initialize_machine(self, machine_model: MachineModel) -> Machine:
     """Initialize and connects to a machine's PyLabRobot machine/resource."""
     # We assume self is WorkcellRuntime
     runtime = cast("WorkcellRuntime", self)
@@ -82,6 +100,7 @@ class MachineManagerMixin:
           )
 
     machine_instance: Machine
+    reused_warm = False
     if shared_plr_instance:
       machine_instance = cast("Machine", shared_plr_instance)
     else:
@@ -111,7 +130,6 @@ class MachineManagerMixin:
             from sqlalchemy import select
             from sqlalchemy.orm import selectinload
 
-            from praxis.backend.models import Machine as MachineModel
             from praxis.backend.models import MachineDefinition
 
             stmt = (
@@ -130,121 +148,22 @@ class MachineManagerMixin:
             loaded_machine = result.scalar_one()
             machine_model = loaded_machine
 
-        # NEW: Support frontend/backend separation if definitions are set
-        if (
-          machine_model.frontend_definition_accession_id
-          and machine_model.backend_definition_accession_id
-        ):
-          # New pattern: instantiate backend, then frontend with backend
-          logger.info(
-            "WorkcellRuntime: Using new frontend/backend separation for machine '%s'.",
-            machine_model.name,
-          )
-
-          backend_fqn = machine_model.backend_definition.fqn
-          frontend_fqn = machine_model.frontend_definition.fqn
-          backend_config = machine_model.backend_config or {}
-
-          # Instantiate backend
-          backend_class = get_class_from_fqn(backend_fqn)
-          backend_instance = backend_class(**backend_config)
-
-          # Instantiate frontend with backend
-          target_class = get_class_from_fqn(frontend_fqn)
-          machine_config = machine_model.properties_json or {}
-          machine_config["backend"] = backend_instance
-        else:
-          # Legacy pattern: use fqn directly (backwards compatibility)
-          target_class = get_class_from_fqn(machine_model.fqn)
-          machine_config = machine_model.properties_json or {}
-
-        # AUTO-DECK LOGIC: If the machine definition specifies a deck and none is provided
-        # in properties_json, we auto-initialize it.
-        if "deck" not in machine_config:
-          deck_definition = None
-          if machine_model.machine_definition and machine_model.machine_definition.deck_definition:
-            deck_definition = machine_model.machine_definition.deck_definition
-          elif (
-            hasattr(machine_model, "deck_child_definition") and machine_model.deck_child_definition
-          ):
-            deck_definition = machine_model.deck_child_definition
-
-          if deck_definition:
-            logger.info(
-              "WorkcellRuntime: Auto-initializing deck '%s' (FQN: %s) for machine '%s'.",
-              deck_definition.name,
-              deck_definition.fqn,
-              machine_model.name,
-            )
-            deck_class = get_class_from_fqn(deck_definition.fqn)
-            # Most PLR Decks take a 'name' in __init__
-            deck_instance = deck_class(name=f"{machine_model.name}_deck")
-            machine_config["deck"] = deck_instance
-
-        instance_name = machine_model.name
-
-        init_params = machine_config.copy()
-        sig = inspect.signature(target_class.__init__)
-
-        if "name" in sig.parameters:
-          init_params["name"] = instance_name
-        elif "name" in init_params and init_params["name"] != instance_name:
-          logger.warning(
-            "WorkcellRuntime: 'name' in machine_config for %s differs. Using name.",
-            instance_name,
-          )
-          init_params["name"] = instance_name
-
-        valid_init_params = {k: v for k, v in init_params.items() if k in sig.parameters}
-        extra_params = {k: v for k, v in init_params.items() if k not in sig.parameters}
-        if (
-          extra_params
-          and "options" in sig.parameters
-          and isinstance(init_params.get("options"), dict)
-        ):
-          valid_init_params.setdefault("options", {}).update(extra_params)
-        elif extra_params and "options" in sig.parameters:
-          valid_init_params["options"] = extra_params
-        elif extra_params:
-          logger.warning(
-            "WorkcellRuntime: Extra parameters in machine_config for %s not "
-            "accepted by %s.__init__: %s",
-            instance_name,
-            target_class.__name__,
-            extra_params.keys(),
-          )
-
-        machine_instance = target_class(**valid_init_params)
-
-        if not isinstance(machine_instance, Machine):
-          msg = (
-            f"Machine '{machine_model.name}' initialized, but it is not a valid PyLabRobot Machine "
-            f"instance. Type is {type(machine_instance).__name__}."
-          )
-          raise TypeError(msg)
-
-        if (
-          hasattr(machine_instance, "setup")
-          and isinstance(machine_instance.setup, Awaitable)
-          and isinstance(machine_instance.setup, Callable)
-        ):
+        pooled = None
+        if runtime._machine_pool is not None:
+          fingerprint = machine_config_fingerprint(machine_model)
+          pooled = runtime._machine_pool.checkout(machine_model.accession_id, fingerprint)
+          runtime._machine_pool.track(machine_model.accession_id, fingerprint)
+          await self.evict_idle_machines()
+        if pooled is not None:
           logger.info(
-            "WorkcellRuntime: Calling setup() for '%s'...",
+            "WorkcellRuntime: Reusing warm machine '%s' (ID: %s) from the machine pool.",
             machine_model.name,
+            machine_model.accession_id,
           )
-          try:
-            await machine_instance.setup()
-          except Exception as e:
-            error_message = (
-              f"Failed to call setup() for machine '{machine_model.name}': {str(e)[:250]}"
-            )
-            raise WorkcellRuntimeError(error_message) from e
+          machine_instance = pooled
+          reused_warm = True
         else:
-          msg = (
-            f"Machine '{machine_model.name}' does not have a valid setup() method that is callable "
-            "and awaitable."
-          )
-          raise WorkcellRuntimeError(msg)
+          machine_instance = await self._instantiate_machine(machine_model)
       except Exception as e:  # pylint: disable=broad-except
         error_message = f"Failed to instantiate or setup machine \
                 '{machine_model.name}'\
@@ -261,12 +180,14 @@ class MachineManagerMixin:
         raise WorkcellRuntimeError(error_message) from e
 
     runtime._active_machines[machine_model.accession_id] = machine_instance
-    runtime._main_workcell.add_asset(machine_instance)
-    logger.info(
-      "WorkcellRuntime: Machine '%s' (ID: %s) added to main Workcell container.",
-      machine_model.name,
-      machine_model.accession_id,
-    )
+    if not reused_warm:
+      # Warm instances stayed in the Workcell container while parked.
+      runtime._main_workcell.add_asset(machine_instance)
+      logger.info(
+        "WorkcellRuntime: Machine '%s' (ID: %s) added to main Workcell container.",
+        machine_model.name,
+        machine_model.accession_id,
+      )
 
     if (
       machine_model.is_resource
@@ -346,6 +267,257 @@ class MachineManagerMixin:
       await db_session.commit()
     return machine_instance
 
+  async def _instantiate_machine(self, machine_model: MachineModel) -> Machine:
+    """Instantiate a machine's PLR frontend (and backend and deck) and call setup()."""
+    # NEW: Support frontend/backend separation if definitions are set
+    if (
+      machine_model.frontend_definition_accession_id
+      and machine_model.backend_definition_accession_id
+    ):
+      # New pattern: instantiate backend, then frontend with backend
+      logger.info(
+        "WorkcellRuntime: Using new frontend/backend separation for machine '%s'.",
+        machine_model.name,
+      )
+
+      backend_fqn = machine_model.backend_definition.fqn
+      frontend_fqn = machine_model.frontend_definition.fqn
+      backend_config = machine_model.backend_config or {}
+
+      # Instantiate backend
+      backend_class = get_class_from_fqn(backend_fqn)
+      backend_instance = backend_class(**backend_config)
+
+      # Instantiate frontend with backend
+      target_class = get_class_from_fqn(frontend_fqn)
+      machine_config = dict(machine_model.properties_json or {})
+      machine_config["backend"] = backend_instance
+    else:
+      # Legacy pattern: use fqn directly (backwards compatibility)
+      target_class = get_class_from_fqn(machine_model.fqn)
+      machine_config = dict(machine_model.properties_json or {})
+
+    # AUTO-DECK LOGIC: If the machine definition specifies a deck and none is provided
+    # in properties_json, we auto-initialize it.
+    if "deck" not in machine_config:
+      deck_definition = None
+      if machine_model.machine_definition and machine_model.machine_definition.deck_definition:
+        deck_definition = machine_model.machine_definition.deck_definition
+      elif (
+        hasattr(machine_model, "deck_child_definition") and machine_model.deck_child_definition
+      ):
+        deck_definition = machine_model.deck_child_definition
+
+      if deck_definition:
+        logger.info(
+          "WorkcellRuntime: Auto-initializing deck '%s' (FQN: %s) for machine '%s'.",
+          deck_definition.name,
+          deck_definition.fqn,
+          machine_model.name,
+        )
+        deck_class = get_class_from_fqn(deck_definition.fqn)
+        # Most PLR Decks take a 'name' in __init__
+        deck_instance = deck_class(name=f"{machine_model.name}_deck")
+        machine_config["deck"] = deck_instance
+
+    instance_name = machine_model.name
+
+    init_params = machine_config.copy()
+    sig = inspect.signature(target_class.__init__)
+
+    if "name" in sig.parameters:
+      init_params["name"] = instance_name
+    elif "name" in init_params and init_params["name"] != instance_name:
+      logger.warning(
+        "WorkcellRuntime: 'name' in machine_config for %s differs. Using name.",
+        instance_name,
+      )
+      init_params["name"] = instance_name
+
+    valid_init_params = {k: v for k, v in init_params.items() if k in sig.parameters}
+    extra_params = {k: v for k, v in init_params.items() if k not in sig.parameters}
+    if (
+      extra_params
+      and "options" in sig.parameters
+      and isinstance(init_params.get("options"), dict)
+    ):
+      valid_init_params.setdefault("options", {}).update(extra_params)
+    elif extra_params and "options" in sig.parameters:
+      valid_init_params["options"] = extra_params
+    elif extra_params:
+      logger.warning(
+        "WorkcellRuntime: Extra parameters in machine_config for %s not "
+        "accepted by %s.__init__: %s",
+        instance_name,
+        target_class.__name__,
+        extra_params.keys(),
+      )
+
+    machine_instance = target_class(**valid_init_params)
+
+    if not isinstance(machine_instance, Machine):
+      msg = (
+        f"Machine '{machine_model.name}' initialized, but it is not a valid PyLabRobot Machine "
+        f"instance. Type is {type(machine_instance).__name__}."
+      )
+      raise TypeError(msg)
+
+    if callable(getattr(machine_instance, "setup", None)):
+      logger.info(
+        "WorkcellRuntime: Calling setup() for '%s'...",
+        machine_model.name,
+      )
+      try:
+        await _call_maybe_async(machine_instance.setup)
+      except Exception as e:
+        error_message = (
+          f"Failed to call setup() for machine '{machine_model.name}': {str(e)[:250]}"
+        )
+        raise WorkcellRuntimeError(error_message) from e
+    else:
+      msg = (
+        f"Machine '{machine_model.name}' does not have a callable setup() method."
+      )
+      raise WorkcellRuntimeError(msg)
+    return machine_instance
+
+  async def initialize_machines(
+    self,
+    machine_models: Iterable[MachineModel],
+    dependencies: Mapping[uuid.UUID, Iterable[uuid.UUID]] | None = None,
+  ) -> dict[uuid.UUID, Machine]:
+    """Initialize several machines concurrently, respecting dependencies.
+
+    Machines are set up in levels: every machine whose dependencies are
+    already active is initialized concurrently with the others in its level.
+    A machine whose resource counterpart is located on another machine in the
+    batch (e.g. a heater shaker on a liquid handler's deck) depends on that
+    machine implicitly.
+
+    Args:
+        machine_models: Machines to initialize.
+        dependencies: Extra dependencies, mapping a machine ID to the IDs of
+            machines that must be initialized before it.
+
+    Returns:
+        Live PLR instances keyed by machine ID.
+
+    Raises:
+        WorkcellRuntimeError: If the dependencies contain a cycle, or if any
+            machine fails to initialize (after the rest of its level finished).
+            Machines this call already started are shut down again first.
+
+    """
+    models = {model.accession_id: model for model in machine_models}
+    pending: dict[uuid.UUID, set[uuid.UUID]] = {}
+    for accession_id, model in models.items():
+      required = set((dependencies or {}).get(accession_id, ()))
+      counterpart = model.resource_counterpart if model.is_resource else None
+      host_id = getattr(counterpart, "machine_location_accession_id", None)
+      if host_id is not None:
+        required.add(host_id)
+      pending[accession_id] = {dep for dep in required if dep in models and dep != accession_id}
+
+    runtime = cast("WorkcellRuntime", self)
+    already_active = set(runtime._active_machines)
+    initialized: dict[uuid.UUID, Machine] = {}
+    while pending:
+      level = [accession_id for accession_id, deps in pending.items() if deps <= initialized.keys()]
+      if not level:
+        await self._roll_back_machines(initialized.keys() - already_active)
+        msg = f"Circular machine dependencies among: {sorted(map(str, pending))}"
+        raise WorkcellRuntimeError(msg)
+      results = await asyncio.gather(
+        *(self.initialize_machine(models[accession_id]) for accession_id in level),
+        return_exceptions=True,
+      )
+      errors: list[BaseException] = []
+      for accession_id, result in zip(level, results, strict=True):
+        del pending[accession_id]
+        if isinstance(result, BaseException):
+          errors.append(result)
+        else:
+          initialized[accession_id] = result
+      if errors:
+        await self._roll_back_machines(initialized.keys() - already_active)
+        msg = f"Failed to initialize {len(errors)} machine(s): {errors[0]}"
+        raise WorkcellRuntimeError(msg) from errors[0]
+    return initialized
+
+  async def _roll_back_machines(self, machine_accession_ids: Iterable[uuid.UUID]) -> None:
+    """Shut down machines started by a failed batch, logging (not raising) failures."""
+    for machine_accession_id in machine_accession_ids:
+      logger.info(
+        "WorkcellRuntime: Rolling back machine ID %s after failed batch initialization.",
+        machine_accession_id,
+      )
+      try:
+        await self.shutdown_machine(machine_accession_id)
+      except WorkcellRuntimeError:
+        logger.exception(
+          "WorkcellRuntime: Error rolling back machine ID %s",
+          machine_accession_id,
+        )
+
+  def start_machine_pool(self, eviction_interval: float = 30.0) -> None:
+    """Start periodically stopping warm machines that outlived the idle timeout.
+
+    Args:
+        eviction_interval: Seconds between idle-eviction sweeps.
+
+    """
+    runtime = cast("WorkcellRuntime", self)
+    if runtime._machine_pool is None:
+      logger.info("WorkcellRuntime: No machine pool configured; eviction not started.")
+      return
+    if self._machine_pool_task and not self._machine_pool_task.done():
+      logger.warning("Machine pool eviction task is already running.")
+      return
+    self._machine_pool_task = asyncio.create_task(self._machine_pool_eviction_loop(eviction_interval))
+    logger.info("Machine pool eviction task started (every %.1fs).", eviction_interval)
+
+  async def _machine_pool_eviction_loop(self, eviction_interval: float) -> None:
+    """Sweep the machine pool for idle or unhealthy machines until cancelled."""
+    while True:
+      await asyncio.sleep(eviction_interval)
+      try:
+        await self.evict_idle_machines()
+      except Exception:  # pylint: disable=broad-except
+        logger.exception("WorkcellRuntime: Error evicting idle machines.")
+
+  async def stop_machine_pool(self) -> None:
+    """Stop the eviction task and every machine still parked in the pool."""
+    runtime = cast("WorkcellRuntime", self)
+    if self._machine_pool_task:
+      self._machine_pool_task.cancel()
+      with contextlib.suppress(asyncio.CancelledError):
+        await self._machine_pool_task
+      self._machine_pool_task = None
+    if runtime._machine_pool is not None:
+      await self._stop_machines(runtime._machine_pool.drain())
+
+  async def evict_idle_machines(self) -> int:
+    """Stop warm machines that exceeded the pool's idle timeout or were rejected.
+
+    Returns:
+        Number of machines stopped.
+
+    """
+    runtime = cast("WorkcellRuntime", self)
+    if runtime._machine_pool is None:
+      return 0
+    return await self._stop_machines(runtime._machine_pool.evict_idle())
+
+  async def _stop_machines(self, machines: list[Machine]) -> int:
+    """Stop machines that left the pool, logging (not raising) failures."""
+    for machine in machines:
+      logger.info("WorkcellRuntime: Stopping pooled machine '%s'.", getattr(machine, "name", machine))
+      try:
+        await _call_maybe_async(machine.stop)
+      except Exception:  # pylint: disable=broad-except
+        logger.exception("WorkcellRuntime: Error stopping pooled machine '%s'.", machine)
+    return len(machines)
+
   def get_active_machine(self, machine_orm_accession_id: uuid.UUID) -> Machine:
     """Retrieve an active PyLabRobot machine instance by its ORM ID."""
     runtime = cast("WorkcellRuntime", self)
@@ -378,30 +550,60 @@ class MachineManagerMixin:
     prefix="WorkcellRuntime: Error shutting down machine",
     suffix=" - Ensure the machine ORM ID is valid and the machine is active.",
   )
-  async def shutdown_machine(self, machine_orm_accession_id: uuid.UUID) -> None:
-    """Shut down and removes a live PyLabRobot machine instance."""
+  async def shutdown_machine(
+    self,
+    machine_orm_accession_id: uuid.UUID,
+    *,
+    keep_warm: bool | None = None,
+  ) -> None:
+    """Shut down and removes a live PyLabRobot machine instance.
+
+    Args:
+        machine_orm_accession_id: ID of the machine to shut down.
+        keep_warm: Park the set-up instance in the machine pool instead of
+            calling stop(). Defaults to True when the runtime has a pool.
+
+    """
     runtime = cast("WorkcellRuntime", self)
     machine_instance = runtime._active_machines.pop(machine_orm_accession_id, None)
+    if keep_warm is None:
+      keep_warm = runtime._machine_pool is not None
     try:
-      if machine_instance is not None:
+      if (
+        machine_instance is not None
+        and keep_warm
+        and runtime._machine_pool is not None
+        and runtime._machine_pool.checkin(machine_orm_accession_id, machine_instance)
+      ):
+        logger.info(
+          "WorkcellRuntime: Keeping machine ID %s warm in the machine pool.",
+          machine_orm_accession_id,
+        )
+        async with runtime.db_session_factory() as db_session:
+          await runtime.machine_svc.update_machine_status(
+            db_session,
+            machine_orm_accession_id,
+            MachineStatusEnum.AVAILABLE,
+            "Machine kept warm.",
+          )
+          await db_session.commit()
+        await self.evict_idle_machines()
+
+      elif machine_instance is not None:
         logger.info(
           "WorkcellRuntime: Shutting down machine for machine ID: %s...",
           machine_orm_accession_id,
         )
-        if (
-          hasattr(machine_instance, "stop")
-          and isinstance(machine_instance.stop, Awaitable)
-          and isinstance(machine_instance.stop, Callable)
-        ):
+        if callable(getattr(machine_instance, "stop", None)):
           logger.info(
             "WorkcellRuntime: Calling stop() for machine ID %s...",
             machine_orm_accession_id,
           )
-          await machine_instance.stop()
+          await _call_maybe_async(machine_instance.stop)
         else:
           msg = (
-            f"No stop() method for {machine_instance.__class__.__name__} machine "
-            f"{machine_orm_accession_id} that is callable and awaitable."
+            f"No callable stop() method for {machine_instance.__class__.__name__} machine "
+            f"{machine_orm_accession_id}."
           )
           raise WorkcellRuntimeError(msg)
         async with runtime.db_session_factory() as db_session:
@@ -503,11 +705,13 @@ class MachineManagerMixin:
           "WorkcellRuntime: Shutting down machine ID %s...",
           machine_accession_id,
         )
-        await self.shutdown_machine(machine_accession_id)
+        await self.shutdown_machine(machine_accession_id, keep_warm=False)
       except WorkcellRuntimeError:
         logger.exception(
           "WorkcellRuntime: Error shutting down machine ID %s",
           machine_accession_id,
         )
         continue
+    if runtime._machine_pool is not None:
+      await self._stop_machines(runtime._machine_pool.drain())
     logger.info("WorkcellRuntime: All active machines processed for shutdown.")
@@ -0,0 +1,205 @@
+"""Keep-warm pool of set-up machine instances for WorkcellRuntime.
+
+Setting up a PyLabRobot machine (opening the connection, homing, loading
+firmware state) dominates the start-up of a run. When consecutive runs use the
+same machine with an unchanged configuration, the runtime parks the set-up
+instance here on shutdown instead of calling `stop()`, and the next
+`initialize_machine` reuses it.
+
+An entry is reused only if its configuration fingerprint still matches and it
+passes a health check. Entries idle for longer than `idle_timeout` are evicted
+and must be stopped by the caller.
+"""
+
+import hashlib
+import json
+import time
+import uuid
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from praxis.backend.utils.logging import get_logger
+
+if TYPE_CHECKING:
+  from pylabrobot.machines import Machine as PLRMachine
+
+  from praxis.backend.models import Machine
+
+logger = get_logger(__name__)
+
+DEFAULT_MACHINE_IDLE_TIMEOUT = 300.0
+"""Seconds a parked machine stays warm before it is stopped."""
+
+
+def machine_config_fingerprint(machine_model: "Machine") -> str:
+  """Hash the parts of a machine's configuration that shape its live instance.
+
+  Args:
+      machine_model: The machine ORM model, with definitions loaded.
+
+  Returns:
+      SHA-256 hex digest; two models with equal fingerprints produce
+      interchangeable PLR instances.
+
+  """
+
+  def _fqn(definition: Any) -> str | None:
+    return getattr(definition, "fqn", None) if definition is not None else None
+
+  machine_definition = getattr(machine_model, "machine_definition", None)
+  payload = {
+    "fqn": machine_model.fqn,
+    "frontend": _fqn(getattr(machine_model, "frontend_definition", None)),
+    "backend": _fqn(getattr(machine_model, "backend_definition", None)),
+    "backend_config": getattr(machine_model, "backend_config", None),
+    "properties": machine_model.properties_json,
+    "deck": _fqn(getattr(machine_definition, "deck_definition", None))
+    or _fqn(getattr(machine_model, "deck_child_definition", None)),
+  }
+  canonical = json.dumps(payload, sort_keys=True, default=repr)
+  return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def default_machine_health_check(machine: "PLRMachine") -> bool:
+  """Consider a machine healthy while PyLabRobot reports it as set up."""
+  return bool(getattr(machine, "setup_finished", True))
+
+
+@dataclass
+class PooledMachine:
+  """A set-up machine instance parked in the pool."""
+
+  instance: "PLRMachine"
+  fingerprint: str
+  parked_at: float = field(default_factory=time.monotonic)
+
+
+class MachinePool:
+  """Set-up machine instances kept warm between runs, keyed by machine ID.
+
+  Usage:
+      pool = MachinePool(idle_timeout=120)
+      instance = pool.checkout(machine_id, fingerprint)
+      if instance is None:
+          instance = ...  # instantiate and set up
+      ...
+      pool.checkin(machine_id, instance, fingerprint)
+      for stale in pool.evict_idle():
+          await stale.stop()
+
+  """
+
+  def __init__(
+    self,
+    idle_timeout: float = DEFAULT_MACHINE_IDLE_TIMEOUT,
+    health_check: Callable[["PLRMachine"], bool] = default_machine_health_check,
+    clock: Callable[[], float] = time.monotonic,
+  ) -> None:
+    """Initialize the pool.
+
+    Args:
+        idle_timeout: Seconds an entry may stay parked before it is evicted.
+        health_check: Predicate a parked instance must pass to be reused.
+        clock: Monotonic time source (injectable for tests).
+
+    """
+    self.idle_timeout = idle_timeout
+    self._health_check = health_check
+    self._clock = clock
+    self._entries: dict[uuid.UUID, PooledMachine] = {}
+    self._active_fingerprints: dict[uuid.UUID, str] = {}
+    self._evicted: list[PLRMachine] = []
+    self.hits = 0
+    self.misses = 0
+
+  def __len__(self) -> int:
+    return len(self._entries)
+
+  def __contains__(self, machine_accession_id: object) -> bool:
+    return machine_accession_id in self._entries
+
+  def track(self, machine_accession_id: uuid.UUID, fingerprint: str) -> None:
+    """Record the configuration an active (not parked) instance was built from."""
+    self._active_fingerprints[machine_accession_id] = fingerprint
+
+  def checkin(
+    self,
+    machine_accession_id: uuid.UUID,
+    instance: "PLRMachine",
+    fingerprint: str | None = None,
+  ) -> bool:
+    """Park a set-up instance for reuse by the next run.
+
+    Args:
+        machine_accession_id: ID of the machine the instance belongs to.
+        instance: The set-up PLR machine.
+        fingerprint: Configuration fingerprint; defaults to the one recorded
+            by `track`.
+
+    Returns:
+        False if no fingerprint is known (the instance is not parked).
+
+    """
+    fingerprint = fingerprint or self._active_fingerprints.pop(machine_accession_id, None)
+    if fingerprint is None:
+      return False
+    previous = self._entries.pop(machine_accession_id, None)
+    if previous is not None and previous.instance is not instance:
+      self._evicted.append(previous.instance)
+    self._entries[machine_accession_id] = PooledMachine(
+      instance=instance,
+      fingerprint=fingerprint,
+      parked_at=self._clock(),
+    )
+    return True
+
+  def checkout(self, machine_accession_id: uuid.UUID, fingerprint: str) -> "PLRMachine | None":
+    """Take a warm instance out of the pool, if a reusable one is parked.
+
+    Entries that are stale, unhealthy or built from a different configuration
+    are moved to the eviction list instead.
+    """
+    entry = self._entries.pop(machine_accession_id, None)
+    if entry is None:
+      self.misses += 1
+      return None
+
+    reason = None
+    if entry.fingerprint != fingerprint:
+      reason = "configuration changed"
+    elif self._clock() - entry.parked_at > self.idle_timeout:
+      reason = "idle timeout"
+    else:
+      try:
+        if not self._health_check(entry.instance):
+          reason = "health check failed"
+      except Exception:  # pylint: disable=broad-except
+        logger.debug("Health check raised for machine %s", machine_accession_id, exc_info=True)
+        reason = "health check raised"
+
+    if reason is not None:
+      logger.info("MachinePool: Not reusing warm machine %s (%s).", machine_accession_id, reason)
+      self._evicted.append(entry.instance)
+      self.misses += 1
+      return None
+    self.hits += 1
+    return entry.instance
+
+  def evict_idle(self) -> list["PLRMachine"]:
+    """Remove entries past the idle timeout and return every instance to stop."""
+    now = self._clock()
+    for machine_accession_id, entry in list(self._entries.items()):
+      if now - entry.parked_at > self.idle_timeout:
+        del self._entries[machine_accession_id]
+        self._evicted.append(entry.instance)
+    evicted, self._evicted = self._evicted, []
+    return evicted
+
+  def drain(self) -> list["PLRMachine"]:
+    """Remove every entry and return all instances to stop."""
+    self._active_fingerprints.clear()
+    self._evicted.extend(entry.instance for entry in self._entries.values())
+    self._entries.clear()
+    evicted, self._evicted = self._evicted, []
+    return evicted
@@ -26,6 +26,7 @@ class StateSyncMixin:
   workcell_svc: WorkcellService
   _main_workcell: "IWorkcell"
   _state_sync_task: asyncio.Task[None] | None
+  evict_idle_machines: Callable[[], Awaitable[int]]
   _state_listeners: list[Callable[[dict[str, Any]], Awaitable[None]]] = []
   _background_tasks: set[asyncio.Task[None]] = set()
 
@@ -100,6 +101,8 @@ class StateSyncMixin:
           self._workcell_db_accession_id,
         )
 
+        await self.evict_idle_machines()
+
         now = datetime.datetime.now(datetime.timezone.utc)
         if (now - last_disk_backup_time).total_seconds() >= self._main_workcell.backup_interval:
           disk_backup_path = self._main_workcell.save_file.replace(
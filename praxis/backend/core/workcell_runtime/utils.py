@@ -1,10 +1,10 @@
 """Utility functions for WorkcellRuntime."""
 
-import importlib
 from functools import partial
 
 from praxis.backend.utils.errors import WorkcellRuntimeError
 from praxis.backend.utils.logging import get_logger, log_async_runtime_errors
+from praxis.common.resource_templates import resolve_class
 
 logger = get_logger(__name__)
 
@@ -17,10 +17,8 @@ log_workcell_runtime_errors = partial(
 
 
 def get_class_from_fqn(class_fqn: str) -> type:
-  """Import and return a class dynamically from its fully qualified name."""
-  if not class_fqn or "." not in class_fqn:
-    msg = "Invalid fully qualified class name: %s"
-    raise ValueError(msg, class_fqn)
-  module_name, class_name = class_fqn.rsplit(".", 1)
-  imported_module = importlib.import_module(module_name)
-  return getattr(imported_module, class_name)
+  """Import and return a class dynamically from its fully qualified name.
+
+  Resolution is memoized, so repeated lookups of the same FQN are dict hits.
+  """
+  return resolve_class(class_fqn)
@@ -32,6 +32,7 @@ from praxis.backend.core.orchestrator import Orchestrator
 from praxis.backend.core.storage import StorageBackend, StorageFactory
 from praxis.backend.core.workcell import Workcell
 from praxis.backend.core.workcell_runtime import WorkcellRuntime
+from praxis.backend.core.workcell_runtime.machine_pool import MachinePool
 from praxis.backend.models.domain.deck import Deck, DeckDefinition
 from praxis.backend.models.domain.machine import Machine
 from praxis.backend.models.domain.resource import Resource
@@ -56,16 +57,17 @@ if TYPE_CHECKING:
 from praxis.backend.utils.db import (
   async_engine as praxis_async_engine,
 )
+from praxis.backend.utils.logging import configure_logging
 
 # --- Configuration and Logging Setup ---
 config_file = "praxis.ini"
 praxis_config = PraxisConfiguration(config_file)
 
 # Configure logging from config file
-logging.basicConfig(
-  filename=praxis_config.log_file,
-  level=logging.INFO,
-  format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+configure_logging(
+  level=praxis_config.logging_level,
+  log_file=praxis_config.log_file,
+  json_format=praxis_config.logging_format == "json",
 )
 logger = logging.getLogger(__name__)
 
@@ -98,6 +100,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
   asset_manager: AssetManager | None = None
   workcell_runtime: WorkcellRuntime | None = None
   discovery_service: DiscoveryService | None = None
+  schedule_queue = None
+  reservation_expiry_service = None
+  hardware_discovery_service = None
   try:
     logger.info("Application startup sequence initiated...")
 
@@ -118,8 +123,12 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Create key-value store and task queue based on backend
     kv_store = StorageFactory.create_key_value_store(storage_backend)
     task_queue = StorageFactory.create_task_queue(storage_backend)
+    # One pub/sub for every service: in lite mode each adapter is a separate
+    # in-process bus, so services only see each other's messages when shared.
+    pubsub = StorageFactory.create_pubsub(storage_backend)
     app.state.kv_store = kv_store
     app.state.task_queue = task_queue
+    app.state.pubsub = pubsub
     logger.info(
       "Storage layer initialized: kv_store=%s, task_queue=%s",
       type(kv_store).__name__,
@@ -153,10 +162,15 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         resource_service=resource_service,
         deck_type_definition_service=deck_type_definition_service,
         workcell_service=workcell_service,
+        machine_pool=MachinePool(),
       )
+    workcell_runtime.start_machine_pool()
     logger.info("WorkcellRuntime initialized successfully.")
     async with AsyncSessionLocal() as db_session:  # Use async with for session
-      asset_lock_manager = AssetLockManager()
+      asset_lock_manager = AssetLockManager(
+        store=kv_store,
+        pubsub=pubsub,
+      )
       resource_type_definition_service = ResourceTypeDefinitionService(db_session)
       asset_manager = AssetManager(
         db_session=db_session,
@@ -184,6 +198,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         machine_type_definition_service=machine_type_definition_service,
         protocol_definition_service=protocol_definition_service,
       )
+      discovery_service.start()
       logger.info("DiscoveryService initialized.")
 
       # Instantiate and initialize the Orchestrator with its dependencies
@@ -212,17 +227,37 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
       # Initialize ProtocolExecutionService
       logger.info("Initializing ProtocolExecutionService...")
       from praxis.backend.core.protocol_execution_service import ProtocolExecutionService
-      from praxis.backend.core.scheduler import ProtocolScheduler
+      from praxis.backend.core.scheduler import PersistentScheduleQueue, ProtocolScheduler
       from praxis.backend.services.mock_data_generator import MockTelemetryService
       from praxis.backend.services.protocols import ProtocolRunService
 
       protocol_run_service = ProtocolRunService(ProtocolRun)
+      schedule_queue = PersistentScheduleQueue(AsyncSessionLocal)
+      schedule_queue.start()
       protocol_scheduler = ProtocolScheduler(
         db_session_factory=AsyncSessionLocal,
         task_queue=scheduler_task_queue,
         protocol_run_service=protocol_run_service,
         protocol_definition_service=protocol_definition_service,
+        schedule_queue=schedule_queue,
+      )
+
+      from praxis.backend.core.reservation_expiry import ReservationExpiryService
+
+      reservation_expiry_service = ReservationExpiryService(
+        AsyncSessionLocal,
+        pubsub=pubsub,
+        reservation_manager=protocol_scheduler.asset_reservation_manager,
+      )
+      await reservation_expiry_service.load()
+      reservation_expiry_service.start()
+
+      from praxis.backend.services.hardware_discovery import HardwareDiscoveryService
+
+      hardware_discovery_service = HardwareDiscoveryService(
+        pubsub=pubsub,
       )
+      await hardware_discovery_service.start()
 
       # Inject scheduler into orchestrator
       # This addresses the circular dependency where Orchestrator needs Scheduler to release assets
@@ -247,6 +282,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
       app.state.praxis_config = praxis_config
       app.state.protocol_execution_service = protocol_execution_service
       app.state.mock_telemetry_service = mock_telemetry_service
+      app.state.reservation_expiry_service = reservation_expiry_service
+      app.state.hardware_discovery_service = hardware_discovery_service
       logger.info(
         "Orchestrator, DiscoveryService, and ProtocolExecutionService attached to application state."
       )
@@ -261,6 +298,27 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
   finally:
     logger.info("Application shutdown sequence initiated...")
     try:
+      if reservation_expiry_service is not None:
+        logger.info("Stopping reservation expiry service...")
+        await reservation_expiry_service.stop()
+
+      if hardware_discovery_service is not None:
+        logger.info("Stopping hardware discovery monitoring...")
+        await hardware_discovery_service.stop()
+
+      if discovery_service is not None:
+        logger.info("Stopping protocol simulation workers...")
+        await discovery_service.stop()
+
+      if workcell_runtime is not None:
+        logger.info("Stopping warm machine pool...")
+        await workcell_runtime.stop_machine_pool()
+
+      # Persist buffered schedule writes before the engine goes away
+      if schedule_queue is not None:
+        logger.info("Flushing schedule queue...")
+        await schedule_queue.stop()
+
       # Safely close the database services using the instance created during startup
       if db_service_instance:
         logger.info("Closing PraxisDBService (Keycloak pool)...")
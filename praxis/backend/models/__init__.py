@@ -94,6 +94,8 @@ from .domain.schedule import (
   ScheduleHistory as ScheduleHistory,
 )
 from .domain.schedule import (
+  ScheduleMetricsRollup,
+  ScheduleMetricsStatusRollup,
   SchedulerMetricsView,
 )
 from .domain.user import User as User
@@ -251,6 +253,8 @@ __all__ = [
   "RuntimeAssetRequirement",
   "ScheduleEntry",
   "ScheduleHistory",
+  "ScheduleMetricsRollup",
+  "ScheduleMetricsStatusRollup",
   "ScheduleStatusEnum",
   "SchedulerMetricsView",
   "SpatialContextEnum",
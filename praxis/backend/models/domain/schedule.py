@@ -3,7 +3,7 @@ from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any, Optional
 
 from pydantic import computed_field
-from sqlalchemy import UUID, Column
+from sqlalchemy import UUID, Column, Index
 from sqlalchemy import Enum as SAEnum
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -141,7 +141,9 @@ class AssetReservationBase(PraxisBase):
   released_at: datetime | None = Field(
     default=None, index=True, description="When the asset was released"
   )
-  expires_at: datetime | None = Field(default=None)
+  expires_at: datetime | None = Field(
+    default=None, index=True, description="When the reservation lapses if not released"
+  )
   is_active: bool = Field(
     default=True, index=True, description="Whether the reservation is currently active"
   )
@@ -165,6 +167,11 @@ class AssetReservation(AssetReservationBase, table=True):
   """AssetReservation ORM model - represents a reservation of an asset for a schedule entry."""
 
   __tablename__ = "asset_reservations"
+  __table_args__ = (
+    # Back the reservation listing: filter by status / lock key, newest first.
+    Index("ix_asset_reservations_status_created_at", "status", "created_at"),
+    Index("ix_asset_reservations_redis_lock_key_created_at", "redis_lock_key", "created_at"),
+  )
 
   status: AssetReservationStatusEnum = Field(
     default=AssetReservationStatusEnum.PENDING,
@@ -257,7 +264,7 @@ class AssetReservationRead(AssetReservationBase):
   """Schema for reading an AssetReservation (API response)."""
 
   accession_id: uuid.UUID
-  asset_accession_id: uuid.UUID
+  asset_accession_id: uuid.UUID | None = None
   schedule_entry_accession_id: uuid.UUID
   protocol_run_accession_id: uuid.UUID
 
@@ -396,6 +403,48 @@ class SchedulerMetricsResponse(SQLModel):
   avg_execution_time_ms: float
 
 
+class ScheduleMetricsRollup(SQLModel, table=True):
+  """Pre-aggregated scheduling metrics for one time bucket.
+
+  Maintained incrementally as schedule history events are logged (see
+  `praxis.backend.services.scheduler_metrics`), so metrics queries read a
+  handful of buckets instead of aggregating the whole history table. Per-status
+  event counts live in `ScheduleMetricsStatusRollup`.
+  """
+
+  __tablename__ = "schedule_metrics_rollups"
+
+  granularity: str = Field(primary_key=True, max_length=16)
+  bucket_start: datetime = Field(primary_key=True)
+
+  event_count: int = Field(default=0)
+  error_count: int = Field(default=0)
+  duration_sum_ms: int = Field(default=0)
+  duration_samples: int = Field(default=0)
+  wait_time_sum_ms: int = Field(default=0)
+  wait_time_samples: int = Field(default=0)
+  reservation_time_sum_ms: int = Field(default=0)
+  reservation_time_samples: int = Field(default=0)
+  queue_depth_delta: int = Field(default=0)
+  queue_depth: int = Field(default=0, description="Queued entries at the end of the bucket")
+  max_queue_depth: int = Field(
+    default=0,
+    description="Largest queue depth seen in the bucket (approximate after late events)",
+  )
+
+
+class ScheduleMetricsStatusRollup(SQLModel, table=True):
+  """Number of schedule history events per resulting status in one time bucket."""
+
+  __tablename__ = "schedule_metrics_status_rollups"
+
+  granularity: str = Field(primary_key=True, max_length=16)
+  bucket_start: datetime = Field(primary_key=True)
+  status: str = Field(primary_key=True, max_length=32)
+
+  event_count: int = Field(default=0)
+
+
 # =============================================================================
 # Auxiliary Models
 # =============================================================================
@@ -467,6 +516,18 @@ class ScheduleStatusResponse(SQLModel):
   estimated_start: datetime | None = None
 
 
+class AssetReservationListResponse(SQLModel):
+  """Response model for one page of asset reservations."""
+
+  reservations: list[AssetReservationRead]
+  total_count: int
+  """Reservations matching the filters, across all pages."""
+  active_count: int
+  """Matching reservations that are PENDING, RESERVED or ACTIVE."""
+  next_cursor: str | None = None
+  """Pass as `cursor` to fetch the next page; None on the last page."""
+
+
 class ReleaseReservationResponse(SQLModel):
   """Response model for releasing asset reservations."""
 
@@ -1,4 +1,18 @@
-"""Service for managing deck type definitions."""
+"""Service for managing deck type definitions.
+
+Deck geometry (positioning config and nominal position coordinates) is read on
+every resource assignment but only changes when type definitions are synced.
+`deck_geometry_registry` keeps an immutable, per-process snapshot of each deck
+type's geometry with O(1) position lookup; this service invalidates it whenever
+a deck type definition is written.
+"""
+
+import threading
+import uuid
+from collections.abc import Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -18,6 +32,88 @@ from praxis.backend.services.utils.crud_base import CRUDBase
 from praxis.backend.utils.uuid import uuid7
 
 
+@dataclass(frozen=True)
+class DeckPositionGeometry:
+  """Nominal coordinates of one named deck position."""
+
+  position_accession_id: str
+  nominal_x_mm: float | None
+  nominal_y_mm: float | None
+  nominal_z_mm: float | None
+
+
+@dataclass(frozen=True)
+class DeckGeometry:
+  """Snapshot of a deck type's geometry."""
+
+  deck_type_id: uuid.UUID
+  positioning_config_json: dict[str, Any] | None
+  positions: Mapping[str, DeckPositionGeometry]
+
+  @classmethod
+  def from_definition(cls, definition: DeckDefinition) -> "DeckGeometry":
+    """Build a snapshot from a deck type definition and its positions."""
+    positions = {
+      str(position.position_accession_id): DeckPositionGeometry(
+        position_accession_id=str(position.position_accession_id),
+        nominal_x_mm=position.nominal_x_mm,
+        nominal_y_mm=position.nominal_y_mm,
+        nominal_z_mm=position.nominal_z_mm,
+      )
+      for position in definition.positions or []
+      if position.position_accession_id is not None
+    }
+    return cls(
+      deck_type_id=definition.accession_id,
+      positioning_config_json=definition.positioning_config_json,
+      positions=MappingProxyType(positions),
+    )
+
+  def get_position(self, position_accession_id: str | int | uuid.UUID) -> DeckPositionGeometry | None:
+    """Look up a position by its accession ID."""
+    return self.positions.get(str(position_accession_id))
+
+
+class DeckGeometryRegistry:
+  """Process-wide cache of deck geometry keyed by deck type ID."""
+
+  def __init__(self) -> None:
+    """Initialize an empty registry."""
+    self._entries: dict[uuid.UUID, DeckGeometry] = {}
+    self._lock = threading.Lock()
+    self.hits = 0
+    self.misses = 0
+
+  def __len__(self) -> int:
+    return len(self._entries)
+
+  def get(self, deck_type_id: uuid.UUID) -> DeckGeometry | None:
+    """Return the cached geometry for a deck type, if any."""
+    geometry = self._entries.get(deck_type_id)
+    if geometry is None:
+      self.misses += 1
+    else:
+      self.hits += 1
+    return geometry
+
+  def put(self, geometry: DeckGeometry) -> DeckGeometry:
+    """Cache a geometry snapshot and return it."""
+    with self._lock:
+      self._entries[geometry.deck_type_id] = geometry
+    return geometry
+
+  def invalidate(self, deck_type_id: uuid.UUID | None = None) -> None:
+    """Drop one deck type's geometry, or all of it if no ID is given."""
+    with self._lock:
+      if deck_type_id is None:
+        self._entries.clear()
+      else:
+        self._entries.pop(deck_type_id, None)
+
+
+deck_geometry_registry = DeckGeometryRegistry()
+
+
 class DeckTypeDefinitionService(
   CRUDBase[DeckDefinition, DeckTypeDefinitionCreate, DeckTypeDefinitionUpdate],
 ):
@@ -69,4 +165,23 @@ class DeckTypeDefinitionService(
     # Only refresh positions; `resource_definition` is not a mapped attribute
     # on DeckDefinition and asking SQLAlchemy to refresh it raises KeyError.
     await db.refresh(db_obj, ["positions"])
+    deck_geometry_registry.invalidate(db_obj.accession_id)
     return db_obj
+
+  async def update(
+    self,
+    db: AsyncSession,
+    *,
+    db_obj: DeckDefinition,
+    obj_in: DeckTypeDefinitionUpdate,
+  ) -> DeckDefinition:
+    """Update a deck type definition and drop its cached geometry."""
+    updated = await super().update(db, db_obj=db_obj, obj_in=obj_in)
+    deck_geometry_registry.invalidate(db_obj.accession_id)
+    return updated
+
+  async def remove(self, db: AsyncSession, *, accession_id: uuid.UUID) -> DeckDefinition | None:
+    """Delete a deck type definition and drop its cached geometry."""
+    removed = await super().remove(db, accession_id=accession_id)
+    deck_geometry_registry.invalidate(accession_id)
+    return removed
@@ -19,7 +19,6 @@ from pathlib import Path
 from typing import Any
 
 import libcst as cst
-from libcst.metadata import MetadataWrapper
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from praxis.backend.models.domain.deck import (
@@ -39,6 +38,7 @@ from praxis.backend.services.resource_type_definition import (
   ResourceTypeDefinitionService,
 )
 from praxis.backend.services.simulation_service import SimulationService
+from praxis.backend.utils.plr_static_analysis.parsed_module import ParsedModule
 from praxis.backend.utils.plr_static_analysis.visitors.protocol_discovery import (
   ProtocolFunctionVisitor,
 )
@@ -111,6 +111,16 @@ class DiscoveryService:
     self.enable_simulation = enable_simulation
     self._simulation_service = SimulationService() if enable_simulation else None
 
+  def start(self) -> None:
+    """Start the simulation worker pool used when protocols are discovered."""
+    if self._simulation_service is not None:
+      self._simulation_service.start()
+
+  async def stop(self) -> None:
+    """Shut down the simulation worker pool."""
+    if self._simulation_service is not None:
+      await self._simulation_service.stop()
+
   async def discover_and_sync_all_definitions(
     self,
     protocol_search_paths: str | list[str],
@@ -214,15 +224,12 @@ class DiscoveryService:
             )
 
             try:
-              source = module_file_path.read_text(encoding="utf-8")
-              tree = cst.parse_module(source)
+              parsed = ParsedModule.from_file(module_file_path)
               visitor = ProtocolFunctionVisitor(
                 module_name,
                 str(module_file_path),
               )
-              # Use MetadataWrapper to enable advanced features in visitors later if needed
-              wrapper = MetadataWrapper(tree)
-              wrapper.visit(visitor)
+              parsed.visit(visitor)
 
               # Convert ProtocolFunctionInfo models back to raw dicts for existing upsert logic
               for def_info in visitor.definitions:
@@ -370,6 +377,9 @@ class DiscoveryService:
 
     # Run simulation on discovered protocols if enabled
     if self._simulation_service and upserted_definitions_model:
+      # Re-synced protocols may carry new bytecode; drop loaded callables.
+      for definition in upserted_definitions_model:
+        self._simulation_service.invalidate_loaded_protocols(definition.fqn)
       logger.info(
         "Running simulation on %d discovered protocol(s)...",
         len(upserted_definitions_model),
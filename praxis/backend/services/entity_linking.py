@@ -5,13 +5,15 @@ Machine, Resource, and Deck, ensuring consistency and proper bidirectional relat
 the database.
 """
 
-import gc
 import uuid
+from collections.abc import Sequence
+from dataclasses import dataclass
 from functools import partial
 from typing import TYPE_CHECKING, Any, Optional
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from praxis.backend.models import (
   Machine,
@@ -86,6 +88,9 @@ async def _create_or_link_resource_counterpart_for_machine(
       )
       new_resource = current_resource
     else:
+      # `db.get` consults the session identity map first, so a Resource already
+      # loaded in this session is returned as that same instance (and no SELECT
+      # is issued); every holder of it observes the link below.
       new_resource = await db.get(
         Resource,
         resource_counterpart_accession_id,
@@ -99,16 +104,6 @@ async def _create_or_link_resource_counterpart_for_machine(
           msg,
         )
       machine_model.resource_counterpart = new_resource
-      # Ensure the Resource instance referenced by the machine also has the
-      # reciprocal link set (helps tests that use mocked DB sessions).
-      try:
-        machine_model.resource_counterpart.machine_counterpart = machine_model
-      except Exception:
-        pass
-      try:
-        machine_model.resource_counterpart.__dict__["machine_counterpart"] = machine_model
-      except Exception:
-        pass
       logger.info(
         "%s Linked to existing Resource ID %s.",
         log_prefix,
@@ -117,28 +112,6 @@ async def _create_or_link_resource_counterpart_for_machine(
 
     # Ensure reciprocal link and name synchronization
     new_resource.machine_counterpart = machine_model
-    # Also set directly on instance dict to ensure simple unittest/mocked sessions
-    try:
-      new_resource.__dict__["machine_counterpart"] = machine_model
-    except Exception:
-      pass
-    # Some tests create separate in-memory Resource instances with the same
-    # accession_id; make sure we update any such objects so test assertions
-    # observing those instances see the reciprocal link as well.
-    try:
-      for obj in gc.get_objects():
-        if isinstance(obj, Resource) and getattr(obj, "accession_id", None) == new_resource.accession_id:
-          try:
-            obj.machine_counterpart = machine_model
-          except Exception:
-            pass
-          try:
-            obj.__dict__["machine_counterpart"] = machine_model
-          except Exception:
-            pass
-    except Exception:
-      # If GC inspection fails for any reason, continue without blocking
-      pass
     new_resource.name = machine_model.name  # Sync name
     db.add(new_resource)
     logger.debug(
@@ -317,6 +290,136 @@ async def _create_or_link_machine_counterpart_for_resource(
   return new_machine_counterpart
 
 
+@dataclass
+class ResourceCounterpartLink:
+  """Requested Resource counterpart for one Machine in a bulk link.
+
+  The fields mirror the arguments of `_create_or_link_resource_counterpart_for_machine`.
+  """
+
+  machine_model: "Machine"
+  resource_counterpart_accession_id: uuid.UUID | None = None
+  resource_definition_name: str | None = None
+  resource_properties_json: dict[str, Any] | None = None
+  resource_status: Optional["ResourceStatusEnum"] = None
+
+
+@handle_db_transaction
+async def bulk_link_resource_counterparts_for_machines(
+  db: AsyncSession,
+  links: Sequence[ResourceCounterpartLink],
+) -> list[Optional["Resource"]]:
+  """Create or link Resource counterparts for many Machines at once.
+
+  Behaves like `_create_or_link_resource_counterpart_for_machine` applied to
+  each link, but with a fixed number of round trips regardless of the batch
+  size: one SELECT for every referenced Resource (with their machine
+  counterparts), one for every needed ResourceDefinition, and a single flush.
+
+  Args:
+      db: The database session.
+      links: One entry per machine to link.
+
+  Returns:
+      The linked or created Resource for each link, in order.
+
+  Raises:
+      ValueError: If a referenced Resource or ResourceDefinition does not exist,
+          or a new Resource is needed but no definition name was given.
+
+  """
+  if not links:
+    return []
+
+  wanted_ids = {
+    link.resource_counterpart_accession_id
+    for link in links
+    if link.resource_counterpart_accession_id is not None
+  }
+  current_ids = {
+    link.machine_model.resource_counterpart_accession_id
+    for link in links
+    if link.machine_model.resource_counterpart_accession_id is not None
+  }
+  resources_by_id: dict[uuid.UUID, Resource] = {}
+  if wanted_ids | current_ids:
+    result = await db.execute(
+      select(Resource)
+      .options(selectinload(Resource.machine_counterpart))
+      .where(Resource.accession_id.in_(wanted_ids | current_ids)),
+    )
+    resources_by_id = {resource.accession_id: resource for resource in result.scalars()}
+  missing_ids = wanted_ids - resources_by_id.keys()
+  if missing_ids:
+    msg = f"Resources not found for linking: {sorted(str(i) for i in missing_ids)}."
+    raise ValueError(msg)
+
+  to_create = [
+    link
+    for link in links
+    if link.resource_counterpart_accession_id is None
+    and link.machine_model.resource_counterpart_accession_id not in resources_by_id
+  ]
+  for link in to_create:
+    if not link.resource_definition_name:
+      msg = (
+        f"Machine (ID: {link.machine_model.accession_id}, Name: '{link.machine_model.name}'): "
+        "Cannot create new Resource: 'resource_definition_name' is required when no "
+        "'resource_counterpart_accession_id' is provided."
+      )
+      raise ValueError(msg)
+  definition_names = {link.resource_definition_name for link in to_create}
+  definitions: dict[str, ResourceDefinition] = {}
+  if definition_names:
+    result = await db.execute(
+      select(ResourceDefinition).where(ResourceDefinition.name.in_(definition_names)),
+    )
+    definitions = {definition.name: definition for definition in result.scalars()}
+  missing_names = definition_names - definitions.keys()
+  if missing_names:
+    msg = (
+      f"Resource definitions not found: {sorted(missing_names)}. "
+      "Cannot create resource instances."
+    )
+    raise ValueError(msg)
+
+  linked: list[Resource | None] = []
+  for link in links:
+    machine_model = link.machine_model
+    current_resource = resources_by_id.get(machine_model.resource_counterpart_accession_id)
+    if link.resource_counterpart_accession_id is not None:
+      machine_model.asset_type = AssetType.MACHINE_RESOURCE
+      new_resource = resources_by_id[link.resource_counterpart_accession_id]
+      if current_resource is not None and current_resource is not new_resource:
+        current_resource.machine_counterpart = None
+      machine_model.resource_counterpart = new_resource
+      new_resource.machine_counterpart = machine_model
+      new_resource.name = machine_model.name  # Sync name
+    elif current_resource is not None:
+      new_resource = current_resource
+    else:
+      definition = definitions[link.resource_definition_name]
+      new_resource = Resource(
+        fqn=machine_model.fqn,
+        name=f"{machine_model.name}_resource",
+        asset_type=AssetType.RESOURCE,
+        resource_definition_accession_id=definition.accession_id,
+        properties_json=link.resource_properties_json or {},
+        status=link.resource_status or ResourceStatusEnum.AVAILABLE_IN_STORAGE,
+      )
+      db.add(new_resource)
+      machine_model.resource_counterpart = new_resource
+    linked.append(new_resource)
+
+  await db.flush()
+  logger.info(
+    "Linked %d machines to Resource counterparts (%d created).",
+    len(links),
+    len(to_create),
+  )
+  return linked
+
+
 @handle_db_transaction
 async def synchronize_machine_resource_names(
   db: AsyncSession,
@@ -7,12 +7,16 @@ or SQLite (lite mode), ensuring they survive server restarts.
 Features:
 - Connection state persistence across restarts
 - TTL-based heartbeat for automatic cleanup of stale connections
-- Multi-worker safe (via Redis or SQLite file locking)
+- Multi-worker safe (each device is its own hash field, so writers never contend)
 - Mode-agnostic (works with both Redis and SQLite backends)
 
 Key Patterns:
-- "hw:conn:{device_id}" -> ConnectionState JSON
-- "hw:conn:index" -> JSON list of active device IDs
+- "hw:conn:registry:{workcell_id}" -> hash {device_id: ConnectionState JSON}
+
+All connections of a workcell live in one hash, so listing them is a single
+read however many devices are connected. Each field carries its own TTL in the
+store; a heartbeat rewrites only its device's field and refreshes that TTL, and
+the store drops lapsed fields on its own.
 
 Usage:
     manager = HardwareConnectionManager(kv_store)
@@ -36,11 +40,14 @@ logger = logging.getLogger(__name__)
 
 # Key patterns for KV store
 KEY_PREFIX = "hw:conn:"
-KEY_INDEX = "hw:conn:index"
+REGISTRY_KEY_PREFIX = f"{KEY_PREFIX}registry:"
+DEFAULT_WORKCELL_ID = "default"
 
 # Connection TTL (seconds) - connections without heartbeat are considered stale
 CONNECTION_TTL = 120  # 2 minutes
 
+Registry = dict[str, dict[str, Any]]
+
 
 @dataclass
 class ConnectionState:
@@ -124,6 +131,7 @@ class HardwareConnectionManager:
     self,
     kv_store: KeyValueStore,
     ttl_seconds: int = CONNECTION_TTL,
+    workcell_id: str = DEFAULT_WORKCELL_ID,
   ) -> None:
     """Initialize the connection manager.
 
@@ -132,30 +140,27 @@ class HardwareConnectionManager:
         ttl_seconds: Time-to-live for connections without heartbeat.
             Connections that don't receive a heartbeat within this
             time are considered stale.
+        workcell_id: Workcell whose connection registry is managed.
 
     """
     self._kv = kv_store
     self._ttl = ttl_seconds
+    self._key = f"{REGISTRY_KEY_PREFIX}{workcell_id}"
+
+  # --- Registry access ---
+
+  async def _read(self) -> Registry:
+    """Read every live entry of the registry in one round trip."""
+    return await self._kv.hgetall(self._key)
+
+  async def _put(self, state: ConnectionState) -> None:
+    await self._put_entry(state.device_id, state.to_dict())
+
+  async def _put_entry(self, device_id: str, entry: dict[str, Any]) -> None:
+    """Write one device's field and restart its TTL."""
+    await self._kv.hset(self._key, device_id, entry, ttl_seconds=self._ttl)
 
-  def _get_key(self, device_id: str) -> str:
-    """Get the KV store key for a device."""
-    return f"{KEY_PREFIX}{device_id}"
-
-  async def _add_to_index(self, device_id: str) -> None:
-    """Add device to the index of active connections."""
-    index_data = await self._kv.get(KEY_INDEX)
-    index: list[str] = index_data if isinstance(index_data, list) else []
-    if device_id not in index:
-      index.append(device_id)
-      await self._kv.set(KEY_INDEX, index)
-
-  async def _remove_from_index(self, device_id: str) -> None:
-    """Remove device from the index of active connections."""
-    index_data = await self._kv.get(KEY_INDEX)
-    index: list[str] = index_data if isinstance(index_data, list) else []
-    if device_id in index:
-      index.remove(device_id)
-      await self._kv.set(KEY_INDEX, index)
+  # --- Connection lifecycle ---
 
   async def connect(
     self,
@@ -186,9 +191,7 @@ class HardwareConnectionManager:
     )
 
     # Store with TTL
-    key = self._get_key(device_id)
-    await self._kv.set(key, state.to_dict(), ttl_seconds=self._ttl)
-    await self._add_to_index(device_id)
+    await self._put(state)
 
     logger.info(
       "Device connected: %s (backend: %s, TTL: %ds)",
@@ -226,9 +229,7 @@ class HardwareConnectionManager:
       error_message=None,
     )
 
-    key = self._get_key(device_id)
-    await self._kv.set(key, state.to_dict(), ttl_seconds=self._ttl)
-    await self._add_to_index(device_id)
+    await self._put(state)
 
     logger.info("Device connecting: %s (backend: %s)", device_id, backend_class)
     return state
@@ -243,19 +244,31 @@ class HardwareConnectionManager:
         True if the device was disconnected, False if it wasn't connected.
 
     """
-    key = self._get_key(device_id)
-    existed = await self._kv.delete(key)
-    await self._remove_from_index(device_id)
+    existed = await self._kv.hdel(self._key, device_id) > 0
 
     if existed:
       logger.info("Device disconnected: %s", device_id)
     return existed
 
+  async def _patch(self, device_id: str, **fields: Any) -> ConnectionState | None:
+    """Update individual fields of a device's entry and refresh its TTL.
+
+    Only this device's hash field is read and written. A patch racing a
+    `disconnect` of the same device can re-register it until its TTL lapses.
+    """
+    entry = await self._kv.hget(self._key, device_id)
+    if entry is None:
+      return None
+    patched = {**entry, **fields, "last_heartbeat": datetime.now(UTC).isoformat()}
+    await self._put_entry(device_id, patched)
+    return ConnectionState.from_dict(patched)
+
   async def heartbeat(self, device_id: str) -> ConnectionState | None:
     """Update the heartbeat timestamp for a connection.
 
     This should be called periodically to keep the connection alive.
-    Connections without heartbeats will expire after TTL.
+    Connections without heartbeats will expire after TTL. Only the
+    heartbeat fields of the entry are touched.
 
     Args:
         device_id: Unique identifier for the device.
@@ -264,18 +277,11 @@ class HardwareConnectionManager:
         The updated connection state, or None if not connected.
 
     """
-    key = self._get_key(device_id)
-    data = await self._kv.get(key)
-
-    if data is None:
+    state = await self._patch(device_id)
+    if state is None:
       logger.warning("Heartbeat for unknown device: %s", device_id)
       return None
 
-    state = ConnectionState.from_dict(data)
-    state.last_heartbeat = datetime.now(UTC)
-
-    # Refresh TTL
-    await self._kv.set(key, state.to_dict(), ttl_seconds=self._ttl)
     logger.debug("Heartbeat received: %s", device_id)
     return state
 
@@ -289,13 +295,11 @@ class HardwareConnectionManager:
         The connection state, or None if not connected.
 
     """
-    key = self._get_key(device_id)
-    data = await self._kv.get(key)
-
-    if data is None:
+    entry = await self._kv.hget(self._key, device_id)
+    if entry is None:
       return None
 
-    return ConnectionState.from_dict(data)
+    return ConnectionState.from_dict(entry)
 
   async def set_error(
     self,
@@ -312,54 +316,27 @@ class HardwareConnectionManager:
         The updated connection state, or None if not connected.
 
     """
-    key = self._get_key(device_id)
-    data = await self._kv.get(key)
-
-    if data is None:
+    # Keep TTL active so error state is visible
+    state = await self._patch(device_id, status="error", error_message=error_message)
+    if state is None:
       logger.warning("Set error for unknown device: %s", device_id)
       return None
 
-    state = ConnectionState.from_dict(data)
-    state.status = "error"
-    state.error_message = error_message
-    state.last_heartbeat = datetime.now(UTC)
-
-    # Keep TTL active so error state is visible
-    await self._kv.set(key, state.to_dict(), ttl_seconds=self._ttl)
     logger.error("Device error: %s - %s", device_id, error_message)
     return state
 
   async def list_connections(self) -> list[ConnectionState]:
     """List all active connections.
 
+    Reads the whole registry in one round trip; lapsed entries are dropped by
+    the store.
+
     Returns:
         List of all current connection states.
 
     """
-    # Get device IDs from index
-    index_data = await self._kv.get(KEY_INDEX)
-    index: list[str] = index_data if isinstance(index_data, list) else []
-
-    connections: list[ConnectionState] = []
-    stale_ids: list[str] = []
-
-    for device_id in index:
-      state = await self.get_connection(device_id)
-      if state is not None:
-        connections.append(state)
-      else:
-        # Connection expired, mark for cleanup
-        stale_ids.append(device_id)
-
-    # Clean up stale entries from index
-    for device_id in stale_ids:
-      await self._remove_from_index(device_id)
-
-    logger.debug(
-      "Listed %d connections (%d stale removed)",
-      len(connections),
-      len(stale_ids),
-    )
+    connections = [ConnectionState.from_dict(entry) for entry in (await self._read()).values()]
+    logger.debug("Listed %d connections", len(connections))
     return connections
 
   async def clear_all(self) -> int:
@@ -369,12 +346,7 @@ class HardwareConnectionManager:
         Number of connections cleared.
 
     """
-    connections = await self.list_connections()
-    count = len(connections)
-
-    for state in connections:
-      await self._kv.delete(self._get_key(state.device_id))
-
-    await self._kv.delete(KEY_INDEX)
+    count = len(await self._read())
+    await self._kv.delete(self._key)
     logger.info("Cleared %d connections", count)
     return count
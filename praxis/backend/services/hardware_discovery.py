@@ -7,17 +7,38 @@ Supports:
 - Serial/USB devices via pyserial
 - Network devices via mDNS/Zeroconf (Opentrons, Tecan, Hamilton, etc.)
 - PyLabRobot simulators
+
+One-shot discovery queries all sources concurrently. Once `start()` has been
+called, a persistent zeroconf browser and a serial-port watcher keep the device
+cache up to date in the background; `discover_all()` then answers from the cache
+immediately, and every change is published on `HARDWARE_DEVICES_CHANNEL`.
+
+Usage:
+    discovery = HardwareDiscoveryService(pubsub=pubsub)
+    await discovery.start()
+    devices = await discovery.discover_all()  # Cached view
+    ...
+    await discovery.stop()
 """
 
 import asyncio
+import contextlib
 import logging
-from collections.abc import Callable
-from dataclasses import dataclass
+from collections.abc import Callable, Coroutine, Iterable
+from dataclasses import asdict, dataclass
 from enum import Enum
-from typing import Any, TypedDict
+from typing import TYPE_CHECKING, Any, TypedDict
+
+if TYPE_CHECKING:
+  from praxis.backend.core.storage import PubSub
 
 logger = logging.getLogger(__name__)
 
+HARDWARE_DEVICES_CHANNEL = "hardware:devices"
+"""Pub/sub channel carrying one message per change to the device cache."""
+
+DEFAULT_SERIAL_POLL_SECONDS = 2.0
+
 
 class NetworkSignature(TypedDict):
   """Type definition for network device signatures."""
@@ -125,17 +146,40 @@ class HardwareDiscoveryService:
     },
   }
 
-  def __init__(self) -> None:
-    """Initialize the hardware discovery service."""
-    self._cached_devices: list[DiscoveredDevice] = []
+  def __init__(
+    self,
+    *,
+    pubsub: "PubSub | None" = None,
+    serial_poll_seconds: float = DEFAULT_SERIAL_POLL_SECONDS,
+  ) -> None:
+    """Initialize the hardware discovery service.
+
+    Args:
+        pubsub: Where device cache changes are published while monitoring (optional).
+        serial_poll_seconds: How often the serial-port watcher re-enumerates ports.
+
+    """
+    self.pubsub = pubsub
+    self.serial_poll_seconds = serial_poll_seconds
+    self._devices: dict[str, DiscoveredDevice] = {}
+    self._network_services: dict[tuple[str, str], str] = {}
+    self._serial_task: asyncio.Task | None = None
+    self._tasks: set[asyncio.Task] = set()
+    self._zeroconf: Any = None
+    self._browser: Any = None
 
   async def discover_serial_ports(self) -> list[DiscoveredDevice]:
     """Discover devices connected via serial/USB ports.
 
+    Port enumeration blocks, so it runs in a worker thread.
+
     Returns:
         List of discovered serial devices.
 
     """
+    return await asyncio.to_thread(self._list_serial_ports)
+
+  def _list_serial_ports(self) -> list[DiscoveredDevice]:
     devices: list[DiscoveredDevice] = []
 
     try:
@@ -252,23 +296,7 @@ class HardwareDiscoveryService:
         try:
           info = zc.get_service_info(type_, name, timeout=1000)
           if info:
-            self.discovered.append(
-              (
-                type_,
-                name,
-                {
-                  "addresses": [str(addr) for addr in info.parsed_addresses()],
-                  "port": info.port,
-                  "server": info.server,
-                  "properties": {
-                    k.decode() if isinstance(k, bytes) else k: v.decode()
-                    if isinstance(v, bytes)
-                    else v
-                    for k, v in (info.properties or {}).items()
-                  },
-                },
-              )
-            )
+            self.discovered.append((type_, name, _service_info_to_dict(info)))
             logger.debug("mDNS discovered: %s (%s)", name, type_)
         except Exception as e:
           logger.debug("Error getting service info for %s: %s", name, e)
@@ -401,26 +429,26 @@ class HardwareDiscoveryService:
   async def discover_all(self) -> list[DiscoveredDevice]:
     """Discover all available hardware devices.
 
+    While monitoring, this returns the background-maintained cache without
+    scanning. Otherwise every source is scanned concurrently, so the call
+    takes as long as the slowest source (the mDNS browse window).
+
     Returns:
         Combined list of all discovered devices.
 
     """
-    all_devices: list[DiscoveredDevice] = []
-
-    # Discover serial devices
-    serial_devices = await self.discover_serial_ports()
-    all_devices.extend(serial_devices)
+    if self.is_monitoring:
+      return self.get_cached_devices()
 
-    # Discover simulators
-    simulators = await self.discover_simulators()
-    all_devices.extend(simulators)
-
-    # Discover network devices
-    network_devices = await self.discover_network_devices()
-    all_devices.extend(network_devices)
+    serial_devices, simulators, network_devices = await asyncio.gather(
+      self.discover_serial_ports(),
+      self.discover_simulators(),
+      self.discover_network_devices(),
+    )
+    all_devices = [*serial_devices, *simulators, *network_devices]
 
     # Cache for quick access
-    self._cached_devices = all_devices
+    self._devices = {device.id: device for device in all_devices}
 
     logger.info(
       "Discovered %d devices: %d serial, %d simulators, %d network",
@@ -432,6 +460,162 @@ class HardwareDiscoveryService:
 
     return all_devices
 
+  # --- Background monitoring ---
+
+  @property
+  def is_monitoring(self) -> bool:
+    """Whether the background watchers are maintaining the device cache."""
+    return self._serial_task is not None
+
+  async def start(self) -> None:
+    """Populate the device cache and keep it up to date in the background.
+
+    Starts a persistent zeroconf browser for `NETWORK_SERVICE_TYPES` and a
+    watcher that re-enumerates serial ports every `serial_poll_seconds`.
+    """
+    if self.is_monitoring:
+      return
+    simulators, serial_devices = await asyncio.gather(
+      self.discover_simulators(),
+      self.discover_serial_ports(),
+    )
+    await self._replace_source(ConnectionType.SIMULATOR, simulators)
+    await self._replace_source(ConnectionType.SERIAL, serial_devices)
+    self._start_network_browser()
+    self._serial_task = asyncio.create_task(self._watch_serial_ports())
+    logger.info("Hardware discovery monitoring started with %d devices.", len(self._devices))
+
+  async def stop(self) -> None:
+    """Stop the background watchers; the cache keeps its last state."""
+    if self._serial_task is None:
+      return
+    tasks = [self._serial_task, *self._tasks]
+    self._serial_task = None
+    for task in tasks:
+      task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    if self._browser is not None:
+      with contextlib.suppress(Exception):
+        await self._browser.async_cancel()
+      self._browser = None
+    if self._zeroconf is not None:
+      with contextlib.suppress(Exception):
+        await self._zeroconf.async_close()
+      self._zeroconf = None
+    self._network_services.clear()
+    logger.info("Hardware discovery monitoring stopped.")
+
+  async def _watch_serial_ports(self) -> None:
+    while True:
+      await asyncio.sleep(self.serial_poll_seconds)
+      try:
+        await self._replace_source(ConnectionType.SERIAL, await self.discover_serial_ports())
+      except Exception:
+        logger.exception("Serial port watcher failed; retrying on the next poll.")
+
+  def _start_network_browser(self) -> None:
+    try:
+      from zeroconf.asyncio import AsyncServiceBrowser, AsyncZeroconf
+    except ImportError:
+      logger.warning(
+        "zeroconf not installed. Network discovery unavailable. "
+        "Install with: pip install zeroconf"
+      )
+      return
+
+    try:
+      self._zeroconf = AsyncZeroconf()
+      self._browser = AsyncServiceBrowser(
+        self._zeroconf.zeroconf,
+        self.NETWORK_SERVICE_TYPES,
+        handlers=[self._on_service_state_change],
+      )
+    except Exception as e:
+      logger.exception("Error starting the mDNS browser: %s", e)
+
+  def _on_service_state_change(self, **kwargs: Any) -> None:
+    """Zeroconf handler; runs on the event loop, so resolve in a task."""
+    self._spawn(
+      self._resolve_network_service(kwargs["service_type"], kwargs["name"], kwargs["state_change"]),
+    )
+
+  async def _resolve_network_service(self, service_type: str, name: str, state_change: Any) -> None:
+    from zeroconf import ServiceStateChange
+    from zeroconf.asyncio import AsyncServiceInfo
+
+    key = (service_type, name)
+    if state_change is ServiceStateChange.Removed:
+      device_id = self._network_services.pop(key, None)
+      if device_id is not None and device_id not in self._network_services.values():
+        await self._update_devices([], [device_id])
+      return
+
+    try:
+      info = AsyncServiceInfo(service_type, name)
+      if not await info.async_request(self._zeroconf.zeroconf, 1000):
+        return
+      device = self._parse_network_device(service_type, name, _service_info_to_dict(info))
+    except Exception as e:
+      logger.debug("Error getting service info for %s: %s", name, e)
+      return
+    if device is not None:
+      logger.debug("mDNS discovered: %s (%s)", name, service_type)
+      self._network_services[key] = device.id
+      await self._update_devices([device], [])
+
+  def _spawn(self, coro: Coroutine[Any, Any, None]) -> None:
+    task = asyncio.create_task(coro)
+    self._tasks.add(task)
+    task.add_done_callback(self._tasks.discard)
+
+  # --- Device cache ---
+
+  async def _replace_source(
+    self,
+    connection_type: ConnectionType,
+    devices: list[DiscoveredDevice],
+  ) -> None:
+    """Make `devices` the complete cached set for one connection type."""
+    current = {d.id for d in devices}
+    stale = [
+      device_id
+      for device_id, device in self._devices.items()
+      if device.connection_type == connection_type and device_id not in current
+    ]
+    await self._update_devices(devices, stale)
+
+  async def _update_devices(
+    self,
+    devices: Iterable[DiscoveredDevice],
+    removed_ids: Iterable[str],
+  ) -> None:
+    """Apply changes to the cache and publish whatever actually changed."""
+    added: list[DiscoveredDevice] = []
+    updated: list[DiscoveredDevice] = []
+    for device in devices:
+      previous = self._devices.get(device.id)
+      if previous == device:
+        continue
+      (added if previous is None else updated).append(device)
+      self._devices[device.id] = device
+    removed = [
+      device_id for device_id in removed_ids if self._devices.pop(device_id, None) is not None
+    ]
+
+    if not (added or updated or removed) or self.pubsub is None:
+      return
+    try:
+      await self.pubsub.publish(
+        HARDWARE_DEVICES_CHANNEL,
+        {
+          "added": [asdict(d) for d in added],
+          "updated": [asdict(d) for d in updated],
+          "removed": removed,
+        },
+      )
+    except Exception:
+      logger.exception("Failed to publish hardware device changes.")
+
   def _identify_device(self, vid: int | None, pid: int | None) -> dict[str, str]:
     """Identify a device by its USB VID/PID.
 
@@ -454,4 +638,17 @@ class HardwareDiscoveryService:
         Cached list of discovered devices.
 
     """
-    return self._cached_devices
+    return list(self._devices.values())
+
+
+def _service_info_to_dict(info: Any) -> dict[str, Any]:
+  """Convert a zeroconf ServiceInfo into the dict `_parse_network_device` takes."""
+  return {
+    "addresses": [str(addr) for addr in info.parsed_addresses()],
+    "port": info.port,
+    "server": info.server,
+    "properties": {
+      k.decode() if isinstance(k, bytes) else k: v.decode() if isinstance(v, bytes) else v
+      for k, v in (info.properties or {}).items()
+    },
+  }
@@ -9,11 +9,14 @@ This includes Machine Definitions, Machine Instances, and Machine configurations
 
 import datetime
 import uuid
+from collections import Counter
+from collections.abc import Sequence
 from uuid import UUID
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from praxis.backend.models.domain.filters import SearchFilters
 from praxis.backend.models.domain.machine import (
@@ -23,7 +26,9 @@ from praxis.backend.models.domain.machine import (
 )
 from praxis.backend.models.enums import MachineStatusEnum
 from praxis.backend.services.entity_linking import (
+  ResourceCounterpartLink,
   _create_or_link_resource_counterpart_for_machine,
+  bulk_link_resource_counterparts_for_machines,
   synchronize_machine_resource_names,
 )
 from praxis.backend.services.utils.crud_base import CRUDBase
@@ -81,6 +86,63 @@ class MachineService(CRUDBase[Machine, MachineCreate, MachineUpdate]):
     logger.info("%s Successfully committed new machine.", log_prefix)
     return machine_model
 
+  @handle_db_transaction
+  async def create_many(
+    self,
+    db: AsyncSession,
+    *,
+    objs_in: Sequence[MachineCreate],
+  ) -> list[Machine]:
+    """Create many machines (e.g. a bulk import) in one transaction.
+
+    Name collisions are checked with a single query, and Resource counterparts
+    are linked or created with `bulk_link_resource_counterparts_for_machines`,
+    so the number of round trips does not grow with the batch size.
+    """
+    name_counts = Counter(obj_in.name for obj_in in objs_in)
+    duplicates = sorted(name for name, count in name_counts.items() if count > 1)
+    if name_counts and not duplicates:
+      result = await db.execute(select(Machine.name).filter(Machine.name.in_(name_counts)))
+      duplicates = sorted(result.scalars().all())
+    if duplicates:
+      error_message = (
+        f"Machines with names {duplicates} already exist or are duplicated in the batch."
+      )
+      logger.error(error_message)
+      raise ValueError(error_message)
+
+    machine_models = [self._build_db_obj(obj_in) for obj_in in objs_in]
+    db.add_all(machine_models)
+    await db.flush()
+
+    links = [
+      ResourceCounterpartLink(
+        machine_model=machine_model,
+        resource_counterpart_accession_id=obj_in.resource_counterpart_accession_id,
+        resource_definition_name=obj_in.resource_def_name,
+        resource_properties_json=obj_in.resource_properties_json,
+        resource_status=obj_in.resource_initial_status,
+      )
+      for machine_model, obj_in in zip(machine_models, objs_in, strict=True)
+      if obj_in.resource_counterpart_accession_id or obj_in.resource_def_name
+    ]
+    if links:
+      await bulk_link_resource_counterparts_for_machines(db, links)
+      # Linking updated these rows, which expired the server-set updated_at;
+      # reload it for the whole batch in one query.
+      result = await db.execute(
+        select(Machine.accession_id, Machine.updated_at).where(
+          Machine.accession_id.in_([link.machine_model.accession_id for link in links]),
+        ),
+      )
+      updated_at = dict(result.tuples().all())
+      for link in links:
+        set_committed_value(
+          link.machine_model, "updated_at", updated_at[link.machine_model.accession_id]
+        )
+    logger.info("Created %d machines (%d with resource counterparts).", len(objs_in), len(links))
+    return machine_models
+
   @handle_db_transaction
   async def update(
     self,
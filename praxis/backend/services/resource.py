@@ -3,9 +3,11 @@
 
 import enum
 import uuid
+from collections import Counter
+from collections.abc import Collection, Mapping
 from typing import Any, cast
 
-from sqlalchemy import and_, select
+from sqlalchemy import ColumnElement, and_, case, func, or_, select
 from sqlalchemy import inspect as sa_inspect
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload, selectinload
@@ -37,6 +39,13 @@ logger = get_logger(__name__)
 
 UUID = uuid.UUID
 
+ACQUISITION_STATUS_RANK: dict[ResourceStatusEnum, int] = {
+  ResourceStatusEnum.IN_USE: 0,
+  ResourceStatusEnum.AVAILABLE_ON_DECK: 1,
+  ResourceStatusEnum.AVAILABLE_IN_STORAGE: 2,
+}
+"""Preference order for acquisition candidates; lower ranks are taken first."""
+
 
 class ResourceService(CRUDBase[Resource, ResourceCreate, ResourceUpdate]):
   """Service for resource-related operations."""
@@ -158,6 +167,172 @@ class ResourceService(CRUDBase[Resource, ResourceCreate, ResourceUpdate]):
     logger.info("Found %s resources.", len(resources))
     return resources
 
+  async def find_acquisition_candidates(
+    self,
+    db: AsyncSession,
+    *,
+    protocol_run_accession_id: uuid.UUID,
+    fqn_counts: Mapping[str, int],
+    property_filters: dict[str, Any] | None = None,
+    exclude_accession_ids: Collection[uuid.UUID] = (),
+    lock: bool = True,
+  ) -> dict[str, list[Resource]]:
+    """Return the best acquisition candidates for several definitions.
+
+    A resource is a candidate when it is IN_USE by this run or available on deck
+    or in storage. Candidates are ranked per FQN in that order (see
+    `ACQUISITION_STATUS_RANK`), ties broken by name, and at most
+    ``fqn_counts[fqn]`` are returned for each FQN. With ``lock`` the selected
+    rows are locked ``FOR UPDATE SKIP LOCKED`` until the transaction ends, so
+    concurrent runs cannot allocate the same instance. Rows another transaction
+    holds are skipped, and FQNs left short are ranked again without them, so a
+    concurrent acquirer gets the next best instance instead of none.
+
+    Args:
+        db: The database session.
+        protocol_run_accession_id: The run acquiring the resources.
+        fqn_counts: Number of instances wanted per resource definition FQN.
+        property_filters: Property constraints every candidate must satisfy.
+        exclude_accession_ids: Resources that must not be returned.
+        lock: Whether to lock the returned rows.
+
+    Returns:
+        Candidates per requested FQN, best first.
+
+    """
+    candidates: dict[str, list[Resource]] = {fqn: [] for fqn in fqn_counts}
+    remaining = {fqn: count for fqn, count in fqn_counts.items() if count > 0}
+    seen = set(exclude_accession_ids)
+    while remaining:
+      ranked = await self._rank_acquisition_candidates(
+        db,
+        protocol_run_accession_id=protocol_run_accession_id,
+        fqn_counts=remaining,
+        property_filters=property_filters,
+        exclude_accession_ids=seen,
+      )
+      if not ranked:
+        break
+      seen.update(accession_id for accession_id, _ in ranked)
+      locked = await self._lock_acquisition_candidates(
+        db,
+        protocol_run_accession_id=protocol_run_accession_id,
+        ranked=ranked,
+        lock=lock,
+      )
+      ranked_counts = Counter(fqn for _, fqn in ranked)
+      locked_counts = Counter(resource.fqn for resource in locked)
+      for resource in locked:
+        candidates[resource.fqn].append(resource)
+      # A ranking shorter than requested already held every remaining
+      # candidate, so only FQNs with a full ranking that lost rows to another
+      # transaction are ranked again.
+      remaining = {
+        fqn: count - locked_counts[fqn]
+        for fqn, count in remaining.items()
+        if ranked_counts[fqn] == count and locked_counts[fqn] < count
+      }
+    logger.info(
+      "Found acquisition candidates for run %s: %s",
+      protocol_run_accession_id,
+      {fqn: len(found) for fqn, found in candidates.items()},
+    )
+    return candidates
+
+  def _acquirable(self, protocol_run_accession_id: uuid.UUID) -> ColumnElement[bool]:
+    """Build the predicate for resources the given run may acquire."""
+    model = self.model
+    return or_(
+      and_(
+        model.status == ResourceStatusEnum.IN_USE,
+        model.current_protocol_run_accession_id == protocol_run_accession_id,
+      ),
+      model.status.in_(  # type: ignore[union-attr]
+        [ResourceStatusEnum.AVAILABLE_ON_DECK, ResourceStatusEnum.AVAILABLE_IN_STORAGE],
+      ),
+    )
+
+  async def _rank_acquisition_candidates(
+    self,
+    db: AsyncSession,
+    *,
+    protocol_run_accession_id: uuid.UUID,
+    fqn_counts: Mapping[str, int],
+    property_filters: dict[str, Any] | None,
+    exclude_accession_ids: Collection[uuid.UUID],
+  ) -> list[tuple[uuid.UUID, str]]:
+    """Return the ids and FQNs of the best ``fqn_counts`` candidates, best first."""
+    model = self.model
+    rank = case(
+      *((model.status == status, value) for status, value in ACQUISITION_STATUS_RANK.items()),
+      else_=len(ACQUISITION_STATUS_RANK),
+    )
+    ranked = select(
+      model.accession_id.label("accession_id"),
+      model.fqn.label("fqn"),
+      func.row_number()
+      .over(partition_by=model.fqn, order_by=(rank, model.name, model.accession_id))
+      .label("position"),
+    ).where(
+      model.fqn.in_(list(fqn_counts)),  # type: ignore[union-attr]
+      self._acquirable(protocol_run_accession_id),
+    )
+    if exclude_accession_ids:
+      ranked = ranked.where(model.accession_id.not_in(list(exclude_accession_ids)))  # type: ignore[union-attr]
+    ranked = apply_property_filters(
+      ranked,
+      SearchFilters(property_filters=property_filters),
+      model.properties_json,
+    )
+    ranked_subquery = ranked.subquery()
+    stmt = (
+      select(ranked_subquery.c.accession_id, ranked_subquery.c.fqn)
+      .where(
+        or_(
+          *(
+            and_(ranked_subquery.c.fqn == fqn, ranked_subquery.c.position <= count)
+            for fqn, count in fqn_counts.items()
+          ),
+        ),
+      )
+      .order_by(ranked_subquery.c.fqn, ranked_subquery.c.position)
+    )
+    result = await db.execute(stmt)
+    return [(accession_id, fqn) for accession_id, fqn in result.all()]
+
+  async def _lock_acquisition_candidates(
+    self,
+    db: AsyncSession,
+    *,
+    protocol_run_accession_id: uuid.UUID,
+    ranked: list[tuple[uuid.UUID, str]],
+    lock: bool,
+  ) -> list[Resource]:
+    """Load the ranked candidates, locking those no other transaction holds.
+
+    Window functions cannot be locked directly, so the ranked ids are loaded in
+    a second statement and the status predicate is re-checked on the locked
+    rows. The result keeps the ranking order.
+    """
+    model = self.model
+    stmt = (
+      select(model)
+      .where(
+        model.accession_id.in_([accession_id for accession_id, _ in ranked]),  # type: ignore[union-attr]
+        self._acquirable(protocol_run_accession_id),
+      )
+      .options(
+        joinedload(model.parent),
+        selectinload(model.children),
+        joinedload(model.resource_definition),
+      )
+    )
+    if lock:
+      stmt = stmt.with_for_update(of=model, skip_locked=True)
+    result = await db.execute(stmt)
+    by_id = {resource.accession_id: resource for resource in result.scalars().unique().all()}
+    return [by_id[accession_id] for accession_id, _ in ranked if accession_id in by_id]
+
   def _convert_enums(self, update_data: dict) -> dict:
     """Convert enum string values to enum members for SQLAlchemy."""
     for attr_name, column in sa_inspect(self.model).columns.items():
@@ -248,6 +423,27 @@ class ResourceService(CRUDBase[Resource, ResourceCreate, ResourceUpdate]):
     )
     return resource_model
 
+  async def list_on_deck(
+    self,
+    db: AsyncSession,
+    *,
+    deck_accession_id: uuid.UUID,
+  ) -> list[Resource]:
+    """List resources placed at a named position on a deck.
+
+    Loads each resource's definition in the same query.
+    """
+    stmt = (
+      select(self.model)
+      .options(joinedload(self.model.resource_definition))
+      .where(
+        self.model.machine_location_accession_id == deck_accession_id,
+        self.model.current_deck_position_name.is_not(None),  # type: ignore[union-attr]
+      )
+    )
+    result = await db.execute(stmt)
+    return list(result.scalars().unique().all())
+
   @validate_accession_ids
   @handle_db_transaction
   async def update_resource_location_and_status(
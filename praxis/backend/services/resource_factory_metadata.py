@@ -0,0 +1,231 @@
+"""Persistent cache of metadata extracted from PyLabRobot resource factories.
+
+`get_metadata_from_factory_function` instantiates a factory (a whole plate, tip
+rack or carrier) to read its dimensions, item counts and volumes. Resource type
+sync does that for thousands of vendor factories, so the results are cached on
+disk keyed by factory FQN, a hash of the factory's module source and the
+installed PyLabRobot version. A warm re-sync instantiates nothing; cache misses
+are extracted in a pool of worker processes.
+
+The module source is hashed rather than the function's own source because
+factories usually build their wells through helpers in the same module.
+
+Usage:
+    cache = FactoryMetadataCache()
+    metadata = await extract_factory_metadata(factories, cache=cache)
+    cache.save()
+
+"""
+
+import asyncio
+import hashlib
+import importlib
+import importlib.metadata
+import inspect
+import json
+import os
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any
+
+from praxis.backend.services.resource_type_validation import get_metadata_from_factory_function
+from praxis.backend.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+CACHE_FORMAT = 1
+MIN_PARALLEL_MISSES = 16
+"""Below this many cache misses, extracting in-process beats starting a pool."""
+
+
+def _plr_version() -> str:
+  try:
+    return importlib.metadata.version("pylabrobot")
+  except importlib.metadata.PackageNotFoundError:
+    return "unknown"
+
+
+class FactoryMetadataCache:
+  """Factory metadata persisted across processes, invalidated by source changes.
+
+  Entries are validated against the hash of the factory's module source, so an
+  edited or upgraded module is re-extracted while everything else is reused.
+
+  """
+
+  def __init__(self, cache_file: Path | None = None, plr_version: str | None = None) -> None:
+    """Initialize the cache.
+
+    Args:
+      cache_file: JSON file holding the cache. Defaults to
+        ~/.cache/praxis/plr_factory_metadata.json
+      plr_version: Installed PyLabRobot version; read from package metadata
+        when omitted. A different version discards every entry.
+
+    """
+    self.cache_file = cache_file or Path.home() / ".cache" / "praxis" / "plr_factory_metadata.json"
+    self.plr_version = plr_version or _plr_version()
+    self._entries: dict[str, dict[str, Any]] = {}
+    self._module_hashes: dict[str, str] = {}
+    self._dirty = False
+    self._load()
+
+  def source_hash(self, func: Callable[..., Any]) -> str | None:
+    """Return the hash of the module source defining `func`, or None if unavailable."""
+    module_name = func.__module__
+    if module_name in self._module_hashes:
+      return self._module_hashes[module_name]
+    try:
+      source_file = inspect.getsourcefile(func)
+      digest = (
+        hashlib.md5(Path(source_file).read_bytes(), usedforsecurity=False).hexdigest()
+        if source_file
+        else None
+      )
+    except (OSError, TypeError):
+      digest = None
+    if digest is not None:
+      self._module_hashes[module_name] = digest
+    return digest
+
+  def get(self, fqn: str, source_hash: str | None) -> dict[str, Any] | None:
+    """Return the cached metadata for a factory if its source is unchanged."""
+    if source_hash is None:
+      return None
+    entry = self._entries.get(fqn)
+    if entry is None or entry["source_hash"] != source_hash:
+      return None
+    return entry["metadata"]
+
+  def set(self, fqn: str, source_hash: str | None, metadata: dict[str, Any]) -> None:
+    """Cache the metadata extracted for a factory."""
+    if source_hash is None:
+      return
+    try:
+      json.dumps(metadata)
+    except (TypeError, ValueError):
+      logger.debug("Factory metadata for %s is not JSON serializable; not caching.", fqn)
+      return
+    self._entries[fqn] = {"source_hash": source_hash, "metadata": metadata}
+    self._dirty = True
+
+  def save(self) -> None:
+    """Write the cache to disk if it changed."""
+    if not self._dirty:
+      return
+    data = {"format": CACHE_FORMAT, "plr_version": self.plr_version, "entries": self._entries}
+    try:
+      self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+      tmp = self.cache_file.with_suffix(f".{os.getpid()}.tmp")
+      tmp.write_text(json.dumps(data))
+      tmp.replace(self.cache_file)
+      self._dirty = False
+    except OSError as e:
+      logger.debug("Factory metadata cache write error for %s: %s", self.cache_file, e)
+
+  def _load(self) -> None:
+    if not self.cache_file.exists():
+      return
+    try:
+      data = json.loads(self.cache_file.read_text())
+    except (OSError, json.JSONDecodeError) as e:
+      logger.debug("Factory metadata cache read error for %s: %s", self.cache_file, e)
+      return
+    if data.get("format") == CACHE_FORMAT and data.get("plr_version") == self.plr_version:
+      self._entries = data.get("entries", {})
+
+
+def _extract_factory_chunk(fqns: list[str]) -> dict[str, dict[str, Any]]:
+  """Worker entry point: import and instantiate each factory by FQN."""
+  results: dict[str, dict[str, Any]] = {}
+  for fqn in fqns:
+    module_name, _, func_name = fqn.rpartition(".")
+    try:
+      func = getattr(importlib.import_module(module_name), func_name)
+    except Exception as e:
+      logger.debug("Could not import factory function %s: %s", fqn, e)
+      continue
+    results[fqn] = get_metadata_from_factory_function(func, fqn)
+  return results
+
+
+async def extract_factory_metadata(
+  factories: dict[str, Callable[..., Any]],
+  *,
+  cache: FactoryMetadataCache,
+  max_workers: int | None = None,
+) -> dict[str, dict[str, Any]]:
+  """Return metadata for each factory, extracting only cache misses.
+
+  Args:
+    factories: Factory functions by fully qualified name.
+    cache: Cache consulted first and updated with newly extracted metadata.
+    max_workers: Worker processes for cache misses; defaults to the CPU count.
+
+  Returns:
+    Metadata by FQN, in the order of `factories`.
+
+  """
+  hashes = {fqn: cache.source_hash(func) for fqn, func in factories.items()}
+  results: dict[str, dict[str, Any]] = {}
+  misses: list[str] = []
+  for fqn in factories:
+    cached = cache.get(fqn, hashes[fqn])
+    if cached is not None:
+      results[fqn] = cached
+    else:
+      misses.append(fqn)
+
+  if misses:
+    logger.info(
+      "Extracting metadata for %d resource factories (%d cached).",
+      len(misses),
+      len(factories) - len(misses),
+    )
+    max_workers = max_workers if max_workers is not None else os.cpu_count() or 1
+    extracted: dict[str, dict[str, Any]] = {}
+    if len(misses) >= MIN_PARALLEL_MISSES and max_workers > 1:
+      extracted = await _extract_in_workers(misses, max_workers)
+    for fqn in misses:
+      if fqn not in extracted:  # Not run in a worker, or the worker could not import it
+        extracted[fqn] = get_metadata_from_factory_function(factories[fqn], fqn)
+      cache.set(fqn, hashes[fqn], extracted[fqn])
+      results[fqn] = extracted[fqn]
+
+  return {fqn: results[fqn] for fqn in factories}
+
+
+async def _extract_in_workers(fqns: list[str], max_workers: int) -> dict[str, dict[str, Any]]:
+  """Extract metadata in a process pool; factories it could not reach are omitted."""
+  loop = asyncio.get_running_loop()
+  workers = min(max_workers, len(fqns))
+  chunk_size = max(1, -(-len(fqns) // (workers * 4)))
+  chunks = [fqns[i : i + chunk_size] for i in range(0, len(fqns), chunk_size)]
+  extracted: dict[str, dict[str, Any]] = {}
+  pool = ProcessPoolExecutor(max_workers=workers)
+  try:
+    futures = [loop.run_in_executor(pool, _extract_factory_chunk, chunk) for chunk in chunks]
+    for result in await asyncio.gather(*futures, return_exceptions=True):
+      if isinstance(result, BrokenProcessPool):
+        logger.warning("Factory metadata worker pool stopped; extracting the rest in-process.")
+      elif isinstance(result, BaseException):
+        logger.warning("Factory metadata extraction failed in a worker: %s", result)
+      else:
+        extracted.update(result)
+  finally:
+    # Joining the workers blocks, so keep it off the event loop.
+    await asyncio.to_thread(pool.shutdown, wait=True, cancel_futures=True)
+  return extracted
+
+
+_default_cache: FactoryMetadataCache | None = None
+
+
+def get_factory_metadata_cache() -> FactoryMetadataCache:
+  """Return the process-wide factory metadata cache."""
+  global _default_cache
+  if _default_cache is None:
+    _default_cache = FactoryMetadataCache()
+  return _default_cache
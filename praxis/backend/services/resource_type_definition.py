@@ -16,13 +16,17 @@ from praxis.backend.models.domain.resource import (
     ResourceDefinitionUpdate,
 )
 from praxis.backend.services.plr_type_base import DiscoverableTypeServiceBase
+from praxis.backend.services.resource_factory_metadata import (
+    FactoryMetadataCache,
+    extract_factory_metadata,
+    get_factory_metadata_cache,
+)
 from praxis.backend.services.resource_type_validation import (
     can_catalog_resource,
     extract_ordering_from_plr_class,
     extract_vendor_from_fqn,
     get_category_from_plr_class,
     get_description_from_plr_class,
-    get_metadata_from_factory_function,
     get_nominal_volume_ul_from_plr_class,
     get_short_name_from_plr_class,
     get_size_x_mm_from_plr_class,
@@ -89,10 +93,26 @@ class ResourceTypeDefinitionService(
     2. Factory functions that create resource instances (Cor_96_wellplate_360ul_Fb, etc.)
     """
 
-    def __init__(self, db: AsyncSession) -> None:
-        """Initialize the ResourceTypeDefinitionService."""
+    def __init__(
+        self,
+        db: AsyncSession,
+        metadata_cache: FactoryMetadataCache | None = None,
+        max_workers: int | None = None,
+    ) -> None:
+        """Initialize the ResourceTypeDefinitionService.
+
+        Args:
+            db: The database session.
+            metadata_cache: Cache of factory metadata; defaults to the
+                process-wide cache persisted under ~/.cache/praxis.
+            max_workers: Worker processes used to extract uncached factory
+                metadata; defaults to the CPU count.
+
+        """
         super().__init__(ResourceDefinition)
         self.db = db
+        self.metadata_cache = metadata_cache
+        self.max_workers = max_workers
 
     @property
     def _orm_model(self) -> type[ResourceDefinition]:
@@ -115,6 +135,7 @@ class ResourceTypeDefinitionService(
         )
         synced_definitions = []
         processed_fqns: set[str] = set()
+        factories: dict[str, Any] = {}
 
         for _, modname, _ in pkgutil.walk_packages(
             path=plr_resources_package.__path__,
@@ -182,26 +203,36 @@ class ResourceTypeDefinitionService(
                     if func_obj.__module__ != modname:
                         continue
 
-                    metadata = get_metadata_from_factory_function(func_obj, fqn)
+                    factories[fqn] = func_obj
 
-                    synced_def = await self._sync_definition(
-                        fqn=fqn,
-                        short_name=metadata["name"],
-                        description=metadata["description"],
-                        category=metadata["category"],
-                        ordering=metadata["ordering"],
-                        size_x_mm=metadata["size_x_mm"],
-                        size_y_mm=metadata["size_y_mm"],
-                        size_z_mm=metadata["size_z_mm"],
-                        nominal_volume_ul=metadata["nominal_volume_ul"],
-                        num_items=metadata["num_items"],
-                        plate_type=metadata["plate_type"],
-                        well_volume_ul=metadata["well_volume_ul"],
-                        tip_volume_ul=metadata["tip_volume_ul"],
-                        vendor=metadata["vendor"],
-                        properties_json=metadata.get("properties_json"),
-                    )
-                    synced_definitions.append(synced_def)
+        # Instantiating factories is the expensive part of a sync, so their
+        # metadata is cached by source hash and misses are extracted in bulk.
+        metadata_cache = self.metadata_cache or get_factory_metadata_cache()
+        factory_metadata = await extract_factory_metadata(
+            factories,
+            cache=metadata_cache,
+            max_workers=self.max_workers,
+        )
+        metadata_cache.save()
+        for fqn, metadata in factory_metadata.items():
+            synced_def = await self._sync_definition(
+                fqn=fqn,
+                short_name=metadata["name"],
+                description=metadata["description"],
+                category=metadata["category"],
+                ordering=metadata["ordering"],
+                size_x_mm=metadata["size_x_mm"],
+                size_y_mm=metadata["size_y_mm"],
+                size_z_mm=metadata["size_z_mm"],
+                nominal_volume_ul=metadata["nominal_volume_ul"],
+                num_items=metadata["num_items"],
+                plate_type=metadata["plate_type"],
+                well_volume_ul=metadata["well_volume_ul"],
+                tip_volume_ul=metadata["tip_volume_ul"],
+                vendor=metadata["vendor"],
+                properties_json=metadata.get("properties_json"),
+            )
+            synced_definitions.append(synced_def)
 
         await self.db.commit()
         logger.info("Synchronized %d resource definitions.", len(synced_definitions))
@@ -14,7 +14,7 @@ from datetime import datetime, timezone
 from functools import partial
 from typing import TYPE_CHECKING, Any, cast
 
-from sqlalchemy import and_, asc, desc, func, select
+from sqlalchemy import ColumnElement, Row, asc, case, desc, func, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -40,6 +40,7 @@ from praxis.backend.models.enums import (
   ScheduleHistoryEventTriggerEnum,
   ScheduleStatusEnum,
 )
+from praxis.backend.services.scheduler_metrics import get_rollup_metrics, record_schedule_events
 from praxis.backend.services.utils.crud_base import CRUDBase
 from praxis.backend.services.utils.query_builder import (
   apply_date_range_filters,
@@ -82,25 +83,21 @@ class ScheduleEntryCRUDService(
     )
     logger.info("%s Attempting to create new schedule entry.", log_prefix)
 
-    # Fetch the protocol run
-    protocol_run_result = await db.execute(
-      select(ProtocolRun).filter(
-        ProtocolRun.accession_id == obj_in.protocol_run_accession_id,
-      ),
+    # Fetch the protocol run and any existing entry for it in one round trip
+    lookup = await db.execute(
+      select(ProtocolRun, self.model.accession_id)
+      .outerjoin(self.model, self.model.protocol_run_accession_id == ProtocolRun.accession_id)
+      .filter(ProtocolRun.accession_id == obj_in.protocol_run_accession_id)
+      .limit(1),
     )
-    protocol_run = protocol_run_result.scalar_one_or_none()
-    if not protocol_run:
+    row = lookup.first()
+    if row is None:
       error_message = f"{log_prefix} Protocol run '{obj_in.protocol_run_accession_id}' not found."
       logger.error(error_message)
       raise ValueError(error_message)
+    protocol_run, existing_entry_accession_id = row
 
-    # Check if a schedule entry for this protocol run already exists
-    existing_entry = await db.execute(
-      select(self.model).filter(
-        self.model.protocol_run_accession_id == obj_in.protocol_run_accession_id,
-      ),
-    )
-    if existing_entry.scalar_one_or_none():
+    if existing_entry_accession_id is not None:
       error_message = (
         f"{log_prefix} A schedule entry for protocol run "
         f"'{obj_in.protocol_run_accession_id}' already exists. Use the update function for "
@@ -136,17 +133,17 @@ class ScheduleEntryCRUDService(
     db.add(schedule_entry)
     logger.info("%s Initialized new schedule entry for creation.", log_prefix)
 
-    await db.flush()
-    logger.debug("%s Flushed new schedule entry to get ID.", log_prefix)
-
-    # Log the scheduling event
-    await log_schedule_event(
-      db,
+    # The accession ID is assigned client-side, so the creation event is written
+    # in the same flush as the entry itself.
+    created_event = build_schedule_event(
       schedule_entry.accession_id,
       ScheduleHistoryEventEnum.SCHEDULE_CREATED,
       new_status=ScheduleStatusEnum.QUEUED,
       event_details_json={"priority": schedule_entry.priority},
     )
+    db.add(created_event)
+    await db.flush()
+    await record_schedule_events(db, [created_event])
 
     await db.refresh(schedule_entry)
 
@@ -294,6 +291,7 @@ schedule_entry_service = ScheduleEntryCRUDService(ScheduleEntry)
 @handle_db_transaction
 async def create_asset_reservation(
   db: AsyncSession,
+  *,
   schedule_entry_accession_id: uuid.UUID,
   asset_type: AssetType,
   asset_name: str,
@@ -395,6 +393,104 @@ async def list_asset_reservations(
   return list(result.scalars().all())
 
 
+def _reservation_filters(
+  *,
+  include_released: bool = False,
+  asset_key: str | None = None,
+  protocol_run_accession_id: uuid.UUID | None = None,
+  asset_type: AssetType | None = None,
+  created_after: datetime | None = None,
+  created_before: datetime | None = None,
+) -> list[ColumnElement[bool]]:
+  """Build the WHERE clauses shared by the reservation page and count queries.
+
+  Args:
+      include_released: Also match reservations that are no longer active.
+      asset_key: Only match reservations holding this lock key.
+      protocol_run_accession_id: Only match reservations for this run.
+      asset_type: Only match reservations of this asset type.
+      created_after: Only match reservations created at or after this time.
+      created_before: Only match reservations created before this time.
+
+  Returns:
+      The clauses to AND together.
+
+  """
+  clauses: list[ColumnElement[bool]] = []
+  if not include_released:
+    clauses.append(AssetReservation.status.in_(ACTIVE_RESERVATION_STATUSES))
+  if asset_key:
+    clauses.append(AssetReservation.redis_lock_key == asset_key)
+  if protocol_run_accession_id:
+    clauses.append(AssetReservation.protocol_run_accession_id == protocol_run_accession_id)
+  if asset_type:
+    clauses.append(AssetReservation.asset_type == asset_type)
+  if created_after:
+    clauses.append(AssetReservation.created_at >= created_after)
+  if created_before:
+    clauses.append(AssetReservation.created_at < created_before)
+  return clauses
+
+
+async def list_asset_reservations_page(
+  db: AsyncSession,
+  *,
+  limit: int = 100,
+  cursor: tuple[datetime, uuid.UUID] | None = None,
+  **filters: Any,
+) -> tuple[list[AssetReservation], tuple[datetime, uuid.UUID] | None]:
+  """List one page of asset reservations, newest first, by keyset pagination.
+
+  Args:
+      db: The database session.
+      limit: Maximum number of reservations to return.
+      cursor: `(created_at, accession_id)` of the last reservation on the
+          previous page, as returned by the previous call.
+      **filters: Keyword filters accepted by `_reservation_filters`.
+
+  Returns:
+      The page of reservations and the cursor for the next page, or None if
+      this is the last page.
+
+  """
+  stmt = select(AssetReservation).where(*_reservation_filters(**filters))
+  if cursor is not None:
+    stmt = stmt.where(
+      tuple_(AssetReservation.created_at, AssetReservation.accession_id) < tuple_(*cursor),
+    )
+  stmt = stmt.order_by(
+    AssetReservation.created_at.desc(),
+    AssetReservation.accession_id.desc(),
+  ).limit(limit + 1)
+
+  reservations = list((await db.execute(stmt)).scalars().all())
+  if len(reservations) <= limit:
+    return reservations, None
+  reservations = reservations[:limit]
+  return reservations, (reservations[-1].created_at, reservations[-1].accession_id)
+
+
+async def count_asset_reservations(db: AsyncSession, **filters: Any) -> tuple[int, int]:
+  """Count matching reservations, and the active ones among them, in one query.
+
+  Args:
+      db: The database session.
+      **filters: Keyword filters accepted by `_reservation_filters`.
+
+  Returns:
+      A `(total_count, active_count)` tuple.
+
+  """
+  is_active = case((AssetReservation.status.in_(ACTIVE_RESERVATION_STATUSES), 1), else_=0)
+  stmt = (
+    select(func.count(), func.coalesce(func.sum(is_active), 0))
+    .select_from(AssetReservation)
+    .where(*_reservation_filters(**filters))
+  )
+  total_count, active_count = (await db.execute(stmt)).one()
+  return int(total_count), int(active_count)
+
+
 @handle_db_transaction
 async def update_asset_reservation_status(
   db: AsyncSession,
@@ -428,52 +524,83 @@ async def update_asset_reservation_status(
   return reservation
 
 
-@handle_db_transaction
-async def cleanup_expired_reservations(
+ACTIVE_RESERVATION_STATUSES = (
+  AssetReservationStatusEnum.PENDING,
+  AssetReservationStatusEnum.RESERVED,
+  AssetReservationStatusEnum.ACTIVE,
+)
+
+
+async def expire_reservations(
   db: AsyncSession,
   current_time: datetime | None = None,
-) -> int:
-  """Clean up expired asset reservations."""
+  *,
+  limit: int | None = None,
+) -> list[Row]:
+  """Mark active reservations past their `expires_at` as EXPIRED in one UPDATE.
+
+  Args:
+      db: The database session.
+      current_time: Expiry cut-off (defaults to now).
+      limit: Expire at most this many, earliest deadlines first.
+
+  Returns:
+      One row per expired reservation with its `accession_id`,
+      `redis_lock_key`, `protocol_run_accession_id` and `expires_at`.
+
+  """
   if current_time is None:
     current_time = datetime.now(timezone.utc)
 
-  stmt = select(AssetReservation).filter(
-    and_(
-      AssetReservation.expires_at < current_time,
-      AssetReservation.status.in_(
-        [
-          AssetReservationStatusEnum.PENDING,
-          AssetReservationStatusEnum.RESERVED,
-          AssetReservationStatusEnum.ACTIVE,
-        ],
-      ),
-    ),
+  due = (
+    select(AssetReservation.accession_id)
+    .where(
+      AssetReservation.expires_at <= current_time,
+      AssetReservation.status.in_(ACTIVE_RESERVATION_STATUSES),
+    )
+    .order_by(AssetReservation.expires_at)
   )
+  if limit is not None:
+    due = due.limit(limit)
+
+  result = await db.execute(
+    update(AssetReservation)
+    .where(AssetReservation.accession_id.in_(due.scalar_subquery()))
+    .values(
+      status=AssetReservationStatusEnum.EXPIRED,
+      released_at=current_time,
+      is_active=False,
+    )
+    .returning(
+      AssetReservation.accession_id,
+      AssetReservation.redis_lock_key,
+      AssetReservation.protocol_run_accession_id,
+      AssetReservation.expires_at,
+    )
+    .execution_options(synchronize_session="fetch"),
+  )
+  return list(result.all())
 
-  result = await db.execute(stmt)
-  expired_reservations = list(result.scalars().all())
-
-  count = 0
-  for reservation in expired_reservations:
-    reservation.status = AssetReservationStatusEnum.EXPIRED
-    reservation.released_at = current_time
-    count += 1
-
-  if count > 0:
-    await db.flush()
-    logger.info("Cleaned up %d expired asset reservations", count)
 
-  return count
+@handle_db_transaction
+async def cleanup_expired_reservations(
+  db: AsyncSession,
+  current_time: datetime | None = None,
+) -> int:
+  """Clean up expired asset reservations."""
+  expired = await expire_reservations(db, current_time)
+  if expired:
+    logger.info("Cleaned up %d expired asset reservations", len(expired))
+  return len(expired)
 
 
 # Schedule History Services
 
 
-@handle_db_transaction
-async def log_schedule_event(
-  db: AsyncSession,
+def build_schedule_event(
   schedule_entry_accession_id: uuid.UUID,
   event_type: ScheduleHistoryEventEnum,
+  *,
   previous_status: ScheduleStatusEnum | None = None,
   new_status: ScheduleStatusEnum | None = None,
   event_details_json: dict[str, Any] | None = None,
@@ -484,11 +611,9 @@ async def log_schedule_event(
   duration_ms: int | None = None,
   triggered_by: ScheduleHistoryEventTriggerEnum | None = None,
 ) -> ScheduleHistory:
-  """Log a scheduling event for history and analytics."""
-  if name is None:
-    name = "Unnamed Event"
-  history_entry = ScheduleHistory(
-    name=name,
+  """Build (but do not add) a ScheduleHistory row."""
+  return ScheduleHistory(
+    name=name or "Unnamed Event",
     schedule_entry_accession_id=schedule_entry_accession_id,
     event_type=event_type,
     event_end=event_end,
@@ -501,9 +626,42 @@ async def log_schedule_event(
     triggered_by=triggered_by or ScheduleHistoryEventTriggerEnum.SYSTEM,
   )
 
+
+@handle_db_transaction
+async def log_schedule_event(
+  db: AsyncSession,
+  schedule_entry_accession_id: uuid.UUID,
+  event_type: ScheduleHistoryEventEnum,
+  *,
+  previous_status: ScheduleStatusEnum | None = None,
+  new_status: ScheduleStatusEnum | None = None,
+  event_details_json: dict[str, Any] | None = None,
+  error_details_json: dict[str, Any] | None = None,
+  event_end: datetime | None = None,
+  message: str | None = None,
+  name: str | None = None,
+  duration_ms: int | None = None,
+  triggered_by: ScheduleHistoryEventTriggerEnum | None = None,
+) -> ScheduleHistory:
+  """Log a scheduling event for history and analytics."""
+  history_entry = build_schedule_event(
+    schedule_entry_accession_id,
+    event_type,
+    previous_status=previous_status,
+    new_status=new_status,
+    event_details_json=event_details_json,
+    error_details_json=error_details_json,
+    event_end=event_end,
+    message=message,
+    name=name,
+    duration_ms=duration_ms,
+    triggered_by=triggered_by,
+  )
+
   db.add(history_entry)
   await db.flush()
   await db.refresh(history_entry)
+  await record_schedule_events(db, [history_entry])
 
   return history_entry
 
@@ -534,51 +692,10 @@ async def get_scheduling_metrics(
   start_time: datetime,
   end_time: datetime,
 ) -> dict[str, Any]:
-  """Get scheduling metrics for a time period."""
-  # Get status counts
-  status_count_stmt = (
-    select(ScheduleHistory.to_status, func.count().label("count"))
-    .filter(
-      and_(
-        ScheduleHistory.created_at >= start_time,
-        ScheduleHistory.created_at <= end_time,
-      ),
-    )
-    .group_by(ScheduleHistory.to_status)
-  )
-
-  status_result = await db.execute(status_count_stmt)
-  status_counts = {row.to_status: row[1] for row in status_result}
-
-  # Get average timing metrics
-  avg_stmt = select(
-    # Use stored/override duration column for SQL aggregation (computed properties are not SQL expressions)
-    func.avg(ScheduleHistory.override_duration_ms).label("avg_duration"),
-  ).filter(
-    and_(
-      ScheduleHistory.created_at >= start_time,
-      ScheduleHistory.created_at <= end_time,
-    ),
-  )
-
-  avg_result = await db.execute(avg_stmt)
-  avg_data = avg_result.first()
-
-  # Get error count
-  error_count_stmt = select(func.count()).filter(
-    and_(
-      ScheduleHistory.created_at >= start_time,
-      ScheduleHistory.created_at <= end_time,
-      ScheduleHistory.error_details.isnot(None),
-    ),
-  )
-
-  error_result = await db.execute(error_count_stmt)
-  error_count = error_result.scalar()
+  """Get scheduling metrics for a time period.
 
-  return {
-    "status_counts": status_counts,
-    "avg_duration_ms": avg_data.avg_duration if avg_data else None,
-    "error_count": error_count,
-    "total_events": (sum(list(status_counts.values())) if status_counts else 0),
-  }
+  Served from the pre-aggregated rollups maintained by `log_schedule_event`,
+  so the cost depends on the length of the period rather than the size of the
+  history table. The period is resolved to whole minutes.
+  """
+  return await get_rollup_metrics(db, start_time, end_time)
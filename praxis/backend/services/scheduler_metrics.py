@@ -0,0 +1,431 @@
+"""Incremental, time-bucketed rollups of scheduling metrics.
+
+praxis/backend/services/scheduler_metrics.py
+
+Every schedule history event is folded into one minute bucket and one hour
+bucket of `ScheduleMetricsRollup` as it is logged. Metrics for a time range are
+then read from at most a couple of hundred buckets (whole hours in the middle,
+minutes at the edges) instead of aggregating the full history table, so the
+cost of a metrics query no longer grows with all-time history.
+
+Buckets are written with `INSERT ... ON CONFLICT DO UPDATE SET col = col +
+excluded.col`, so concurrent writers add to a bucket atomically without first
+locking it with a SELECT.
+
+`max_queue_depth` is exact for events logged in time order. An event logged
+after later buckets already exist (a late event) shifts their `queue_depth`
+but can only raise, never lower, their `max_queue_depth`, so the maximum is an
+upper bound for ranges that received late events that removed entries.
+`backfill_scheduling_metrics` rebuilds the rollups, including exact maxima,
+from existing history (see `scripts/backfill_schedule_metrics.py`).
+"""
+
+import uuid
+from collections import Counter
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from sqlalchemy import ColumnElement, delete, desc, func, or_, select, tuple_, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from praxis.backend.models.domain.schedule import (
+  ScheduleEntry,
+  ScheduleHistory,
+  ScheduleMetricsRollup,
+  ScheduleMetricsStatusRollup,
+)
+from praxis.backend.models.enums import ScheduleStatusEnum
+from praxis.backend.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+MINUTE = "minute"
+HOUR = "hour"
+GRANULARITIES: dict[str, timedelta] = {
+  MINUTE: timedelta(minutes=1),
+  HOUR: timedelta(hours=1),
+}
+
+WAITING_STATUSES = (ScheduleStatusEnum.QUEUED, ScheduleStatusEnum.RESERVED)
+
+_NO_STATUS = "none"
+DEFAULT_BACKFILL_BATCH_SIZE = 5000
+
+
+def bucket_start(timestamp: datetime, granularity: str) -> datetime:
+  """Return the UTC start of the bucket containing `timestamp` (naive means UTC)."""
+  timestamp = _as_utc(timestamp)
+  if granularity == MINUTE:
+    return timestamp.replace(second=0, microsecond=0)
+  if granularity == HOUR:
+    return timestamp.replace(minute=0, second=0, microsecond=0)
+  msg = f"Unknown rollup granularity '{granularity}'."
+  raise ValueError(msg)
+
+
+def _as_utc(timestamp: datetime) -> datetime:
+  # SQLite hands back naive datetimes; everything is stored in UTC.
+  if timestamp.tzinfo is None:
+    return timestamp.replace(tzinfo=timezone.utc)
+  return timestamp.astimezone(timezone.utc)
+
+
+def _utcnow() -> datetime:
+  return datetime.now(timezone.utc)
+
+
+def _ms_between(start: datetime | None, end: datetime) -> int | None:
+  if start is None:
+    return None
+  return max(0, int((end - _as_utc(start)).total_seconds() * 1000))
+
+
+_ADDITIVE_COLUMNS = (
+  "event_count",
+  "error_count",
+  "duration_sum_ms",
+  "duration_samples",
+  "wait_time_sum_ms",
+  "wait_time_samples",
+  "reservation_time_sum_ms",
+  "reservation_time_samples",
+  "queue_depth_delta",
+)
+
+
+@dataclass
+class _BucketDelta:
+  """Additive contribution of a group of events to one bucket."""
+
+  event_count: int = 0
+  error_count: int = 0
+  status_counts: Counter = field(default_factory=Counter)
+  duration_sum_ms: int = 0
+  duration_samples: int = 0
+  wait_time_sum_ms: int = 0
+  wait_time_samples: int = 0
+  reservation_time_sum_ms: int = 0
+  reservation_time_samples: int = 0
+  queue_depth_delta: int = 0
+  queue_depth_peak: int = 0
+  """Highest running queue-depth change within the group (never below 0)."""
+
+  def add_event(
+    self,
+    event: ScheduleHistory,
+    *,
+    wait_time_ms: int | None,
+    reservation_time_ms: int | None,
+  ) -> None:
+    self.event_count += 1
+    if event.error_details is not None:
+      self.error_count += 1
+    self.status_counts[_status_key(event.to_status)] += 1
+    if event.override_duration_ms is not None:
+      self.duration_sum_ms += event.override_duration_ms
+      self.duration_samples += 1
+    if wait_time_ms is not None:
+      self.wait_time_sum_ms += wait_time_ms
+      self.wait_time_samples += 1
+    if reservation_time_ms is not None:
+      self.reservation_time_sum_ms += reservation_time_ms
+      self.reservation_time_samples += 1
+    self.queue_depth_delta += _queue_depth_change(event)
+    self.queue_depth_peak = max(self.queue_depth_peak, self.queue_depth_delta)
+
+
+def _status_key(status: ScheduleStatusEnum | str | None) -> str:
+  if status is None:
+    return _NO_STATUS
+  return ScheduleStatusEnum(status).value
+
+
+def _queue_depth_change(event: ScheduleHistory) -> int:
+  """+1 when an entry starts waiting, -1 when it stops, 0 otherwise."""
+  if event.to_status is None:
+    return 0
+  was_waiting = event.from_status in WAITING_STATUSES
+  is_waiting = event.to_status in WAITING_STATUSES
+  return int(is_waiting) - int(was_waiting)
+
+
+def _event_time(event: ScheduleHistory) -> datetime:
+  return _as_utc(event.created_at or event.event_start or _utcnow())
+
+
+async def _queued_since(
+  db: AsyncSession,
+  events: Iterable[ScheduleHistory],
+) -> dict[uuid.UUID, datetime | None]:
+  """When each entry that leaves the queue in `events` started waiting."""
+  entry_ids = {
+    event.schedule_entry_accession_id
+    for event in events
+    if event.to_status in (ScheduleStatusEnum.RESERVED, ScheduleStatusEnum.EXECUTING)
+  }
+  if not entry_ids:
+    return {}
+  result = await db.execute(
+    select(
+      ScheduleEntry.accession_id,
+      ScheduleEntry.scheduled_at,
+      ScheduleEntry.created_at,
+    ).where(ScheduleEntry.accession_id.in_(entry_ids)),
+  )
+  return {row.accession_id: row.scheduled_at or row.created_at for row in result}
+
+
+async def record_schedule_events(
+  db: AsyncSession,
+  events: Sequence[ScheduleHistory],
+  *,
+  propagate_queue_depth: bool = True,
+) -> None:
+  """Fold schedule history events into their minute and hour rollup buckets.
+
+  Call this in the same transaction that adds the events. Wait time is
+  measured when an entry starts executing and reservation time when its
+  assets are reserved, both from the moment the entry was queued.
+
+  Args:
+      db: The database session.
+      events: The history events being logged.
+      propagate_queue_depth: Carry queue-depth changes forward into buckets
+          that already exist after an event's bucket (late events only).
+
+  """
+  if not events:
+    return
+  queued_since = await _queued_since(db, events)
+
+  deltas: dict[tuple[str, datetime], _BucketDelta] = {}
+  for event in events:
+    timestamp = _event_time(event)
+    since = queued_since.get(event.schedule_entry_accession_id)
+    elapsed_ms = _ms_between(since, timestamp)
+    for granularity in GRANULARITIES:
+      key = (granularity, bucket_start(timestamp, granularity))
+      deltas.setdefault(key, _BucketDelta()).add_event(
+        event,
+        wait_time_ms=elapsed_ms if event.to_status == ScheduleStatusEnum.EXECUTING else None,
+        reservation_time_ms=elapsed_ms if event.to_status == ScheduleStatusEnum.RESERVED else None,
+      )
+  await _apply_deltas(db, deltas, propagate_queue_depth=propagate_queue_depth)
+
+
+async def _apply_deltas(
+  db: AsyncSession,
+  deltas: dict[tuple[str, datetime], _BucketDelta],
+  *,
+  propagate_queue_depth: bool,
+) -> None:
+  postgres = db.get_bind().dialect.name == "postgresql"
+  insert = postgresql.insert if postgres else sqlite.insert
+  greatest = func.greatest if postgres else func.max
+  rollup = ScheduleMetricsRollup
+  now = _utcnow()
+
+  for granularity, start in sorted(deltas):
+    delta = deltas[granularity, start]
+    # A new bucket starts from the queue depth at the end of the one before it.
+    previous_depth = func.coalesce(
+      select(rollup.queue_depth)
+      .where(rollup.granularity == granularity, rollup.bucket_start < start)
+      .order_by(desc(rollup.bucket_start))
+      .limit(1)
+      .scalar_subquery(),
+      0,
+    )
+    stmt = insert(rollup).values(
+      granularity=granularity,
+      bucket_start=start,
+      **{column: getattr(delta, column) for column in _ADDITIVE_COLUMNS},
+      queue_depth=previous_depth + delta.queue_depth_delta,
+      max_queue_depth=previous_depth + delta.queue_depth_peak,
+    )
+    await db.execute(
+      stmt.on_conflict_do_update(
+        index_elements=["granularity", "bucket_start"],
+        set_={
+          **{
+            column: getattr(rollup, column) + getattr(stmt.excluded, column)
+            for column in _ADDITIVE_COLUMNS
+          },
+          "queue_depth": rollup.queue_depth + delta.queue_depth_delta,
+          "max_queue_depth": greatest(
+            rollup.max_queue_depth,
+            rollup.queue_depth + delta.queue_depth_peak,
+          ),
+        },
+      ),
+    )
+    if propagate_queue_depth and delta.queue_depth_delta and start < bucket_start(now, granularity):
+      await db.execute(
+        update(rollup)
+        .where(rollup.granularity == granularity, rollup.bucket_start > start)
+        .values(
+          queue_depth=rollup.queue_depth + delta.queue_depth_delta,
+          max_queue_depth=greatest(
+            rollup.max_queue_depth,
+            rollup.queue_depth + delta.queue_depth_delta,
+          ),
+        ),
+      )
+
+  status_rows = [
+    {"granularity": granularity, "bucket_start": start, "status": status, "event_count": count}
+    for (granularity, start), delta in sorted(deltas.items())
+    for status, count in sorted(delta.status_counts.items())
+  ]
+  stmt = insert(ScheduleMetricsStatusRollup).values(status_rows)
+  await db.execute(
+    stmt.on_conflict_do_update(
+      index_elements=["granularity", "bucket_start", "status"],
+      set_={"event_count": ScheduleMetricsStatusRollup.event_count + stmt.excluded.event_count},
+    ),
+  )
+
+
+# --- Reading ---
+
+
+def _average(total: int, samples: int) -> float | None:
+  return total / samples if samples else None
+
+
+async def get_rollup_metrics(
+  db: AsyncSession,
+  start_time: datetime,
+  end_time: datetime,
+) -> dict[str, Any]:
+  """Aggregate the rollup buckets covering `[start_time, end_time]`.
+
+  The range is resolved to whole minutes. Whole hours inside it are read from
+  hour buckets and the partial hours at either edge from minute buckets, so at
+  most ~120 minute buckets plus one bucket per hour are read.
+
+  Returns:
+      Event counts per resulting status, error count, average event duration,
+      average wait and reservation times, the queue depth at the end of the
+      range and the largest queue depth seen in it.
+
+  """
+  first_minute = bucket_start(start_time, MINUTE)
+  last_minute = bucket_start(end_time, MINUTE)
+  first_hour = bucket_start(first_minute + GRANULARITIES[HOUR] - GRANULARITIES[MINUTE], HOUR)
+  last_hour = bucket_start(last_minute + GRANULARITIES[MINUTE], HOUR) - GRANULARITIES[HOUR]
+
+  def bucket_filter(
+    model: type[ScheduleMetricsRollup | ScheduleMetricsStatusRollup],
+  ) -> ColumnElement[bool]:
+    minute_filter = (model.granularity == MINUTE) & model.bucket_start.between(
+      first_minute,
+      last_minute,
+    )
+    if first_hour > last_hour:
+      return minute_filter
+    return or_(
+      (model.granularity == HOUR) & model.bucket_start.between(first_hour, last_hour),
+      minute_filter
+      & or_(
+        model.bucket_start < first_hour,
+        model.bucket_start >= last_hour + GRANULARITIES[HOUR],
+      ),
+    )
+
+  buckets = list(
+    (
+      await db.execute(select(ScheduleMetricsRollup).where(bucket_filter(ScheduleMetricsRollup)))
+    ).scalars(),
+  )
+  status_result = await db.execute(
+    select(ScheduleMetricsStatusRollup.status, func.sum(ScheduleMetricsStatusRollup.event_count))
+    .where(bucket_filter(ScheduleMetricsStatusRollup))
+    .group_by(ScheduleMetricsStatusRollup.status),
+  )
+  status_counts = dict(status_result.tuples().all())
+
+  queue_depth = (
+    await db.execute(
+      select(ScheduleMetricsRollup.queue_depth)
+      .where(
+        ScheduleMetricsRollup.granularity == MINUTE,
+        ScheduleMetricsRollup.bucket_start <= last_minute,
+      )
+      .order_by(desc(ScheduleMetricsRollup.bucket_start))
+      .limit(1),
+    )
+  ).scalar() or 0
+
+  def total(column: str) -> int:
+    return sum(getattr(bucket, column) for bucket in buckets)
+
+  return {
+    "status_counts": {
+      (None if key == _NO_STATUS else ScheduleStatusEnum(key)): count
+      for key, count in status_counts.items()
+    },
+    "total_events": total("event_count"),
+    "error_count": total("error_count"),
+    "avg_duration_ms": _average(total("duration_sum_ms"), total("duration_samples")),
+    "avg_wait_time_ms": _average(total("wait_time_sum_ms"), total("wait_time_samples")),
+    "avg_reservation_time_ms": _average(
+      total("reservation_time_sum_ms"),
+      total("reservation_time_samples"),
+    ),
+    "queue_depth": queue_depth,
+    "max_queue_depth": max([queue_depth, *(bucket.max_queue_depth for bucket in buckets)]),
+  }
+
+
+# --- Backfill ---
+
+
+async def backfill_scheduling_metrics(
+  db: AsyncSession,
+  *,
+  since: datetime | None = None,
+  batch_size: int = DEFAULT_BACKFILL_BATCH_SIZE,
+) -> int:
+  """Rebuild the rollups from the schedule history table.
+
+  Buckets from `since` (rounded down to the hour) onward are dropped and
+  rebuilt by replaying history in time order, in batches of `batch_size`.
+  Without `since` everything is rebuilt. The caller commits.
+
+  Returns:
+      The number of history events replayed.
+
+  """
+  start = bucket_start(since, HOUR) if since is not None else None
+  for model in (ScheduleMetricsRollup, ScheduleMetricsStatusRollup):
+    clear = delete(model)
+    if start is not None:
+      clear = clear.where(model.bucket_start >= start)
+    await db.execute(clear)
+
+  replayed = 0
+  cursor: tuple[datetime, uuid.UUID] | None = None
+  while True:
+    stmt = select(ScheduleHistory).order_by(
+      ScheduleHistory.created_at, ScheduleHistory.accession_id
+    )
+    if start is not None:
+      stmt = stmt.where(ScheduleHistory.created_at >= start)
+    if cursor is not None:
+      stmt = stmt.where(
+        tuple_(ScheduleHistory.created_at, ScheduleHistory.accession_id) > tuple_(*cursor),
+      )
+    events = list((await db.execute(stmt.limit(batch_size))).scalars())
+    if not events:
+      break
+    await record_schedule_events(db, events, propagate_queue_depth=False)
+    replayed += len(events)
+    cursor = (events[-1].created_at, events[-1].accession_id)
+    for event in events:
+      db.expunge(event)
+    logger.info("Scheduling metrics backfill: replayed %d events.", replayed)
+  return replayed
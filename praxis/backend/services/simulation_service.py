@@ -7,17 +7,31 @@ It also provides cloudpickle-based bytecode caching for:
 - Faster protocol re-execution (no import needed)
 - Distributed execution (send pickled functions to workers)
 - Early validation with clear error messages
+
+Pending simulations are dispatched to a bounded pool of worker processes. Each
+protocol function is shipped to its worker as `ProtocolCache` bytecode, results
+come back as cache dictionaries and are written to the database in batches.
 """
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import importlib
 import inspect
 import logging
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any
 
+from praxis.backend.configure import PraxisConfiguration
 from praxis.backend.core.protocol_cache import (
+  CachedProtocol,
   CacheValidationError,
   DeserializationError,
   ProtocolCache,
@@ -27,6 +41,7 @@ from praxis.backend.core.simulation import (
   SIMULATION_VERSION,
   ProtocolSimulationResult,
   ProtocolSimulator,
+  create_trace_memo,
   is_cache_valid,
 )
 
@@ -39,6 +54,195 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_SIMULATION_BATCH_SIZE = 50
+"""Number of simulated protocols written per database commit."""
+
+DEFAULT_MAX_LOADED_PROTOCOLS = 128
+"""Number of deserialized protocol callables kept per process."""
+
+LoadedProtocolKey = tuple[str, str, str]
+"""(source_hash, cache_version, python_version) of cached bytecode."""
+
+
+@dataclass
+class LoadedProtocolCacheStats:
+  """Counters for the deserialized-protocol LRU."""
+
+  hits: int = 0
+  misses: int = 0
+  evictions: int = 0
+  invalidations: int = 0
+
+  @property
+  def hit_rate(self) -> float:
+    """Fraction of lookups served from the LRU."""
+    lookups = self.hits + self.misses
+    return self.hits / lookups if lookups else 0.0
+
+
+class LoadedProtocolCache:
+  """LRU of protocol callables deserialized from cached bytecode.
+
+  One instance is shared by everything in a process (see `loaded_protocols`),
+  so validation and `cloudpickle.loads` run once per protocol version per
+  process rather than once per `SimulationService` or worker job.
+  """
+
+  def __init__(self, max_entries: int = DEFAULT_MAX_LOADED_PROTOCOLS) -> None:
+    """Initialize the cache.
+
+    Args:
+        max_entries: Maximum number of callables to keep.
+
+    """
+    self.max_entries = max(1, max_entries)
+    self._entries: OrderedDict[LoadedProtocolKey, tuple[str, Callable[..., Any]]] = OrderedDict()
+    self._lock = threading.Lock()
+    self.stats = LoadedProtocolCacheStats()
+
+  def __len__(self) -> int:
+    return len(self._entries)
+
+  def get_or_load(
+    self,
+    key: LoadedProtocolKey,
+    fqn: str,
+    load: Callable[[], Callable[..., Any] | None],
+  ) -> Callable[..., Any] | None:
+    """Return the callable stored under `key`, loading and caching it on a miss.
+
+    Args:
+        key: Identity of the cached bytecode.
+        fqn: Protocol the bytecode belongs to, used by `invalidate`.
+        load: Deserializes the bytecode; may return None, which is not cached.
+
+    Returns:
+        The protocol callable, or None if `load` failed.
+
+    """
+    with self._lock:
+      loaded = self._entries.get(key)
+      if loaded is not None:
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return loaded[1]
+      self.stats.misses += 1
+
+    func = load()
+    if func is not None:
+      with self._lock:
+        self._entries[key] = (fqn, func)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+          self._entries.popitem(last=False)
+          self.stats.evictions += 1
+    return func
+
+  def invalidate(self, fqn: str | None = None) -> int:
+    """Drop the callables of one protocol, or all of them if `fqn` is None.
+
+    Returns:
+        Number of entries removed.
+
+    """
+    with self._lock:
+      if fqn is None:
+        removed = len(self._entries)
+        self._entries.clear()
+      else:
+        stale = [key for key, (entry_fqn, _) in self._entries.items() if entry_fqn == fqn]
+        for key in stale:
+          del self._entries[key]
+        removed = len(stale)
+      self.stats.invalidations += removed
+    return removed
+
+
+loaded_protocols = LoadedProtocolCache()
+"""Process-wide cache of deserialized protocol callables."""
+
+
+def _cached_protocol_key(cached: CachedProtocol) -> LoadedProtocolKey:
+  """Key identifying freshly cached bytecode in `LoadedProtocolCache`."""
+  source_hash = cached.source_hash or hashlib.sha256(cached.bytecode).hexdigest()
+  return (source_hash, cached.cache_version, cached.python_version)
+
+
+def _create_simulator(enable_failure_detection: bool, max_failure_states: int) -> ProtocolSimulator:
+  """Create a simulator whose traces persist to the configured cache directory."""
+  return ProtocolSimulator(
+    enable_failure_detection=enable_failure_detection,
+    max_failure_states=max_failure_states,
+    trace_memo=create_trace_memo(cache_dir=PraxisConfiguration().simulation_trace_cache_dir),
+  )
+
+
+# =============================================================================
+# Worker Process Entry Points
+# =============================================================================
+
+_worker_simulator: ProtocolSimulator | None = None
+
+
+def _init_simulation_worker(
+  enable_failure_detection: bool,
+  max_failure_states: int,
+) -> ProtocolSimulator:
+  """Create the simulator reused by every job of a worker process."""
+  global _worker_simulator
+  _worker_simulator = _create_simulator(enable_failure_detection, max_failure_states)
+  return _worker_simulator
+
+
+def _simulate_cached_protocol(
+  bytecode: bytes,
+  key: LoadedProtocolKey,
+  fqn: str,
+  parameter_types: dict[str, str],
+) -> dict[str, Any]:
+  """Simulate a cloudpickled protocol function in a worker process.
+
+  The function is deserialized through the worker's `loaded_protocols`, so a
+  worker that simulates the same protocol version again reuses it.
+
+  Args:
+      bytecode: `ProtocolCache` bytecode of the protocol function.
+      key: `LoadedProtocolCache` key of the bytecode.
+      fqn: Fully qualified name of the protocol.
+      parameter_types: Mapping of parameter names to type hints.
+
+  Returns:
+      The simulation result as a cache dictionary.
+
+  """
+  simulator = _worker_simulator or _init_simulation_worker(
+    enable_failure_detection=True,
+    max_failure_states=50,
+  )
+  protocol_func = loaded_protocols.get_or_load(
+    key,
+    fqn,
+    lambda: ProtocolCache().load_protocol(bytecode=bytecode, validate=False),
+  )
+  result = asyncio.run(
+    simulator.analyze_protocol(
+      protocol_func=protocol_func,
+      parameter_types=parameter_types,
+    ),
+  )
+  return result.to_cache_dict()
+
+
+@dataclass
+class _SimulationJob:
+  """A pending protocol simulation prepared for dispatch."""
+
+  protocol_model: FunctionProtocolDefinition
+  protocol_func: Callable[..., Any]
+  parameter_types: dict[str, str]
+  cached: CachedProtocol | None = None
+  """Bytecode shipped to the worker; None if the function can't be pickled"""
+
 
 class SimulationService:
   """Service for running and caching protocol simulations.
@@ -57,8 +261,10 @@ class SimulationService:
       # Simulate a single protocol
       result = await service.simulate_protocol(protocol_model, session)
 
-      # Simulate all protocols that need it
+      # Simulate all protocols that need it (in worker processes)
+      service.start()
       await service.simulate_pending_protocols(session, protocol_orms)
+      await service.stop()
 
       # Get protocol function (from cache or import)
       func = await service.get_protocol_function(protocol_model)
@@ -70,6 +276,9 @@ class SimulationService:
     enable_failure_detection: bool = True,
     max_failure_states: int = 50,
     enable_bytecode_cache: bool = True,
+    max_workers: int | None = None,
+    batch_size: int = DEFAULT_SIMULATION_BATCH_SIZE,
+    loaded_protocol_cache: LoadedProtocolCache | None = None,
   ) -> None:
     """Initialize the simulation service.
 
@@ -77,14 +286,56 @@ class SimulationService:
         enable_failure_detection: Whether to run failure mode detection.
         max_failure_states: Maximum states to explore for failure detection.
         enable_bytecode_cache: Whether to cache protocol bytecode.
+        max_workers: Worker processes used by `simulate_pending_protocols`.
+            Defaults to ``[simulation] workers`` from the configuration;
+            ``1`` simulates in-process.
+        batch_size: Simulated protocols written per database commit.
+        loaded_protocol_cache: LRU of callables deserialized from cached
+            bytecode. Defaults to the process-wide `loaded_protocols`.
 
     """
-    self._simulator = ProtocolSimulator(
-      enable_failure_detection=enable_failure_detection,
-      max_failure_states=max_failure_states,
-    )
+    self._enable_failure_detection = enable_failure_detection
+    self._max_failure_states = max_failure_states
+    if max_workers is None:
+      max_workers = PraxisConfiguration().simulation_workers
+    self._max_workers = max(1, max_workers)
+    self._pool: ProcessPoolExecutor | None = None
+    self._batch_size = max(1, batch_size)
+    self._simulator = _create_simulator(enable_failure_detection, max_failure_states)
     self._enable_bytecode_cache = enable_bytecode_cache
     self._protocol_cache = ProtocolCache() if enable_bytecode_cache else None
+    self._loaded_protocols = (
+      loaded_protocols if loaded_protocol_cache is None else loaded_protocol_cache
+    )
+
+  @property
+  def loaded_protocol_stats(self) -> LoadedProtocolCacheStats:
+    """Counters of the deserialized-protocol LRU this service uses."""
+    return self._loaded_protocols.stats
+
+  def start(self) -> None:
+    """Start the worker processes used by `simulate_pending_protocols`.
+
+    Call this at application startup so no request has to create the pool; the
+    pool is then reused by every batch. Does nothing when simulating in-process
+    or when the pool is already running.
+    """
+    if self._pool is not None or self._max_workers <= 1:
+      return
+    self._pool = ProcessPoolExecutor(
+      max_workers=self._max_workers,
+      initializer=_init_simulation_worker,
+      initargs=(self._enable_failure_detection, self._max_failure_states),
+    )
+    # Submitting a job brings the worker processes up now rather than on the
+    # first batch.
+    self._pool.submit(os.getpid)
+
+  async def stop(self) -> None:
+    """Shut down the worker pool without blocking the event loop."""
+    pool, self._pool = self._pool, None
+    if pool is not None:
+      await asyncio.to_thread(pool.shutdown, wait=True, cancel_futures=True)
 
   async def simulate_protocol(
     self,
@@ -105,15 +356,7 @@ class SimulationService:
     """
     # Check if cache is valid
     # If source_hash is missing from DB, we MUST resimulate to get it
-    if (
-      not force_resimulate
-      and protocol_model.source_hash is not None
-      and is_cache_valid(
-        cached_version=protocol_model.simulation_version,
-        source_hash=protocol_model.source_hash,
-        current_source_hash=protocol_model.source_hash,
-      )
-    ):
+    if not force_resimulate and self._has_valid_cached_result(protocol_model):
       logger.debug(
         "Simulation cache valid for %s, skipping re-simulation",
         protocol_model.fqn,
@@ -123,8 +366,8 @@ class SimulationService:
         return ProtocolSimulationResult.from_cache_dict(protocol_model.simulation_result_json)
       return None
 
-    # Try to import and get the protocol function
-    protocol_func = self._get_protocol_function(protocol_model)
+    # Import the protocol function, falling back to its cached bytecode
+    protocol_func = await self.get_protocol_function(protocol_model, prefer_cache=False)
     if protocol_func is None:
       logger.warning(
         "Could not import protocol function %s for simulation",
@@ -170,34 +413,206 @@ class SimulationService:
       )
       return None
 
+  def _has_valid_cached_result(self, protocol_model: FunctionProtocolDefinition) -> bool:
+    """Whether the stored simulation result is current for this protocol."""
+    return protocol_model.source_hash is not None and is_cache_valid(
+      cached_version=protocol_model.simulation_version,
+      source_hash=protocol_model.source_hash,
+      current_source_hash=protocol_model.source_hash,
+    )
+
   async def simulate_pending_protocols(
     self,
     session: AsyncSession,
     protocol_orms: list[FunctionProtocolDefinition],
     force_resimulate: bool = False,
+    progress_callback: Callable[[int, int, str], None] | None = None,
   ) -> dict[str, ProtocolSimulationResult | None]:
     """Run simulation on multiple protocols.
 
+    Protocols whose cached result is still valid are skipped, so a run that
+    was interrupted resumes with only the protocols it had not written yet.
+    The rest are simulated in a pool of up to ``max_workers`` processes and
+    their results are committed every ``batch_size`` protocols.
+
     Args:
         session: Database session.
         protocol_orms: List of protocol ORM objects to simulate.
         force_resimulate: If True, run simulation even if cache is valid.
+        progress_callback: Called as ``(completed, total, fqn)`` after each
+            simulated protocol.
 
     Returns:
         Dictionary mapping FQN to simulation result.
 
     """
     results: dict[str, ProtocolSimulationResult | None] = {}
+    jobs: list[_SimulationJob] = []
 
     for protocol_model in protocol_orms:
-      result = await self.simulate_protocol(
-        protocol_model=protocol_model,
-        session=session,
-        force_resimulate=force_resimulate,
+      if not force_resimulate and self._has_valid_cached_result(protocol_model):
+        cached_json = protocol_model.simulation_result_json
+        results[protocol_model.fqn] = (
+          ProtocolSimulationResult.from_cache_dict(cached_json) if cached_json else None
+        )
+        continue
+      job = await self._prepare_job(protocol_model)
+      if job is None:
+        results[protocol_model.fqn] = None
+      else:
+        jobs.append(job)
+
+    if not jobs:
+      return results
+
+    logger.info(
+      "Simulating %d protocol(s) (%d already cached)",
+      len(jobs),
+      len(results),
+    )
+    completed = 0
+    pending_writes = 0
+
+    async def _record(job: _SimulationJob, result: ProtocolSimulationResult | None) -> None:
+      nonlocal completed, pending_writes
+      fqn = job.protocol_model.fqn
+      results[fqn] = result
+      completed += 1
+      if result is not None:
+        self._apply_results(job.protocol_model, result, job.cached)
+        session.add(job.protocol_model)
+        pending_writes += 1
+        if pending_writes >= self._batch_size:
+          await session.commit()
+          pending_writes = 0
+      logger.info("Simulated %d/%d protocol(s): %s", completed, len(jobs), fqn)
+      if progress_callback is not None:
+        progress_callback(completed, len(jobs), fqn)
+
+    parallel_jobs = [job for job in jobs if job.cached is not None]
+    local_jobs = [job for job in jobs if job.cached is None]
+    if len(parallel_jobs) < 2 or self._max_workers <= 1:
+      local_jobs, parallel_jobs = jobs, []
+
+    if parallel_jobs:
+      local_jobs += await self._simulate_in_workers(parallel_jobs, _record)
+    for job in local_jobs:
+      await _record(job, await self._simulate_job(job))
+
+    if pending_writes:
+      await session.commit()
+    return results
+
+  async def _prepare_job(
+    self,
+    protocol_model: FunctionProtocolDefinition,
+  ) -> _SimulationJob | None:
+    """Resolve the function, parameter types and bytecode for a simulation."""
+    protocol_func = await self.get_protocol_function(protocol_model, prefer_cache=False)
+    if protocol_func is None:
+      logger.warning(
+        "Could not import protocol function %s for simulation",
+        protocol_model.fqn,
       )
-      results[protocol_model.fqn] = result
+      return None
 
-    return results
+    parameter_types = self._extract_parameter_types(protocol_model)
+    if not parameter_types:
+      logger.warning(
+        "No parameter types found for protocol %s, skipping simulation",
+        protocol_model.fqn,
+      )
+      return None
+
+    cached = None
+    if self._protocol_cache is not None:
+      try:
+        cached = self._protocol_cache.cache_protocol(
+          protocol_func,
+          self._get_source_code(protocol_func),
+        )
+      except SerializationError as e:
+        logger.warning(
+          "Cannot cache bytecode for %s: %s. Simulating in-process.",
+          protocol_model.fqn,
+          e,
+        )
+    return _SimulationJob(
+      protocol_model=protocol_model,
+      protocol_func=protocol_func,
+      parameter_types=parameter_types,
+      cached=cached,
+    )
+
+  async def _simulate_job(self, job: _SimulationJob) -> ProtocolSimulationResult | None:
+    """Simulate a prepared job in this process."""
+    try:
+      return await self._simulator.analyze_protocol(
+        protocol_func=job.protocol_func,
+        parameter_types=job.parameter_types,
+      )
+    except Exception as e:
+      logger.exception("Simulation failed for protocol %s: %s", job.protocol_model.fqn, e)
+      return None
+
+  async def _simulate_in_workers(
+    self,
+    jobs: list[_SimulationJob],
+    record: Callable[[_SimulationJob, ProtocolSimulationResult | None], Any],
+  ) -> list[_SimulationJob]:
+    """Simulate jobs in the worker pool, recording results as they complete.
+
+    Returns:
+        Jobs that could not be run because the pool broke; the caller
+        simulates them in-process.
+
+    """
+    loop = asyncio.get_running_loop()
+    unfinished: list[_SimulationJob] = []
+    if self._pool is None:
+      self.start()
+    pool = self._pool
+
+    async def _run(
+      job: _SimulationJob,
+    ) -> tuple[_SimulationJob, dict[str, Any] | None, BaseException | None]:
+      try:
+        cache_dict = await loop.run_in_executor(
+          pool,
+          _simulate_cached_protocol,
+          job.cached.bytecode,  # type: ignore[union-attr]
+          _cached_protocol_key(job.cached),  # type: ignore[arg-type]
+          job.protocol_model.fqn,
+          job.parameter_types,
+        )
+      except Exception as e:
+        return job, None, e
+      return job, cache_dict, None
+
+    for next_done in asyncio.as_completed([_run(job) for job in jobs]):
+      job, cache_dict, error = await next_done
+      if isinstance(error, BrokenProcessPool):
+        unfinished.append(job)
+      elif error is not None or cache_dict is None:
+        logger.error(
+          "Simulation failed for protocol %s: %s",
+          job.protocol_model.fqn,
+          error,
+        )
+        await record(job, None)
+      else:
+        await record(job, ProtocolSimulationResult.from_cache_dict(cache_dict))
+
+    if unfinished and self._pool is pool:
+      # A broken pool cannot run anything again; the next batch starts a new one.
+      self._pool = None
+      pool.shutdown(wait=False, cancel_futures=True)  # type: ignore[union-attr]
+    if unfinished:
+      logger.warning(
+        "Simulation worker pool stopped; simulating %d protocol(s) in-process",
+        len(unfinished),
+      )
+    return unfinished
 
   def _get_protocol_function(
     self,
@@ -295,7 +710,30 @@ class SimulationService:
         protocol_func: Optional protocol function for bytecode caching.
 
     """
-    # Update ORM fields
+    self._apply_results(protocol_model, result)
+
+    # Cache bytecode if enabled and function available
+    if protocol_func and self._enable_bytecode_cache:
+      await self._cache_bytecode(protocol_model, protocol_func)
+
+    # Save to database
+    session.add(protocol_model)
+    await session.commit()
+
+  def _apply_results(
+    self,
+    protocol_model: FunctionProtocolDefinition,
+    result: ProtocolSimulationResult,
+    cached: CachedProtocol | None = None,
+  ) -> None:
+    """Copy a simulation result (and optional bytecode) onto the ORM object.
+
+    Args:
+        protocol_model: Protocol definition ORM object.
+        result: Simulation result to cache.
+        cached: Bytecode produced while preparing the simulation, if any.
+
+    """
     protocol_model.simulation_result_json = result.to_cache_dict()
     protocol_model.inferred_requirements_json = [
       req.model_dump(mode="json") for req in result.inferred_requirements
@@ -306,13 +744,12 @@ class SimulationService:
     protocol_model.simulation_version = SIMULATION_VERSION
     protocol_model.simulation_cached_at = datetime.now(timezone.utc)
 
-    # Cache bytecode if enabled and function available
-    if protocol_func and self._enable_bytecode_cache:
-      await self._cache_bytecode(protocol_model, protocol_func)
-
-    # Save to database
-    session.add(protocol_model)
-    await session.commit()
+    if cached is not None:
+      self.invalidate_loaded_protocols(protocol_model.fqn)
+      protocol_model.cached_bytecode = cached.bytecode
+      protocol_model.bytecode_python_version = cached.python_version
+      protocol_model.bytecode_cache_version = cached.cache_version
+      protocol_model.bytecode_cached_at = cached.created_at
 
   async def _cache_bytecode(
     self,
@@ -340,6 +777,7 @@ class SimulationService:
       cached = self._protocol_cache.cache_protocol(protocol_func, source_code)
 
       # Update ORM fields
+      self.invalidate_loaded_protocols(protocol_model.fqn)
       protocol_model.cached_bytecode = cached.bytecode
       protocol_model.bytecode_python_version = cached.python_version
       protocol_model.bytecode_cache_version = cached.cache_version
@@ -394,8 +832,11 @@ class SimulationService:
     """Get protocol function from cache or import.
 
     This method provides a unified way to get protocol functions:
-    1. First tries to load from bytecode cache (if enabled and valid)
-    2. Falls back to importing from module
+    1. With ``prefer_cache``, load the bytecode cache first (if enabled and
+       valid) and import the module if that fails.
+    2. Otherwise import the module first and fall back to the bytecode cache,
+       e.g. when the module is no longer importable. Simulation uses this order
+       so it always sees the current source.
 
     Args:
         protocol_model: Protocol definition ORM object.
@@ -405,15 +846,44 @@ class SimulationService:
         The protocol function or None if not found.
 
     """
-    # Try cache first if enabled and preferred
-    if prefer_cache and self._protocol_cache and protocol_model.cached_bytecode:
+    use_cache = bool(self._protocol_cache and protocol_model.cached_bytecode)
+    if prefer_cache and use_cache:
       func = self._load_from_cache(protocol_model)
       if func is not None:
         return func
       # If cache load failed, fall through to import
 
-    # Fall back to import
-    return self._get_protocol_function(protocol_model)
+    func = self._get_protocol_function(protocol_model)
+    if func is None and use_cache and not prefer_cache:
+      func = self._load_from_cache(protocol_model)
+    return func
+
+  @staticmethod
+  def _loaded_protocol_key(protocol_model: FunctionProtocolDefinition) -> LoadedProtocolKey:
+    """Key identifying one version of a protocol's cached bytecode."""
+    source_hash = protocol_model.source_hash
+    if not source_hash:
+      source_hash = hashlib.sha256(protocol_model.cached_bytecode).hexdigest()
+    return (
+      source_hash,
+      protocol_model.bytecode_cache_version or "",
+      protocol_model.bytecode_python_version or "",
+    )
+
+  def invalidate_loaded_protocols(self, fqn: str | None = None) -> int:
+    """Drop deserialized protocol callables.
+
+    Called when a protocol is re-synced so its next load reads the new
+    bytecode.
+
+    Args:
+        fqn: Only drop entries of this protocol. Drops everything if None.
+
+    Returns:
+        Number of entries removed.
+
+    """
+    return self._loaded_protocols.invalidate(fqn)
 
   def _load_from_cache(
     self,
@@ -421,7 +891,8 @@ class SimulationService:
   ) -> Callable[..., Any] | None:
     """Load protocol function from bytecode cache.
 
-    Performs early validation and returns clear error messages.
+    Deserialized callables are kept in the service's `LoadedProtocolCache`,
+    keyed by `(source_hash, cache_version, python_version)`.
 
     Args:
         protocol_model: Protocol definition ORM object.
@@ -433,6 +904,30 @@ class SimulationService:
     if not self._protocol_cache or not protocol_model.cached_bytecode:
       return None
 
+    return self._loaded_protocols.get_or_load(
+      self._loaded_protocol_key(protocol_model),
+      protocol_model.fqn,
+      lambda: self._deserialize_cached_protocol(protocol_model),
+    )
+
+  def _deserialize_cached_protocol(
+    self,
+    protocol_model: FunctionProtocolDefinition,
+  ) -> Callable[..., Any] | None:
+    """Validate and deserialize a protocol's cached bytecode.
+
+    Performs early validation and returns clear error messages.
+
+    Args:
+        protocol_model: Protocol definition ORM object.
+
+    Returns:
+        The deserialized function or None if loading failed.
+
+    """
+    if not self._protocol_cache:
+      return None
+
     try:
       # Validate cache first (catches Python version mismatches early)
       validation = self._protocol_cache.validate_cache(
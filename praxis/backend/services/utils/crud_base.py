@@ -77,6 +77,14 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
 
   async def create(self, db: AsyncSession, *, obj_in: CreateSchemaType) -> ModelType:
     """Create a new object."""
+    db_obj = self._build_db_obj(obj_in)
+    db.add(db_obj)
+    await db.flush()
+    await db.refresh(db_obj)
+    return db_obj
+
+  def _build_db_obj(self, obj_in: CreateSchemaType) -> ModelType:
+    """Build an (unsaved) ORM object from a create schema."""
     # Check if the model supports SQLModel-style validation
     if hasattr(self.model, "model_validate"):
       # SQLModel / Pydantic v2 style
@@ -120,9 +128,6 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
 
       db_obj = self.model(**filtered_data)
 
-    db.add(db_obj)
-    await db.flush()
-    await db.refresh(db_obj)
     return db_obj
 
   async def update(
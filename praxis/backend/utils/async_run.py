@@ -3,12 +3,21 @@
 Provides `run_sync(coro)` which runs the coroutine using `asyncio.run` when
 no event loop is running, and falls back to running the coroutine in a
 separate thread with its own event loop when a loop is already running.
+
+For long-lived sync hosts (e.g. Celery worker processes) that repeatedly call
+into async code, `BackgroundEventLoop` keeps a single loop running on a
+dedicated thread so loop-bound resources such as connection pools survive
+between calls.
 """
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import threading
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+  import collections.abc
 
 
 def run_sync(coro: collections.abc.Coroutine[Any, Any, Any]) -> Any:
@@ -34,10 +43,8 @@ def run_sync(coro: collections.abc.Coroutine[Any, Any, Any]) -> Any:
       asyncio.set_event_loop(loop)
       return loop.run_until_complete(coro)
     finally:
-      try:
+      with contextlib.suppress(Exception):
         asyncio.set_event_loop(None)
-      except Exception:
-        pass
       loop.close()
 
   # There is a running event loop in this thread; run the coroutine
@@ -50,13 +57,128 @@ def run_sync(coro: collections.abc.Coroutine[Any, Any, Any]) -> Any:
       asyncio.set_event_loop(loop)
       result["value"] = loop.run_until_complete(coro)
     finally:
-      try:
+      with contextlib.suppress(Exception):
         asyncio.set_event_loop(None)
-      except Exception:
-        pass
       loop.close()
 
   thread = threading.Thread(target=_runner)
   thread.start()
   thread.join()
   return result.get("value")
+
+
+class BackgroundEventLoop:
+  """An event loop that runs forever on a dedicated daemon thread.
+
+  Coroutines submitted through `run` execute on the same loop for the lifetime
+  of the object, so anything bound to the loop (asyncpg/aiosqlite pools, Redis
+  connections, asyncio primitives) can be created once and reused.
+  """
+
+  def __init__(self, name: str = "praxis-event-loop") -> None:
+    """Initialize the background loop without starting it.
+
+    Args:
+      name: Name given to the thread that runs the loop.
+
+    """
+    self._name = name
+    self._loop: asyncio.AbstractEventLoop | None = None
+    self._thread: threading.Thread | None = None
+    self._started = threading.Event()
+
+  @property
+  def loop(self) -> asyncio.AbstractEventLoop:
+    """The underlying event loop.
+
+    Raises:
+      RuntimeError: If the loop has not been started.
+
+    """
+    if self._loop is None:
+      msg = "BackgroundEventLoop has not been started."
+      raise RuntimeError(msg)
+    return self._loop
+
+  @property
+  def is_running(self) -> bool:
+    """Whether the loop thread is alive and the loop is running."""
+    return (
+      self._thread is not None
+      and self._thread.is_alive()
+      and self._loop is not None
+      and self._loop.is_running()
+    )
+
+  def start(self) -> None:
+    """Start the loop thread. Calling `start` on a running loop is a no-op."""
+    if self.is_running:
+      return
+    self._started.clear()
+    self._loop = asyncio.new_event_loop()
+    self._thread = threading.Thread(target=self._run_forever, name=self._name, daemon=True)
+    self._thread.start()
+    self._started.wait()
+
+  def _run_forever(self) -> None:
+    loop = self.loop
+    asyncio.set_event_loop(loop)
+    loop.call_soon(self._started.set)
+    try:
+      loop.run_forever()
+    finally:
+      asyncio.set_event_loop(None)
+
+  def run(
+    self,
+    coro: collections.abc.Coroutine[Any, Any, Any],
+    timeout: float | None = None,
+  ) -> Any:
+    """Run a coroutine on the background loop and block until it completes.
+
+    Args:
+      coro: The coroutine to run.
+      timeout: Optional number of seconds to wait for the result.
+
+    Returns:
+      The coroutine's return value.
+
+    Raises:
+      RuntimeError: If called from the loop's own thread, which would deadlock.
+
+    """
+    if self._thread is threading.current_thread():
+      coro.close()
+      msg = "BackgroundEventLoop.run cannot be called from the loop's own thread."
+      raise RuntimeError(msg)
+    future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+    return future.result(timeout)
+
+  def stop(self, timeout: float = 5.0) -> None:
+    """Cancel outstanding tasks, stop the loop and join its thread.
+
+    Args:
+      timeout: Maximum number of seconds to wait for the thread to exit.
+
+    """
+    if self._loop is None or self._thread is None:
+      return
+    loop = self._loop
+    if loop.is_running():
+
+      async def _cancel_pending() -> None:
+        current = asyncio.current_task()
+        pending = [t for t in asyncio.all_tasks() if t is not current]
+        for task in pending:
+          task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        await loop.shutdown_asyncgens()
+
+      with contextlib.suppress(Exception):
+        asyncio.run_coroutine_threadsafe(_cancel_pending(), loop).result(timeout)
+      loop.call_soon_threadsafe(loop.stop)
+    self._thread.join(timeout)
+    if not loop.is_running():
+      loop.close()
+    self._loop = None
+    self._thread = None
@@ -1,20 +1,262 @@
-"""Logging utilities and decorators for error handling in PyLabPraxis."""
+"""Logging utilities and decorators for error handling in PyLabPraxis.
 
+Once `configure_logging` has run, records are not formatted or written on the
+thread that logs them. A single `QueueHandler` on the root logger hands them to
+a `QueueListener` thread, which formats them as text or JSON and writes them to
+stderr and, if configured, to the log file. Records are stamped with the active
+protocol run and function call before they are queued. Until then nothing is
+started and records follow the standard library defaults. A forked child (e.g. a
+Celery prefork worker) gets its own writer thread with the parent's handlers.
+"""
+
+import atexit
+import copy
+import json
 import logging
+import os
+import queue
+import sys
+import threading
+import time
 import traceback
 from collections.abc import Callable
+from datetime import UTC, datetime
 from functools import wraps
+from logging.handlers import QueueHandler, QueueListener
+from pathlib import Path
 from typing import Any
 
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+CONTEXT_FIELDS: tuple[str, ...] = ("run_accession_id", "call_log_accession_id", "suppressed")
+"""Record attributes carried into structured (JSON) output when set."""
+
+# Module defining the run context var; read lazily so logging never imports core.
+_RUN_CONTEXT_MODULE = "praxis.backend.core.decorators.models"
+
+
+class RunContextFilter(logging.Filter):
+  """Stamp records with the protocol run and function call active when logged."""
+
+  def filter(self, record: logging.LogRecord) -> bool:
+    """Attach `run_accession_id` and `call_log_accession_id` to the record."""
+    context_var = getattr(sys.modules.get(_RUN_CONTEXT_MODULE), "praxis_run_context_cv", None)
+    context = context_var.get(None) if context_var is not None else None
+    call_log_accession_id = context.current_call_log_db_accession_id if context else None
+    record.run_accession_id = str(context.run_accession_id) if context else None
+    record.call_log_accession_id = str(call_log_accession_id) if call_log_accession_id else None
+    return True
+
+
+class RateLimitFilter(logging.Filter):
+  """Token bucket limiting how many records per second a logger emits.
+
+  Records at ERROR and above always pass. The first record let through after
+  others were dropped carries their count as ``suppressed``.
+  """
+
+  def __init__(self, rate: float, burst: int | None = None) -> None:
+    """Initialize the filter.
+
+    Args:
+        rate: Records allowed per second on average.
+        burst: Records allowed back to back. Defaults to ``rate``, at least 1.
+
+    """
+    super().__init__()
+    self.rate = rate
+    self.burst = burst if burst is not None else max(1, int(rate))
+    self._tokens = float(self.burst)
+    self._last = time.monotonic()
+    self._suppressed = 0
+    self._lock = threading.Lock()
+
+  def filter(self, record: logging.LogRecord) -> bool:
+    """Return whether the record fits in the current budget."""
+    if record.levelno >= logging.ERROR:
+      return True
+    with self._lock:
+      now = time.monotonic()
+      self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+      self._last = now
+      if self._tokens < 1:
+        self._suppressed += 1
+        return False
+      self._tokens -= 1
+      suppressed, self._suppressed = self._suppressed, 0
+    if suppressed:
+      record.suppressed = suppressed
+    return True
+
+
+class TextFormatter(logging.Formatter):
+  """`LOG_FORMAT` lines, noting records dropped by rate limiting."""
+
+  def __init__(self) -> None:
+    """Initialize with `LOG_FORMAT`."""
+    super().__init__(LOG_FORMAT)
+
+  def format(self, record: logging.LogRecord) -> str:
+    """Format the record, appending the suppressed count if any."""
+    line = super().format(record)
+    suppressed = getattr(record, "suppressed", None)
+    return f"{line} ({suppressed} records suppressed)" if suppressed else line
+
+
+class JsonFormatter(logging.Formatter):
+  """One JSON object per record, including run context fields when set."""
+
+  def format(self, record: logging.LogRecord) -> str:
+    """Serialize the record to a JSON line."""
+    entry: dict[str, Any] = {
+      "timestamp": datetime.fromtimestamp(record.created, tz=UTC).isoformat(),
+      "level": record.levelname,
+      "logger": record.name,
+      "message": record.getMessage(),
+    }
+    for field in CONTEXT_FIELDS:
+      value = getattr(record, field, None)
+      if value is not None:
+        entry[field] = value
+    if record.exc_info and not record.exc_text:
+      record.exc_text = self.formatException(record.exc_info)
+    if record.exc_text:
+      entry["exception"] = record.exc_text
+    if record.stack_info:
+      entry["stack"] = self.formatStack(record.stack_info)
+    return json.dumps(entry, default=str)
+
+
+class _ContextQueueHandler(QueueHandler):
+  """Queue handler that renders only what cannot wait for the listener.
+
+  The message and traceback are rendered here, since arguments may change and
+  tracebacks hold frames; everything else is left to the listener's formatter.
+  """
+
+  _exception_formatter = logging.Formatter()
+
+  def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+    record = copy.copy(record)
+    record.message = record.getMessage()
+    record.msg = record.message
+    record.args = None
+    if record.exc_info:
+      record.exc_text = record.exc_text or self._exception_formatter.formatException(
+        record.exc_info,
+      )
+      record.exc_info = None
+    return record
+
+
+class _StderrHandler(logging.StreamHandler):
+  """Stream handler writing to whatever `sys.stderr` is when a record is emitted."""
 
-def get_logger(name):  # TODO: change to use built-in logging.getLogger and config
-  """Create and return a configured logger with stream handler."""
+  def __init__(self) -> None:
+    logging.Handler.__init__(self)
+
+  @property
+  def stream(self) -> Any:  # type: ignore[override]
+    return sys.stderr
+
+
+_LOG_QUEUE: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_QUEUE_HANDLER = _ContextQueueHandler(_LOG_QUEUE)
+_QUEUE_HANDLER.addFilter(RunContextFilter())
+_listener: QueueListener | None = None
+_listener_lock = threading.Lock()
+
+
+def _start_listener(*handlers: logging.Handler) -> None:
+  global _listener
+  with _listener_lock:
+    if _listener is not None:
+      _listener.stop()
+    _listener = QueueListener(_LOG_QUEUE, *handlers, respect_handler_level=True)
+    _listener.start()
+    root = logging.getLogger()
+    if _QUEUE_HANDLER not in root.handlers:
+      root.addHandler(_QUEUE_HANDLER)
+
+
+def configure_logging(
+  *,
+  level: int | str = logging.INFO,
+  log_file: str | None = None,
+  json_format: bool = False,
+) -> None:
+  """Start or reconfigure the background log writer.
+
+  Replaces the listener's handlers with stderr and, if given, ``log_file``, both
+  using the text or JSON format. Records already queued are written by the
+  previous handlers first.
+
+  Args:
+      level: Level of the root logger.
+      log_file: File to append records to, in addition to stderr. Missing
+          parent directories are created.
+      json_format: Write structured JSON lines instead of `LOG_FORMAT` text.
+
+  """
+  formatter: logging.Formatter = JsonFormatter() if json_format else TextFormatter()
+  handlers: list[logging.Handler] = [_StderrHandler()]
+  if log_file:
+    Path(log_file).parent.mkdir(parents=True, exist_ok=True)
+    handlers.append(logging.FileHandler(log_file))
+  for handler in handlers:
+    handler.setFormatter(formatter)
+  logging.getLogger().setLevel(level)
+  _start_listener(*handlers)
+
+
+def _restart_listener_after_fork() -> None:
+  """Give a forked child its own queue and writer; the parent's thread does not survive."""
+  global _LOG_QUEUE, _listener, _listener_lock
+  _listener_lock = threading.Lock()
+  _LOG_QUEUE = queue.SimpleQueue()
+  _QUEUE_HANDLER.queue = _LOG_QUEUE
+  if _listener is not None:
+    handlers = _listener.handlers
+    _listener = None
+    _start_listener(*handlers)
+
+
+os.register_at_fork(after_in_child=_restart_listener_after_fork)
+
+
+def shutdown_logging() -> None:
+  """Write out every queued record and stop the background writer."""
+  global _listener
+  with _listener_lock:
+    if _listener is not None:
+      _listener.stop()
+      _listener = None
+
+
+atexit.register(shutdown_logging)
+
+
+def get_logger(name: str, *, rate_limit: float | None = None) -> logging.Logger:
+  """Return the named logger, with records routed to the background writer.
+
+  Calling this repeatedly for one name returns the same logger and adds no
+  handlers or level; records propagate to the root logger, which
+  `configure_logging` sets up.
+
+  Args:
+      name: Logger name, usually ``__name__``.
+      rate_limit: If set, limit the logger to this many records per second
+          (see `RateLimitFilter`), replacing any earlier limit.
+
+  Returns:
+      The configured logger.
+
+  """
   logger = logging.getLogger(name)
-  logger.setLevel(logging.DEBUG)
-  formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-  ch = logging.StreamHandler()
-  ch.setFormatter(formatter)
-  logger.addHandler(ch)
+  if rate_limit is not None:
+    for existing in [f for f in logger.filters if isinstance(f, RateLimitFilter)]:
+      logger.removeFilter(existing)
+    logger.addFilter(RateLimitFilter(rate_limit))
   return logger
 
 
@@ -1,5 +1,10 @@
 """PyLabRobot inspection utilities."""
 
+from .catalog import (
+  ClassCatalog,
+  get_class_catalog,
+  reset_class_catalog,
+)
 from .docs import (
   get_capabilities,
   get_deck_details,
@@ -36,6 +41,9 @@ from .validation import (
 )
 
 __all__ = [
+  "ClassCatalog",
+  "get_class_catalog",
+  "reset_class_catalog",
   "get_capabilities",
   "get_deck_details",
   "discover_deck_classes",
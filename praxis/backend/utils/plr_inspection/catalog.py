@@ -0,0 +1,371 @@
+"""Process-wide catalog of the classes defined in PyLabRobot.
+
+Walking ``pylabrobot`` with :func:`pkgutil.walk_packages` imports every
+submodule, which takes on the order of a second. The runtime helpers used to do
+that once per call, so a single discovery pass re-imported and re-inspected the
+library many times. :class:`ClassCatalog` walks the package once, records every
+class it finds (module, MRO, whether it is abstract) and indexes them by base
+class, so category queries become dictionary lookups.
+
+The records are persisted as a JSON manifest keyed by the installed PyLabRobot
+version and the modification times of its source files. A later process with
+an unchanged installation answers queries from the manifest and only imports
+the modules that define the classes it returns.
+
+Usage:
+    catalog = get_class_catalog()
+    carriers = catalog.classes(Carrier, modules="pylabrobot.resources", concrete_only=True)
+    decks = catalog.category("deck")
+
+"""
+
+import hashlib
+import importlib
+import importlib.metadata
+import importlib.util
+import inspect
+import json
+import logging
+import os
+import pkgutil
+import threading
+import warnings
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+CATALOG_ROOT = "pylabrobot"
+MANIFEST_FORMAT = 1
+
+CATEGORY_BASES: dict[str, str] = {
+  "resource": "pylabrobot.resources.resource.Resource",
+  "resource_holder": "pylabrobot.resources.resource_holder.ResourceHolder",
+  "carrier": "pylabrobot.resources.carrier.Carrier",
+  "plate_carrier": "pylabrobot.resources.carrier.PlateCarrier",
+  "tip_carrier": "pylabrobot.resources.carrier.TipCarrier",
+  "trough_carrier": "pylabrobot.resources.carrier.TroughCarrier",
+  "deck": "pylabrobot.resources.deck.Deck",
+  "machine": "pylabrobot.machines.machine.Machine",
+  "liquid_handler": "pylabrobot.liquid_handling.liquid_handler.LiquidHandler",
+  "liquid_handler_backend": "pylabrobot.liquid_handling.backends.backend.LiquidHandlerBackend",
+}
+"""Category names mapped to the fully qualified name of their base class."""
+
+
+def _fqn(klass: type[Any]) -> str:
+  return f"{klass.__module__}.{klass.__name__}"
+
+
+def _is_test_module(module_name: str) -> bool:
+  # PLR ships its tests inside the package; importing them needs pytest and
+  # optional device SDKs, and they define nothing worth cataloguing.
+  leaf = module_name.rsplit(".", 1)[-1]
+  return leaf == "tests" or leaf.endswith("_tests")
+
+
+@dataclass
+class ClassRecord:
+  """What the catalog knows about one class without importing it."""
+
+  fqn: str
+  module: str
+  qualname: str
+  abstract: bool
+  bases: list[str] = field(default_factory=list)
+  """Fully qualified names of every class in the MRO, including this one."""
+
+
+class ClassCatalog:
+  """Every class defined under a package, indexed by base class.
+
+  Build one with :meth:`load`, which reuses a persisted manifest when the
+  package is unchanged; :func:`get_class_catalog` keeps one per process.
+
+  """
+
+  def __init__(
+    self,
+    records: list[ClassRecord],
+    *,
+    root: str = CATALOG_ROOT,
+    fingerprint: str = "",
+  ) -> None:
+    """Initialize the catalog from class records.
+
+    Args:
+      records: The classes in the catalog.
+      root: The package the records were collected from.
+      fingerprint: Identifies the package installation the records describe.
+
+    """
+    self.root = root
+    self.fingerprint = fingerprint
+    self._records = {record.fqn: record for record in records}
+    self._by_base: dict[str, list[str]] = {}
+    for record in self._records.values():
+      for base in record.bases:
+        self._by_base.setdefault(base, []).append(record.fqn)
+    self._resolved: dict[str, type[Any]] = {}
+
+  def __len__(self) -> int:
+    """Return the number of classes in the catalog."""
+    return len(self._records)
+
+  def covers(self, module_name: str) -> bool:
+    """Return True if classes under `module_name` are part of this catalog."""
+    return module_name == self.root or module_name.startswith(self.root + ".")
+
+  def records(
+    self,
+    parent_fqn: str | None = None,
+    *,
+    modules: str | list[str] | None = None,
+    concrete_only: bool = False,
+  ) -> list[ClassRecord]:
+    """Return the records matching a query, without importing anything.
+
+    Args:
+      parent_fqn: Only classes with this base class (or the class itself).
+      modules: Only classes whose module name starts with one of these.
+      concrete_only: If True, skip abstract classes.
+
+    Returns:
+      The matching class records.
+
+    """
+    if parent_fqn is None:
+      fqns: list[str] = list(self._records)
+    else:
+      fqns = self._by_base.get(parent_fqn, [])
+    prefixes = tuple([modules] if isinstance(modules, str) else modules or ())
+    matches = []
+    for fqn in fqns:
+      record = self._records[fqn]
+      if concrete_only and record.abstract:
+        continue
+      if prefixes and not record.module.startswith(prefixes):
+        continue
+      matches.append(record)
+    return matches
+
+  def classes(
+    self,
+    parent_class: type[Any] | None = None,
+    *,
+    modules: str | list[str] | None = None,
+    concrete_only: bool = False,
+  ) -> dict[str, type[Any]]:
+    """Return the matching classes, importing only the modules that define them.
+
+    Args:
+      parent_class: Only subclasses of this class (including itself).
+      modules: Only classes whose module name starts with one of these.
+      concrete_only: If True, skip abstract classes.
+
+    Returns:
+      A dictionary of fully qualified class names to class objects.
+
+    """
+    parent_fqn = _fqn(parent_class) if parent_class is not None else None
+    found: dict[str, type[Any]] = {}
+    for record in self.records(parent_fqn, modules=modules, concrete_only=concrete_only):
+      klass = self.resolve(record)
+      if klass is None:
+        continue
+      if parent_class is not None and not issubclass(klass, parent_class):
+        continue
+      found[record.fqn] = klass
+    return found
+
+  def category(
+    self,
+    name: str,
+    *,
+    modules: str | list[str] | None = None,
+    concrete_only: bool = False,
+  ) -> dict[str, type[Any]]:
+    """Return the classes in a named category (see `CATEGORY_BASES`).
+
+    Raises:
+      KeyError: If the category is unknown.
+
+    """
+    parent_fqn = CATEGORY_BASES[name]
+    found: dict[str, type[Any]] = {}
+    for record in self.records(parent_fqn, modules=modules, concrete_only=concrete_only):
+      klass = self.resolve(record)
+      if klass is not None:
+        found[record.fqn] = klass
+    return found
+
+  def resolve(self, record: ClassRecord) -> type[Any] | None:
+    """Import the class a record describes, or return None if that fails."""
+    klass = self._resolved.get(record.fqn)
+    if klass is not None:
+      return klass
+    try:
+      obj: Any = importlib.import_module(record.module)
+      for part in record.qualname.split("."):
+        obj = getattr(obj, part)
+    except Exception as e:
+      logger.debug("Could not resolve catalogued class %s: %s", record.fqn, e)
+      return None
+    if not inspect.isclass(obj):
+      return None
+    self._resolved[record.fqn] = obj
+    return obj
+
+  # --- Building and persistence ---
+
+  @classmethod
+  def build(cls, root: str = CATALOG_ROOT, *, fingerprint: str = "") -> "ClassCatalog":
+    """Import every module under `root` once and record the classes defined there."""
+    seen: dict[str, type[Any]] = {}
+    try:
+      package = importlib.import_module(root)
+    except ImportError as e:
+      logger.warning("Could not import module %s: %s", root, e)
+      return cls([], root=root, fingerprint=fingerprint)
+
+    modules = [package]
+    if hasattr(package, "__path__"):
+      for _, module_name, _ in pkgutil.walk_packages(
+        package.__path__,
+        root + ".",
+        onerror=lambda name: logger.debug("Could not walk package %s.", name),
+      ):
+        if _is_test_module(module_name):
+          continue
+        try:
+          with warnings.catch_warnings():
+            warnings.simplefilter("ignore", DeprecationWarning)
+            modules.append(importlib.import_module(module_name))
+        except ImportError as e:
+          logger.warning("Could not import module %s: %s", module_name, e)
+        except Exception as e:
+          logger.exception("Error processing module %s: %s", module_name, e)
+
+    prefix = root + "."
+    for module in modules:
+      for _, obj in inspect.getmembers(module, inspect.isclass):
+        if obj.__module__ == root or obj.__module__.startswith(prefix):
+          seen.setdefault(_fqn(obj), obj)
+
+    records = [
+      ClassRecord(
+        fqn=fqn,
+        module=klass.__module__,
+        qualname=klass.__qualname__,
+        abstract=inspect.isabstract(klass),
+        bases=[_fqn(base) for base in inspect.getmro(klass)],
+      )
+      for fqn, klass in seen.items()
+    ]
+    catalog = cls(records, root=root, fingerprint=fingerprint)
+    catalog._resolved.update(seen)
+    logger.info("Catalogued %d classes from %d %s modules.", len(records), len(modules), root)
+    return catalog
+
+  @classmethod
+  def load(cls, root: str = CATALOG_ROOT, cache_dir: Path | None = None) -> "ClassCatalog":
+    """Return the catalog for `root`, from its manifest when still valid.
+
+    Args:
+      root: The package to catalogue.
+      cache_dir: Where manifests are kept. Defaults to ~/.cache/praxis/plr_catalog.
+
+    Returns:
+      The class catalog.
+
+    """
+    cache_dir = cache_dir or Path.home() / ".cache" / "praxis" / "plr_catalog"
+    fingerprint = package_fingerprint(root)
+    manifest = cache_dir / f"{root}.json"
+
+    if fingerprint and manifest.exists():
+      try:
+        data = json.loads(manifest.read_text())
+        if data.get("format") == MANIFEST_FORMAT and data.get("fingerprint") == fingerprint:
+          records = [ClassRecord(**record) for record in data["classes"]]
+          return cls(records, root=root, fingerprint=fingerprint)
+      except (OSError, json.JSONDecodeError, KeyError, TypeError) as e:
+        logger.debug("Catalog manifest read error for %s: %s", manifest, e)
+
+    catalog = cls.build(root, fingerprint=fingerprint)
+    if fingerprint:
+      catalog.save(manifest)
+    return catalog
+
+  def save(self, manifest: Path) -> None:
+    """Write the catalog to a manifest file."""
+    data = {
+      "format": MANIFEST_FORMAT,
+      "root": self.root,
+      "fingerprint": self.fingerprint,
+      "classes": [asdict(record) for record in self._records.values()],
+    }
+    try:
+      manifest.parent.mkdir(parents=True, exist_ok=True)
+      tmp = manifest.with_suffix(f".{os.getpid()}.tmp")
+      tmp.write_text(json.dumps(data))
+      tmp.replace(manifest)
+    except OSError as e:
+      logger.debug("Catalog manifest write error for %s: %s", manifest, e)
+
+
+def package_fingerprint(root: str = CATALOG_ROOT) -> str:
+  """Identify an installed package by its version and source modification times.
+
+  Finds the package without importing it. Returns an empty string when the
+  package cannot be located, which disables manifest reuse.
+
+  """
+  try:
+    spec = importlib.util.find_spec(root)
+  except (ImportError, ValueError):
+    return ""
+  if spec is None:
+    return ""
+  try:
+    version = importlib.metadata.version(root)
+  except importlib.metadata.PackageNotFoundError:
+    version = "unknown"
+
+  digest = hashlib.md5(version.encode(), usedforsecurity=False)
+  locations = spec.submodule_search_locations or ([spec.origin] if spec.origin else [])
+  for location in sorted(locations):
+    for dirpath, dirnames, filenames in os.walk(location):
+      dirnames.sort()
+      for filename in sorted(filenames):
+        if not filename.endswith(".py"):
+          continue
+        path = Path(dirpath, filename)
+        try:
+          mtime = path.stat().st_mtime_ns
+        except OSError:
+          continue
+        digest.update(f"{path.relative_to(location).as_posix()}:{mtime}".encode())
+  return f"{version}-{digest.hexdigest()}"
+
+
+_catalog: ClassCatalog | None = None
+_catalog_lock = threading.Lock()
+
+
+def get_class_catalog() -> ClassCatalog:
+  """Return the process-wide PyLabRobot class catalog, building it on first use."""
+  global _catalog
+  if _catalog is None:
+    with _catalog_lock:
+      if _catalog is None:
+        _catalog = ClassCatalog.load()
+  return _catalog
+
+
+def reset_class_catalog() -> None:
+  """Forget the process-wide catalog, e.g. after PyLabRobot was upgraded in place."""
+  global _catalog
+  with _catalog_lock:
+    _catalog = None
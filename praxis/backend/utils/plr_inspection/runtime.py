@@ -34,6 +34,8 @@ from pylabrobot.resources.carrier import (
 )
 from pylabrobot.resources.trough import Trough
 
+from .catalog import get_class_catalog
+
 logger = logging.getLogger(__name__)
 
 
@@ -174,6 +176,9 @@ def get_all_classes(
 ) -> dict[str, type[Any]]:
   """Get all PyLabRobot classes from base module(s) and their submodules.
 
+  Modules under ``pylabrobot`` are answered from the process-wide class catalog
+  (see :mod:`.catalog`), so repeated calls do not walk the library again.
+
   Args:
     base_module_names: A single module name or a list of names to start discovery.
     parent_class: The parent class to filter by. If None, all classes are returned.
@@ -183,10 +188,19 @@ def get_all_classes(
     A dictionary of fully qualified class names to class objects.
 
   """
+  module_list = [base_module_names] if isinstance(base_module_names, str) else base_module_names
+  catalog = get_class_catalog()
+  catalogued = [name for name in module_list if catalog.covers(name)]
   all_classes: dict[str, type[Any]] = {}
+  if catalogued:
+    all_classes.update(
+      catalog.classes(parent_class, modules=catalogued, concrete_only=concrete_only),
+    )
+  # Modules outside the catalog (not part of PyLabRobot) are still walked directly.
   visited_modules: set[str] = set()
-  module_list = [base_module_names] if isinstance(base_module_names, str) else base_module_names
   for base_module_name in module_list:
+    if base_module_name in catalogued:
+      continue
     all_classes.update(
       _discover_classes_in_module_recursive(
         base_module_name,
@@ -311,25 +325,8 @@ def discover_deck_classes(
   packages: str | list[str] = "pylabrobot.resources",
 ) -> dict[str, type[Deck]]:
   """Discover all non-abstract PLR Deck subclasses in the given Python package(s)."""
-  package_list = [packages] if isinstance(packages, str) else list(packages)
-  discovered_deck_classes: dict[str, type[Deck]] = {}
-  visited_modules: set[str] = set()
-  for package_name in package_list:
-    try:
-      deck_classes_in_pkg = _discover_classes_in_module_recursive(
-        package_name,
-        Deck,
-        concrete_only=True,
-        visited_modules=visited_modules,
-      )
-      for fqn, deck_class in deck_classes_in_pkg.items():
-        if issubclass(deck_class, Deck) and deck_class is not Deck:
-          discovered_deck_classes[fqn] = deck_class
-    except ImportError:
-      logger.warning("Package %s not found during deck discovery.", package_name)
-    except Exception as e:
-      logger.exception("Error discovering deck classes in package %s: %s", package_name, e)
-  return discovered_deck_classes
+  deck_classes = get_all_classes(packages, parent_class=Deck, concrete_only=True)
+  return {fqn: deck_class for fqn, deck_class in deck_classes.items() if deck_class is not Deck}
 
 
 def _get_accepted_categories_for_resource_holder(
@@ -521,18 +518,7 @@ def get_all_classes_with_inspection(
     A dictionary of fully qualified class names to class objects.
 
   """
-  all_classes: dict[str, type[Any]] = {}
-  visited_modules: set[str] = set()
-  module_list = [base_module_names] if isinstance(base_module_names, str) else base_module_names
-  for base_module_name in module_list:
-    all_classes.update(
-      _discover_classes_in_module_recursive(
-        base_module_name,
-        parent_class,
-        concrete_only,
-        visited_modules,
-      ),
-    )
+  all_classes = get_all_classes(base_module_names, parent_class, concrete_only)
 
   # --- Additional Inspection Logic ---
 
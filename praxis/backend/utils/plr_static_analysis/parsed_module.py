@@ -0,0 +1,172 @@
+"""Parse-once source artifacts shared by the LibCST visitors.
+
+Discovery used to call ``cst.parse_module`` and build a fresh
+``MetadataWrapper`` (which deep-copies the tree) in every consumer of a file,
+and then walk each protocol function again per extractor. A `ParsedModule`
+holds one parse of a file together with its metadata wrapper, so every visitor
+runs against the same tree and shares whatever metadata has been resolved.
+`MultiVisitor` drives several visitors through a single traversal.
+
+Usage:
+    parsed = ParsedModule.from_file(path)
+    parsed.visit(ClassDiscoveryVisitor(module, str(path)), ResourceFactoryVisitor(module, str(path)))
+    requirements = extract_requirements_from_source(parsed)
+
+"""
+
+import contextlib
+from collections.abc import Iterable
+from pathlib import Path
+
+import libcst as cst
+from libcst.metadata import MetadataWrapper
+
+
+class MultiVisitor(cst.CSTVisitor):
+  """Run several visitors in one traversal.
+
+  Each visitor sees exactly the callbacks it would see when visiting the tree
+  on its own: a visitor that returns False for a node skips that subtree while
+  the others carry on, and still gets ``on_leave`` for the node itself.
+
+  """
+
+  def __init__(self, visitors: Iterable[cst.CSTVisitor], *, isolate_errors: bool = False) -> None:
+    """Initialize the visitor.
+
+    Args:
+      visitors: The visitors to drive, called in this order for every node.
+      isolate_errors: If True, a visitor that raises is recorded in `failed`
+        and dropped for the rest of the traversal instead of aborting it.
+
+    """
+    self.visitors = list(visitors)
+    self.isolate_errors = isolate_errors
+    self.failed: dict[int, Exception] = {}
+    """Index of each visitor that raised, mapped to its exception."""
+    self._pruned_at: dict[int, cst.CSTNode] = {}
+
+  def has_failed(self, visitor: cst.CSTVisitor) -> bool:
+    """Return True if `visitor` raised during the traversal."""
+    return any(self.visitors[index] is visitor for index in self.failed)
+
+  def _active(self) -> Iterable[tuple[int, cst.CSTVisitor]]:
+    for index, visitor in enumerate(self.visitors):
+      if index not in self.failed and index not in self._pruned_at:
+        yield index, visitor
+
+  def _fail(self, index: int, error: Exception) -> None:
+    if not self.isolate_errors:
+      raise error
+    self.failed[index] = error
+    self._pruned_at.pop(index, None)
+
+  def on_visit(self, node: cst.CSTNode) -> bool:
+    """Dispatch to every visitor still descending; descend while any is."""
+    descend = False
+    for index, visitor in list(self._active()):
+      try:
+        if visitor.on_visit(node):
+          descend = True
+        else:
+          self._pruned_at[index] = node
+      except Exception as e:
+        self._fail(index, e)
+    return descend
+
+  def on_leave(self, original_node: cst.CSTNode) -> None:
+    """Dispatch to every visitor that visited this node."""
+    for index, visitor in enumerate(self.visitors):
+      if index in self.failed:
+        continue
+      pruned_at = self._pruned_at.get(index)
+      if pruned_at is not None:
+        if pruned_at is not original_node:
+          continue
+        del self._pruned_at[index]
+      try:
+        visitor.on_leave(original_node)
+      except Exception as e:
+        self._fail(index, e)
+
+  def on_visit_attribute(self, node: cst.CSTNode, attribute: str) -> None:
+    """Dispatch to every visitor still descending."""
+    for index, visitor in list(self._active()):
+      try:
+        visitor.on_visit_attribute(node, attribute)
+      except Exception as e:
+        self._fail(index, e)
+
+  def on_leave_attribute(self, original_node: cst.CSTNode, attribute: str) -> None:
+    """Dispatch to every visitor still descending."""
+    for index, visitor in list(self._active()):
+      try:
+        visitor.on_leave_attribute(original_node, attribute)
+      except Exception as e:
+        self._fail(index, e)
+
+
+class ParsedModule:
+  """One parse of a Python source file, shared by every visitor that needs it."""
+
+  def __init__(self, source: str, *, path: str | Path | None = None) -> None:
+    """Parse `source`.
+
+    Args:
+      source: The Python source code.
+      path: Where the source was read from, if anywhere.
+
+    Raises:
+      cst.ParserSyntaxError: If the source does not parse.
+
+    """
+    self.source = source
+    self.path = Path(path) if path is not None else None
+    self.tree = cst.parse_module(source)
+    self.visit_count = 0
+    """How many traversals have been run over the tree."""
+    self._wrapper: MetadataWrapper | None = None
+    self._functions: dict[str, cst.FunctionDef] | None = None
+
+  @classmethod
+  def from_file(cls, path: str | Path) -> "ParsedModule":
+    """Read and parse a source file.
+
+    Raises:
+      OSError: If the file cannot be read.
+      UnicodeDecodeError: If the file is not UTF-8.
+      cst.ParserSyntaxError: If the source does not parse.
+
+    """
+    return cls(Path(path).read_text(encoding="utf-8"), path=path)
+
+  @property
+  def wrapper(self) -> MetadataWrapper:
+    """The metadata wrapper over the tree; resolved metadata is cached on it."""
+    if self._wrapper is None:
+      # The visitors never modify the tree, so the defensive deep copy
+      # MetadataWrapper makes by default is not needed.
+      self._wrapper = MetadataWrapper(self.tree, unsafe_skip_copy=True)
+    return self._wrapper
+
+  def visit(self, *visitors: cst.CSTVisitor) -> None:
+    """Run the visitors over the module in a single traversal.
+
+    Each visitor gets the metadata it declares in ``METADATA_DEPENDENCIES``.
+
+    """
+    wrapper = self.wrapper
+    self.visit_count += 1
+    with contextlib.ExitStack() as stack:
+      for visitor in visitors:
+        stack.enter_context(visitor.resolve(wrapper))
+      wrapper.module.visit(visitors[0] if len(visitors) == 1 else MultiVisitor(visitors))
+
+  def function(self, name: str) -> cst.FunctionDef | None:
+    """Return the top-level function called `name`, if there is one."""
+    if self._functions is None:
+      self._functions = {}
+      for stmt in self.tree.body:
+        if isinstance(stmt, cst.FunctionDef):
+          self._functions.setdefault(stmt.name.value, stmt)
+    return self._functions.get(name)
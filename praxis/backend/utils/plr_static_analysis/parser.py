@@ -4,7 +4,6 @@ import logging
 from pathlib import Path
 
 import libcst as cst
-from libcst.metadata import MetadataWrapper
 
 from praxis.backend.utils.plr_static_analysis.cache import ParseCache
 from praxis.backend.utils.plr_static_analysis.connection_config_templates import (
@@ -21,6 +20,7 @@ from praxis.backend.utils.plr_static_analysis.models import (
   DiscoveredClass,
   PLRClassType,
 )
+from praxis.backend.utils.plr_static_analysis.parsed_module import ParsedModule
 from praxis.backend.utils.plr_static_analysis.visitors.capability_extractor import (
   CapabilityExtractorVisitor,
 )
@@ -28,6 +28,9 @@ from praxis.backend.utils.plr_static_analysis.visitors.class_discovery import (
   EXCLUDED_BASE_CLASS_NAMES,
   ClassDiscoveryVisitor,
 )
+from praxis.backend.utils.plr_static_analysis.visitors.resource_factory import (
+  ResourceFactoryVisitor,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -76,6 +79,9 @@ class PLRSourceParser:
     self._machine_classes: list[DiscoveredClass] | None = None
     self._backend_classes: list[DiscoveredClass] | None = None
     self._resource_classes: list[DiscoveredClass] | None = None
+    # Factories found while a resource file was parsed for its classes, so
+    # discover_resource_factories() does not parse that file again.
+    self._factories_by_file: dict[Path, list[DiscoveredClass]] = {}
 
   def discover_all_classes(self) -> list[DiscoveredClass]:
     """Discover all PLR classes from source files.
@@ -100,7 +106,9 @@ class PLRSourceParser:
         if py_file.name.endswith("_tests.py") or py_file.name.endswith("_test.py"):
           continue
         try:
-          classes = self._parse_file(py_file)
+          classes = self._parse_file(
+            py_file, collect_factories=pattern in self.RESOURCE_PATTERNS
+          )
           discovered.extend(classes)
         except Exception as e:
           logger.warning("Failed to parse %s: %s", py_file, e)
@@ -210,42 +218,68 @@ class PLRSourceParser:
       List of discovered resource factory functions.
 
     """
-    from praxis.backend.utils.plr_static_analysis.visitors.resource_factory import (
-      ResourceFactoryVisitor,
-    )
-
     discovered: list[DiscoveredClass] = []
 
     for pattern in self.RESOURCE_PATTERNS:
       for py_file in self.plr_source_root.glob(pattern):
         if py_file.name.startswith("_") and py_file.name != "__init__.py":
           continue
-        try:
-          source = py_file.read_text(encoding="utf-8")
-          module_path = self._path_to_module(py_file)
-
-          tree = cst.parse_module(source)
-          visitor = ResourceFactoryVisitor(module_path, str(py_file))
+        factories = self._factories_by_file.get(py_file)
+        if factories is None:
           try:
-            wrapper = MetadataWrapper(tree)
-            wrapper.visit(visitor)
-          except Exception:
-            # Fall back to simple visit if metadata fails
-            for node in tree.body:
-              if isinstance(node, cst.FunctionDef):
-                visitor.visit_FunctionDef(node)
-
-          discovered.extend(visitor.discovered_resources)
-        except Exception as e:
-          logger.debug("Failed to parse factory functions in %s: %s", py_file, e)
+            parsed = ParsedModule.from_file(py_file)
+            factories = self._visit_factories(parsed, py_file)
+          except Exception as e:
+            logger.debug("Failed to parse factory functions in %s: %s", py_file, e)
+            continue
+        discovered.extend(factories)
 
     return discovered
 
-  def _parse_file(self, file_path: Path) -> list[DiscoveredClass]:
+  def _visit_factories(
+    self,
+    parsed: ParsedModule,
+    file_path: Path,
+    *visitors: cst.CSTVisitor,
+  ) -> list[DiscoveredClass]:
+    """Find the resource factories in a parsed file, alongside any other visitors.
+
+    Args:
+      parsed: The parsed source file.
+      file_path: Path to the source file.
+      *visitors: Further visitors to run in the same traversal.
+
+    Returns:
+      The discovered factory functions.
+
+    Raises:
+      Exception: Whatever the additional visitors raise; the factory visitor
+        falls back to a simple top-level scan on its own.
+
+    """
+    factory_visitor = ResourceFactoryVisitor(self._path_to_module(file_path), str(file_path))
+    error: Exception | None = None
+    try:
+      parsed.visit(factory_visitor, *visitors)
+    except Exception as e:
+      # Fall back to simple visit if metadata fails
+      error = e
+      factory_visitor.discovered_resources.clear()
+      for node in parsed.tree.body:
+        if isinstance(node, cst.FunctionDef):
+          factory_visitor.visit_FunctionDef(node)
+    self._factories_by_file[file_path] = factory_visitor.discovered_resources
+    if error is not None and visitors:
+      raise error
+    return factory_visitor.discovered_resources
+
+  def _parse_file(self, file_path: Path, collect_factories: bool = False) -> list[DiscoveredClass]:
     """Parse a single Python file.
 
     Args:
       file_path: Path to the Python source file.
+      collect_factories: Also find resource factory functions in the same
+        traversal, for discover_resource_factories().
 
     Returns:
       List of discovered classes in the file.
@@ -258,27 +292,28 @@ class PLRSourceParser:
         return cached
 
     try:
-      source = file_path.read_text(encoding="utf-8")
+      parsed = ParsedModule.from_file(file_path)
     except (OSError, UnicodeDecodeError) as e:
       logger.warning("Could not read %s: %s", file_path, e)
       return []
-
-    module_path = self._path_to_module(file_path)
-
-    try:
-      tree = cst.parse_module(source)
     except cst.ParserSyntaxError as e:
       logger.warning("Syntax error in %s: %s", file_path, e)
       return []
+    tree = parsed.tree
+
+    module_path = self._path_to_module(file_path)
 
-    # Run class discovery using MetadataWrapper
+    # Run class discovery (and factory discovery for resource files) in one traversal
     discovery_visitor = ClassDiscoveryVisitor(module_path, str(file_path))
     try:
-      wrapper = MetadataWrapper(tree)
-      wrapper.visit(discovery_visitor)
+      if collect_factories:
+        self._visit_factories(parsed, file_path, discovery_visitor)
+      else:
+        parsed.visit(discovery_visitor)
     except Exception as e:
       # Fall back to manual iteration if metadata fails
       logger.debug("MetadataWrapper failed for %s, using manual iteration: %s", file_path, e)
+      discovery_visitor.discovered_classes.clear()
       self._visit_tree_manually(tree, discovery_visitor)
 
     # For each discovered class, extract capabilities
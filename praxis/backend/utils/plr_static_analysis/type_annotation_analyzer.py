@@ -2,15 +2,26 @@
 
 This module provides utilities for analyzing CST type annotations to detect
 types that should be rendered as visual index selectors (Well, TipSpot, etc.)
+
+Analysis results are memoized in a bounded LRU keyed by the normalized hint
+source, shared by CST annotations and hint strings, so the small vocabulary of
+hints PLR protocols use is analysed (and, for strings, parsed) once. The memo is
+seeded with the most common of those hints on first use rather than at import.
 """
 
 from __future__ import annotations
 
+import re
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import libcst as cst
 
+if TYPE_CHECKING:
+  from collections.abc import Callable
+
 # =============================================================================
 # ANSI/SBS Standard Plate Dimensions
 # =============================================================================
@@ -87,9 +98,13 @@ OPTIONAL_TYPE_NAMES: frozenset[str] = frozenset(
 )
 
 
-@dataclass
+@dataclass(frozen=True)
 class ItemizedTypeInfo:
-  """Information about an itemized type detected from annotation."""
+  """Information about an itemized type detected from annotation.
+
+  Instances are immutable because analysis results are shared through the
+  type hint cache.
+  """
 
   field_type: str = "index_selector"
   """The field type for Formly."""
@@ -112,7 +127,7 @@ class ItemizedTypeInfo:
   def __post_init__(self) -> None:
     """Set correct field type based on container status."""
     if self.is_container and self.field_type == "index_selector":
-      self.field_type = "itemized-selector"
+      object.__setattr__(self, "field_type", "itemized-selector")
 
   def to_dict(self) -> dict[str, Any]:
     """Convert to dict for ProtocolParameterInfo."""
@@ -280,11 +295,104 @@ class TypeAnnotationAnalyzer:
     return False
 
 
+# =============================================================================
+# Type Hint String Analysis
+# =============================================================================
+
+TYPE_HINT_CACHE_SIZE = 1024
+"""Maximum number of distinct normalized type hints kept in the memo."""
+
+# Hints seeded into the memo on first use: the itemized elements, their common
+# containers and optional forms, and frequent non-itemized PLR parameter types.
+COMMON_TYPE_HINTS: tuple[str, ...] = (
+  *sorted(ITEMIZED_ELEMENT_TYPES),
+  *(
+    hint
+    for element in sorted(ITEMIZED_ELEMENT_TYPES)
+    for hint in (
+      f"list[{element}]",
+      f"List[{element}]",
+      f"Sequence[{element}]",
+      f"tuple[{element},...]",
+      f"Optional[{element}]",
+      f"{element}|None",
+      f"Optional[list[{element}]]",
+      f"list[{element}]|None",
+    )
+  ),
+  "Plate",
+  "TipRack",
+  "Trough",
+  "Reservoir",
+  "Carrier",
+  "PlateCarrier",
+  "TipCarrier",
+  "Deck",
+  "Resource",
+  "LiquidHandler",
+  "PlateReader",
+  "Any",
+  "str",
+  "int",
+  "float",
+  "bool",
+  "dict",
+  "dict[str,Any]",
+  "list[float]",
+  "list[int]",
+  "list[str]",
+)
+
+_SEPARATOR_WHITESPACE = re.compile(r"\s*([\[\],|.])\s*")
+
+
+def normalize_type_hint(type_hint: str) -> str:
+  """Normalize a type hint string for use as a cache key.
+
+  Whitespace is collapsed and removed around brackets, commas, dots and ``|``,
+  so ``"Sequence[ Well ]"`` and ``"Sequence[Well]"`` share an entry. Hints
+  containing comments are only stripped, since joining their lines would
+  comment out the remainder.
+
+  Args:
+      type_hint: The type hint as a string.
+
+  Returns:
+      The normalized type hint.
+
+  """
+  if "#" in type_hint:
+    return type_hint.strip()
+  return _SEPARATOR_WHITESPACE.sub(r"\1", " ".join(type_hint.split()))
+
+
+def analyze_type_annotation(
+  node: cst.BaseExpression,
+  code: str | None = None,
+) -> ItemizedTypeInfo | None:
+  """Analyze a CST type annotation, memoized by its normalized source.
+
+  On a cache miss the node itself is analysed; nothing is re-parsed. Results
+  are shared between callers, which is why `ItemizedTypeInfo` is immutable.
+
+  Args:
+      node: The annotation expression (e.g., ``param.annotation.annotation``).
+      code: The node's source, if the caller already rendered it.
+
+  Returns:
+      ItemizedTypeInfo if itemized type detected, None otherwise.
+
+  """
+  if code is None:
+    code = _CODE_MODULE.code_for_node(node)
+  return _memoized(normalize_type_hint(code), lambda: _ANALYZER.analyze(node))
+
+
 def analyze_type_hint_string(type_hint: str) -> ItemizedTypeInfo | None:
   """Analyze a type hint string for itemized types.
 
   This is a convenience function for when you have a string representation
-  rather than a CST node.
+  rather than a CST node. It shares the memo of `analyze_type_annotation`.
 
   Args:
       type_hint: The type hint as a string (e.g., "Sequence[Well]")
@@ -293,6 +401,11 @@ def analyze_type_hint_string(type_hint: str) -> ItemizedTypeInfo | None:
       ItemizedTypeInfo if itemized type detected, None otherwise.
 
   """
+  normalized = normalize_type_hint(type_hint)
+  return _memoized(normalized, lambda: _analyze_hint_string(normalized))
+
+
+def _analyze_hint_string(type_hint: str) -> ItemizedTypeInfo | None:
   try:
     # Parse as an expression
     module = cst.parse_module(f"x: {type_hint}")
@@ -300,8 +413,7 @@ def analyze_type_hint_string(type_hint: str) -> ItemizedTypeInfo | None:
     if isinstance(stmt, cst.SimpleStatementLine):
       inner = stmt.body[0]
       if isinstance(inner, cst.AnnAssign) and inner.annotation:
-        analyzer = TypeAnnotationAnalyzer()
-        return analyzer.analyze(inner.annotation.annotation)
+        return _ANALYZER.analyze(inner.annotation.annotation)
   except Exception:
     pass
 
@@ -315,3 +427,50 @@ def analyze_type_hint_string(type_hint: str) -> ItemizedTypeInfo | None:
       )
 
   return None
+
+
+def _seed_common_hints() -> None:
+  """Memoize `COMMON_TYPE_HINTS`, once until the memo is cleared."""
+  global _seeded
+  with _memo_lock:
+    if _seeded:
+      return
+    _seeded = True
+  for hint in COMMON_TYPE_HINTS:
+    result = _ANALYZER.analyze(cst.parse_expression(hint))
+    with _memo_lock:
+      _memo.setdefault(hint, result)
+
+
+def _memoized(
+  key: str,
+  analyze: Callable[[], ItemizedTypeInfo | None],
+) -> ItemizedTypeInfo | None:
+  if not _seeded:
+    _seed_common_hints()
+  with _memo_lock:
+    if key in _memo:
+      _memo.move_to_end(key)
+      return _memo[key]
+  result = analyze()
+  with _memo_lock:
+    _memo[key] = result
+    _memo.move_to_end(key)
+    while len(_memo) > TYPE_HINT_CACHE_SIZE:
+      _memo.popitem(last=False)
+  return result
+
+
+def clear_type_hint_cache() -> None:
+  """Drop every memoized type hint result; common hints are re-seeded on next use."""
+  global _seeded
+  with _memo_lock:
+    _memo.clear()
+    _seeded = False
+
+
+_ANALYZER = TypeAnnotationAnalyzer()
+_CODE_MODULE = cst.Module([])
+_memo: OrderedDict[str, ItemizedTypeInfo | None] = OrderedDict()
+_memo_lock = threading.Lock()
+_seeded = False
@@ -23,6 +23,7 @@ from praxis.backend.utils.plr_static_analysis.models import (
   ResourceNode,
   StatePrecondition,
 )
+from praxis.backend.utils.plr_static_analysis.parsed_module import ParsedModule
 from praxis.backend.utils.plr_static_analysis.resource_hierarchy import (
   DeckLayoutType,
   get_parental_chain,
@@ -641,7 +642,7 @@ def _walk_cst_node(node: cst.CSTNode, visitor: cst.CSTVisitor) -> None:
 
 
 def extract_graph_from_source(
-  source: str,
+  source: str | ParsedModule,
   function_name: str,
   module_name: str = "protocol",
   deck_layout_type: DeckLayoutType = DeckLayoutType.CARRIER_BASED,
@@ -649,7 +650,8 @@ def extract_graph_from_source(
   """Extract a computation graph from source code.
 
   Args:
-      source: Python source code containing the function.
+      source: Python source code containing the function, or an already
+          parsed module.
       function_name: Name of the function to extract.
       module_name: Module name for FQN generation.
       deck_layout_type: Type of deck layout.
@@ -658,16 +660,17 @@ def extract_graph_from_source(
       The extracted ProtocolComputationGraph, or None if function not found.
 
   """
-  try:
-    tree = cst.parse_module(source)
-  except cst.ParserSyntaxError:
-    return None
-
-  # Find the function
-  for stmt in tree.body:
-    if isinstance(stmt, cst.FunctionDef) and stmt.name.value == function_name:
-      return extract_graph_from_function(
-        stmt, module_name, deck_layout_type=deck_layout_type
-      )
+  if isinstance(source, ParsedModule):
+    parsed = source
+  else:
+    try:
+      parsed = ParsedModule(source)
+    except cst.ParserSyntaxError:
+      return None
 
-  return None
+  function_node = parsed.function(function_name)
+  if function_node is None:
+    return None
+  return extract_graph_from_function(
+    function_node, module_name, deck_layout_type=deck_layout_type
+  )
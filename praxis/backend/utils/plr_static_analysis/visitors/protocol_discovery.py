@@ -1,6 +1,7 @@
 """LibCST visitor for discovering protocol functions."""
 
 import hashlib
+from dataclasses import dataclass
 from typing import Any
 
 import libcst as cst
@@ -9,12 +10,13 @@ from praxis.backend.utils.plr_static_analysis.models import (
   ProtocolFunctionInfo,
   ProtocolParameterInfo,
 )
+from praxis.backend.utils.plr_static_analysis.parsed_module import MultiVisitor
 from praxis.backend.utils.plr_static_analysis.type_annotation_analyzer import (
-  TypeAnnotationAnalyzer,
+  analyze_type_annotation,
 )
 from praxis.backend.utils.plr_static_analysis.visitors.base import BasePLRVisitor
 from praxis.backend.utils.plr_static_analysis.visitors.computation_graph_extractor import (
-  extract_graph_from_function,
+  ComputationGraphExtractor,
 )
 from praxis.backend.utils.plr_static_analysis.visitors.protocol_requirement_extractor import (
   ProtocolRequirementExtractor,
@@ -23,8 +25,24 @@ from praxis.common.type_inspection import is_pylabrobot_resource
 from praxis.backend.models.enums.plr_category import infer_category_from_name
 
 
+@dataclass
+class _ProtocolFunctionWalk:
+  """A protocol function whose body is being walked by the per-function extractors."""
+
+  node: cst.FunctionDef
+  params_info: list[ProtocolParameterInfo]
+  graph_extractor: ComputationGraphExtractor | None
+  requirement_extractor: ProtocolRequirementExtractor
+  body_visitor: MultiVisitor
+
+
 class ProtocolFunctionVisitor(BasePLRVisitor):
-  """Visitor to find and extract metadata from @protocol_function decorated functions."""
+  """Visitor to find and extract metadata from @protocol_function decorated functions.
+
+  The computation graph and hardware requirement extractors ride along on this
+  visitor's own traversal: the body of each protocol function is walked once,
+  with both extractors fed from the same pass.
+  """
 
   # Decorator names that indicate a protocol function
   PROTOCOL_DECORATOR_NAMES = {"protocol_function"}
@@ -39,17 +57,70 @@ class ProtocolFunctionVisitor(BasePLRVisitor):
     """
     super().__init__(module_name, file_path)
     self.definitions: list[ProtocolFunctionInfo] = []
+    self._walk: _ProtocolFunctionWalk | None = None
+
+  def on_visit(self, node: cst.CSTNode) -> bool:
+    """Feed nodes inside a protocol function to its extractors."""
+    if self._walk is not None:
+      return self._walk.body_visitor.on_visit(node)
+    return super().on_visit(node)
+
+  def on_leave(self, original_node: cst.CSTNode) -> None:
+    """Finish a protocol function once its whole body has been walked."""
+    walk = self._walk
+    if walk is None:
+      super().on_leave(original_node)
+    elif original_node is walk.node:
+      walk.body_visitor.on_leave(original_node)
+      self._walk = None
+      self._process_protocol_function(walk)
+    else:
+      walk.body_visitor.on_leave(original_node)
+
+  def on_visit_attribute(self, node: cst.CSTNode, attribute: str) -> None:
+    """Forward attribute callbacks inside a protocol function to its extractors."""
+    if self._walk is not None:
+      self._walk.body_visitor.on_visit_attribute(node, attribute)
+    else:
+      super().on_visit_attribute(node, attribute)
+
+  def on_leave_attribute(self, original_node: cst.CSTNode, attribute: str) -> None:
+    """Forward attribute callbacks inside a protocol function to its extractors."""
+    if self._walk is not None:
+      self._walk.body_visitor.on_leave_attribute(original_node, attribute)
+    else:
+      super().on_leave_attribute(original_node, attribute)
 
   def visit_FunctionDef(self, node: cst.FunctionDef) -> bool:  # noqa: N802
     """Visit a function definition to check for protocol decorators."""
     if not self._has_protocol_decorator(node):
       return False
 
-    self._process_protocol_function(node)
-    # We don't need to traverse into the function body for discovery purposes,
-    # unless we want to do nested protocol discovery (which we don't for now).
-    # However, if we add requirements extraction here later, we might return True.
-    return False
+    self._begin_protocol_function(node)
+    return True
+
+  def _begin_protocol_function(self, node: cst.FunctionDef) -> None:
+    """Start walking a protocol function with the per-function extractors."""
+    params_info = self._extract_parameters(node)
+    try:
+      graph_extractor: ComputationGraphExtractor | None = ComputationGraphExtractor(
+        protocol_fqn=f"{self.module_path}.{node.name.value}",
+        parameter_types={p.name: p.type_hint for p in params_info},
+      )
+    except Exception:
+      graph_extractor = None
+    requirement_extractor = ProtocolRequirementExtractor()
+    extractors = [requirement_extractor] if graph_extractor is None else [graph_extractor, requirement_extractor]
+    body_visitor = MultiVisitor(extractors, isolate_errors=True)
+    # The extractors also see the function node itself, as when they walked it alone.
+    body_visitor.on_visit(node)
+    self._walk = _ProtocolFunctionWalk(
+      node=node,
+      params_info=params_info,
+      graph_extractor=graph_extractor,
+      requirement_extractor=requirement_extractor,
+      body_visitor=body_visitor,
+    )
 
   def _has_protocol_decorator(self, node: cst.FunctionDef) -> bool:
     """Check if the function has a @protocol_function decorator."""
@@ -74,11 +145,9 @@ class ProtocolFunctionVisitor(BasePLRVisitor):
 
     return False
 
-  def _process_protocol_function(self, node: cst.FunctionDef) -> None:
-    """Extract metadata from a protocol function node."""
+  def _extract_parameters(self, node: cst.FunctionDef) -> list[ProtocolParameterInfo]:
+    """Extract parameter information from a protocol function node."""
     function_name = node.name.value
-    docstring = self._get_docstring(node.body) or "Inferred from code."
-
     params_info: list[ProtocolParameterInfo] = []
 
     # Process parameters
@@ -109,12 +178,11 @@ class ProtocolFunctionVisitor(BasePLRVisitor):
       is_itemized = False
       itemized_spec = None
 
-      # Use TypeAnnotationAnalyzer for comprehensive type detection
+      # Use the memoized type hint analysis for comprehensive type detection
       # Supports: Well, TipSpot, list[Well], Sequence[TipSpot],
       #           tuple[Well, ...], Optional[Well], Well | None, etc.
       if param.annotation:
-        analyzer = TypeAnnotationAnalyzer()
-        type_info = analyzer.analyze(param.annotation.annotation)
+        type_info = analyze_type_annotation(param.annotation.annotation, type_hint)
         if type_info:
           field_type = type_info.field_type
           is_itemized = type_info.is_itemized
@@ -142,6 +210,15 @@ class ProtocolFunctionVisitor(BasePLRVisitor):
 
       params_info.append(info)
 
+    return params_info
+
+  def _process_protocol_function(self, walk: _ProtocolFunctionWalk) -> None:
+    """Build the definition of a protocol function whose body has been walked."""
+    node = walk.node
+    params_info = walk.params_info
+    function_name = node.name.value
+    docstring = self._get_docstring(node.body) or "Inferred from code."
+
     # Construct raw dicts for backward compatibility with DiscoveryService
     # This matches the structure created by the AST-based ProtocolVisitor
     uuid_placeholder = "00000000-0000-0000-0000-000000000000"  # Real UUIDs generated by service
@@ -192,7 +269,7 @@ class ProtocolFunctionVisitor(BasePLRVisitor):
         )
 
     # Extract computation graph
-    computation_graph, source_hash = self._extract_computation_graph(node, params_info)
+    computation_graph, source_hash = self._extract_computation_graph(walk)
 
     # Infer requires_deck: False if no LiquidHandler or Deck param exists
     # This enables machine-only protocols (e.g., plate reader)
@@ -209,7 +286,7 @@ class ProtocolFunctionVisitor(BasePLRVisitor):
       parameters=params_info,
       raw_assets=raw_assets,
       raw_parameters=raw_parameters,
-      hardware_requirements=self._extract_requirements(node),
+      hardware_requirements=self._extract_requirements(walk),
       computation_graph=computation_graph,
       source_hash=source_hash,
       requires_deck=requires_deck,
@@ -274,61 +351,43 @@ class ProtocolFunctionVisitor(BasePLRVisitor):
       return [self._parse_cst_literal(e.value) for e in node.elements]
     return None
 
-  def _extract_requirements(self, node: cst.FunctionDef) -> dict[str, Any] | None:
-    """Extract hardware requirements from the function body."""
+  def _extract_requirements(self, walk: _ProtocolFunctionWalk) -> dict[str, Any] | None:
+    """Build the hardware requirements gathered while walking the function body."""
+    if walk.body_visitor.has_failed(walk.requirement_extractor):
+      # If extraction fails, we don't want to fail discovery
+      return None
     try:
-      # Create a dummy module to wrap the function body for visitation
-      # We clone the body to avoid modifying the original tree if that matters,
-      # but here we just need to visit it.
-      # A simple way is to use the extractor directly on the function node
-      # but the extractor expects to visit Call nodes.
-
-      extractor = ProtocolRequirementExtractor()
-      node.visit(extractor)
-      requirements_model = extractor.build_requirements()
-
+      requirements_model = walk.requirement_extractor.build_requirements()
       # Convert to dict for JSON serialization
       return requirements_model.model_dump(exclude_none=True)
     except Exception:
-      # If extraction fails, we don't want to fail discovery
-      # Log it? The visitor doesn't have a logger handy, passing one might be good.
-      # For now, safe fail.
       return None
 
   def _extract_computation_graph(
     self,
-    node: cst.FunctionDef,
-    params_info: list[ProtocolParameterInfo],
+    walk: _ProtocolFunctionWalk,
   ) -> tuple[dict[str, Any] | None, str | None]:
-    """Extract computation graph and source hash from the function.
+    """Build the computation graph and source hash of the walked function.
 
     Args:
-      node: The function definition CST node.
-      params_info: Pre-extracted parameter information.
+      walk: The protocol function and the extractors that walked its body.
 
     Returns:
       Tuple of (computation_graph_dict, source_hash).
 
     """
+    extractor = walk.graph_extractor
+    if extractor is None or walk.body_visitor.has_failed(extractor):
+      # If extraction fails, we don't want to fail discovery
+      return None, None
     try:
       # Calculate source hash from the function source code
-      source_code = cst.Module([]).code_for_node(node)
+      source_code = cst.Module([]).code_for_node(walk.node)
       source_hash = hashlib.sha256(source_code.encode()).hexdigest()[:16]
 
-      # Build parameter types dict from params_info
-      parameter_types = {p.name: p.type_hint for p in params_info}
-
-      # Extract the computation graph
-      graph = extract_graph_from_function(
-        function_node=node,
-        module_name=self.module_path,
-        parameter_types=parameter_types,
-      )
-
       # Convert to dict for JSON serialization
-      return graph.model_dump(exclude_none=True), source_hash
+      return extractor.build_graph().model_dump(exclude_none=True), source_hash
 
     except Exception:
-      # If extraction fails, we don't want to fail discovery
       # Safe fail with no graph
       return None, None
@@ -5,12 +5,12 @@ capabilities from method calls and type hints.
 """
 
 import libcst as cst
-from libcst.metadata import MetadataWrapper
 
 from praxis.backend.utils.plr_static_analysis.models import (
   CapabilityRequirement,
   ProtocolRequirements,
 )
+from praxis.backend.utils.plr_static_analysis.parsed_module import ParsedModule
 
 # =============================================================================
 # Method Call Patterns and Their Implied Requirements
@@ -249,30 +249,31 @@ class ProtocolRequirementExtractor(cst.CSTVisitor):
     return self._machine_types
 
 
-def extract_requirements_from_source(source: str) -> ProtocolRequirements:
+def extract_requirements_from_source(source: str | ParsedModule) -> ProtocolRequirements:
   """Extract hardware requirements from Python source code.
 
   Args:
-    source: Python source code to analyze.
+    source: Python source code to analyze, or an already parsed module.
 
   Returns:
     ProtocolRequirements inferred from the code.
 
   """
-  try:
-    tree = cst.parse_module(source)
-  except cst.ParserSyntaxError:
-    return ProtocolRequirements()
+  if isinstance(source, ParsedModule):
+    parsed = source
+  else:
+    try:
+      parsed = ParsedModule(source)
+    except cst.ParserSyntaxError:
+      return ProtocolRequirements()
 
   extractor = ProtocolRequirementExtractor()
 
-  # Use MetadataWrapper to properly walk the visitor
   try:
-    wrapper = MetadataWrapper(tree)
-    wrapper.visit(extractor)
+    parsed.visit(extractor)
   except Exception:
     # Fall back to manual tree traversal if metadata fails
-    _visit_tree_manually(tree, extractor)
+    _visit_tree_manually(parsed.tree, extractor)
 
   return extractor.build_requirements()
 
@@ -1,19 +1,59 @@
 import contextlib
 import time
-from typing import cast
+import uuid
 
 import redis
 
+_PTTL_KEY_MISSING = -2
+"""PTTL reply when the key does not exist."""
+
+
+def _lock_channel(lock_name: str) -> str:
+  """Pub/sub channel on which releases of `lock_name` are announced."""
+  return f"{lock_name}:released"
+
+
+def _release_lock(redis_client: redis.Redis, lock_name: str, identifier: str) -> bool:
+  """Delete the lock only if it still holds `identifier`, then announce the release.
+
+  Uses a WATCH/MULTI transaction so a lock that expired and was re-acquired by
+  someone else between the read and the delete is never removed.
+
+  Returns:
+      True if the lock was ours and has been released.
+
+  """
+  with redis_client.pipeline() as pipe:
+    try:
+      pipe.watch(lock_name)
+      current = pipe.get(lock_name)
+      if isinstance(current, bytes):
+        current = current.decode("utf-8")
+      if current != identifier:
+        pipe.unwatch()
+        return False
+      pipe.multi()
+      pipe.delete(lock_name)
+      pipe.publish(_lock_channel(lock_name), identifier)
+      pipe.execute()
+    except redis.WatchError:
+      return False
+  return True
+
 
 @contextlib.contextmanager
 def acquire_lock(
   redis_client: redis.Redis,
   resource_name: str,
   lock_timeout: int = 60,
-  acquire_timeout: int = 10,
+  acquire_timeout: float = 10,
 ):
   """Acquires a lock on a resource using Redis.
 
+  Contended acquisition does not poll: the caller subscribes to the lock's
+  release channel and blocks on it, waking up when the holder releases the
+  lock or when the holder's lock expires, whichever comes first.
+
   Args:
       redis_client: The Redis client instance.
       resource_name: The name of the resource to lock.
@@ -28,22 +68,33 @@ def acquire_lock(
 
   """
   lock_name = f"lock:{resource_name}"
-  identifier = str(int(time.time()))  # Unique identifier for the lock
+  identifier = uuid.uuid4().hex  # Unique per acquisition, unlike a timestamp
 
-  end_time = time.time() + acquire_timeout
-  acquired = False
+  acquired = bool(redis_client.set(lock_name, identifier, ex=lock_timeout, nx=True))
+  pubsub = None
   try:
-    while time.time() < end_time:
-      if redis_client.set(lock_name, identifier, ex=lock_timeout, nx=True):
-        # Lock acquired
-        acquired = True
-        yield True
-        return  # Exit the while loop and context manager
-      time.sleep(0.1)  # Wait for a short time before retrying
-    # Timeout
-    yield False
+    if not acquired and acquire_timeout > 0:
+      pubsub = redis_client.pubsub(ignore_subscribe_messages=True)
+      pubsub.subscribe(_lock_channel(lock_name))
+      deadline = time.monotonic() + acquire_timeout
+      while not acquired:
+        # Re-check after subscribing so a release in between is not missed.
+        acquired = bool(redis_client.set(lock_name, identifier, ex=lock_timeout, nx=True))
+        remaining = deadline - time.monotonic()
+        if acquired or remaining <= 0:
+          break
+        # Wake on a release message, or when the current holder's lock expires.
+        holder_ttl_ms = redis_client.pttl(lock_name)
+        if holder_ttl_ms == _PTTL_KEY_MISSING:
+          # Released or expired since the SET above, so its release message was
+          # published before we checked; retry straight away.
+          continue
+        wait = remaining if holder_ttl_ms < 0 else min(remaining, holder_ttl_ms / 1000)
+        pubsub.get_message(timeout=wait)
+    yield acquired
   finally:
+    if pubsub is not None:
+      pubsub.close()
     # Only release the lock if it was acquired and the identifier matches
-    val = cast("bytes | None", redis_client.get(lock_name))
-    if acquired and val and val.decode("utf-8") == identifier:
-      redis_client.delete(lock_name)
+    if acquired:
+      _release_lock(redis_client, lock_name, identifier)
@@ -0,0 +1,177 @@
+"""Cached class resolution and prebuilt resource templates.
+
+Building a PyLabRobot deck means importing every resource class by its fully
+qualified name and instantiating each resource (and every well, tip spot, ...)
+from scratch. Simulation, edge-case runs and preflight checks build the same
+layouts over and over, so this module provides:
+
+- `resolve_class`: a memoized FQN -> class resolver.
+- `ResourceTemplateCache`: an LRU of prebuilt resource trees stored as
+  cloudpickled bytes (PLR containers carry local volume/height closures that
+  plain pickle rejects). Each `get` unpickles a fresh, fully independent copy, which is several
+  times cheaper than re-instantiating the tree and never shares state between
+  callers.
+
+Like the rest of `praxis.common`, this module has no backend (database) imports.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import importlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, TypeVar
+
+import cloudpickle
+
+if TYPE_CHECKING:
+  from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_MAX_TEMPLATES = 32
+"""Default number of templates kept by a `ResourceTemplateCache`."""
+
+
+@functools.lru_cache(maxsize=1024)
+def resolve_class(fqn: str) -> type:
+  """Import and return a class from its fully qualified name (memoized).
+
+  Failed lookups are not cached, so a module that becomes importable later is
+  picked up on the next call.
+
+  Args:
+      fqn: Fully qualified name (e.g., 'pylabrobot.resources.Plate').
+
+  Returns:
+      The imported class.
+
+  Raises:
+      ValueError: If `fqn` is not a dotted name.
+      ImportError: If the module cannot be imported.
+      AttributeError: If the module has no such attribute.
+
+  """
+  if not fqn or "." not in fqn:
+    msg = f"Invalid fully qualified class name: {fqn!r}"
+    raise ValueError(msg)
+  module_path, class_name = fqn.rsplit(".", 1)
+  module = importlib.import_module(module_path)
+  return getattr(module, class_name)
+
+
+def layout_hash(layout: Any) -> str:
+  """Hash a JSON-like layout description into a template key.
+
+  Args:
+      layout: Layout description (dicts, lists and scalars).
+
+  Returns:
+      SHA-256 hex digest of the canonical JSON encoding.
+
+  """
+  canonical = json.dumps(layout, sort_keys=True, separators=(",", ":"), default=str)
+  return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class ResourceTemplateCache:
+  """LRU cache of prebuilt resource trees, cloned on every read.
+
+  Usage:
+      cache = ResourceTemplateCache()
+      deck = cache.get_or_build(layout_hash(config), lambda: build(config))
+
+  """
+
+  def __init__(self, max_entries: int = DEFAULT_MAX_TEMPLATES) -> None:
+    """Initialize the cache.
+
+    Args:
+        max_entries: Maximum number of templates to keep.
+
+    """
+    self.max_entries = max(1, max_entries)
+    self._templates: OrderedDict[str, bytes] = OrderedDict()
+    self._lock = threading.Lock()
+    self.hits = 0
+    self.misses = 0
+    self.evictions = 0
+
+  def __len__(self) -> int:
+    return len(self._templates)
+
+  def __getstate__(self) -> dict[str, Any]:
+    """Pickle the templates and counters, leaving out the process-local lock."""
+    with self._lock:
+      state = self.__dict__.copy()
+      state["_templates"] = self._templates.copy()
+    del state["_lock"]
+    return state
+
+  def __setstate__(self, state: dict[str, Any]) -> None:
+    self.__dict__.update(state)
+    self._lock = threading.Lock()
+
+  def __contains__(self, key: object) -> bool:
+    return key in self._templates
+
+  def get(self, key: str) -> Any | None:
+    """Return a fresh copy of the template stored under `key`, if any."""
+    with self._lock:
+      template = self._templates.get(key)
+      if template is None:
+        self.misses += 1
+        return None
+      self._templates.move_to_end(key)
+      self.hits += 1
+    return cloudpickle.loads(template)
+
+  def put(self, key: str, value: Any) -> bool:
+    """Store a snapshot of `value` as the template for `key`.
+
+    The snapshot is taken immediately, so later changes to `value` do not
+    affect the template.
+
+    Returns:
+        False if `value` cannot be pickled (nothing is cached).
+
+    """
+    try:
+      template = cloudpickle.dumps(value)
+    except Exception:
+      logger.debug("Resource template %s is not picklable; not caching.", key, exc_info=True)
+      return False
+    with self._lock:
+      self._templates[key] = template
+      self._templates.move_to_end(key)
+      while len(self._templates) > self.max_entries:
+        self._templates.popitem(last=False)
+        self.evictions += 1
+    return True
+
+  def get_or_build(self, key: str, build: Callable[[], T]) -> T:
+    """Return a copy of the template for `key`, building and caching it on a miss.
+
+    On a miss the freshly built value is returned to the caller and a snapshot
+    of it becomes the template.
+    """
+    cached = self.get(key)
+    if cached is not None:
+      return cached
+    value = build()
+    self.put(key, value)
+    return value
+
+  def invalidate(self, key: str | None = None) -> None:
+    """Drop one template, or all templates if no key is given."""
+    with self._lock:
+      if key is None:
+        self._templates.clear()
+      else:
+        self._templates.pop(key, None)
@@ -0,0 +1,42 @@
+"""Rebuild the scheduling metrics rollups from existing schedule history.
+
+Usage:
+    python scripts/backfill_schedule_metrics.py [--since 2026-01-01T00:00:00Z]
+
+Without --since every rollup bucket is rebuilt; with it, only buckets from that
+hour onward. Safe to re-run.
+"""
+
+import argparse
+import asyncio
+import sys
+from datetime import datetime
+
+# Add project root to path
+sys.path.append(".")
+
+from praxis.backend.services.scheduler_metrics import (
+  DEFAULT_BACKFILL_BATCH_SIZE,
+  backfill_scheduling_metrics,
+)
+from praxis.backend.utils.db import AsyncSessionLocal
+
+
+async def main(since: datetime | None, batch_size: int) -> None:
+  async with AsyncSessionLocal() as db:
+    replayed = await backfill_scheduling_metrics(db, since=since, batch_size=batch_size)
+    await db.commit()
+  print(f"Replayed {replayed} schedule history events into the metrics rollups.")
+
+
+if __name__ == "__main__":
+  parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+  parser.add_argument(
+    "--since",
+    type=datetime.fromisoformat,
+    default=None,
+    help="Only rebuild buckets from this (ISO 8601) time onward; naive times are UTC.",
+  )
+  parser.add_argument("--batch-size", type=int, default=DEFAULT_BACKFILL_BATCH_SIZE)
+  args = parser.parse_args()
+  asyncio.run(main(args.since, args.batch_size))
@@ -0,0 +1,54 @@
+"""API tests for machines following the established pattern.
+
+Based on test_resources.py and API_TEST_PATTERN.md
+"""
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from tests.helpers import create_resource_definition
+
+
+@pytest.mark.asyncio
+async def test_create_machines_bulk(client: AsyncClient, db_session: AsyncSession) -> None:
+    """Test importing several machines with resource counterparts in one request."""
+    # 1. SETUP: Create the counterpart resource definition
+    resource_def = await create_resource_definition(
+        db_session,
+        name="bulk_machine_api_res_def",
+        fqn="test.bulk.machine.res.def",
+    )
+
+    # 2. SETUP: Prepare payload
+    payload = [
+        {"name": "bulk_api_machine_0", "fqn": "test.machine", "asset_type": "MACHINE"},
+        {
+            "name": "bulk_api_machine_1",
+            "fqn": "test.machine",
+            "asset_type": "MACHINE",
+            "resource_def_name": resource_def.name,
+        },
+    ]
+
+    # 3. ACT: Call the API
+    response = await client.post("/api/v1/machines/bulk", json=payload)
+
+    # 4. ASSERT: Check the response
+    assert response.status_code == 201
+    data = response.json()
+    assert [machine["name"] for machine in data] == ["bulk_api_machine_0", "bulk_api_machine_1"]
+    assert all(machine["accession_id"] is not None for machine in data)
+
+
+@pytest.mark.asyncio
+async def test_create_machines_bulk_rejects_duplicate_names(client: AsyncClient) -> None:
+    """Test that a batch repeating a name is rejected with 400."""
+    payload = [
+        {"name": "bulk_api_twice", "fqn": "test.machine", "asset_type": "MACHINE"},
+        {"name": "bulk_api_twice", "fqn": "test.machine", "asset_type": "MACHINE"},
+    ]
+
+    response = await client.post("/api/v1/machines/bulk", json=payload)
+
+    assert response.status_code == 400
+    assert "bulk_api_twice" in response.json()["detail"]
@@ -4,6 +4,7 @@ This module tests the scheduler API endpoints, including CRUD operations
 (via crud_router_factory) and custom endpoints for status and priority updates.
 """
 
+from datetime import datetime, timedelta, timezone
 from uuid import uuid4
 
 import pytest
@@ -11,7 +12,11 @@ import pytest_asyncio
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from praxis.backend.models.enums import ScheduleStatusEnum
+from praxis.backend.models.enums import (
+    AssetReservationStatusEnum,
+    AssetType,
+    ScheduleStatusEnum,
+)
 from praxis.backend.models.domain.protocol import (
     FunctionProtocolDefinition,
     ProtocolRun,
@@ -20,7 +25,7 @@ from praxis.backend.models.domain.protocol_source import (
     FileSystemProtocolSource,
     ProtocolSourceRepository,
 )
-from praxis.backend.models.domain.schedule import ScheduleEntry
+from praxis.backend.models.domain.schedule import AssetReservation, ScheduleEntry
 from praxis.backend.utils.uuid import uuid7
 
 # ============================================================================
@@ -256,3 +261,107 @@ async def test_update_schedule_entry_priority_not_found(client: AsyncClient):
         json=payload,
     )
     assert response.status_code == 404
+
+
+# ============================================================================
+# Reservation Listing Tests
+# ============================================================================
+
+
+@pytest_asyncio.fixture
+async def reservations(
+    db_session: AsyncSession,
+    schedule_entry: ScheduleEntry,
+) -> list[AssetReservation]:
+    """Create five reservations, newest last: three active, two released."""
+    base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    statuses = [
+        AssetReservationStatusEnum.RELEASED,
+        AssetReservationStatusEnum.ACTIVE,
+        AssetReservationStatusEnum.RELEASED,
+        AssetReservationStatusEnum.RESERVED,
+        AssetReservationStatusEnum.PENDING,
+    ]
+    created = []
+    for i, reservation_status in enumerate(statuses):
+        reservation = AssetReservation(
+            accession_id=uuid7(),
+            name=f"plate_{i}",
+            asset_name=f"plate_{i}",
+            asset_type=AssetType.MACHINE if i == 1 else AssetType.RESOURCE,
+            redis_lock_key=f"asset:plate_{i}",
+            status=reservation_status,
+            schedule_entry_accession_id=schedule_entry.accession_id,
+            protocol_run_accession_id=schedule_entry.protocol_run_accession_id,
+            created_at=base + timedelta(minutes=i),
+        )
+        db_session.add(reservation)
+        created.append(reservation)
+    await db_session.commit()
+    return created
+
+
+@pytest.mark.asyncio
+async def test_list_reservations_pages_newest_first(
+    client: AsyncClient,
+    reservations: list[AssetReservation],
+):
+    """Test paging GET /reservations with counts covering every page."""
+    seen = []
+    cursor = None
+    while True:
+        params = {"include_released": "true", "limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        response = await client.get("/api/v1/scheduler/reservations", params=params)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_count"] == 5
+        assert data["active_count"] == 3
+        seen.extend(r["asset_name"] for r in data["reservations"])
+        cursor = data["next_cursor"]
+        if cursor is None:
+            break
+
+    assert seen == [f"plate_{i}" for i in reversed(range(5))]
+
+
+@pytest.mark.asyncio
+async def test_list_reservations_filters(
+    client: AsyncClient,
+    reservations: list[AssetReservation],
+):
+    """Test the default active-only listing and the server-side filters."""
+    response = await client.get("/api/v1/scheduler/reservations")
+    data = response.json()
+    assert [r["asset_name"] for r in data["reservations"]] == ["plate_4", "plate_3", "plate_1"]
+    assert data["total_count"] == data["active_count"] == 3
+
+    response = await client.get(
+        "/api/v1/scheduler/reservations",
+        params={
+            "include_released": "true",
+            "asset_type": AssetType.RESOURCE.value,
+            "created_after": "2026-01-01T00:01:00+00:00",
+            "created_before": "2026-01-01T00:04:00+00:00",
+        },
+    )
+    data = response.json()
+    assert [r["asset_name"] for r in data["reservations"]] == ["plate_3", "plate_2"]
+    assert (data["total_count"], data["active_count"]) == (2, 1)
+
+    response = await client.get(
+        "/api/v1/scheduler/reservations",
+        params={"asset_key": "asset:plate_1"},
+    )
+    assert [r["asset_name"] for r in response.json()["reservations"]] == ["plate_1"]
+
+
+@pytest.mark.asyncio
+async def test_list_reservations_rejects_bad_cursor(client: AsyncClient):
+    """Test that a malformed cursor is a 400, not a server error."""
+    response = await client.get(
+        "/api/v1/scheduler/reservations",
+        params={"cursor": "not-a-cursor"},
+    )
+    assert response.status_code == 400
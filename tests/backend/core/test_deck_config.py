@@ -1,5 +1,7 @@
 
 import json
+import pickle
+import threading
 import pytest
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -8,8 +10,11 @@ from praxis.backend.core.deck_config import (
     ResourcePlacement,
     load_deck_layout,
     build_deck_from_config,
+    deck_layout_hash,
+    deck_template_cache,
     validate_deck_layout_config,
 )
+from praxis.common.resource_templates import ResourceTemplateCache, resolve_class
 
 # Test Data
 VALID_CONFIG_DICT = {
@@ -104,3 +109,92 @@ def test_build_deck_from_config(mock_import):
     MockResourceInstance2.name = "plate_2"
     MockDeckInstance.assign_child_resource.assert_called()
     MockResourceInstance2.rotate.assert_called_with(z=90)
+
+
+# Template cache
+
+LARGE_CONFIG_DICT = {
+    "deck_fqn": "pylabrobot.resources.hamilton.STARDeck",
+    "placements": [
+        {
+            "resource_fqn": "pylabrobot.resources.Greiner_384_wellplate_28ul_Fb",
+            "name": f"plate_{i}",
+            "position": {"x": 100 + 130 * (i % 6), "y": 63 + 90 * (i // 6), "z": 0},
+        }
+        for i in range(4)
+    ],
+}
+
+
+@pytest.fixture
+def template_cache():
+    deck_template_cache.invalidate()
+    yield deck_template_cache
+    deck_template_cache.invalidate()
+
+
+def test_build_deck_from_template_returns_independent_copies(template_cache):
+    config = DeckLayoutConfig(**LARGE_CONFIG_DICT)
+    first = build_deck_from_config(config)
+    first.get_resource("plate_0").get_well("A1").tracker.set_volume(5)
+    second = build_deck_from_config(config)
+
+    assert template_cache.hits == 1
+    assert second is not first
+    assert second.get_resource("plate_0").get_well("A1").tracker.get_used_volume() == 0
+    assert [c.name for c in second.children] == [c.name for c in first.children]
+
+
+def test_deck_layout_hash_ignores_description():
+    config = DeckLayoutConfig(**LARGE_CONFIG_DICT)
+    described = DeckLayoutConfig(**LARGE_CONFIG_DICT, description="Four plates")
+    moved = DeckLayoutConfig(
+        **{**LARGE_CONFIG_DICT, "placements": LARGE_CONFIG_DICT["placements"][:1]}
+    )
+    assert deck_layout_hash(config) == deck_layout_hash(described)
+    assert deck_layout_hash(config) != deck_layout_hash(moved)
+
+
+def test_build_deck_without_template_skips_cache(template_cache):
+    config = DeckLayoutConfig(**LARGE_CONFIG_DICT)
+    build_deck_from_config(config, use_template=False)
+    assert len(template_cache) == 0
+
+
+def test_resource_template_cache_evicts_least_recently_used():
+    cache = ResourceTemplateCache(max_entries=2)
+    cache.put("a", {"v": 1})
+    cache.put("b", {"v": 2})
+    assert cache.get("a") == {"v": 1}
+    cache.put("c", {"v": 3})
+
+    assert "b" not in cache
+    assert "a" in cache and "c" in cache
+    assert cache.evictions == 1
+
+
+def test_resource_template_cache_skips_unpicklable_values():
+    cache = ResourceTemplateCache()
+    built = cache.get_or_build("lock", threading.Lock)
+    assert built is not None
+    assert len(cache) == 0
+
+
+def test_resource_template_cache_pickles_without_lock():
+    cache = ResourceTemplateCache(max_entries=4)
+    cache.put("a", {"v": 1})
+
+    restored = pickle.loads(pickle.dumps(cache))
+
+    assert restored.get("a") == {"v": 1}
+    assert restored.max_entries == 4
+    restored.put("b", {"v": 2})
+    assert "b" not in cache
+
+
+def test_resolve_class_is_memoized():
+    resolve_class.cache_clear()
+    assert resolve_class("pylabrobot.resources.Plate") is resolve_class("pylabrobot.resources.Plate")
+    assert resolve_class.cache_info().hits == 1
+    with pytest.raises(ValueError):
+        resolve_class("Plate")
@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
@@ -6,6 +7,7 @@ import inspect
 from typing import Awaitable, Callable
 
 from praxis.backend.core.workcell_runtime.machine_manager import MachineManagerMixin
+from praxis.backend.core.workcell_runtime.machine_pool import MachinePool
 from praxis.backend.models import Machine, MachineDefinition, DeckDefinition, MachineStatusEnum
 from praxis.backend.utils.errors import WorkcellRuntimeError
 
@@ -162,3 +164,204 @@ async def test_initialize_machine_does_not_overwrite_existing_deck():
         # VERIFY
         assert isinstance(result, MockLH)
         assert result.deck == existing_deck
+
+
+def _chatterbox_machine_model(name="LH1", properties=None):
+  from pylabrobot.resources.hamilton import STARLetDeck
+
+  machine_model = MagicMock(spec=Machine)
+  machine_model.id = 1
+  machine_model.accession_id = uuid4()
+  machine_model.name = name
+  machine_model.fqn = "pylabrobot.liquid_handling.LiquidHandler"
+  machine_model.properties_json = properties if properties is not None else {"deck": STARLetDeck()}
+  machine_model.is_resource = False
+  machine_model.machine_definition_accession_id = None
+  machine_model.machine_definition = None
+  machine_model.deck_child_definition = None
+  machine_model.frontend_definition_accession_id = uuid4()
+  machine_model.backend_definition_accession_id = uuid4()
+  machine_model.frontend_definition = MagicMock(fqn="pylabrobot.liquid_handling.LiquidHandler")
+  machine_model.backend_definition = MagicMock(
+    fqn="pylabrobot.liquid_handling.backends.LiquidHandlerChatterboxBackend"
+  )
+  machine_model.backend_config = {}
+  return machine_model
+
+
+def _pooled_runtime(**pool_kwargs):
+  runtime = MockRuntime()
+  runtime.db_session_factory.return_value.__aenter__.return_value = AsyncMock()
+  runtime.deck_svc.read_decks_by_machine_id = AsyncMock(return_value=None)
+  runtime._machine_pool = MachinePool(**pool_kwargs)
+  return runtime
+
+
+@pytest.mark.asyncio
+async def test_warm_pool_reuses_chatterbox_machine_across_runs():
+  runtime = _pooled_runtime()
+  machine_model = _chatterbox_machine_model()
+
+  first = await runtime.initialize_machine(machine_model)
+  assert first.setup_finished
+  await runtime.shutdown_machine(machine_model.accession_id)
+  assert machine_model.accession_id in runtime._machine_pool
+  assert first.setup_finished
+
+  second = await runtime.initialize_machine(machine_model)
+  assert second is first
+  assert runtime._machine_pool.hits == 1
+  runtime._main_workcell.add_asset.assert_called_once_with(first)
+
+
+@pytest.mark.asyncio
+async def test_warm_pool_rebuilds_when_configuration_changes():
+  from pylabrobot.resources.hamilton import STARLetDeck
+
+  runtime = _pooled_runtime()
+  machine_model = _chatterbox_machine_model()
+  first = await runtime.initialize_machine(machine_model)
+  await runtime.shutdown_machine(machine_model.accession_id)
+
+  machine_model.properties_json = {"deck": STARLetDeck(), "default_offset_head96": None}
+  second = await runtime.initialize_machine(machine_model)
+
+  assert second is not first
+  assert not first.setup_finished  # stale instance was stopped
+  assert second.setup_finished
+
+
+@pytest.mark.asyncio
+async def test_warm_pool_stops_idle_and_unhealthy_machines():
+  now = [0.0]
+  runtime = _pooled_runtime(idle_timeout=60, clock=lambda: now[0])
+  idle_model = _chatterbox_machine_model("idle")
+  idle = await runtime.initialize_machine(idle_model)
+  await runtime.shutdown_machine(idle_model.accession_id)
+
+  now[0] = 61.0
+  assert await runtime.evict_idle_machines() == 1
+  assert not idle.setup_finished
+  assert len(runtime._machine_pool) == 0
+
+  sick_model = _chatterbox_machine_model("sick")
+  sick = await runtime.initialize_machine(sick_model)
+  await runtime.shutdown_machine(sick_model.accession_id)
+  sick._setup_finished = False  # e.g. connection dropped while parked
+  replacement = await runtime.initialize_machine(sick_model)
+  assert replacement is not sick
+
+
+@pytest.mark.asyncio
+async def test_shutdown_without_keep_warm_stops_machine():
+  runtime = _pooled_runtime()
+  machine_model = _chatterbox_machine_model()
+  machine = await runtime.initialize_machine(machine_model)
+
+  await runtime.shutdown_machine(machine_model.accession_id, keep_warm=False)
+
+  assert not machine.setup_finished
+  assert len(runtime._machine_pool) == 0
+
+
+def _dependency_model(accession_id, host_id=None):
+  model = MagicMock()
+  model.accession_id = accession_id
+  model.is_resource = host_id is not None
+  model.resource_counterpart = MagicMock(machine_location_accession_id=host_id)
+  return model
+
+
+@pytest.mark.asyncio
+async def test_initialize_machines_runs_levels_concurrently_in_dependency_order():
+  runtime = MockRuntime()
+  host, other, mounted = uuid4(), uuid4(), uuid4()
+  in_flight = 0
+  max_in_flight = 0
+  started: list[uuid.UUID] = []
+
+  async def fake_initialize(machine_model):
+    nonlocal in_flight, max_in_flight
+    started.append(machine_model.accession_id)
+    in_flight += 1
+    max_in_flight = max(max_in_flight, in_flight)
+    await asyncio.sleep(0.01)
+    in_flight -= 1
+    return f"plr-{machine_model.accession_id}"
+
+  runtime.initialize_machine = fake_initialize
+  result = await runtime.initialize_machines(
+    [_dependency_model(mounted, host_id=host), _dependency_model(host), _dependency_model(other)]
+  )
+
+  assert set(result) == {host, other, mounted}
+  assert max_in_flight == 2
+  assert started[-1] == mounted
+
+
+@pytest.mark.asyncio
+async def test_initialize_machines_rejects_cycles_and_reports_failures():
+  runtime = MockRuntime()
+  a, b = uuid4(), uuid4()
+  runtime.initialize_machine = AsyncMock(side_effect=lambda m: m.accession_id)
+
+  with pytest.raises(WorkcellRuntimeError, match="Circular"):
+    await runtime.initialize_machines(
+      [_dependency_model(a), _dependency_model(b)], dependencies={a: [b], b: [a]}
+    )
+
+  runtime.initialize_machine = AsyncMock(side_effect=RuntimeError("no USB"))
+  with pytest.raises(WorkcellRuntimeError, match="no USB"):
+    await runtime.initialize_machines([_dependency_model(a)])
+
+
+@pytest.mark.asyncio
+async def test_initialize_machines_rolls_back_started_levels_on_failure():
+  runtime = MockRuntime()
+  host, mounted, sibling, preexisting = uuid4(), uuid4(), uuid4(), uuid4()
+  runtime._active_machines[preexisting] = "plr-preexisting"
+
+  async def fake_initialize(machine_model):
+    if machine_model.accession_id == mounted:
+      raise RuntimeError("no USB")
+    runtime._active_machines[machine_model.accession_id] = f"plr-{machine_model.accession_id}"
+    return runtime._active_machines[machine_model.accession_id]
+
+  runtime.initialize_machine = fake_initialize
+  runtime.shutdown_machine = AsyncMock()
+  with pytest.raises(WorkcellRuntimeError, match="no USB"):
+    await runtime.initialize_machines(
+      [
+        _dependency_model(host),
+        _dependency_model(preexisting),
+        _dependency_model(mounted, host_id=host),
+        _dependency_model(sibling, host_id=host),
+      ]
+    )
+
+  rolled_back = {call.args[0] for call in runtime.shutdown_machine.await_args_list}
+  assert rolled_back == {host, sibling}
+
+
+@pytest.mark.asyncio
+async def test_machine_pool_eviction_task_starts_and_drains_on_stop():
+  now = [0.0]
+  runtime = _pooled_runtime(idle_timeout=60, clock=lambda: now[0])
+  runtime.start_machine_pool(eviction_interval=0.01)
+  idle_model = _chatterbox_machine_model("idle")
+  idle = await runtime.initialize_machine(idle_model)
+  await runtime.shutdown_machine(idle_model.accession_id)
+  parked_model = _chatterbox_machine_model("parked")
+  parked = await runtime.initialize_machine(parked_model)
+  await runtime.shutdown_machine(parked_model.accession_id)
+  runtime._machine_pool._entries[parked_model.accession_id].parked_at = 61.0
+
+  now[0] = 61.0
+  await asyncio.sleep(0.05)
+  assert not idle.setup_finished
+  assert parked.setup_finished
+
+  await runtime.stop_machine_pool()
+  assert runtime._machine_pool_task is None
+  assert not parked.setup_finished
+  assert len(runtime._machine_pool) == 0
@@ -0,0 +1,52 @@
+"""Benchmark Celery task startup latency with and without the worker loop.
+
+"Before" mirrors the per-task `run_sync` bridge: every call gets a new event
+loop, so a loop-bound async engine has to be created and disposed each time.
+"After" runs on the worker-lifetime loop with a warm engine and pool.
+
+Run with: pytest tests/benchmarks -m slow --benchmark-only
+"""
+
+from pathlib import Path
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from praxis.backend.utils.async_run import BackgroundEventLoop, run_sync
+
+pytestmark = [pytest.mark.slow, pytest.mark.benchmark(group="celery-task-startup")]
+
+
+def test_task_startup_run_sync(benchmark, tmp_path: Path) -> None:
+    """Per-task loop: engine and connection are rebuilt on every task."""
+    url = f"sqlite+aiosqlite:///{tmp_path / 'bench.db'}"
+
+    async def _task_body() -> int:
+        engine = create_async_engine(url)
+        try:
+            async with engine.connect() as conn:
+                return (await conn.execute(text("SELECT 1"))).scalar_one()
+        finally:
+            await engine.dispose()
+
+    assert benchmark(lambda: run_sync(_task_body())) == 1
+
+
+def test_task_startup_worker_loop(benchmark, tmp_path: Path) -> None:
+    """Worker-lifetime loop: the engine's pool stays warm across tasks."""
+    url = f"sqlite+aiosqlite:///{tmp_path / 'bench.db'}"
+    loop = BackgroundEventLoop()
+    loop.start()
+    engine = create_async_engine(url)
+
+    async def _task_body() -> int:
+        async with engine.connect() as conn:
+            return (await conn.execute(text("SELECT 1"))).scalar_one()
+
+    try:
+        loop.run(_task_body())
+        assert benchmark(lambda: loop.run(_task_body())) == 1
+    finally:
+        loop.run(engine.dispose())
+        loop.stop()
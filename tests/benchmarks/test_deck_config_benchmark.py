@@ -0,0 +1,43 @@
+"""Benchmarks for building configured decks.
+
+A STAR deck holding 24 384-well plates is built from a `DeckLayoutConfig`
+either from scratch (resolving and instantiating every resource and well) or
+from the cached layout template.
+
+Run with ``pytest tests/benchmarks -m slow --benchmark-only``.
+"""
+
+import pytest
+
+from praxis.backend.core.deck_config import (
+    DeckLayoutConfig,
+    build_deck_from_config,
+    deck_template_cache,
+)
+
+pytestmark = [pytest.mark.slow, pytest.mark.benchmark(group="deck-config")]
+
+CONFIG = DeckLayoutConfig(
+    deck_fqn="pylabrobot.resources.hamilton.STARDeck",
+    placements=[
+        {
+            "resource_fqn": "pylabrobot.resources.Greiner_384_wellplate_28ul_Fb",
+            "name": f"plate_{i}",
+            "position": {"x": 100 + 130 * (i % 6), "y": 63 + 90 * (i // 6), "z": 0},
+        }
+        for i in range(24)
+    ],
+)
+
+
+def test_build_from_scratch(benchmark):
+    deck = benchmark(build_deck_from_config, CONFIG, use_template=False)
+    assert len(deck.children) >= 24
+
+
+def test_build_from_template(benchmark):
+    deck_template_cache.invalidate()
+    build_deck_from_config(CONFIG)
+    deck = benchmark(build_deck_from_config, CONFIG)
+    assert len(deck.children) >= 24
+    deck_template_cache.invalidate()
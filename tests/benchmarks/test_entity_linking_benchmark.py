@@ -0,0 +1,69 @@
+"""Benchmark importing machines that each get a Resource counterpart.
+
+"Per entity" creates the machines one at a time through `MachineService.create`,
+so each one pays for its own duplicate-name query, definition lookup, flushes,
+refreshes and commit. "Bulk" imports the same machines with
+`MachineService.create_many`, which links all counterparts with a fixed number of
+queries and a single flush.
+
+Run with: pytest tests/benchmarks -m slow --benchmark-only
+"""
+
+import asyncio
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlmodel import SQLModel
+
+from praxis.backend.models.domain.machine import MachineCreate
+from praxis.backend.models.domain.resource import Resource, ResourceDefinition
+from praxis.backend.models.enums.asset import AssetType
+from praxis.backend.services.machine import machine_service
+from praxis.backend.utils.db import Base
+
+pytestmark = [pytest.mark.slow, pytest.mark.benchmark(group="entity-linking-import")]
+
+ASSET_COUNT = 2000
+DEFINITION_NAME = "benchmark_resource_def"
+
+
+def _machines() -> list[MachineCreate]:
+    return [
+        MachineCreate(
+            name=f"machine_{i}",
+            fqn="pylabrobot.liquid_handling.LiquidHandler",
+            asset_type=AssetType.MACHINE,
+            resource_def_name=DEFINITION_NAME,
+        )
+        for i in range(ASSET_COUNT)
+    ]
+
+
+async def _import(bulk: bool) -> int:
+    engine = create_async_engine("sqlite+aiosqlite://")
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+            await conn.run_sync(SQLModel.metadata.create_all)
+        async with AsyncSession(engine, expire_on_commit=False) as db:
+            db.add(ResourceDefinition(name=DEFINITION_NAME, fqn="pylabrobot.resources.Resource"))
+            await db.commit()
+            if bulk:
+                await machine_service.create_many(db, objs_in=_machines())
+            else:
+                for machine_in in _machines():
+                    await machine_service.create(db, obj_in=machine_in)
+            return (await db.execute(select(func.count()).select_from(Resource))).scalar_one()
+    finally:
+        await engine.dispose()
+
+
+def test_import_per_entity(benchmark) -> None:
+    count = benchmark.pedantic(lambda: asyncio.run(_import(bulk=False)), rounds=3)
+    assert count == ASSET_COUNT
+
+
+def test_import_bulk(benchmark) -> None:
+    count = benchmark.pedantic(lambda: asyncio.run(_import(bulk=True)), rounds=3)
+    assert count == ASSET_COUNT
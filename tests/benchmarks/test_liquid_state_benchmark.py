@@ -0,0 +1,65 @@
+"""Benchmarks for the exact-level liquid state model.
+
+A 1536-well serial dilution transfers half of each column into the next one,
+snapshotting the state after every column as the simulator does between
+transitions. The per-well path mirrors how `MethodContract` effects drive the
+state one transfer at a time; the vectorized path moves a whole column per call.
+
+Run with ``pytest tests/benchmarks -m slow --benchmark-only``.
+"""
+
+import pytest
+
+from praxis.backend.core.simulation.state_models import ExactLiquidState
+
+pytestmark = [pytest.mark.slow, pytest.mark.benchmark(group="liquid-state")]
+
+ROWS = [chr(ord("A") + i) for i in range(26)] + ["AA", "AB", "AC", "AD", "AE", "AF"]
+COLUMNS = range(1, 49)
+
+
+def _plate() -> tuple[ExactLiquidState, list[list[str]]]:
+    columns = [[f"plate['{row}{col}']" for row in ROWS] for col in COLUMNS]
+    state = ExactLiquidState()
+    state.register_resource([well for column in columns for well in column], max_capacity=15.0)
+    for well in columns[0]:
+        state.set_volume(well, 10.0, max_capacity=15.0)
+    for column in columns[1:]:
+        for well in column:
+            state.set_volume(well, 5.0, max_capacity=15.0)
+    return state, columns
+
+
+def _serial_dilution_per_well(state: ExactLiquidState, columns: list[list[str]]) -> None:
+    snapshots = []
+    for source, dest in zip(columns, columns[1:], strict=False):
+        for s, d in zip(source, dest, strict=True):
+            state.transfer(s, d, 5.0)
+        snapshots.append(state.copy())
+
+
+def _serial_dilution_vectorized(state: ExactLiquidState, columns: list[list[str]]) -> None:
+    snapshots = []
+    for source, dest in zip(columns, columns[1:], strict=False):
+        state.transfer_many(source, dest, 5.0)
+        snapshots.append(state.copy())
+
+
+def test_serial_dilution_per_well(benchmark) -> None:
+    """Column-by-column dilution applied one well at a time."""
+    benchmark.pedantic(_serial_dilution_per_well, setup=lambda: (_plate(), {}), rounds=5)
+
+
+def test_serial_dilution_vectorized(benchmark) -> None:
+    """Column-by-column dilution applied one column per call."""
+    benchmark.pedantic(_serial_dilution_vectorized, setup=lambda: (_plate(), {}), rounds=5)
+
+
+def test_serial_dilution_paths_agree() -> None:
+    """Both paths end in the same state."""
+    per_well, columns = _plate()
+    vectorized, _ = _plate()
+    _serial_dilution_per_well(per_well, columns)
+    _serial_dilution_vectorized(vectorized, columns)
+    assert per_well == vectorized
+    assert per_well.get_volume("plate['A48']") == 10.0
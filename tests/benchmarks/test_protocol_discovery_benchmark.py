@@ -0,0 +1,109 @@
+"""Benchmark protocol discovery with a shared parse versus per-consumer parses.
+
+"Per consumer" mirrors the old flow: discovery, the requirement extractor and
+the graph extractor each parse the file and walk the tree on their own.
+"Shared" parses the file once into a ParsedModule and runs discovery as a single
+traversal that feeds both per-function extractors. Parse and node-visit counts
+per file are reported in the benchmark's extra_info.
+
+Run with: pytest tests/benchmarks -m slow --benchmark-only
+"""
+
+import textwrap
+
+import libcst as cst
+import pytest
+
+from praxis.backend.utils.plr_static_analysis.parsed_module import ParsedModule
+from praxis.backend.utils.plr_static_analysis.visitors.computation_graph_extractor import (
+    extract_graph_from_source,
+)
+from praxis.backend.utils.plr_static_analysis.visitors.protocol_discovery import (
+    ProtocolFunctionVisitor,
+)
+from praxis.backend.utils.plr_static_analysis.visitors.protocol_requirement_extractor import (
+    extract_requirements_from_source,
+)
+
+pytestmark = [pytest.mark.slow, pytest.mark.benchmark(group="protocol-discovery-parse")]
+
+PROTOCOL_COUNT = 20
+
+PROTOCOL_TEMPLATE = '''
+@protocol_function(param_metadata={{"volume": {{"constraints": {{"min": 1}}}}}})
+async def transfer_{index}(lh: LiquidHandler, source: Plate, dest: Plate, tips: TipRack, volume: float = 50.0):
+    """Transfer between plates."""
+    await lh.pick_up_tips(tips["A1:H1"])
+    for column in range(12):
+        wells = source.wells()
+        await lh.aspirate(wells, vols=[volume] * 8)
+        if column % 2:
+            await lh.dispense(dest["A1:H1"], vols=[volume] * 8)
+        await lh.move_plate(dest, source)
+    await lh.drop_tips(tips["A1:H1"])
+'''
+
+SOURCE = "from pylabrobot.resources import Plate, TipRack\n" + "".join(
+    textwrap.dedent(PROTOCOL_TEMPLATE).format(index=i) for i in range(PROTOCOL_COUNT)
+)
+
+
+class _Counts:
+    def __init__(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        self.parses = 0
+        self.node_visits = 0
+        parse_module = cst.parse_module
+        visit = cst.CSTNode.visit
+
+        def counting_parse(*args, **kwargs):
+            self.parses += 1
+            return parse_module(*args, **kwargs)
+
+        def counting_visit(node, visitor):
+            self.node_visits += 1
+            return visit(node, visitor)
+
+        monkeypatch.setattr(cst, "parse_module", counting_parse)
+        monkeypatch.setattr(cst.CSTNode, "visit", counting_visit)
+
+    def per_file(self, rounds: int) -> dict[str, float]:
+        return {
+            "parses_per_file": self.parses / rounds,
+            "node_visits_per_file": self.node_visits / rounds,
+        }
+
+
+def _discover_per_consumer() -> int:
+    visitor = ProtocolFunctionVisitor("bench", "bench.py")
+    ParsedModule(SOURCE).visit(visitor)
+    for definition in visitor.definitions:
+        extract_requirements_from_source(SOURCE)
+        extract_graph_from_source(SOURCE, definition.name, module_name="bench")
+    return len(visitor.definitions)
+
+
+def _discover_shared() -> int:
+    visitor = ProtocolFunctionVisitor("bench", "bench.py")
+    ParsedModule(SOURCE).visit(visitor)
+    assert all(d.computation_graph and d.hardware_requirements for d in visitor.definitions)
+    return len(visitor.definitions)
+
+
+def test_discovery_per_consumer_parse(benchmark, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Every consumer parses and walks the file itself."""
+    counts = _Counts(monkeypatch)
+    assert _discover_per_consumer() == PROTOCOL_COUNT
+    benchmark.extra_info.update(counts.per_file(1))
+    assert counts.parses == 1 + 2 * PROTOCOL_COUNT
+
+    assert benchmark.pedantic(_discover_per_consumer, rounds=5) == PROTOCOL_COUNT
+
+
+def test_discovery_shared_parse(benchmark, monkeypatch: pytest.MonkeyPatch) -> None:
+    """One parse, one traversal feeding discovery and both extractors."""
+    counts = _Counts(monkeypatch)
+    assert _discover_shared() == PROTOCOL_COUNT
+    benchmark.extra_info.update(counts.per_file(1))
+    assert counts.parses == 1
+
+    assert benchmark.pedantic(_discover_shared, rounds=5) == PROTOCOL_COUNT
@@ -0,0 +1,85 @@
+"""Benchmark PLR state transformation over a fully loaded 1536-well deck.
+
+"Per resource" mirrors the old flow: every well name is run through separate
+parent and well-ID regexes on every transform. "Compiled" resolves each name
+with the module's single precompiled pattern, either cold (memo cleared before
+every round) or warm, as for consecutive snapshots of the same deck.
+
+Run with: pytest tests/benchmarks -m slow --benchmark-only
+"""
+
+import re
+from typing import Any
+
+import pytest
+from pylabrobot.resources import Hibase_Greiner_1536_Well
+
+from praxis.backend.core import state_transform
+from praxis.backend.core.state_transform import extract_liquid_volumes
+
+pytestmark = [pytest.mark.slow, pytest.mark.benchmark(group="state-transform-1536")]
+
+PLATE_COUNT = 4
+
+
+def _loaded_deck_state() -> dict[str, Any]:
+    state: dict[str, Any] = {"liquid_handler": {"head_state": {0: {"tip": None}}}}
+    for index in range(PLATE_COUNT):
+        plate = Hibase_Greiner_1536_Well(f"plate_{index}")
+        for name, well_state in plate.serialize_all_state().items():
+            if "volume" in well_state:
+                well_state = {**well_state, "volume": 5.0}
+            state[name] = well_state
+    return state
+
+
+STATE = _loaded_deck_state()
+WELL_COUNT = PLATE_COUNT * 1536
+
+
+def _extract_per_resource(plr_state: dict[str, Any]) -> dict[str, dict[str, float]]:
+    liquids: dict[str, dict[str, float]] = {}
+    for resource_name, resource_state in plr_state.items():
+        if not isinstance(resource_state, dict) or resource_state.get("volume", 0.0) <= 0:
+            continue
+        match = re.match(r"^(.+?)(?:_well)?_([A-P]\d{1,2})$", resource_name, re.IGNORECASE)
+        if match:
+            parent_name = match.group(1)
+        elif re.match(r"^[A-P]\d{1,2}$", resource_name, re.IGNORECASE):
+            parent_name = "unknown_plate"
+        else:
+            parent_name = resource_name
+        well = re.search(r"([A-P]\d{1,2})$", resource_name, re.IGNORECASE)
+        well_id = well.group(1).upper() if well else resource_name
+        liquids.setdefault(parent_name, {})[well_id] = resource_state["volume"]
+    return liquids
+
+
+def _well_count(liquids: dict[str, dict[str, float]]) -> int:
+    return sum(len(wells) for wells in liquids.values())
+
+
+def test_transform_per_resource_patterns(benchmark) -> None:
+    """Old flow: separate regex evaluations per well on every transform."""
+    result = benchmark(_extract_per_resource, STATE)
+    # Rows Q-Z and AA-AF are not recognised, so each of those wells becomes a "plate".
+    assert len(result) > PLATE_COUNT
+
+
+def test_transform_compiled_cold(benchmark) -> None:
+    """Compiled pattern with an empty memo each round."""
+
+    def run() -> dict[str, dict[str, float]]:
+        state_transform._resolve_well_name.cache_clear()
+        return extract_liquid_volumes(STATE)
+
+    result = benchmark(run)
+    assert sorted(result) == [f"plate_{index}" for index in range(PLATE_COUNT)]
+    assert _well_count(result) == WELL_COUNT
+
+
+def test_transform_compiled_warm(benchmark) -> None:
+    """Compiled pattern with the memo populated by a previous snapshot."""
+    extract_liquid_volumes(STATE)
+    result = benchmark(extract_liquid_volumes, STATE)
+    assert _well_count(result) == WELL_COUNT
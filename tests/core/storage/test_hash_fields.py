@@ -0,0 +1,62 @@
+"""Tests for per-field hash operations across the KeyValueStore adapters."""
+
+from collections.abc import AsyncIterator
+from unittest.mock import patch
+
+import fakeredis.aioredis
+import pytest
+import pytest_asyncio
+
+from praxis.backend.core.storage.memory_adapter import InMemoryKeyValueStore
+from praxis.backend.core.storage.protocols import KeyValueStore
+from praxis.backend.core.storage.redis_adapter import RedisKeyValueStore
+from praxis.backend.core.storage.sqlite_adapter import SqliteKeyValueStore
+
+NOW = 1_000_000.0
+
+
+@pytest_asyncio.fixture(params=["memory", "sqlite", "redis"])
+async def store(request: pytest.FixtureRequest) -> AsyncIterator[KeyValueStore]:
+    """Yield each adapter in turn."""
+    if request.param == "memory":
+        kv: KeyValueStore = InMemoryKeyValueStore()
+    elif request.param == "sqlite":
+        kv = SqliteKeyValueStore(":memory:")
+    else:
+        kv = RedisKeyValueStore()
+        kv._client = fakeredis.aioredis.FakeRedis()
+    yield kv
+    await kv.close()
+
+
+@pytest.mark.asyncio
+async def test_fields_are_set_read_and_deleted(store: KeyValueStore) -> None:
+    """Test fields are independent entries of one hash."""
+    await store.hset("registry", "dev-1", {"status": "connected"})
+    await store.hset("registry", "dev-2", {"status": "connecting"})
+
+    assert await store.hget("registry", "dev-1") == {"status": "connected"}
+    assert await store.hget("registry", "missing") is None
+    assert await store.hgetall("registry") == {
+        "dev-1": {"status": "connected"},
+        "dev-2": {"status": "connecting"},
+    }
+    assert await store.hdel("registry", "dev-1", "missing") == 1
+    assert await store.hgetall("registry") == {"dev-2": {"status": "connecting"}}
+    assert await store.delete("registry") is True
+    assert await store.hgetall("registry") == {}
+
+
+@pytest.mark.asyncio
+async def test_fields_expire_individually(store: KeyValueStore) -> None:
+    """Test a lapsed field disappears while a refreshed one stays."""
+    with patch("time.time", return_value=NOW):
+        await store.hset("registry", "stale", 1, ttl_seconds=60)
+        await store.hset("registry", "pinned", 2)
+    with patch("time.time", return_value=NOW + 30):
+        await store.hset("registry", "fresh", 3, ttl_seconds=60)
+
+    with patch("time.time", return_value=NOW + 61):
+        assert await store.hget("registry", "stale") is None
+        assert await store.hgetall("registry") == {"pinned": 2, "fresh": 3}
+        assert await store.hdel("registry", "stale") == 0
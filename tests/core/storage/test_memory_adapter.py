@@ -87,6 +87,32 @@ class TestInMemoryKeyValueStore:
         # Key should be expired
         assert await store.get("key1") is None
 
+    @pytest.mark.asyncio
+    async def test_compare_and_set(self, store: InMemoryKeyValueStore) -> None:
+        """Test set-if-absent, conditional replace and conditional delete."""
+        assert await store.compare_and_set("lock", None, {"owner": "a"}) is True
+        assert await store.compare_and_set("lock", None, {"owner": "b"}) is False
+        assert await store.compare_and_set("lock", {"owner": "b"}, None) is False
+        assert await store.compare_and_set("lock", {"owner": "a"}, {"owner": "a2"}) is True
+        assert await store.compare_and_set("lock", {"owner": "a2"}, None) is True
+        assert await store.exists("lock") is False
+
+    @pytest.mark.asyncio
+    async def test_compare_and_set_treats_expired_as_absent(
+        self, store: InMemoryKeyValueStore,
+    ) -> None:
+        """Test that an expired value no longer blocks set-if-absent."""
+        await store.set("lock", "a", ttl_seconds=1)
+        await asyncio.sleep(1.1)
+        assert await store.compare_and_set("lock", None, "b") is True
+
+    @pytest.mark.asyncio
+    async def test_increment(self, store: InMemoryKeyValueStore) -> None:
+        """Test that counters start at zero and only increase."""
+        assert await store.increment("counter") == 1
+        assert await store.increment("counter", 5) == 6
+        assert await store.get("counter") == 6
+
     @pytest.mark.asyncio
     async def test_close(self, store: InMemoryKeyValueStore) -> None:
         """Test closing the store."""
@@ -146,6 +172,7 @@ class TestInMemoryPubSub:
         """Test unsubscribing from a channel."""
         subscription = pubsub.subscribe("events")
         await subscription.unsubscribe()
+        assert await pubsub.publish("events", "ignored") == 0
 
         # After unsubscribe, iteration should stop
         with pytest.raises(StopAsyncIteration):
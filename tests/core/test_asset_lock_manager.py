@@ -1,9 +1,15 @@
 """Tests for core/asset_lock_manager.py."""
 
+import asyncio
+import time
+from unittest.mock import AsyncMock
 
+import fakeredis
 import pytest
 
 from praxis.backend.core.asset_lock_manager import AssetLockManager
+from praxis.backend.core.storage.memory_adapter import InMemoryKeyValueStore, InMemoryPubSub
+from praxis.backend.core.storage.redis_adapter import RedisKeyValueStore
 from praxis.backend.models.pydantic_internals.runtime import AcquireAssetLock
 from praxis.backend.utils.uuid import uuid7
 
@@ -403,3 +409,147 @@ class TestAssetLockManagerIntegration:
         # Check it's the new lock
         status = await manager.get_lock_status("MACHINE", "machine1")
         assert status.protocol_run_id == protocol_run_id2
+
+
+def _lock(asset_name: str = "machine1", **overrides) -> AcquireAssetLock:
+    fields = {
+        "asset_type": "MACHINE",
+        "asset_name": asset_name,
+        "protocol_run_id": uuid7(),
+        "reservation_id": uuid7(),
+    }
+    fields.update(overrides)
+    return AcquireAssetLock(**fields)
+
+
+@pytest.fixture
+def shared_store() -> tuple[InMemoryKeyValueStore, InMemoryPubSub]:
+    """A store and pub/sub shared by several managers (i.e. several processes)."""
+    return InMemoryKeyValueStore(), InMemoryPubSub()
+
+
+class TestDistributedLeases:
+
+    """Tests for lease, fencing and cross-manager behavior."""
+
+    @pytest.mark.asyncio
+    async def test_managers_sharing_a_store_exclude_each_other(self, shared_store) -> None:
+        store, pubsub = shared_store
+        worker_a = AssetLockManager(store=store, pubsub=pubsub)
+        worker_b = AssetLockManager(store=store, pubsub=pubsub)
+
+        assert await worker_a.acquire_asset_lock(_lock()) is True
+        assert await worker_b.acquire_asset_lock(_lock()) is False
+        assert await worker_b.check_asset_availability("MACHINE", "machine1") is not None
+        await worker_a.close()
+
+    @pytest.mark.asyncio
+    async def test_fencing_tokens_increase_across_holders(self, shared_store) -> None:
+        store, pubsub = shared_store
+        manager = AssetLockManager(store=store, pubsub=pubsub)
+
+        tokens = []
+        for _ in range(3):
+            lock_data = _lock()
+            lease = await manager.acquire_lease(lock_data)
+            tokens.append(lease.fencing_token)
+            await manager.release_asset_lock(
+                "MACHINE", "machine1", lock_data.reservation_id, lock_data.protocol_run_id,
+            )
+
+        assert tokens == sorted(tokens)
+        assert len(set(tokens)) == 3
+
+    @pytest.mark.asyncio
+    async def test_waiter_is_woken_by_release(self, shared_store) -> None:
+        store, pubsub = shared_store
+        holder = AssetLockManager(store=store, pubsub=pubsub)
+        waiter = AssetLockManager(store=store, pubsub=pubsub, recheck_seconds=30)
+        held = _lock()
+        await holder.acquire_asset_lock(held)
+
+        async def release_soon() -> None:
+            await asyncio.sleep(0.05)
+            await holder.release_asset_lock("MACHINE", "machine1", held.reservation_id)
+
+        release_task = asyncio.create_task(release_soon())
+        start = time.monotonic()
+        lease = await waiter.acquire_lease(_lock(timeout_seconds=5))
+        await release_task
+
+        assert lease is not None
+        assert time.monotonic() - start < 1.0
+        await waiter.close()
+
+    @pytest.mark.asyncio
+    async def test_release_requires_matching_reservation(self) -> None:
+        manager = AssetLockManager()
+        await manager.acquire_asset_lock(_lock())
+
+        assert await manager.release_asset_lock("MACHINE", "machine1", uuid7()) is False
+        assert await manager.get_lock_status("MACHINE", "machine1") is not None
+        await manager.close()
+
+    @pytest.mark.asyncio
+    async def test_release_all_protocol_locks_uses_run_index(self) -> None:
+        manager = AssetLockManager()
+        run_id = uuid7()
+        other_run = _lock("machine9")
+        for name in ("machine1", "machine2", "machine3"):
+            await manager.acquire_asset_lock(_lock(name, protocol_run_id=run_id))
+        await manager.acquire_asset_lock(other_run)
+        manager._store.get = AsyncMock(wraps=manager._store.get)
+
+        assert await manager.release_all_protocol_locks(run_id) == 3
+
+        # One index read plus one read per lock of the run, never a key scan.
+        assert manager._store.get.await_count == 4
+        assert await manager.get_lock_status("MACHINE", "machine9") is not None
+        assert set(manager._locks) == {"MACHINE:machine9"}
+        await manager.close()
+
+    @pytest.mark.asyncio
+    async def test_unrenewed_lease_expires_and_renewed_lease_survives(self, shared_store) -> None:
+        store, pubsub = shared_store
+        renewing = AssetLockManager(store=store, pubsub=pubsub, lease_seconds=1)
+        crashed = AssetLockManager(store=store, pubsub=pubsub, lease_seconds=1)
+        other = AssetLockManager(store=store, pubsub=pubsub, lease_seconds=1)
+
+        await renewing.acquire_asset_lock(_lock("kept"))
+        stale = await crashed.acquire_lease(_lock("abandoned"))
+        await crashed.close()  # Process died: nobody renews its lease.
+        await asyncio.sleep(1.5)
+
+        assert await other.acquire_asset_lock(_lock("kept")) is False
+        taken = await other.acquire_lease(_lock("abandoned"))
+        assert taken is not None
+        assert taken.fencing_token > stale.fencing_token
+        assert await crashed.renew_lease(stale) is False
+        await renewing.close()
+        await other.close()
+
+
+class TestRedisBackedLocks:
+
+    """Runs the lock manager against the Redis key-value adapter."""
+
+    @pytest.mark.asyncio
+    async def test_redis_store_supports_leases(self) -> None:
+        server = fakeredis.FakeServer()
+        pubsub = InMemoryPubSub()
+        managers = []
+        for _ in range(2):
+            store = RedisKeyValueStore()
+            store._client = fakeredis.aioredis.FakeRedis(server=server)
+            managers.append(AssetLockManager(store=store, pubsub=pubsub))
+        first, second = managers
+        held = _lock()
+
+        lease = await first.acquire_lease(held)
+        assert lease.fencing_token == 1
+        assert await second.acquire_asset_lock(_lock()) is False
+        assert await first.renew_lease(lease) is True
+        assert await first.release_all_protocol_locks(held.protocol_run_id) == 1
+        assert (await second.acquire_lease(_lock())).fencing_token == 2
+        await first.close()
+        await second.close()
@@ -10,7 +10,11 @@ from praxis.backend.models.enums import MachineStatusEnum
 from praxis.backend.models.enums import ResourceStatusEnum
 from praxis.backend.models.pydantic_internals.runtime import AcquireAsset
 from praxis.backend.models.domain.protocol import AssetRequirement as AssetRequirementModel
-from praxis.backend.utils.errors import AssetAcquisitionError, AssetReleaseError
+from praxis.backend.utils.errors import (
+    AssetAcquisitionError,
+    AssetReleaseError,
+    WorkcellRuntimeError,
+)
 from praxis.backend.utils.uuid import uuid7
 
 
@@ -232,6 +236,87 @@ class TestAcquireMachine:
         assert result == mock_live_machine
 
 
+class TestPrepareMachines:
+
+    """Tests for prepare_machines method."""
+
+    @staticmethod
+    def _manager() -> AssetManager:
+        return AssetManager(
+            db_session=AsyncMock(),
+            workcell_runtime=Mock(),
+            deck_service=Mock(),
+            machine_service=Mock(),
+            resource_service=Mock(),
+            resource_type_definition_service=Mock(),
+            asset_lock_manager=Mock(),
+        )
+
+    @staticmethod
+    def _requirement(name: str, fqn: str) -> Mock:
+        requirement = Mock()
+        requirement.name = name
+        requirement.fqn = fqn
+        return requirement
+
+    @pytest.mark.asyncio
+    async def test_prepare_machines_starts_selected_machines_together(self) -> None:
+        """Machines for all machine requirements are started in one batch."""
+        manager = self._manager()
+        run_id = uuid7()
+        handler, reader = Mock(accession_id=uuid7()), Mock(accession_id=uuid7())
+
+        manager.resource_type_definition_svc.get_by_name = AsyncMock(
+            side_effect=lambda _db, name: Mock() if name == "test.Plate" else None,
+        )
+        manager.machine_svc.get_multi = AsyncMock(side_effect=[[], [handler], [], [reader]])
+        manager.workcell_runtime.initialize_machines = AsyncMock(return_value={})
+
+        await manager.prepare_machines(
+            run_id,
+            [
+                self._requirement("lh", "test.Handler"),
+                self._requirement("plate", "test.Plate"),
+                self._requirement("reader", "test.Reader"),
+            ],
+        )
+
+        manager.workcell_runtime.initialize_machines.assert_awaited_once()
+        (models,) = manager.workcell_runtime.initialize_machines.await_args.args
+        assert list(models) == [handler, reader]
+
+    @pytest.mark.asyncio
+    async def test_prepare_machines_skips_single_machine(self) -> None:
+        """A lone machine is left to acquire_machine to start."""
+        manager = self._manager()
+        manager.resource_type_definition_svc.get_by_name = AsyncMock(return_value=None)
+        manager.machine_svc.get_multi = AsyncMock(side_effect=[[], [Mock(accession_id=uuid7())]])
+        manager.workcell_runtime.initialize_machines = AsyncMock()
+
+        await manager.prepare_machines(uuid7(), [self._requirement("lh", "test.Handler")])
+
+        manager.workcell_runtime.initialize_machines.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_prepare_machines_swallows_start_up_failure(self) -> None:
+        """A failed batch start leaves the per-asset acquisition to report errors."""
+        manager = self._manager()
+        manager.resource_type_definition_svc.get_by_name = AsyncMock(return_value=None)
+        manager.machine_svc.get_multi = AsyncMock(
+            side_effect=[[], [Mock(accession_id=uuid7())], [], [Mock(accession_id=uuid7())]],
+        )
+        manager.workcell_runtime.initialize_machines = AsyncMock(
+            side_effect=WorkcellRuntimeError("boom"),
+        )
+
+        await manager.prepare_machines(
+            uuid7(),
+            [self._requirement("lh", "test.Handler"), self._requirement("reader", "test.Reader")],
+        )
+
+        manager.workcell_runtime.initialize_machines.assert_awaited_once()
+
+
 class TestAcquireResource:
 
     """Tests for acquire_resource method."""
@@ -743,7 +828,9 @@ class TestFindResourceToAcquire:
         mock_resource.status = ResourceStatusEnum.IN_USE
         mock_resource.current_protocol_run_accession_id = run_id
 
-        manager.resource_svc.get_multi = AsyncMock(return_value=[mock_resource])
+        manager.resource_svc.find_acquisition_candidates = AsyncMock(
+            return_value={"test.Resource": [mock_resource]},
+        )
 
         result = await manager._find_resource_to_acquire(
             run_id,
@@ -753,6 +840,12 @@ class TestFindResourceToAcquire:
         )
 
         assert result == mock_resource
+        manager.resource_svc.find_acquisition_candidates.assert_awaited_once_with(
+            manager.db,
+            protocol_run_accession_id=run_id,
+            fqn_counts={"test.Resource": 1},
+            property_filters=None,
+        )
 
     @pytest.mark.asyncio
     async def test_find_resource_on_deck(self) -> None:
@@ -773,8 +866,10 @@ class TestFindResourceToAcquire:
         mock_resource.fqn = "test.Resource"
         mock_resource.status = ResourceStatusEnum.AVAILABLE_ON_DECK
 
-        # First call returns empty (no in-use), second call returns resource on deck
-        manager.resource_svc.get_multi = AsyncMock(side_effect=[[], [mock_resource]])
+        # Ranking happens in one query; the best candidate comes first
+        manager.resource_svc.find_acquisition_candidates = AsyncMock(
+            return_value={"test.Resource": [mock_resource]},
+        )
 
         result = await manager._find_resource_to_acquire(
             run_id,
@@ -784,6 +879,73 @@ class TestFindResourceToAcquire:
         )
 
         assert result == mock_resource
+        manager.resource_svc.find_acquisition_candidates.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_find_resource_none_available(self) -> None:
+        """Test no candidate yields None."""
+        manager = AssetManager(
+            db_session=AsyncMock(),
+            workcell_runtime=Mock(),
+            deck_service=Mock(),
+            machine_service=Mock(),
+            resource_service=Mock(),
+            resource_type_definition_service=Mock(),
+            asset_lock_manager=Mock(),
+        )
+
+        manager.resource_svc.find_acquisition_candidates = AsyncMock(
+            return_value={"test.Resource": []},
+        )
+
+        result = await manager._find_resource_to_acquire(
+            uuid7(),
+            "test.Resource",
+            None,
+            None,
+        )
+
+        assert result is None
+
+    @pytest.mark.asyncio
+    async def test_find_resources_batches_and_allocates_distinct_instances(self) -> None:
+        """Test a batch shares one query and never hands out an instance twice."""
+        manager = AssetManager(
+            db_session=AsyncMock(),
+            workcell_runtime=Mock(),
+            deck_service=Mock(),
+            machine_service=Mock(),
+            resource_service=Mock(),
+            resource_type_definition_service=Mock(),
+            asset_lock_manager=Mock(),
+        )
+
+        run_id = uuid7()
+        plates = [Mock(accession_id=uuid7(), fqn="test.Plate") for _ in range(2)]
+        tips = Mock(accession_id=uuid7(), fqn="test.Tips")
+        manager.resource_svc.find_acquisition_candidates = AsyncMock(
+            return_value={"test.Plate": plates, "test.Tips": [tips]},
+        )
+        requests = [
+            AcquireAsset(
+                protocol_run_accession_id=run_id,
+                requested_asset_name_in_protocol=name,
+                fqn=fqn,
+            )
+            for name, fqn in [
+                ("source", "test.Plate"),
+                ("tips", "test.Tips"),
+                ("dest", "test.Plate"),
+                ("spare_tips", "test.Tips"),
+            ]
+        ]
+
+        result = await manager._find_resources_to_acquire(requests)
+
+        assert result == [plates[0], tips, plates[1], None]
+        manager.resource_svc.find_acquisition_candidates.assert_awaited_once()
+        call = manager.resource_svc.find_acquisition_candidates.await_args
+        assert call.kwargs["fqn_counts"] == {"test.Plate": 2, "test.Tips": 2}
 
 
 class TestModuleStructure:
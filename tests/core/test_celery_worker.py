@@ -0,0 +1,250 @@
+"""Tests for core/celery_worker.py."""
+
+import asyncio
+import json
+import logging
+import multiprocessing
+import threading
+from logging.handlers import QueueHandler
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from praxis.backend.core import celery_worker
+from praxis.backend.utils.async_run import BackgroundEventLoop
+from praxis.backend.utils.logging import configure_logging, get_logger, shutdown_logging
+
+
+@pytest.fixture
+def fresh_worker_loop():
+    """Ensure each test starts and ends without a worker loop."""
+    celery_worker.stop_worker_loop()
+    with patch.object(celery_worker, "warm_worker_resources", AsyncMock()), patch.object(
+        celery_worker, "release_worker_resources", AsyncMock(),
+    ):
+        yield
+        celery_worker.stop_worker_loop()
+
+
+class TestBackgroundEventLoop:
+
+    """Tests for the BackgroundEventLoop helper."""
+
+    def test_run_returns_coroutine_result(self) -> None:
+        """Test that run executes the coroutine and returns its value."""
+        loop = BackgroundEventLoop()
+        loop.start()
+        try:
+            async def _double(value: int) -> int:
+                await asyncio.sleep(0)
+                return value * 2
+
+            assert loop.run(_double(21)) == 42
+        finally:
+            loop.stop()
+
+    def test_loop_persists_between_calls(self) -> None:
+        """Test that consecutive calls run on the same event loop."""
+        loop = BackgroundEventLoop()
+        loop.start()
+        try:
+            async def _current_loop() -> asyncio.AbstractEventLoop:
+                return asyncio.get_running_loop()
+
+            assert loop.run(_current_loop()) is loop.run(_current_loop())
+        finally:
+            loop.stop()
+
+    def test_run_propagates_exceptions(self) -> None:
+        """Test that exceptions raised by the coroutine reach the caller."""
+        loop = BackgroundEventLoop()
+        loop.start()
+        try:
+            async def _fail() -> None:
+                msg = "boom"
+                raise ValueError(msg)
+
+            with pytest.raises(ValueError, match="boom"):
+                loop.run(_fail())
+        finally:
+            loop.stop()
+
+    def test_stop_cancels_pending_tasks(self) -> None:
+        """Test that stop cancels tasks still scheduled on the loop."""
+        loop = BackgroundEventLoop()
+        loop.start()
+        cancelled = threading.Event()
+
+        async def _forever() -> None:
+            try:
+                await asyncio.sleep(3600)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        asyncio.run_coroutine_threadsafe(_forever(), loop.loop)
+        loop.stop()
+        assert cancelled.is_set()
+        assert not loop.is_running
+
+    def test_loop_property_requires_start(self) -> None:
+        """Test that accessing the loop before start raises."""
+        with pytest.raises(RuntimeError):
+            _ = BackgroundEventLoop().loop
+
+
+class TestWorkerLoopLifecycle:
+
+    """Tests for the worker loop start/stop helpers."""
+
+    def test_get_worker_loop_starts_lazily(self, fresh_worker_loop) -> None:
+        """Test that get_worker_loop starts a loop when none is running."""
+        loop = celery_worker.get_worker_loop()
+        assert loop.is_running
+        assert celery_worker.get_worker_loop() is loop
+
+    def test_start_warms_resources_once(self, fresh_worker_loop) -> None:
+        """Test that warming runs on start but not on reuse."""
+        celery_worker.start_worker_loop()
+        celery_worker.start_worker_loop()
+        assert celery_worker.warm_worker_resources.await_count == 1
+
+    def test_stop_releases_resources(self, fresh_worker_loop) -> None:
+        """Test that stopping the loop releases warm resources."""
+        loop = celery_worker.start_worker_loop()
+        celery_worker.stop_worker_loop()
+        celery_worker.release_worker_resources.assert_awaited_once()
+        assert not loop.is_running
+
+    def test_loop_from_other_process_is_replaced(self, fresh_worker_loop) -> None:
+        """Test that a loop inherited across fork is not reused."""
+        loop = celery_worker.start_worker_loop()
+        celery_worker._worker_loop_pid = -1
+        replacement = celery_worker.get_worker_loop()
+        assert replacement is not loop
+        loop.stop()
+
+    def test_run_in_worker_loop_reuses_loop(self, fresh_worker_loop) -> None:
+        """Test that tasks share one event loop across calls."""
+        async def _current_loop() -> asyncio.AbstractEventLoop:
+            return asyncio.get_running_loop()
+
+        first = celery_worker.run_in_worker_loop(_current_loop())
+        second = celery_worker.run_in_worker_loop(_current_loop())
+        assert first is second
+
+    def test_worker_process_init_signal_starts_loop(self, fresh_worker_loop) -> None:
+        """Test that the worker_process_init handler starts the loop."""
+        celery_worker._on_worker_process_init()
+        assert celery_worker._worker_loop is not None
+        assert celery_worker._worker_loop.is_running
+
+
+class TestWarmWorkerResources:
+
+    """Tests for warm_worker_resources."""
+
+    @pytest.mark.asyncio
+    async def test_resolves_container_providers(self) -> None:
+        """Test that configured container providers are resolved and pinged."""
+        redis_instance = Mock()
+        redis_instance.ping = AsyncMock()
+        container = Mock()
+        container.db_session_factory = Mock(return_value=object())
+        container.redis_client = Mock(return_value=redis_instance)
+        app = Mock()
+        app.container = container
+
+        with patch("praxis.backend.utils.db.async_engine") as engine:
+            engine.connect.return_value.__aenter__ = AsyncMock()
+            engine.connect.return_value.__aexit__ = AsyncMock(return_value=None)
+            await celery_worker.warm_worker_resources(app)
+
+        container.db_session_factory.assert_called_once()
+        redis_instance.ping.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_provider_failures_are_tolerated(self) -> None:
+        """Test that a failing provider does not abort warming."""
+        container = Mock()
+        container.db_session_factory = Mock(side_effect=RuntimeError("no db"))
+        container.redis_client = Mock(side_effect=RuntimeError("no redis"))
+        app = Mock()
+        app.container = container
+
+        with patch("praxis.backend.utils.db.async_engine") as engine:
+            engine.connect.side_effect = RuntimeError("unreachable")
+            await celery_worker.warm_worker_resources(app)
+
+    @pytest.mark.asyncio
+    async def test_attaches_container_to_app(self) -> None:
+        """Test that an app without a container gets one attached once."""
+        app = Mock(spec=[])
+        with patch.object(celery_worker, "Container") as container_cls, patch(
+            "praxis.backend.utils.db.async_engine",
+        ) as engine:
+            engine.connect.side_effect = RuntimeError("unreachable")
+            await celery_worker.warm_worker_resources(app)
+            assert celery_worker.attach_worker_container(app) is app.container
+
+        container_cls.assert_called_once_with()
+        app.container.config.from_dict.assert_called_once()
+        celery_worker._warm_instances.clear()
+
+
+class TestReleaseWorkerResources:
+
+    """Tests for release_worker_resources."""
+
+    @pytest.mark.asyncio
+    async def test_closes_only_warmed_instances(self) -> None:
+        """Test that release closes what warming created without resolving providers."""
+        redis_instance = Mock()
+        redis_instance.aclose = AsyncMock()
+        celery_worker._warm_instances["redis_client"] = redis_instance
+        container = Mock()
+        container.shutdown_resources.return_value = None
+        app = Mock()
+        app.container = container
+
+        with patch("praxis.backend.utils.db.async_engine") as engine:
+            engine.dispose = AsyncMock()
+            await celery_worker.release_worker_resources(app)
+
+        redis_instance.aclose.assert_awaited_once()
+        container.redis_client.assert_not_called()
+        assert celery_worker._warm_instances == {}
+
+
+def test_discard_inherited_connections_keeps_parent_sockets() -> None:
+    """Test that the inherited pool is disposed without closing connections."""
+    engine = Mock()
+    with patch("praxis.backend.utils.db._async_engine", engine):
+        celery_worker.discard_inherited_connections()
+    engine.sync_engine.dispose.assert_called_once_with(close=False)
+
+
+def _log_from_pool_process() -> None:
+    assert any(isinstance(h, QueueHandler) for h in logging.getLogger().handlers)
+    get_logger("praxis.test_pool_process").info("logged in pool process")
+    celery_worker._on_worker_process_shutdown()
+
+
+def test_worker_process_records_go_through_queue_writer(tmp_path) -> None:
+    """Test a forked worker process logs through the configured background writer."""
+    log_file = tmp_path / "logs" / "worker.log"
+    config = Mock(logging_level="INFO", log_file=str(log_file), logging_format="json")
+    with patch.object(celery_worker, "PraxisConfiguration", return_value=config):
+        celery_worker._on_setup_logging()
+    try:
+        process = multiprocessing.get_context("fork").Process(target=_log_from_pool_process)
+        process.start()
+        process.join(10)
+        shutdown_logging()
+    finally:
+        configure_logging(level=logging.WARNING)
+
+    assert process.exitcode == 0
+    entries = [json.loads(line) for line in log_file.read_text().splitlines()]
+    messages = [(entry["logger"], entry["message"]) for entry in entries]
+    assert ("praxis.test_pool_process", "logged in pool process") in messages
@@ -280,6 +280,7 @@ class TestAcquireAssets:
         asset_id = uuid7()
 
         mock_live_obj = Mock()
+        orchestrator.asset_manager.prepare_machines = AsyncMock()
         orchestrator.asset_manager.acquire_asset = AsyncMock(
             return_value=(mock_live_obj, asset_id, "resource"),
         )
@@ -318,6 +319,7 @@ class TestAcquireAssets:
 
         run_id = uuid7()
 
+        orchestrator.asset_manager.prepare_machines = AsyncMock()
         orchestrator.asset_manager.acquire_asset = AsyncMock(
             side_effect=AssetAcquisitionError("Asset not available"),
         )
@@ -355,6 +357,7 @@ class TestAcquireAssets:
 
         run_id = uuid7()
 
+        orchestrator.asset_manager.prepare_machines = AsyncMock()
         orchestrator.asset_manager.acquire_asset = AsyncMock(
             side_effect=AssetAcquisitionError("Asset not available"),
         )
@@ -834,6 +837,7 @@ class TestOrchestratorExecutionFlow:
         )
 
         # Mock Asset Acquisition
+        mock_asset_manager.prepare_machines = AsyncMock()
         mock_asset_manager.acquire_asset = AsyncMock(return_value=(mock_lh, uuid7(), "liquid_handler"))
 
         # Mock Service calls
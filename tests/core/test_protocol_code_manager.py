@@ -712,6 +712,237 @@ class TestPrepareProtocolCode:
         assert func == mock_function
 
 
+def _fs_protocol_model(base_path: str, module_name: str = "cached_protocol_mod") -> Mock:
+    fs_source = Mock()
+    fs_source.name = "fs"
+    fs_source.base_path = base_path
+    model = Mock()
+    model.name = "cached_protocol"
+    model.version = "1.0"
+    model.accession_id = None
+    model.module_name = module_name
+    model.function_name = "run"
+    model.source_repository_accession_id = None
+    model.file_system_source_accession_id = uuid7()
+    model.file_system_source = fs_source
+    return model
+
+
+def _git(*args: str, cwd) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=cwd, check=True, capture_output=True, text=True,
+    ).stdout.strip()
+
+
+class TestLoadedProtocolCache:
+
+    """Tests for the commit/content-keyed loaded-protocol cache."""
+
+    @pytest.mark.asyncio
+    async def test_file_system_source_loaded_once(self, tmp_path) -> None:
+        """Test that unchanged file-system sources are served from cache."""
+        (tmp_path / "cached_protocol_mod.py").write_text("def run():\n    pass\n")
+        manager = ProtocolCodeManager()
+        loaded = (Mock(), Mock(accession_id=None))
+        manager._load_protocol_function = Mock(return_value=loaded)
+
+        model = _fs_protocol_model(str(tmp_path))
+        first = await manager.prepare_protocol_code(model)
+        second = await manager.prepare_protocol_code(model)
+
+        assert first == second
+        manager._load_protocol_function.assert_called_once()
+        assert manager.cache_stats.hits == 1
+        assert manager.cache_stats.misses == 1
+        assert manager.cache_stats.prepare_count == 2
+
+    @pytest.mark.asyncio
+    async def test_file_system_source_change_invalidates(self, tmp_path) -> None:
+        """Test that editing the module forces a reload."""
+        module_file = tmp_path / "cached_protocol_mod.py"
+        module_file.write_text("def run():\n    pass\n")
+        manager = ProtocolCodeManager()
+        manager._load_protocol_function = Mock(return_value=(Mock(), Mock(accession_id=None)))
+
+        model = _fs_protocol_model(str(tmp_path))
+        await manager.prepare_protocol_code(model)
+        module_file.write_text("def run():\n    return 1\n")
+        await manager.prepare_protocol_code(model)
+
+        assert manager._load_protocol_function.call_count == 2
+        assert manager.cache_stats.hits == 0
+
+    @pytest.mark.asyncio
+    async def test_file_system_source_dependency_change_invalidates(self, tmp_path) -> None:
+        """Test that editing a module the protocol imports forces a reload."""
+        package = tmp_path / "cached_pkg"
+        package.mkdir()
+        (package / "__init__.py").write_text("")
+        (package / "proto.py").write_text("from .helpers import step\n\ndef run():\n    step()\n")
+        (package / "helpers.py").write_text("def step():\n    pass\n")
+        (package / "unrelated.py").write_text("")
+        manager = ProtocolCodeManager()
+        manager._load_protocol_function = Mock(return_value=(Mock(), Mock(accession_id=None)))
+
+        model = _fs_protocol_model(str(tmp_path), module_name="cached_pkg.proto")
+        await manager.prepare_protocol_code(model)
+        (package / "unrelated.py").write_text("x = 1\n")
+        await manager.prepare_protocol_code(model)
+        (package / "helpers.py").write_text("def step():\n    return 1\n")
+        await manager.prepare_protocol_code(model)
+
+        assert manager._load_protocol_function.call_count == 2
+        assert manager.cache_stats.hits == 1
+
+    def test_import_closure_stays_within_package(self, tmp_path) -> None:
+        """Test that the closure follows package imports but not outside ones."""
+        package = tmp_path / "closure_pkg"
+        (package / "sub").mkdir(parents=True)
+        (package / "__init__.py").write_text("")
+        (package / "sub" / "__init__.py").write_text("")
+        (package / "sub" / "proto.py").write_text(
+            "import os\nfrom closure_pkg.sub import util\nfrom closure_pkg import shared\n",
+        )
+        (package / "sub" / "util.py").write_text("from . import deep\n")
+        (package / "sub" / "deep.py").write_text("")
+        (package / "shared.py").write_text("")
+
+        closure = ProtocolCodeManager._import_closure(
+            package / "sub" / "proto.py",
+            "closure_pkg.sub.proto",
+        )
+
+        assert set(closure) == {
+            "closure_pkg.sub",
+            "closure_pkg.sub.proto",
+            "closure_pkg.sub.util",
+            "closure_pkg.sub.deep",
+        }
+
+    @pytest.mark.asyncio
+    async def test_cached_definition_is_not_mutated(self, tmp_path) -> None:
+        """Test that aligning the accession ID leaves the cached definition intact."""
+        (tmp_path / "cached_protocol_mod.py").write_text("def run():\n    pass\n")
+        cached_def = FunctionProtocolDefinitionCreate(
+            name="cached_protocol",
+            fqn="cached_protocol_mod.run",
+            version="1.0",
+            source_file_path=str(tmp_path / "cached_protocol_mod.py"),
+            module_name="cached_protocol_mod",
+            function_name="run",
+        )
+        manager = ProtocolCodeManager()
+        manager._load_protocol_function = Mock(return_value=(Mock(), cached_def))
+
+        model = _fs_protocol_model(str(tmp_path))
+        model.accession_id = uuid7()
+        _, returned_def = await manager.prepare_protocol_code(model)
+
+        assert returned_def.accession_id == model.accession_id
+        assert cached_def.accession_id is None
+
+    @pytest.mark.asyncio
+    async def test_full_sha_hit_skips_git(self) -> None:
+        """Test that a cached full commit SHA needs no git operations."""
+        manager = ProtocolCodeManager()
+        sha = "a" * 40
+        manager._ensure_git_repo_and_fetch = AsyncMock()
+        manager._checkout_specific_commit = AsyncMock(return_value=sha)
+        manager._load_protocol_function = Mock(return_value=(Mock(), Mock(accession_id=None)))
+
+        repo = Mock()
+        repo.name = "repo"
+        repo.git_url = "https://example.com/repo.git"
+        repo.local_checkout_path = "/tmp/repo"
+        model = Mock()
+        model.name = "p"
+        model.version = "1.0"
+        model.accession_id = None
+        model.module_name = "mod"
+        model.function_name = "run"
+        model.commit_hash = sha
+        model.source_repository_accession_id = uuid7()
+        model.source_repository = repo
+        model.file_system_source_accession_id = None
+
+        await manager.prepare_protocol_code(model)
+        await manager.prepare_protocol_code(model)
+
+        manager._ensure_git_repo_and_fetch.assert_called_once()
+        manager._checkout_specific_commit.assert_called_once()
+        manager._load_protocol_function.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_worktree_reused_across_managers(self, tmp_path) -> None:
+        """Test that per-commit worktrees are created once and reused on disk."""
+        origin = tmp_path / "origin"
+        origin.mkdir()
+        _git("init", "-q", cwd=origin)
+        (origin / "wt_protocol_mod.py").write_text("def run():\n    pass\n")
+        _git("add", ".", cwd=origin)
+        _git("-c", "user.name=t", "-c", "user.email=t@t", "commit", "-q", "-m", "init", cwd=origin)
+        sha = _git("rev-parse", "HEAD", cwd=origin)
+
+        repo = Mock()
+        repo.name = "origin"
+        repo.git_url = str(origin)
+        repo.local_checkout_path = str(tmp_path / "checkout")
+        model = Mock()
+        model.name = "p"
+        model.version = "1.0"
+        model.accession_id = None
+        model.module_name = "wt_protocol_mod"
+        model.function_name = "run"
+        model.commit_hash = sha
+        model.source_repository_accession_id = uuid7()
+        model.source_repository = repo
+        model.file_system_source_accession_id = None
+
+        worktree_root = str(tmp_path / "worktrees")
+        first = ProtocolCodeManager(worktree_root=worktree_root)
+        first._load_protocol_function = Mock(return_value=(Mock(), Mock(accession_id=None)))
+        await first.prepare_protocol_code(model)
+        module_path = first._load_protocol_function.call_args[0][2]
+        assert (tmp_path / "worktrees" / "origin" / sha / "wt_protocol_mod.py").is_file()
+        assert module_path == str(tmp_path / "worktrees" / "origin" / sha)
+
+        second = ProtocolCodeManager(worktree_root=worktree_root)
+        second._load_protocol_function = Mock(return_value=(Mock(), Mock(accession_id=None)))
+        with patch.object(second, "_run_git_command", AsyncMock()) as run_git:
+            await second.prepare_protocol_code(model)
+        run_git.assert_not_called()
+
+    def test_reload_evicts_other_versions_of_module(self) -> None:
+        """Test that reloading a module drops cached callables from older versions."""
+        manager = ProtocolCodeManager()
+        entry = (Mock(), Mock())
+        manager._store_cached_protocol(("src", "v1", "mod", "run"), entry, module_reloaded=False)
+        manager._store_cached_protocol(("src", "v2", "mod", "run"), entry, module_reloaded=True)
+
+        assert list(manager._loaded_protocols) == [("src", "v2", "mod", "run")]
+        assert manager.cache_stats.evictions == 1
+
+    def test_cache_is_bounded(self) -> None:
+        """Test that the least recently used entry is evicted past capacity."""
+        manager = ProtocolCodeManager(max_cached_protocols=2)
+        entry = (Mock(), Mock())
+        for version in ("v1", "v2", "v3"):
+            manager._store_cached_protocol(("src", version, f"mod_{version}", "run"), entry, False)
+
+        assert [key[1] for key in manager._loaded_protocols] == ["v2", "v3"]
+
+    def test_invalidate_protocol_cache(self) -> None:
+        """Test explicit invalidation by module and in full."""
+        manager = ProtocolCodeManager()
+        entry = (Mock(), Mock())
+        manager._store_cached_protocol(("src", "v1", "a", "run"), entry, False)
+        manager._store_cached_protocol(("src", "v1", "b", "run"), entry, False)
+
+        assert manager.invalidate_protocol_cache("a") == 1
+        assert manager.invalidate_protocol_cache() == 1
+        assert not manager._loaded_protocols
+
+
 class TestProtocolCodeManagerIntegration:
 
     """Integration tests for ProtocolCodeManager."""
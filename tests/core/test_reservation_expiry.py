@@ -0,0 +1,180 @@
+"""Tests for the background reservation expiry service."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from praxis.backend.core.reservation_expiry import (
+    RESERVATION_RELEASED_CHANNEL,
+    ReservationExpiryService,
+)
+from praxis.backend.core.scheduler_resources import AssetReservationManager
+from praxis.backend.models.domain.schedule import AssetReservation
+from praxis.backend.models.enums import AssetReservationStatusEnum
+from praxis.backend.models.pydantic_internals.runtime import RuntimeAssetRequirement
+from praxis.backend.utils.uuid import uuid7
+from tests.factories_schedule import create_protocol_run, create_schedule_entry
+
+NOW = datetime(2026, 6, 1, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def session_factory(db_session: AsyncSession) -> async_sessionmaker[AsyncSession]:
+    """Sessions on the test connection; their commits become savepoints."""
+    return async_sessionmaker(
+        bind=db_session.bind,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    )
+
+
+@pytest.fixture
+def pubsub() -> MagicMock:
+    mock = MagicMock()
+    mock.publish = AsyncMock(return_value=1)
+    return mock
+
+
+async def _reservation(
+    db: AsyncSession,
+    expires_at: datetime | None,
+    status: AssetReservationStatusEnum = AssetReservationStatusEnum.ACTIVE,
+) -> AssetReservation:
+    run = await create_protocol_run(db)
+    entry = await create_schedule_entry(db, protocol_run=run)
+    reservation = AssetReservation(
+        name=f"reservation_{run.accession_id.hex[:8]}",
+        asset_name="plate",
+        redis_lock_key=f"asset:plate_{run.accession_id.hex[:8]}",
+        schedule_entry_accession_id=entry.accession_id,
+        protocol_run_accession_id=run.accession_id,
+        status=status,
+        expires_at=expires_at,
+    )
+    db.add(reservation)
+    await db.flush()
+    return reservation
+
+
+async def _statuses(db: AsyncSession) -> dict:
+    result = await db.execute(select(AssetReservation.accession_id, AssetReservation.status))
+    return dict(result.all())
+
+
+@pytest.mark.asyncio
+async def test_sweep_expires_due_reservations_and_publishes(
+    db_session: AsyncSession,
+    session_factory,
+    pubsub,
+) -> None:
+    overdue = await _reservation(db_session, NOW - timedelta(seconds=2))
+    due = await _reservation(db_session, NOW)
+    future = await _reservation(db_session, NOW + timedelta(minutes=5))
+    released = await _reservation(
+        db_session, NOW - timedelta(hours=1), AssetReservationStatusEnum.RELEASED,
+    )
+    manager = AssetReservationManager(session_factory)
+    manager._asset_reservations_cache[overdue.redis_lock_key] = {overdue.protocol_run_accession_id}
+    expiry = ReservationExpiryService(
+        session_factory, pubsub=pubsub, reservation_manager=manager,
+    )
+
+    assert await expiry.sweep(now=NOW) == 2
+
+    statuses = await _statuses(db_session)
+    assert statuses[overdue.accession_id] == AssetReservationStatusEnum.EXPIRED
+    assert statuses[due.accession_id] == AssetReservationStatusEnum.EXPIRED
+    assert statuses[future.accession_id] == AssetReservationStatusEnum.ACTIVE
+    assert statuses[released.accession_id] == AssetReservationStatusEnum.RELEASED
+    assert overdue.redis_lock_key not in manager._asset_reservations_cache
+
+    pubsub.publish.assert_awaited_once()
+    channel, message = pubsub.publish.await_args.args
+    assert channel == RESERVATION_RELEASED_CHANNEL
+    assert message["reason"] == "expired"
+    assert {r["reservation_id"] for r in message["reservations"]} == {
+        str(overdue.accession_id),
+        str(due.accession_id),
+    }
+    assert expiry.metrics.last_lag_ms == pytest.approx(2000)
+    assert expiry.metrics.expired_total == 2
+
+
+@pytest.mark.asyncio
+async def test_sweep_expires_in_batches(
+    db_session: AsyncSession,
+    session_factory,
+    pubsub,
+) -> None:
+    for i in range(5):
+        await _reservation(db_session, NOW - timedelta(seconds=i))
+    expiry = ReservationExpiryService(session_factory, pubsub=pubsub, batch_size=2)
+
+    assert await expiry.sweep(now=NOW) == 5
+    assert pubsub.publish.await_count == 3
+    assert await expiry.sweep(now=NOW) == 0
+    assert expiry.metrics.sweeps == 2
+    assert expiry.metrics.max_lag_ms == pytest.approx(4000)
+
+
+@pytest.mark.asyncio
+async def test_load_tracks_active_deadlines(db_session: AsyncSession, session_factory) -> None:
+    soon = await _reservation(db_session, NOW + timedelta(minutes=1))
+    await _reservation(db_session, NOW + timedelta(minutes=5))
+    await _reservation(db_session, None)
+    await _reservation(db_session, NOW, AssetReservationStatusEnum.RELEASED)
+    expiry = ReservationExpiryService(session_factory)
+
+    assert await expiry.load() == 2
+    assert expiry.next_deadline() == soon.expires_at
+
+
+@pytest.mark.asyncio
+async def test_background_sweeper_wakes_for_tracked_deadline(
+    db_session: AsyncSession,
+    session_factory,
+    pubsub,
+) -> None:
+    expiry = ReservationExpiryService(session_factory, pubsub=pubsub, safety_sweep_seconds=30)
+    expiry.start()
+    await asyncio.sleep(0.05)  # Initial sweep, then sleeping on the safety interval
+
+    expires_at = datetime.now(timezone.utc) + timedelta(milliseconds=100)
+    reservation = await _reservation(db_session, expires_at)
+    expiry.track(reservation.accession_id, expires_at)
+    for _ in range(100):
+        if expiry.metrics.expired_total:
+            break
+        await asyncio.sleep(0.02)
+    await expiry.stop()
+
+    assert expiry.metrics.expired_total == 1
+    assert (await _statuses(db_session))[reservation.accession_id] == AssetReservationStatusEnum.EXPIRED
+    assert expiry.next_deadline() is None
+
+
+@pytest.mark.asyncio
+async def test_reservations_with_expiry_are_tracked(session_factory) -> None:
+    manager = AssetReservationManager(session_factory)
+    expiry = ReservationExpiryService(session_factory, reservation_manager=manager)
+    requirement = MagicMock(spec=RuntimeAssetRequirement)
+    requirement.asset_type = "asset"
+    requirement.asset_definition = MagicMock()
+    requirement.asset_definition.name = "plate"
+    requirement.asset_definition.accession_id = None
+    session = AsyncMock()
+    session.add = MagicMock()
+    session.execute = AsyncMock(
+        return_value=MagicMock(scalars=MagicMock(return_value=MagicMock(all=MagicMock(return_value=[])))),
+    )
+
+    expires_at = NOW + timedelta(minutes=10)
+    await manager.reserve_assets([requirement], uuid7(), db_session=session, expires_at=expires_at)
+
+    assert expiry.next_deadline() == expires_at
+    reservation = session.add.call_args.args[0]
+    assert reservation.expires_at == expires_at
@@ -697,6 +697,52 @@ class TestScheduleProtocolExecution:
         mock_protocol_run_service.update.assert_called()
         mock_task_queue.send_task.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_schedule_protocol_execution_records_schedule_queue_entry(self) -> None:
+        """Test that the optional schedule queue records the run until it is handed off."""
+        from praxis.backend.core.scheduler import PersistentScheduleQueue
+        from praxis.backend.models.domain import FunctionProtocolDefinition, ProtocolRun
+        from praxis.backend.models.enums import ScheduleStatusEnum
+
+        mock_task_queue = Mock()
+        mock_task_queue.send_task = Mock(return_value=Mock(id="celery_task_123"))
+
+        protocol_run_id = uuid7()
+        mock_protocol_def = Mock(spec=FunctionProtocolDefinition)
+        mock_protocol_def.name = "test_protocol"
+        mock_protocol_def.assets = []
+        mock_protocol_def.preconfigure_deck = False
+        mock_protocol_def.deck_param_name = None
+        mock_protocol_run = Mock(spec=ProtocolRun)
+        mock_protocol_run.accession_id = protocol_run_id
+        mock_protocol_run.top_level_protocol_definition_accession_id = uuid7()
+
+        mock_protocol_run_service = Mock()
+        mock_protocol_run_service.get = AsyncMock(return_value=mock_protocol_run)
+        mock_protocol_run_service.update = AsyncMock()
+        mock_protocol_definition_service = Mock()
+        mock_protocol_definition_service.get = AsyncMock(return_value=mock_protocol_def)
+
+        session_factory = create_async_session_factory()
+        schedule_queue = PersistentScheduleQueue(session_factory)
+        scheduler = ProtocolScheduler(
+            db_session_factory=session_factory,
+            task_queue=mock_task_queue,
+            protocol_run_service=mock_protocol_run_service,
+            protocol_definition_service=mock_protocol_definition_service,
+            schedule_queue=schedule_queue,
+        )
+
+        assert await scheduler.schedule_protocol_execution(protocol_run_id, {"param1": "value1"})
+
+        # Handed to the worker, which reports the outcome: buffered, then forgotten.
+        assert schedule_queue.get_by_run(protocol_run_id) is None
+        assert len(schedule_queue) == 0
+        statuses = [
+            values["status"] for values in schedule_queue._pending.inserts.values()
+        ]
+        assert statuses == [ScheduleStatusEnum.CELERY_QUEUED]
+
     @pytest.mark.asyncio
     async def test_schedule_protocol_execution_protocol_def_not_found(self) -> None:
         """Test scheduling fails when protocol definition not found."""
@@ -0,0 +1,290 @@
+"""Tests for the in-memory schedule queue and its write-behind persistence."""
+
+import asyncio
+import uuid
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.exc import StatementError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from praxis.backend.core.scheduler_queue import (
+    PersistentScheduleQueue,
+    QueuedSchedule,
+    ScheduleQueue,
+)
+from praxis.backend.models.domain.schedule import ScheduleEntry, ScheduleHistory
+from praxis.backend.models.enums import ScheduleHistoryEventEnum, ScheduleStatusEnum
+from tests.factories_schedule import create_protocol_run
+
+T0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _item(priority: int = 1, minutes: int = 0) -> QueuedSchedule:
+    return QueuedSchedule(
+        accession_id=uuid.uuid4(),
+        protocol_run_accession_id=uuid.uuid4(),
+        priority=priority,
+        scheduled_at=T0 + timedelta(minutes=minutes),
+    )
+
+
+@pytest.fixture
+def session_factory(db_session: AsyncSession) -> async_sessionmaker[AsyncSession]:
+    """Sessions on the test connection; their commits become savepoints."""
+    return async_sessionmaker(
+        bind=db_session.bind,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    )
+
+
+class TestScheduleQueue:
+
+    """Ordering and bookkeeping of the in-memory heap."""
+
+    def test_pops_by_priority_then_time_then_submission(self) -> None:
+        low = _item(priority=1)
+        urgent_late = _item(priority=9, minutes=5)
+        urgent_early = _item(priority=9, minutes=1)
+        tie = _item(priority=1)
+        queue = ScheduleQueue()
+        for item in (low, urgent_late, urgent_early, tie):
+            queue.push(item)
+
+        assert queue.ordered() == [urgent_early, urgent_late, low, tie]
+        assert [queue.pop() for _ in range(4)] == [urgent_early, urgent_late, low, tie]
+        assert queue.pop() is None
+
+    def test_update_priority_and_remove(self) -> None:
+        first, second, third = _item(), _item(minutes=1), _item(minutes=2)
+        queue = ScheduleQueue()
+        for item in (first, second, third):
+            queue.push(item)
+
+        queue.update_priority(third.accession_id, 5)
+        assert queue.remove(first.accession_id) is first
+        assert queue.remove(first.accession_id) is None
+
+        assert queue.peek() is third
+        assert [queue.pop(), queue.pop(), queue.pop()] == [third, second, None]
+        assert len(queue) == 0
+
+    def test_rejects_second_entry_for_run(self) -> None:
+        item = _item()
+        queue = ScheduleQueue()
+        queue.push(item)
+
+        duplicate = QueuedSchedule(uuid.uuid4(), item.protocol_run_accession_id)
+        with pytest.raises(ValueError, match="already queued"):
+            queue.push(duplicate)
+        assert queue.get_by_run(item.protocol_run_accession_id) is item
+
+    def test_stale_keys_are_compacted(self) -> None:
+        items = [_item(minutes=i) for i in range(10)]
+        queue = ScheduleQueue()
+        for item in items:
+            queue.push(item)
+
+        for round_ in range(100):
+            for item in items:
+                queue.update_priority(item.accession_id, round_ + 1)
+
+        assert len(queue._heap) <= 2 * len(items) + 64
+        assert queue.pop() is items[0]
+
+    def test_naive_and_aware_timestamps_compare(self) -> None:
+        aware = _item(minutes=1)
+        naive = _item()
+        naive.scheduled_at = naive.scheduled_at.replace(tzinfo=None)
+        queue = ScheduleQueue()
+        queue.push(aware)
+        queue.push(naive)
+
+        assert queue.pop() is naive
+
+
+class TestPersistentScheduleQueue:
+
+    """Write-behind persistence, retries and dead-lettering."""
+
+    @pytest.mark.asyncio
+    async def test_flush_persists_entries_and_history_in_one_batch(
+        self,
+        db_session: AsyncSession,
+        session_factory,
+    ) -> None:
+        runs = [await create_protocol_run(db_session) for _ in range(3)]
+        queue = PersistentScheduleQueue(session_factory)
+        items = [queue.enqueue(run.accession_id, priority=i) for i, run in enumerate(runs)]
+        queue.update_priority(items[0].accession_id, 10, reason="urgent")
+
+        assert queue.pending_writes == 7  # 3 inserts + 4 history events (priority folded in)
+        assert await queue.flush() == 7
+        assert queue.pending_writes == 0
+
+        entries = {
+            e.accession_id: e
+            for e in (await db_session.execute(select(ScheduleEntry))).scalars()
+        }
+        assert {item.accession_id for item in items} <= entries.keys()
+        assert entries[items[0].accession_id].priority == 10
+        assert entries[items[0].accession_id].status == ScheduleStatusEnum.QUEUED
+        history = (
+            await db_session.execute(
+                select(ScheduleHistory).where(
+                    ScheduleHistory.schedule_entry_accession_id == items[0].accession_id,
+                ),
+            )
+        ).scalars().all()
+        assert sorted(h.event_type for h in history) == sorted(
+            [ScheduleHistoryEventEnum.SCHEDULE_CREATED, ScheduleHistoryEventEnum.PRIORITY_CHANGED],
+        )
+
+    @pytest.mark.asyncio
+    async def test_status_changes_are_batched_updates(
+        self,
+        db_session: AsyncSession,
+        session_factory,
+    ) -> None:
+        runs = [await create_protocol_run(db_session) for _ in range(2)]
+        queue = PersistentScheduleQueue(session_factory)
+        low = queue.enqueue(runs[0].accession_id, priority=1)
+        high = queue.enqueue(runs[1].accession_id, priority=2)
+        await queue.flush()
+
+        assert queue.dequeue() is high
+        queue.set_status(high.accession_id, ScheduleStatusEnum.EXECUTING)
+        queue.set_status(low.accession_id, ScheduleStatusEnum.CANCELLED, error_message="user")
+        await queue.flush()
+
+        statuses = dict(
+            (await db_session.execute(select(ScheduleEntry.accession_id, ScheduleEntry.status))).all(),
+        )
+        assert statuses[high.accession_id] == ScheduleStatusEnum.EXECUTING
+        assert statuses[low.accession_id] == ScheduleStatusEnum.CANCELLED
+        assert len(queue) == 0
+        assert queue.get(high.accession_id) is high
+        assert queue.get(low.accession_id) is None
+
+    @pytest.mark.asyncio
+    async def test_handed_off_entries_are_persisted_and_forgotten(
+        self,
+        db_session: AsyncSession,
+        session_factory,
+    ) -> None:
+        run = await create_protocol_run(db_session)
+        queue = PersistentScheduleQueue(session_factory)
+        item = queue.enqueue(run.accession_id)
+        queue.set_status(item.accession_id, ScheduleStatusEnum.CELERY_QUEUED)
+        await queue.flush()
+
+        status = (
+            await db_session.execute(
+                select(ScheduleEntry.status).where(ScheduleEntry.accession_id == item.accession_id),
+            )
+        ).scalar_one()
+        assert status == ScheduleStatusEnum.CELERY_QUEUED
+        assert queue.get(item.accession_id) is None
+        assert queue.get_by_run(run.accession_id) is None
+
+    @pytest.mark.asyncio
+    async def test_flush_rejects_unknown_and_already_scheduled_runs(
+        self,
+        db_session: AsyncSession,
+        session_factory,
+    ) -> None:
+        run = await create_protocol_run(db_session)
+        queue = PersistentScheduleQueue(session_factory)
+        good = queue.enqueue(run.accession_id)
+        ghost = queue.enqueue(uuid.uuid4())
+        await queue.flush()
+
+        other = PersistentScheduleQueue(session_factory)
+        duplicate = other.enqueue(run.accession_id)
+        await other.flush()
+
+        ids = set((await db_session.execute(select(ScheduleEntry.accession_id))).scalars())
+        assert good.accession_id in ids
+        assert ghost.accession_id not in ids
+        assert duplicate.accession_id not in ids
+        assert queue.get(ghost.accession_id) is None
+        assert other.get(duplicate.accession_id) is None
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_keeps_writes_for_retry(self, session_factory) -> None:
+        broken = MagicMock(side_effect=RuntimeError("database down"))
+        queue = PersistentScheduleQueue(broken)
+        queue.enqueue(uuid.uuid4())
+
+        with pytest.raises(RuntimeError, match="database down"):
+            await queue.flush()
+        queue.enqueue(uuid.uuid4())
+
+        assert queue.pending_writes == 4
+
+    @pytest.mark.asyncio
+    async def test_failed_flushes_back_off(self) -> None:
+        broken = MagicMock(side_effect=RuntimeError("database down"))
+        queue = PersistentScheduleQueue(
+            broken, flush_interval=0.5, max_flush_attempts=10, max_retry_delay=3.0,
+        )
+        queue.enqueue(uuid.uuid4())
+
+        delays = []
+        for _ in range(4):
+            with pytest.raises(RuntimeError):
+                await queue.flush()
+            delays.append(queue._next_flush_delay())
+
+        assert delays == [1.0, 2.0, 3.0, 3.0]
+
+    @pytest.mark.asyncio
+    async def test_poison_writes_are_dead_lettered_after_retry_cap(
+        self,
+        db_session: AsyncSession,
+        session_factory,
+    ) -> None:
+        runs = [await create_protocol_run(db_session) for _ in range(2)]
+        queue = PersistentScheduleQueue(session_factory, max_flush_attempts=2)
+        good = queue.enqueue(runs[0].accession_id)
+        poison = queue.enqueue(runs[1].accession_id, user_params_json={"bad": object()})
+
+        with pytest.raises(StatementError, match="not JSON serializable"):
+            await queue.flush()
+        assert await queue.flush() == 2  # good entry and its creation event
+        assert queue.pending_writes == 0
+        assert [part.inserts.keys() for part in queue.dead_letters] == [{poison.accession_id}]
+
+        ids = set((await db_session.execute(select(ScheduleEntry.accession_id))).scalars())
+        assert good.accession_id in ids
+        assert poison.accession_id not in ids
+        assert queue._next_flush_delay() == queue.flush_interval
+
+    @pytest.mark.asyncio
+    async def test_background_flusher_and_stop(
+        self,
+        db_session: AsyncSession,
+        session_factory,
+    ) -> None:
+        run = await create_protocol_run(db_session)
+        queue = PersistentScheduleQueue(session_factory, flush_interval=0.01)
+        queue.start()
+        item = queue.enqueue(run.accession_id)
+        for _ in range(100):
+            if not queue.pending_writes:
+                break
+            await asyncio.sleep(0.01)
+        assert queue.pending_writes == 0
+
+        queue.set_status(item.accession_id, ScheduleStatusEnum.CANCELLED)
+        await queue.stop()
+        assert queue.pending_writes == 0
+        status = (
+            await db_session.execute(
+                select(ScheduleEntry.status).where(ScheduleEntry.accession_id == item.accession_id),
+            )
+        ).scalar_one()
+        assert status == ScheduleStatusEnum.CANCELLED
@@ -9,6 +9,7 @@ This module tests:
 - Failure mode detector
 """
 
+import numpy as np
 import pytest
 
 from praxis.backend.core.simulation.bounds_analyzer import (
@@ -220,6 +221,88 @@ class TestExactLiquidState:
     assert state.get_volume("source") == 50.0
     assert state.get_volume("dest") == 50.0
 
+  def test_transfer_rolls_back_when_dest_full(self) -> None:
+    """Test a failed dispense leaves the source volume untouched."""
+    state = ExactLiquidState()
+    state.set_volume("source", 100.0)
+    state.set_volume("dest", 190.0, max_capacity=200.0)
+    assert state.transfer("source", "dest", 50.0) is False
+    assert state.get_volume("source") == 100.0
+    assert state.get_volume("dest") == 190.0
+
+  def test_mapping_views(self) -> None:
+    """Test dict views stay consistent with the backing arrays."""
+    state = ExactLiquidState(volumes={"plate['A1']": 20.0}, max_capacities={"plate['A1']": 50.0})
+    state.set_volume("trough", 10.0)
+    assert state.volumes == {"plate['A1']": 20.0, "trough": 10.0}
+    assert state.capacities == {"plate['A1']": 30.0, "trough": 190.0}
+    assert state.max_capacities == {"plate['A1']": 50.0, "trough": 200.0}
+
+  def test_mapping_views_are_live_and_read_only(self) -> None:
+    """Test views follow later writes and reject item assignment."""
+    state = ExactLiquidState()
+    volumes = state.volumes
+    state.set_volume("plate['A1']", 20.0)
+    assert volumes["plate['A1']"] == 20.0
+    with pytest.raises(TypeError):
+      volumes["plate['A1']"] = 5.0  # type: ignore[index]
+
+  def test_failed_batch_aspirate_does_not_register_wells(self) -> None:
+    """Test unknown wells stay unregistered when their aspiration fails."""
+    state = ExactLiquidState()
+    state.set_volume("plate['A1']", 30.0)
+    result = state.aspirate_many(["plate['A1']", "plate['A2']", "other['A1']"], 10.0)
+    assert result.tolist() == [True, False, False]
+    assert dict(state.volumes) == {"plate['A1']": 20.0}
+
+  def test_wells_share_parent_array(self) -> None:
+    """Test wells of one plate are stored in a single per-resource array."""
+    state = ExactLiquidState()
+    wells = [f"plate['A{i}']" for i in range(1, 13)]
+    state.register_resource(wells, max_capacity=300.0, volume=5.0)
+    volumes = state.resource_volumes("plate")
+    assert volumes.shape == (12,)
+    assert np.all(volumes == 5.0)
+    assert state.get_capacity("plate['A3']") == 295.0
+
+  def test_copy_is_copy_on_write(self) -> None:
+    """Test snapshots share storage until either side writes."""
+    state = ExactLiquidState()
+    state.set_volume("plate['A1']", 100.0)
+    state.set_volume("trough", 50.0)
+    snapshot = state.copy()
+    state.aspirate("plate['A1']", 40.0)
+    snapshot.dispense("trough", 10.0)
+    assert state.get_volume("plate['A1']") == 60.0
+    assert snapshot.get_volume("plate['A1']") == 100.0
+    assert state.get_volume("trough") == 50.0
+    assert snapshot.get_volume("trough") == 60.0
+
+  def test_vectorized_transfer_matches_scalar(self) -> None:
+    """Test transfer_many produces the same state as per-well transfers."""
+    sources = [f"plate['A{i}']" for i in range(1, 9)]
+    dests = [f"plate['B{i}']" for i in range(1, 9)]
+    volumes = [10.0, 20.0, 30.0, 40.0, 50.0, 60.0, 70.0, 80.0]
+
+    scalar = ExactLiquidState()
+    scalar.register_resource(sources, volume=45.0)
+    scalar.register_resource(dests, volume=150.0)
+    vectorized = scalar.copy()
+
+    expected = [scalar.transfer(s, d, v) for s, d, v in zip(sources, dests, volumes, strict=True)]
+    result = vectorized.transfer_many(sources, dests, volumes)
+
+    assert result.tolist() == expected
+    assert vectorized == scalar
+
+  def test_vectorized_ops_with_repeated_wells(self) -> None:
+    """Test repeated wells in a batch see earlier effects in order."""
+    state = ExactLiquidState()
+    state.set_volume("plate['A1']", 30.0)
+    result = state.aspirate_many(["plate['A1']", "plate['A1']"], 20.0)
+    assert result.tolist() == [True, False]
+    assert state.get_volume("plate['A1']") == 10.0
+
 
 class TestTipState:
   """Tests for TipState."""
@@ -381,6 +464,25 @@ class TestStatefulTracedMachine:
     machine.drop_tips("tips")
     assert state.tip_state.tips_loaded is False
 
+  def test_multichannel_aspirate_updates_each_well(self, recorder: OperationRecorder) -> None:
+    """Test that a list of wells is aspirated per channel through the batch ops."""
+    state = SimulationState.default_exact()
+    assert isinstance(state.liquid_state, ExactLiquidState)
+    state.liquid_state.register_resource(["plate['A1']", "plate['B1']"], volume=100.0)
+    machine = StatefulTracedMachine(
+      name="lh",
+      recorder=recorder,
+      declared_type="LiquidHandler",
+      machine_type="liquid_handler",
+      state=state,
+    )
+
+    machine.pick_up_tips("tips")
+    machine.aspirate(["plate['A1']", "plate['B1']"], [10, 30])
+
+    assert state.liquid_state.get_volume("plate['A1']") == 90.0
+    assert state.liquid_state.get_volume("plate['B1']") == 70.0
+
 
 # =============================================================================
 # Test Hierarchical Simulator
@@ -1590,3 +1692,171 @@ class TestConvenienceFunctions:
     loaded = load_protocol(cached.bytecode)
 
     assert loaded(5) == 15
+
+
+# =============================================================================
+# Test Trace Memo
+# =============================================================================
+
+
+async def _memo_protocol(lh, plate, tips):
+  await lh.pick_up_tips(tips)
+  await lh.aspirate(plate["A1"], 100)
+  await lh.dispense(plate["B1"], 100)
+  await lh.drop_tips(tips)
+
+
+_MEMO_PARAMETER_TYPES = {"lh": "LiquidHandler", "plate": "Plate", "tips": "TipRack"}
+
+
+class TestTraceMemo:
+  """Tests for trace-once memoization of structural traces."""
+
+  def test_source_hash_is_stable_and_distinguishes_functions(self) -> None:
+    """Test that the source hash depends only on the function's code."""
+    from praxis.backend.core.simulation.trace_memo import protocol_source_hash
+
+    async def other(lh):
+      await lh.pick_up_tips(None)
+
+    assert protocol_source_hash(_memo_protocol) == protocol_source_hash(_memo_protocol)
+    assert protocol_source_hash(_memo_protocol) != protocol_source_hash(other)
+
+  def test_source_hash_tracks_module_file(self, tmp_path) -> None:
+    """Test that editing a helper in the protocol's module changes the hash."""
+    import importlib.util
+
+    from praxis.backend.core.simulation.trace_memo import protocol_source_hash
+
+    module_file = tmp_path / "memo_helper_protocol.py"
+    module_file.write_text("VOLUME = 10\n\n\nasync def run(lh):\n  await lh.aspirate(VOLUME)\n")
+    spec = importlib.util.spec_from_file_location("memo_helper_protocol", module_file)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    before = protocol_source_hash(module.run)
+    module_file.write_text("VOLUME = 20\n\n\nasync def run(lh):\n  await lh.aspirate(VOLUME)\n")
+
+    assert protocol_source_hash(module.run) != before
+
+  def test_key_depends_on_parameter_signature(self) -> None:
+    """Test that different parameter signatures produce different keys."""
+    from praxis.backend.core.simulation.trace_memo import trace_memo_key
+
+    base = trace_memo_key("h", {"a": "Plate", "b": "TipRack"}, "carrier_based")
+    assert base == trace_memo_key("h", {"b": "TipRack", "a": "Plate"}, "carrier_based")
+    assert base != trace_memo_key("h", {"a": "Plate"}, "carrier_based")
+    assert base != trace_memo_key("h", {"a": "Plate", "b": "TipRack"}, "slot_based")
+
+  @pytest.mark.asyncio
+  async def test_structure_traced_once_across_simulations(self, monkeypatch) -> None:
+    """Test that repeated simulations reuse the memoized trace."""
+    simulator = HierarchicalSimulator()
+    calls = 0
+    original = simulator._base_executor.trace_protocol
+
+    async def counting_trace(*args, **kwargs):
+      nonlocal calls
+      calls += 1
+      return await original(*args, **kwargs)
+
+    monkeypatch.setattr(simulator._base_executor, "trace_protocol", counting_trace)
+
+    first = await simulator.simulate(_memo_protocol, _MEMO_PARAMETER_TYPES)
+    second = await simulator.simulate(
+      _memo_protocol,
+      _MEMO_PARAMETER_TYPES,
+      initial_state=SimulationState.default_boolean(),
+    )
+
+    assert calls == 1
+    assert first.computation_graph == second.computation_graph
+    assert simulator.trace_memo.hits == 1
+
+  @pytest.mark.asyncio
+  async def test_failure_detector_shares_simulator_memo(self) -> None:
+    """Test that the facade's failure detection reuses the simulator's trace."""
+    from praxis.backend.core.simulation.simulator import ProtocolSimulator
+
+    simulator = ProtocolSimulator(max_failure_states=5)
+    await simulator.analyze_protocol(_memo_protocol, _MEMO_PARAMETER_TYPES)
+
+    memo = simulator._simulator.trace_memo
+    assert len(memo) == 1
+    assert memo.misses == 1
+    assert memo.hits >= 1
+
+  def test_persisted_memo_is_namespaced_by_version(self, tmp_path) -> None:
+    """Test that persisted traces are reloaded only for the same version."""
+    from praxis.backend.core.simulation.trace_memo import TracedStructure, TraceMemo
+    from praxis.backend.utils.plr_static_analysis.models import ProtocolComputationGraph
+
+    graph = ProtocolComputationGraph(protocol_fqn="m.p", protocol_name="p").model_dump()
+    traced = TracedStructure(computation_graph=graph)
+    TraceMemo(version="1.0.0", cache_dir=tmp_path).put("k", traced)
+
+    assert TraceMemo(version="1.0.0", cache_dir=tmp_path).get("k") == traced
+    assert TraceMemo(version="2.0.0", cache_dir=tmp_path).get("k") is None
+    assert (tmp_path / "1.0.0" / "k.json").is_file()
+
+  @pytest.mark.asyncio
+  async def test_persisted_graph_matches_traced_graph(self, tmp_path) -> None:
+    """Test that a graph reloaded from disk equals the freshly traced one."""
+    from praxis.backend.core.simulation.simulator import create_trace_memo
+
+    traced = await HierarchicalSimulator(
+      trace_memo=create_trace_memo(cache_dir=tmp_path),
+    ).simulate(_memo_protocol, _MEMO_PARAMETER_TYPES)
+    reloaded = await HierarchicalSimulator(
+      trace_memo=create_trace_memo(cache_dir=tmp_path),
+    ).simulate(_memo_protocol, _MEMO_PARAMETER_TYPES)
+
+    assert reloaded.computation_graph == traced.computation_graph
+
+  def test_memo_evicts_least_recently_used(self) -> None:
+    """Test that the in-memory memo is capped and keeps recently used traces."""
+    from praxis.backend.core.simulation.trace_memo import TracedStructure, TraceMemo
+
+    memo = TraceMemo(max_entries=2)
+    for key in ("a", "b"):
+      memo.put(key, TracedStructure(structural_error=key))
+    memo.get("a")
+    memo.put("c", TracedStructure(structural_error="c"))
+
+    assert len(memo) == 2
+    assert memo.get("b") is None
+    assert memo.get("a") is not None
+    assert memo.get("c") is not None
+
+  def test_persistence_requires_version(self, tmp_path) -> None:
+    """Test that a disk-backed memo must be bound to a simulation version."""
+    from praxis.backend.core.simulation.trace_memo import TraceMemo
+
+    with pytest.raises(ValueError):
+      TraceMemo(cache_dir=tmp_path)
+
+  @pytest.mark.asyncio
+  async def test_memoized_structural_error_short_circuits(self, monkeypatch) -> None:
+    """Test that a memoized structural error is returned without re-tracing."""
+    from praxis.backend.core.simulation.trace_memo import (
+      TracedStructure,
+      protocol_source_hash,
+      trace_memo_key,
+    )
+
+    simulator = HierarchicalSimulator()
+    key = trace_memo_key(
+      protocol_source_hash(_memo_protocol),
+      _MEMO_PARAMETER_TYPES,
+      simulator._deck_layout_type.value,
+    )
+    simulator.trace_memo.put(key, TracedStructure(structural_error="bad signature"))
+
+    async def fail_trace(*args, **kwargs):
+      raise AssertionError("trace_protocol should not be called")
+
+    monkeypatch.setattr(simulator._base_executor, "trace_protocol", fail_trace)
+    result = await simulator.simulate(_memo_protocol, _MEMO_PARAMETER_TYPES)
+
+    assert result.level_failed == "structural"
+    assert result.structural_error == "bad signature"
@@ -179,6 +179,12 @@ class TestInferParentName:
         """384-well plate identifiers are handled."""
         assert _infer_parent_name("plate_384_P24") == "plate_384"
 
+    def test_1536_well_plate(self):
+        """1536-well plates continue with rows Q-Z and AA-AF."""
+        assert _infer_parent_name("plate_1536_well_AF48") == "plate_1536"
+        assert _infer_parent_name("plate_1536_well_Z1") == "plate_1536"
+        assert _infer_parent_name("AA1") == "unknown_plate"
+
 
 class TestInferWellId:
     """Tests for _infer_well_id helper."""
@@ -200,6 +206,12 @@ class TestInferWellId:
         """384-well plate identifiers are handled."""
         assert _infer_well_id("plate_P24") == "P24"
 
+    def test_1536_well_ids(self):
+        """1536-well rows beyond P are recognised, two-letter rows kept whole."""
+        assert _infer_well_id("plate_well_AD48") == "AD48"
+        assert _infer_well_id("plate_well_AF1") == "AF1"
+        assert _infer_well_id("plate_well_Q12") == "Q12"
+
 
 class TestGetOnDeckResources:
     """Tests for get_on_deck_resources function."""
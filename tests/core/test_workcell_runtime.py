@@ -409,6 +409,50 @@ class TestGetCalculatedLocation:
         assert result.y == 20.0
         assert result.z == 0.0
 
+    @pytest.mark.asyncio
+    async def test_get_calculated_location_caches_deck_geometry(self) -> None:
+        """Test deck type geometry is fetched once per deck type."""
+        mock_workcell = Mock()
+        mock_workcell.name = "test_workcell"
+
+        mock_session_ctx = AsyncMock()
+        mock_session_ctx.__aenter__.return_value = AsyncMock()
+        mock_session_ctx.__aexit__.return_value = None
+        mock_db_session_factory = Mock(return_value=mock_session_ctx)
+
+        runtime = WorkcellRuntime(
+            db_session_factory=mock_db_session_factory,
+            workcell=mock_workcell,
+            deck_service=Mock(),
+            machine_service=Mock(),
+            resource_service=Mock(),
+            deck_type_definition_service=Mock(),
+            workcell_service=Mock(),
+        )
+
+        deck_type_id = uuid7()
+        positions = []
+        for index in range(1, 4):
+            position = Mock()
+            position.position_accession_id = str(index)
+            position.nominal_x_mm = 10.0 * index
+            position.nominal_y_mm = 5.0
+            position.nominal_z_mm = None
+            positions.append(position)
+        mock_deck_type_def = Mock()
+        mock_deck_type_def.accession_id = deck_type_id
+        mock_deck_type_def.positioning_config_json = None
+        mock_deck_type_def.positions = positions
+        runtime.deck_type_definition_svc.get = AsyncMock(return_value=mock_deck_type_def)
+
+        first = await runtime._get_calculated_location(Mock(spec=Deck), deck_type_id, 1, None)
+        third = await runtime._get_calculated_location(Mock(spec=Deck), deck_type_id, "3", None)
+
+        assert (first.x, first.z) == (10.0, 0.0)
+        assert third.x == 30.0
+        runtime.deck_type_definition_svc.get.assert_awaited_once()
+        mock_db_session_factory.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_get_calculated_location_position_not_found(self) -> None:
         """Test error when position not found in database."""
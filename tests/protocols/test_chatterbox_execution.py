@@ -17,8 +17,11 @@ from __future__ import annotations
 import asyncio
 import importlib
 import inspect
+import multiprocessing
+import time
 from pathlib import Path
 from typing import Any
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -213,6 +216,29 @@ class TestDeckFactory:
         )
         assert "diluent_trough" in setup
 
+    def test_setups_are_cloned_from_one_template(self):
+        factory = DeckFactory()
+        needs = {"plate": "Plate", "tip_rack": "TipRack"}
+        first = factory.create_setup("STARChatterboxBackend", needs)
+        second = factory.create_setup("LiquidHandlerChatterboxBackend", needs)
+        assert factory.template_misses == 1
+        assert factory.template_hits == 1
+        assert first["deck"] is not second["deck"]
+        assert first["plate"] is not second["plate"]
+        assert second["plate"].parent.parent.parent is second["deck"]
+
+    @pytest.mark.asyncio(loop_scope="function")
+    async def test_cloned_setups_do_not_share_tip_state(self):
+        factory = DeckFactory()
+        needs = {"plate": "Plate", "tip_rack": "TipRack"}
+        first = factory.create_setup("LiquidHandlerChatterboxBackend", needs)
+        await first["machine"].setup()
+        await first["machine"].pick_up_tips(first["tip_rack"]["A1"])
+        await first["machine"].stop()
+
+        second = factory.create_setup("LiquidHandlerChatterboxBackend", needs)
+        assert second["tip_rack"].get_item("A1").tracker.has_tip
+
 
 # =============================================================================
 # Test: Result Model
@@ -255,6 +281,8 @@ class TestResultModels:
             protocol_name="test", results_by_backend=results
         )
         assert not er.all_passed
+        assert er.failed_backends == ["STAR"]
+        assert er.to_dict()["results_by_backend"]["STAR"]["error"] == "boom"
 
 
 # =============================================================================
@@ -288,6 +316,36 @@ async def _synthetic_failing_protocol(
     raise RuntimeError(msg)
 
 
+async def _synthetic_blocking_protocol(
+    state: dict[str, Any],
+    liquid_handler: Any,
+    plate: Any,
+    tip_rack: Any,
+) -> dict[str, Any]:
+    """A protocol that blocks the event loop (never yields)."""
+    time.sleep(60)
+    return state
+
+
+async def _synthetic_hanging_protocol(
+    state: dict[str, Any],
+    liquid_handler: Any,
+    plate: Any,
+    tip_rack: Any,
+) -> dict[str, Any]:
+    """A protocol that waits forever."""
+    await asyncio.Event().wait()
+    return state
+
+
+_LH_PARAMETER_TYPES = {
+    "state": "dict[str, Any]",
+    "liquid_handler": "LiquidHandler",
+    "plate": "Plate",
+    "tip_rack": "TipRack",
+}
+
+
 class TestSyntheticProtocols:
     """Run synthetic pass/fail protocols through ChatterboxProtocolRunner."""
 
@@ -325,6 +383,102 @@ class TestSyntheticProtocols:
             assert not br.passed
             assert "Intentional test failure" in br.error
 
+    @pytest.mark.asyncio(loop_scope="function")
+    async def test_backends_run_in_worker_processes(self):
+        runner = ChatterboxProtocolRunner(max_workers=2)
+        result = await runner.run_protocol_function(
+            protocol_func=_synthetic_passing_protocol,
+            parameter_types=_LH_PARAMETER_TYPES,
+        )
+        assert result.parallel
+        assert len(result.results_by_backend) == 2
+        assert result.all_passed
+
+    @pytest.mark.asyncio(loop_scope="function")
+    async def test_spawned_workers_are_reused(self):
+        runner = ChatterboxProtocolRunner(
+            max_workers=2, mp_context=multiprocessing.get_context("spawn")
+        )
+        try:
+            first = await runner.run_protocol_function(
+                protocol_func=_synthetic_passing_protocol,
+                parameter_types=_LH_PARAMETER_TYPES,
+            )
+            pids = {worker.process.pid for worker in runner._idle_workers}
+            second = await runner.run_protocol_function(
+                protocol_func=_synthetic_passing_protocol,
+                parameter_types=_LH_PARAMETER_TYPES,
+            )
+            assert first.all_passed and second.all_passed, [
+                br.error for br in second.results_by_backend.values()
+            ]
+            assert len(pids) == 2
+            assert {worker.process.pid for worker in runner._idle_workers} == pids
+        finally:
+            runner.close()
+        assert not runner._idle_workers
+
+    @pytest.mark.asyncio(loop_scope="function")
+    async def test_worker_start_failure_is_reported(self, monkeypatch):
+        runner = ChatterboxProtocolRunner(max_workers=2)
+
+        def fail_to_start() -> Any:
+            raise OSError("no more processes")
+
+        monkeypatch.setattr(runner, "_start_worker", fail_to_start)
+        result = await runner.run_protocol_function(
+            protocol_func=_synthetic_passing_protocol,
+            parameter_types=_LH_PARAMETER_TYPES,
+        )
+        assert result.parallel
+        for br in result.results_by_backend.values():
+            assert not br.passed
+            assert br.error.startswith("WorkerStartError: OSError")
+
+    def test_idle_workers_are_taken_live_and_once(self):
+        runner = ChatterboxProtocolRunner(max_workers=2)
+        dead, live = MagicMock(), MagicMock()
+        dead.is_alive.return_value = False
+        live.is_alive.return_value = True
+        runner._idle_workers = [live, dead]
+
+        assert runner._take_idle_worker() is live
+        dead.kill.assert_called_once()
+        assert runner._take_idle_worker() is None
+
+    @pytest.mark.asyncio(loop_scope="function")
+    async def test_sequential_when_single_worker(self):
+        runner = ChatterboxProtocolRunner(max_workers=1)
+        result = await runner.run_protocol_function(
+            protocol_func=_synthetic_passing_protocol,
+            parameter_types=_LH_PARAMETER_TYPES,
+        )
+        assert not result.parallel
+        assert result.all_passed
+
+    @pytest.mark.asyncio(loop_scope="function")
+    async def test_blocking_protocol_times_out_in_worker(self):
+        runner = ChatterboxProtocolRunner(max_workers=2, run_timeout=2.0)
+        result = await runner.run_protocol_function(
+            protocol_func=_synthetic_blocking_protocol,
+            parameter_types=_LH_PARAMETER_TYPES,
+        )
+        assert result.parallel
+        assert result.wall_time_ms < 30_000
+        for br in result.results_by_backend.values():
+            assert not br.passed
+            assert br.timed_out
+
+    @pytest.mark.asyncio(loop_scope="function")
+    async def test_in_process_timeout(self):
+        runner = ChatterboxProtocolRunner(max_workers=1, run_timeout=0.5)
+        result = await runner.run_protocol_function(
+            protocol_func=_synthetic_hanging_protocol,
+            parameter_types=_LH_PARAMETER_TYPES,
+        )
+        assert result.failed_backends == sorted(result.results_by_backend)
+        assert all(br.timed_out for br in result.results_by_backend.values())
+
 
 # =============================================================================
 # Test: Real Protocol × Backend Matrix
@@ -8,7 +8,11 @@ from praxis.backend.models.domain.deck import (
     DeckDefinitionUpdate,
     PositioningConfig,
 )
-from praxis.backend.services.deck_type_definition import DeckTypeDefinitionService
+from praxis.backend.services.deck_type_definition import (
+    DeckGeometry,
+    DeckTypeDefinitionService,
+    deck_geometry_registry,
+)
 
 
 @pytest.fixture
@@ -128,3 +132,40 @@ async def test_delete_deck_type_definition(
 
     fetched_def = await deck_type_definition_service.get(db_session, created_def.accession_id)
     assert fetched_def is None
+
+
+@pytest.mark.asyncio
+async def test_deck_geometry_snapshot_and_invalidation_on_update(
+    db_session: AsyncSession,
+    deck_type_definition_service: DeckTypeDefinitionService,
+) -> None:
+    """Geometry is indexed by position ID and dropped when the type is updated."""
+    deck_def_create = DeckDefinitionCreate(
+        name="Geometry Deck",
+        fqn="geometry.deck",
+        version="1.0.0",
+        position_definitions=[
+            DeckPositionDefinitionCreate(
+                name="1",
+                nominal_x_mm=10.0,
+                nominal_y_mm=20.0,
+                nominal_z_mm=0.0,
+                pylabrobot_position_type_name="Slot",
+            ),
+        ],
+    )
+    created_def = await deck_type_definition_service.create(db_session, obj_in=deck_def_create)
+
+    geometry = deck_geometry_registry.put(DeckGeometry.from_definition(created_def))
+    assert geometry.get_position(1).nominal_x_mm == 10.0
+    assert geometry.get_position("1").nominal_y_mm == 20.0
+    assert geometry.get_position("missing") is None
+    assert deck_geometry_registry.get(created_def.accession_id) is geometry
+
+    await deck_type_definition_service.update(
+        db_session,
+        db_obj=created_def,
+        obj_in=DeckDefinitionUpdate(description="moved"),
+    )
+
+    assert deck_geometry_registry.get(created_def.accession_id) is None
@@ -15,9 +15,11 @@ from praxis.backend.models import (
 )
 from praxis.backend.models.enums import AssetType
 from praxis.backend.services.entity_linking import (
+    ResourceCounterpartLink,
     _create_or_link_machine_counterpart_for_resource,
     _create_or_link_resource_counterpart_for_machine,
     _read_resource_definition_for_linking,
+    bulk_link_resource_counterparts_for_machines,
     synchronize_machine_resource_names,
 )
 
@@ -301,3 +303,83 @@ async def test_create_or_link_machine_counterpart_existing_link(
     assert existing_machine.resource_counterpart == resource
     assert resource.asset_type == AssetType.MACHINE_RESOURCE
 
+
+
+@pytest.mark.asyncio
+async def test_bulk_link_resource_counterparts_missing_resource(
+    db_session: AsyncSession,
+) -> None:
+    """Test that bulk linking reports every missing resource up front."""
+    machine = Machine(name="bulk_missing", fqn="machine.fqn", asset_type=AssetType.MACHINE)
+    db_session.add(machine)
+    await db_session.flush()
+
+    with pytest.raises(ValueError, match="Resources not found"):
+        await bulk_link_resource_counterparts_for_machines(
+            db_session,
+            [ResourceCounterpartLink(machine, resource_counterpart_accession_id=uuid.uuid4())],
+        )
+
+
+@pytest.mark.asyncio
+async def test_bulk_link_resource_counterparts_missing_definition(
+    db_session: AsyncSession,
+) -> None:
+    """Test that creating a counterpart requires a resource definition name."""
+    machine = Machine(name="bulk_no_def", fqn="machine.fqn", asset_type=AssetType.MACHINE)
+    db_session.add(machine)
+    await db_session.flush()
+
+    with pytest.raises(ValueError, match="Cannot create new Resource"):
+        await bulk_link_resource_counterparts_for_machines(
+            db_session, [ResourceCounterpartLink(machine)],
+        )
+
+
+@pytest.mark.asyncio
+async def test_bulk_link_resource_counterparts_unknown_definition(
+    db_session: AsyncSession,
+) -> None:
+    """Test that bulk creation reports unknown resource definitions."""
+    machine = Machine(name="bulk_unknown_def", fqn="machine.fqn", asset_type=AssetType.MACHINE)
+    db_session.add(machine)
+    await db_session.flush()
+
+    with pytest.raises(ValueError, match="Resource definitions not found"):
+        await bulk_link_resource_counterparts_for_machines(
+            db_session, [ResourceCounterpartLink(machine, resource_definition_name="nope")],
+        )
+
+
+@pytest.mark.asyncio
+async def test_bulk_link_resource_counterparts_relinks(db_session: AsyncSession) -> None:
+    """Test that relinking a machine detaches its previous resource."""
+    definition = ResourceDefinition(name="bulk_relink_def", fqn="test.fqn")
+    db_session.add(definition)
+    await db_session.flush()
+    old, new = (
+        Resource(
+            name=name,
+            fqn="resource.fqn",
+            asset_type=AssetType.RESOURCE,
+            resource_definition_accession_id=definition.accession_id,
+        )
+        for name in ("old", "new")
+    )
+    machine = Machine(name="relinked", fqn="machine.fqn", asset_type=AssetType.MACHINE_RESOURCE)
+    machine.resource_counterpart = old
+    db_session.add_all([old, new, machine])
+    await db_session.flush()
+
+    (linked,) = await bulk_link_resource_counterparts_for_machines(
+        db_session,
+        [ResourceCounterpartLink(machine, resource_counterpart_accession_id=new.accession_id)],
+    )
+
+    assert linked is new
+    assert machine.resource_counterpart_accession_id == new.accession_id
+    await db_session.refresh(old, attribute_names=["machine_counterpart"])
+    await db_session.refresh(new, attribute_names=["machine_counterpart"])
+    assert old.machine_counterpart is None
+    assert new.machine_counterpart is machine
+
@@ -0,0 +1,90 @@
+"""Tests for the per-workcell hardware connection registry."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from praxis.backend.core.storage import memory_adapter
+from praxis.backend.core.storage.memory_adapter import InMemoryKeyValueStore
+from praxis.backend.services.hardware_connection_manager import HardwareConnectionManager
+
+
+@pytest.fixture
+def kv_store() -> InMemoryKeyValueStore:
+    return InMemoryKeyValueStore()
+
+
+@pytest.mark.asyncio
+async def test_list_connections_is_one_read(kv_store: InMemoryKeyValueStore) -> None:
+    manager = HardwareConnectionManager(kv_store)
+    await asyncio.gather(*(manager.connect(f"dev-{i}", "STAR") for i in range(20)))
+
+    with patch.object(kv_store, "hgetall", wraps=kv_store.hgetall) as hgetall:
+        connections = await manager.list_connections()
+
+    assert hgetall.call_count == 1
+    assert {c.device_id for c in connections} == {f"dev-{i}" for i in range(20)}
+
+
+@pytest.mark.asyncio
+async def test_heartbeat_and_error_update_fields_in_place(kv_store: InMemoryKeyValueStore) -> None:
+    manager = HardwareConnectionManager(kv_store)
+    connected = await manager.connect("dev-1", "STAR", {"port": "/dev/ttyUSB0"})
+
+    beat = await manager.heartbeat("dev-1")
+    errored = await manager.set_error("dev-1", "timeout")
+
+    assert beat.connected_at == connected.connected_at
+    assert beat.last_heartbeat >= connected.last_heartbeat
+    assert errored.status == "error"
+    assert errored.config == {"port": "/dev/ttyUSB0"}
+    assert await manager.get_connection("dev-1") == errored
+    assert await manager.heartbeat("missing") is None
+
+
+@pytest.mark.asyncio
+async def test_concurrent_heartbeats_touch_only_their_own_field(
+    kv_store: InMemoryKeyValueStore,
+) -> None:
+    manager = HardwareConnectionManager(kv_store)
+    devices = [f"dev-{i}" for i in range(20)]
+    await asyncio.gather(*(manager.connect(device, "STAR") for device in devices))
+
+    with patch.object(kv_store, "hset", wraps=kv_store.hset) as hset, \
+            patch.object(kv_store, "get") as get:
+        beats = await asyncio.gather(*(manager.heartbeat(device) for device in devices))
+
+    assert [beat.device_id for beat in beats] == devices
+    assert sorted(call.args[1] for call in hset.call_args_list) == sorted(devices)
+    assert all(call.kwargs["ttl_seconds"] == manager._ttl for call in hset.call_args_list)
+    get.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_entries_lapse_without_heartbeat(kv_store: InMemoryKeyValueStore) -> None:
+    manager = HardwareConnectionManager(kv_store, ttl_seconds=60)
+    now = 1_000_000.0
+    with patch.object(memory_adapter.time, "time", return_value=now):
+        await manager.connect("stale", "STAR")
+    with patch.object(memory_adapter.time, "time", return_value=now + 30):
+        await manager.connect("fresh", "STAR")
+
+    with patch.object(memory_adapter.time, "time", return_value=now + 61):
+        assert [c.device_id for c in await manager.list_connections()] == ["fresh"]
+        assert await manager.heartbeat("stale") is None
+        assert await manager.disconnect("fresh") is True
+        assert await kv_store.hgetall("hw:conn:registry:default") == {}
+
+
+@pytest.mark.asyncio
+async def test_workcells_have_separate_registries(kv_store: InMemoryKeyValueStore) -> None:
+    first = HardwareConnectionManager(kv_store, workcell_id="wc-1")
+    second = HardwareConnectionManager(kv_store, workcell_id="wc-2")
+    await first.connect("dev-1", "STAR")
+    await second.connect("dev-2", "OT2")
+
+    assert [c.device_id for c in await first.list_connections()] == ["dev-1"]
+    assert await second.clear_all() == 1
+    assert await second.list_connections() == []
+    assert [c.device_id for c in await first.list_connections()] == ["dev-1"]
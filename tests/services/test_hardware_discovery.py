@@ -0,0 +1,102 @@
+"""Tests for concurrent and background-monitored hardware discovery."""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from praxis.backend.services.hardware_discovery import (
+    HARDWARE_DEVICES_CHANNEL,
+    ConnectionType,
+    DeviceStatus,
+    DiscoveredDevice,
+    HardwareDiscoveryService,
+)
+
+
+def _serial(port: str) -> DiscoveredDevice:
+    return DiscoveredDevice(
+        id=f"serial-{port}",
+        name=port,
+        connection_type=ConnectionType.SERIAL,
+        status=DeviceStatus.AVAILABLE,
+        port=port,
+    )
+
+
+@pytest.mark.asyncio
+async def test_discover_all_scans_sources_concurrently() -> None:
+    service = HardwareDiscoveryService()
+
+    async def slow_serial():
+        await asyncio.sleep(0.2)
+        return [_serial("COM1")]
+
+    async def slow_network():
+        await asyncio.sleep(0.2)
+        return []
+
+    with patch.object(service, "discover_serial_ports", new=slow_serial), \
+            patch.object(service, "discover_network_devices", new=slow_network):
+        started = time.perf_counter()
+        devices = await service.discover_all()
+        elapsed = time.perf_counter() - started
+
+    assert elapsed < 0.35
+    assert {d.id for d in devices} >= {"serial-COM1", "sim-liquid-handler"}
+    assert service.get_cached_devices() == devices
+
+
+@pytest.mark.asyncio
+async def test_monitoring_serves_cache_and_publishes_changes() -> None:
+    pubsub = AsyncMock()
+    service = HardwareDiscoveryService(pubsub=pubsub, serial_poll_seconds=0.01)
+    ports = [_serial("COM1")]
+
+    with patch.object(service, "_list_serial_ports", side_effect=lambda: list(ports)), \
+            patch.object(service, "_start_network_browser"):
+        await service.start()
+        try:
+            assert service.is_monitoring
+            with patch.object(service, "discover_network_devices", side_effect=AssertionError("scanned")):
+                cached = await service.discover_all()
+            assert "serial-COM1" in {d.id for d in cached}
+            pubsub.publish.reset_mock()
+
+            ports[:] = [_serial("COM2")]
+            for _ in range(100):
+                if pubsub.publish.await_count:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            await service.stop()
+
+    channel, message = pubsub.publish.await_args_list[0].args
+    assert channel == HARDWARE_DEVICES_CHANNEL
+    assert [d["id"] for d in message["added"]] == ["serial-COM2"]
+    assert message["removed"] == ["serial-COM1"]
+    assert message["updated"] == []
+    assert not service.is_monitoring
+
+
+@pytest.mark.asyncio
+async def test_removed_network_service_drops_device() -> None:
+    from zeroconf import ServiceStateChange
+
+    pubsub = AsyncMock()
+    service = HardwareDiscoveryService(pubsub=pubsub)
+    device = service._parse_network_device(
+        "_opentrons._tcp.local.",
+        "ot2._opentrons._tcp.local.",
+        {"addresses": ["10.0.0.5"], "port": 31950, "server": "ot2.local.", "properties": {}},
+    )
+    key = ("_opentrons._tcp.local.", "ot2._opentrons._tcp.local.")
+    service._network_services[key] = device.id
+    await service._update_devices([device], [])
+    pubsub.publish.reset_mock()
+
+    await service._resolve_network_service(*key, ServiceStateChange.Removed)
+
+    assert service.get_cached_devices() == []
+    assert pubsub.publish.await_args.args[1]["removed"] == [device.id]
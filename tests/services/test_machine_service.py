@@ -7,6 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from praxis.backend.models.enums.asset import AssetType
 from praxis.backend.models.enums.machine import MachineStatusEnum
 from praxis.backend.models.domain.resource import (
+    Resource,
     ResourceDefinition,
 )
 from praxis.backend.models.domain.filters import SearchFilters
@@ -219,3 +220,65 @@ async def test_machine_service_update_with_resource_counterpart(db_session: Asyn
     updated = await machine_service.update(db=db_session, db_obj=machine, obj_in=update_data)
 
     assert updated.resource_counterpart is not None
+
+@pytest.mark.asyncio
+async def test_machine_service_create_many(db_session: AsyncSession) -> None:
+    """Test bulk-creating machines, creating and linking resource counterparts."""
+    res_def_name = "bulk_machine_res_def"
+    definition = await create_resource_definition(db_session, res_def_name)
+    existing = Resource(
+        name="existing_resource",
+        fqn="com.example.Resource",
+        asset_type=AssetType.RESOURCE,
+        resource_definition_accession_id=definition.accession_id,
+    )
+    db_session.add(existing)
+    await db_session.flush()
+
+    machines = await machine_service.create_many(
+        db=db_session,
+        objs_in=[
+            MachineCreate(name="Bulk Plain", asset_type=AssetType.MACHINE),
+            MachineCreate(
+                name="Bulk New Resource",
+                asset_type=AssetType.MACHINE,
+                resource_def_name=res_def_name,
+            ),
+            MachineCreate(
+                name="Bulk Linked Resource",
+                asset_type=AssetType.MACHINE,
+                resource_counterpart_accession_id=existing.accession_id,
+            ),
+        ],
+    )
+
+    plain, created, linked = machines
+    assert plain.resource_counterpart_accession_id is None
+    assert created.resource_counterpart.name == "Bulk New Resource_resource"
+    assert created.resource_counterpart.machine_counterpart is created
+    assert linked.resource_counterpart is existing
+    await db_session.refresh(existing, attribute_names=["machine_counterpart"])
+    assert existing.machine_counterpart is linked
+    assert existing.name == "Bulk Linked Resource"
+    assert linked.asset_type == AssetType.MACHINE_RESOURCE
+
+@pytest.mark.asyncio
+async def test_machine_service_create_many_duplicate_names(db_session: AsyncSession) -> None:
+    """Test that bulk creation rejects names already taken or repeated in the batch."""
+    await machine_service.create(
+        db=db_session, obj_in=MachineCreate(name="Taken", asset_type=AssetType.MACHINE),
+    )
+
+    with pytest.raises(ValueError, match="Taken"):
+        await machine_service.create_many(
+            db=db_session,
+            objs_in=[MachineCreate(name="Taken", asset_type=AssetType.MACHINE)],
+        )
+    with pytest.raises(ValueError, match="Twice"):
+        await machine_service.create_many(
+            db=db_session,
+            objs_in=[
+                MachineCreate(name="Twice", asset_type=AssetType.MACHINE),
+                MachineCreate(name="Twice", asset_type=AssetType.MACHINE),
+            ],
+        )
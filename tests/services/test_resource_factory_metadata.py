@@ -0,0 +1,88 @@
+"""Tests for the cached resource factory metadata extraction."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import pylabrobot.resources.corning.plates as corning_plates
+
+from praxis.backend.services import resource_factory_metadata
+from praxis.backend.services.resource_factory_metadata import (
+    FactoryMetadataCache,
+    extract_factory_metadata,
+)
+from praxis.backend.services.resource_type_validation import (
+    get_metadata_from_factory_function,
+    is_resource_factory_function,
+)
+
+CORNING_FACTORIES = {
+    f"{corning_plates.__name__}.{name}": func
+    for name, func in vars(corning_plates).items()
+    if is_resource_factory_function(func) and func.__module__ == corning_plates.__name__
+}
+
+
+def _first(count: int) -> dict:
+    return dict(list(CORNING_FACTORIES.items())[:count])
+
+
+@pytest.mark.asyncio
+async def test_warm_cache_instantiates_nothing(tmp_path: Path) -> None:
+    factories = _first(3)
+    cache_file = tmp_path / "metadata.json"
+    cold = FactoryMetadataCache(cache_file)
+    extracted = await extract_factory_metadata(factories, cache=cold, max_workers=1)
+    cold.save()
+    assert all(metadata["num_items"] for metadata in extracted.values())
+
+    warm = FactoryMetadataCache(cache_file)
+    with patch.object(
+        resource_factory_metadata,
+        "get_metadata_from_factory_function",
+        side_effect=AssertionError("instantiated"),
+    ):
+        assert await extract_factory_metadata(factories, cache=warm, max_workers=1) == extracted
+
+
+@pytest.mark.asyncio
+async def test_changed_source_or_plr_version_is_re_extracted(tmp_path: Path) -> None:
+    fqn, factory = next(iter(CORNING_FACTORIES.items()))
+    cache_file = tmp_path / "metadata.json"
+    cache = FactoryMetadataCache(cache_file, plr_version="1.0")
+    source_hash = cache.source_hash(factory)
+    cache.set(fqn, source_hash, {"name": "stale"})
+    cache.save()
+
+    assert FactoryMetadataCache(cache_file, plr_version="1.0").get(fqn, source_hash) == {"name": "stale"}
+    assert FactoryMetadataCache(cache_file, plr_version="1.0").get(fqn, "edited") is None
+    assert FactoryMetadataCache(cache_file, plr_version="2.0").get(fqn, source_hash) is None
+
+
+@pytest.mark.asyncio
+async def test_misses_are_extracted_in_worker_processes(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(resource_factory_metadata, "MIN_PARALLEL_MISSES", 4)
+    factories = _first(4)
+    cache = FactoryMetadataCache(tmp_path / "metadata.json")
+
+    with patch.object(
+        resource_factory_metadata,
+        "_extract_in_workers",
+        wraps=resource_factory_metadata._extract_in_workers,
+    ) as in_workers, patch.object(
+        resource_factory_metadata.asyncio,
+        "to_thread",
+        wraps=resource_factory_metadata.asyncio.to_thread,
+    ) as to_thread:
+        extracted = await extract_factory_metadata(factories, cache=cache, max_workers=2)
+
+    in_workers.assert_called_once()
+    # The pool is joined in a thread, not on the event loop.
+    assert to_thread.call_args.args[0].__name__ == "shutdown"
+    assert list(extracted) == list(factories)
+    for fqn, factory in factories.items():
+        assert extracted[fqn] == get_metadata_from_factory_function(factory, fqn)
+    assert cache.get(fqn, cache.source_hash(factory)) == extracted[fqn]
@@ -415,6 +415,41 @@ async def test_resource_service_update_location_and_status_not_found(db_session:
     assert result is None
 
 
+@pytest.mark.asyncio
+async def test_resource_service_update_location_and_status_transaction(db_session: AsyncSession) -> None:
+    """Test the update is validated, committed, and rolled back on error."""
+    from unittest.mock import AsyncMock, patch
+
+    resource = await resource_service.create(db_session, obj_in=ResourceCreate(
+        name="loc_status_tx", fqn="resources.loc_status_tx", asset_type=AssetType.RESOURCE,
+        status=ResourceStatusEnum.AVAILABLE_IN_STORAGE,
+    ))
+
+    with patch.object(db_session, "commit", AsyncMock()) as commit, \
+            patch.object(db_session, "rollback", AsyncMock()) as rollback:
+        await resource_service.update_resource_location_and_status(
+            db_session, resource_accession_id=resource.accession_id, new_status=ResourceStatusEnum.IN_USE,
+        )
+        commit.assert_awaited()
+        rollback.assert_not_awaited()
+
+        commit.reset_mock()
+        failing_update = AsyncMock(side_effect=RuntimeError("disk full"))
+        with patch.object(resource_service, "update", failing_update), \
+                pytest.raises(ValueError, match="disk full"):
+            await resource_service.update_resource_location_and_status(
+                db_session, resource_accession_id=resource.accession_id,
+                new_status=ResourceStatusEnum.AVAILABLE_ON_DECK,
+            )
+        rollback.assert_awaited_once()
+        commit.assert_not_awaited()
+
+        with pytest.raises(ValueError, match="Invalid accession ID"):
+            await resource_service.update_resource_location_and_status(
+                db_session, resource_accession_id="not-a-uuid", new_status=ResourceStatusEnum.IN_USE,
+            )
+
+
 @pytest.mark.asyncio
 async def test_resource_service_get_multi_filters_extended(db_session: AsyncSession) -> None:
     """Test get_multi with extended filters (parent, fqn, status)."""
@@ -451,3 +486,128 @@ async def test_resource_service_get_multi_filters_extended(db_session: AsyncSess
     # Note: test database might have other items, so check if 'other_filter' is in results
     names = [r.name for r in results_status]
     assert "other_filter" in names
+
+
+@pytest.mark.asyncio
+async def test_resource_service_find_acquisition_candidates_ranks_by_status(db_session: AsyncSession) -> None:
+    """Test candidates are ranked in-use-by-run, on deck, in storage and capped per FQN."""
+    from praxis.backend.utils.uuid import uuid7
+
+    run_id = uuid7()
+    other_run_id = uuid7()
+    fqn = "resources.plates.acquire_rank"
+    for name, status, run in [
+        ("rank_a_storage", ResourceStatusEnum.AVAILABLE_IN_STORAGE, None),
+        ("rank_b_deck", ResourceStatusEnum.AVAILABLE_ON_DECK, None),
+        ("rank_c_in_use", ResourceStatusEnum.IN_USE, run_id),
+        ("rank_d_other_run", ResourceStatusEnum.IN_USE, other_run_id),
+        ("rank_e_error", ResourceStatusEnum.ERROR, None),
+    ]:
+        resource = await resource_service.create(db_session, obj_in=ResourceCreate(
+            name=name, fqn=fqn, asset_type=AssetType.RESOURCE, status=status,
+        ))
+        resource.current_protocol_run_accession_id = run
+    await resource_service.create(db_session, obj_in=ResourceCreate(
+        name="rank_tip_rack", fqn="resources.tips.acquire_rank", asset_type=AssetType.RESOURCE,
+        status=ResourceStatusEnum.AVAILABLE_ON_DECK,
+    ))
+    await db_session.flush()
+
+    candidates = await resource_service.find_acquisition_candidates(
+        db_session,
+        protocol_run_accession_id=run_id,
+        fqn_counts={fqn: 5, "resources.tips.acquire_rank": 1, "resources.missing": 1},
+    )
+
+    assert [r.name for r in candidates[fqn]] == ["rank_c_in_use", "rank_b_deck", "rank_a_storage"]
+    assert [r.name for r in candidates["resources.tips.acquire_rank"]] == ["rank_tip_rack"]
+    assert candidates["resources.missing"] == []
+
+    in_use = candidates[fqn][0]
+    capped = await resource_service.find_acquisition_candidates(
+        db_session,
+        protocol_run_accession_id=run_id,
+        fqn_counts={fqn: 1},
+        exclude_accession_ids=[in_use.accession_id],
+    )
+    assert [r.name for r in capped[fqn]] == ["rank_b_deck"]
+
+
+@pytest.mark.asyncio
+async def test_resource_service_find_acquisition_candidates_reranks_past_held_rows(
+    db_session: AsyncSession, monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test a row another acquirer holds is skipped and the next best one is returned."""
+    from praxis.backend.utils.uuid import uuid7
+
+    fqn = "resources.plates.acquire_held"
+    resources = {}
+    for name, status in [
+        ("held_a_deck", ResourceStatusEnum.AVAILABLE_ON_DECK),
+        ("held_b_deck", ResourceStatusEnum.AVAILABLE_ON_DECK),
+        ("held_c_storage", ResourceStatusEnum.AVAILABLE_IN_STORAGE),
+    ]:
+        resources[name] = await resource_service.create(db_session, obj_in=ResourceCreate(
+            name=name, fqn=fqn, asset_type=AssetType.RESOURCE, status=status,
+        ))
+    await db_session.flush()
+
+    # SQLite has no row locks, so SKIP LOCKED is emulated for the held row.
+    held = {resources["held_a_deck"].accession_id}
+    lock_calls = []
+    lock_candidates = resource_service._lock_acquisition_candidates
+
+    async def skip_held(db, **kwargs):
+        lock_calls.append(kwargs["ranked"])
+        kwargs["ranked"] = [entry for entry in kwargs["ranked"] if entry[0] not in held]
+        return await lock_candidates(db, **kwargs)
+
+    monkeypatch.setattr(resource_service, "_lock_acquisition_candidates", skip_held)
+
+    candidates = await resource_service.find_acquisition_candidates(
+        db_session, protocol_run_accession_id=uuid7(), fqn_counts={fqn: 2},
+    )
+
+    assert [r.name for r in candidates[fqn]] == ["held_b_deck", "held_c_storage"]
+    assert len(lock_calls) == 2
+
+
+@pytest.mark.postgresql_only
+@pytest.mark.asyncio
+async def test_resource_service_find_acquisition_candidates_concurrent_acquirers(db_engine) -> None:
+    """Test two concurrent acquirers lock different instances instead of blocking."""
+    from sqlalchemy import delete
+
+    from praxis.backend.utils.uuid import uuid7
+
+    fqn = "resources.plates.acquire_concurrent"
+    async with AsyncSession(db_engine, expire_on_commit=False) as setup:
+        for name in ("concurrent_a", "concurrent_b"):
+            setup.add(Resource(
+                name=name, fqn=fqn, asset_type=AssetType.RESOURCE,
+                status=ResourceStatusEnum.AVAILABLE_ON_DECK,
+            ))
+        await setup.commit()
+
+    try:
+        async with AsyncSession(db_engine) as first, AsyncSession(db_engine) as second:
+            first_candidates = await resource_service.find_acquisition_candidates(
+                first, protocol_run_accession_id=uuid7(), fqn_counts={fqn: 1},
+            )
+            second_candidates = await resource_service.find_acquisition_candidates(
+                second, protocol_run_accession_id=uuid7(), fqn_counts={fqn: 1},
+            )
+            third_candidates = await resource_service.find_acquisition_candidates(
+                second, protocol_run_accession_id=uuid7(), fqn_counts={fqn: 1},
+                exclude_accession_ids=[r.accession_id for r in second_candidates[fqn]],
+            )
+            await first.rollback()
+            await second.rollback()
+    finally:
+        async with AsyncSession(db_engine) as cleanup:
+            await cleanup.execute(delete(Resource).where(Resource.fqn == fqn))
+            await cleanup.commit()
+
+    assert [r.name for r in first_candidates[fqn]] == ["concurrent_a"]
+    assert [r.name for r in second_candidates[fqn]] == ["concurrent_b"]
+    assert third_candidates[fqn] == []
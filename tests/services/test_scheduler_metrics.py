@@ -0,0 +1,183 @@
+"""Tests for the incremental scheduling metrics rollups."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from praxis.backend.models.domain.schedule import ScheduleEntryCreate, ScheduleMetricsRollup
+from praxis.backend.models.enums import ScheduleHistoryEventEnum, ScheduleStatusEnum
+from praxis.backend.services.scheduler import (
+    build_schedule_event,
+    get_scheduling_metrics,
+    schedule_entry_service,
+)
+from praxis.backend.services.scheduler_metrics import (
+    HOUR,
+    MINUTE,
+    backfill_scheduling_metrics,
+    bucket_start,
+    get_rollup_metrics,
+    record_schedule_events,
+)
+from praxis.backend.utils.uuid import uuid7
+from tests.factories_schedule import create_protocol_run
+
+T0 = datetime(2026, 3, 1, 10, 0, tzinfo=timezone.utc)
+
+
+def _event(at: datetime, to_status=None, from_status=None, **kwargs):
+    event = build_schedule_event(
+        uuid7(),
+        ScheduleHistoryEventEnum.STATUS_CHANGED,
+        previous_status=from_status,
+        new_status=to_status,
+        **kwargs,
+    )
+    event.created_at = at
+    return event
+
+
+async def _rollups(db: AsyncSession, granularity: str) -> list[ScheduleMetricsRollup]:
+    result = await db.execute(
+        select(ScheduleMetricsRollup)
+        .where(ScheduleMetricsRollup.granularity == granularity)
+        .order_by(ScheduleMetricsRollup.bucket_start),
+    )
+    return list(result.scalars())
+
+
+def test_bucket_start_treats_naive_as_utc() -> None:
+    aware = datetime(2026, 3, 1, 12, 34, 56, 789, tzinfo=timezone(timedelta(hours=2)))
+    naive = datetime(2026, 3, 1, 10, 34, 56)
+
+    assert bucket_start(aware, MINUTE) == datetime(2026, 3, 1, 10, 34, tzinfo=timezone.utc)
+    assert bucket_start(naive, MINUTE) == bucket_start(aware, MINUTE)
+    assert bucket_start(naive, HOUR) == datetime(2026, 3, 1, 10, tzinfo=timezone.utc)
+    with pytest.raises(ValueError, match="Unknown rollup granularity"):
+        bucket_start(naive, "day")
+
+
+@pytest.mark.asyncio
+async def test_logged_events_update_minute_and_hour_buckets(db_session: AsyncSession) -> None:
+    run = await create_protocol_run(db_session)
+    start = datetime.now(timezone.utc) - timedelta(minutes=5)
+
+    entry = await schedule_entry_service.create(
+        db_session,
+        obj_in=ScheduleEntryCreate(protocol_run_accession_id=run.accession_id),
+    )
+    metrics = await get_scheduling_metrics(db_session, start, start + timedelta(minutes=10))
+    assert metrics["queue_depth"] == 1
+
+    await schedule_entry_service.update_status(
+        db_session, entry.accession_id, ScheduleStatusEnum.EXECUTING,
+    )
+    await schedule_entry_service.update_status(
+        db_session, entry.accession_id, ScheduleStatusEnum.FAILED,
+    )
+
+    metrics = await get_scheduling_metrics(db_session, start, start + timedelta(minutes=10))
+    assert metrics["total_events"] == 3
+    assert metrics["status_counts"] == {
+        ScheduleStatusEnum.QUEUED: 1,
+        ScheduleStatusEnum.EXECUTING: 1,
+        ScheduleStatusEnum.FAILED: 1,
+    }
+    assert metrics["queue_depth"] == 0
+    assert metrics["max_queue_depth"] == 1
+    assert metrics["avg_wait_time_ms"] is not None
+    assert metrics["avg_wait_time_ms"] >= 0
+
+    hourly = await _rollups(db_session, HOUR)
+    assert sum(bucket.event_count for bucket in hourly) == 3
+
+
+@pytest.mark.asyncio
+async def test_range_combines_whole_hours_with_edge_minutes(db_session: AsyncSession) -> None:
+    times = [
+        T0 + timedelta(minutes=5),  # before the range
+        T0 + timedelta(hours=1, minutes=30),
+        T0 + timedelta(hours=2, minutes=59),
+        T0 + timedelta(hours=3, minutes=2),
+        T0 + timedelta(hours=3, minutes=10),  # after the range
+    ]
+    await record_schedule_events(
+        db_session,
+        [_event(at, ScheduleStatusEnum.COMPLETED, duration_ms=100 * i) for i, at in enumerate(times)],
+    )
+
+    metrics = await get_rollup_metrics(
+        db_session, T0 + timedelta(minutes=30), T0 + timedelta(hours=3, minutes=5),
+    )
+
+    assert metrics["total_events"] == 3
+    assert metrics["status_counts"] == {ScheduleStatusEnum.COMPLETED: 3}
+    assert metrics["avg_duration_ms"] == 200
+
+
+@pytest.mark.asyncio
+async def test_late_event_carries_queue_depth_forward(db_session: AsyncSession) -> None:
+    await record_schedule_events(db_session, [_event(T0, ScheduleStatusEnum.QUEUED)])
+    await record_schedule_events(
+        db_session, [_event(T0 + timedelta(minutes=10), ScheduleStatusEnum.QUEUED)],
+    )
+    await record_schedule_events(
+        db_session,
+        [_event(T0 + timedelta(minutes=5), ScheduleStatusEnum.CANCELLED, ScheduleStatusEnum.QUEUED)],
+    )
+
+    depths = [(bucket.bucket_start.minute, bucket.queue_depth) for bucket in await _rollups(db_session, MINUTE)]
+    assert depths == [(0, 1), (5, 0), (10, 1)]
+    metrics = await get_rollup_metrics(db_session, T0, T0 + timedelta(hours=1))
+    assert metrics["queue_depth"] == 1
+    assert metrics["max_queue_depth"] == 2  # Recorded before the late event arrived
+
+
+@pytest.mark.asyncio
+async def test_backfill_rebuilds_rollups_from_history(db_session: AsyncSession) -> None:
+    start = datetime.now(timezone.utc) - timedelta(hours=1)
+    for _ in range(3):
+        run = await create_protocol_run(db_session)
+        entry = await schedule_entry_service.create(
+            db_session,
+            obj_in=ScheduleEntryCreate(protocol_run_accession_id=run.accession_id),
+        )
+        await schedule_entry_service.update_status(
+            db_session, entry.accession_id, ScheduleStatusEnum.CANCELLED, error_details="gone",
+        )
+    end = datetime.now(timezone.utc) + timedelta(hours=1)
+    live = await get_scheduling_metrics(db_session, start, end)
+
+    replayed = await backfill_scheduling_metrics(db_session, batch_size=2)
+
+    assert replayed >= 6
+    rebuilt = await get_scheduling_metrics(db_session, start, end)
+    assert rebuilt["status_counts"] == live["status_counts"]
+    assert rebuilt["total_events"] == live["total_events"]
+    assert rebuilt["queue_depth"] == live["queue_depth"]
+
+
+@pytest.mark.asyncio
+async def test_max_queue_depth_tracks_peak_within_one_batch(db_session: AsyncSession) -> None:
+    await record_schedule_events(
+        db_session,
+        [
+            _event(T0, ScheduleStatusEnum.QUEUED),
+            _event(T0 + timedelta(seconds=1), ScheduleStatusEnum.QUEUED),
+            _event(T0 + timedelta(seconds=2), ScheduleStatusEnum.CANCELLED, ScheduleStatusEnum.QUEUED),
+            _event(T0 + timedelta(seconds=3), ScheduleStatusEnum.CANCELLED, ScheduleStatusEnum.QUEUED),
+        ],
+    )
+    await record_schedule_events(
+        db_session, [_event(T0 + timedelta(seconds=4), ScheduleStatusEnum.QUEUED)],
+    )
+
+    [bucket] = await _rollups(db_session, MINUTE)
+    assert (bucket.event_count, bucket.queue_depth, bucket.max_queue_depth) == (5, 1, 2)
+    metrics = await get_rollup_metrics(db_session, T0, T0 + timedelta(minutes=1))
+    assert metrics["status_counts"] == {
+        ScheduleStatusEnum.QUEUED: 3,
+        ScheduleStatusEnum.CANCELLED: 2,
+    }
@@ -0,0 +1,240 @@
+"""Tests for batch protocol simulation in SimulationService."""
+
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from praxis.backend.core.simulation import SIMULATION_VERSION
+from praxis.backend.services.simulation_service import (
+    LoadedProtocolCache,
+    SimulationService,
+    loaded_protocols,
+)
+
+
+async def transfer_protocol(lh: Any, plate: Any, tip_rack: Any) -> None:
+    """Module-level protocol so worker processes can import it."""
+    await lh.pick_up_tips(tip_rack["A1"])
+    await lh.aspirate(plate["A1"], vols=[10])
+    await lh.dispense(plate["B1"], vols=[10])
+    await lh.drop_tips(tip_rack["A1"])
+
+
+def _protocol_model(fqn: str, **overrides: Any) -> SimpleNamespace:
+    fields = {
+        "fqn": fqn,
+        "module_name": __name__,
+        "function_name": "transfer_protocol",
+        "source_hash": "abc123",
+        "simulation_version": None,
+        "simulation_result_json": None,
+        "cached_bytecode": None,
+        "bytecode_python_version": None,
+        "bytecode_cache_version": None,
+        "assets": [
+            SimpleNamespace(name="lh", actual_type_str="LiquidHandler", type_hint_str="LiquidHandler"),
+            SimpleNamespace(name="plate", actual_type_str="Plate", type_hint_str="Plate"),
+            SimpleNamespace(name="tip_rack", actual_type_str="TipRack", type_hint_str="TipRack"),
+        ],
+        "parameters": [],
+    }
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+@pytest.fixture
+def session() -> MagicMock:
+    mock = MagicMock()
+    mock.commit = AsyncMock()
+    return mock
+
+
+@pytest.mark.asyncio
+async def test_simulate_pending_protocols_in_worker_processes(session: MagicMock) -> None:
+    service = SimulationService(enable_failure_detection=False, max_workers=2)
+    models = [_protocol_model(f"protocols.p{i}") for i in range(3)]
+    progress: list[tuple[int, int, str]] = []
+
+    results = await service.simulate_pending_protocols(
+        session,
+        models,
+        progress_callback=lambda done, total, fqn: progress.append((done, total, fqn)),
+    )
+
+    assert set(results) == {m.fqn for m in models}
+    assert all(r is not None for r in results.values())
+    for model in models:
+        assert model.simulation_version == SIMULATION_VERSION
+        assert model.simulation_result_json is not None
+        assert model.cached_bytecode
+    assert [p[0] for p in progress] == [1, 2, 3]
+    assert {p[2] for p in progress} == {m.fqn for m in models}
+    # All three results are written in a single batch.
+    session.commit.assert_awaited_once()
+    await service.stop()
+
+
+@pytest.mark.asyncio
+async def test_worker_pool_is_reused_across_batches(session: MagicMock) -> None:
+    service = SimulationService(enable_failure_detection=False, max_workers=2)
+    service.start()
+    pool = service._pool
+    try:
+        for batch in range(2):
+            models = [_protocol_model(f"protocols.b{batch}p{i}") for i in range(2)]
+            results = await service.simulate_pending_protocols(session, models)
+            assert all(r is not None for r in results.values())
+            assert service._pool is pool
+    finally:
+        await service.stop()
+    assert service._pool is None
+
+
+def test_worker_count_defaults_to_configuration(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(
+        "praxis.backend.services.simulation_service.PraxisConfiguration.simulation_workers",
+        property(lambda _self: 3),
+    )
+    service = SimulationService(enable_failure_detection=False)
+    assert service._max_workers == 3
+    assert service._pool is None
+
+
+@pytest.mark.asyncio
+async def test_simulate_pending_protocols_commits_in_batches(session: MagicMock) -> None:
+    service = SimulationService(enable_failure_detection=False, max_workers=1, batch_size=2)
+    models = [_protocol_model(f"protocols.p{i}") for i in range(3)]
+
+    await service.simulate_pending_protocols(session, models)
+
+    assert session.commit.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_simulate_pending_protocols_skips_completed_on_resume(session: MagicMock) -> None:
+    service = SimulationService(enable_failure_detection=False, max_workers=1)
+    first = [_protocol_model(f"protocols.p{i}") for i in range(2)]
+    await service.simulate_pending_protocols(session, first)
+    cached_results = {m.fqn: m.simulation_result_json for m in first}
+
+    pending = _protocol_model("protocols.pending")
+    progress: list[str] = []
+    results = await service.simulate_pending_protocols(
+        session,
+        [*first, pending],
+        progress_callback=lambda _done, _total, fqn: progress.append(fqn),
+    )
+
+    assert progress == ["protocols.pending"]
+    for model in first:
+        assert results[model.fqn].to_cache_dict() == cached_results[model.fqn]
+    assert results["protocols.pending"] is not None
+
+
+@pytest.mark.asyncio
+async def test_simulate_pending_protocols_reports_unimportable(session: MagicMock) -> None:
+    service = SimulationService(enable_failure_detection=False, max_workers=2)
+    missing = _protocol_model("protocols.missing", function_name="does_not_exist")
+
+    results = await service.simulate_pending_protocols(session, [missing])
+
+    assert results == {"protocols.missing": None}
+    session.commit.assert_not_awaited()
+    await service.stop()
+
+
+def _cached_model(service: SimulationService, fqn: str, source_hash: str) -> SimpleNamespace:
+    model = _protocol_model(fqn, source_hash=source_hash)
+    cached = service._protocol_cache.cache_protocol(transfer_protocol)
+    model.cached_bytecode = cached.bytecode
+    model.bytecode_python_version = cached.python_version
+    model.bytecode_cache_version = cached.cache_version
+    return model
+
+
+@pytest.mark.asyncio
+async def test_loaded_protocol_lru_deserializes_once() -> None:
+    service = SimulationService(
+        enable_failure_detection=False, loaded_protocol_cache=LoadedProtocolCache()
+    )
+    model = _cached_model(service, "protocols.p0", "v1")
+    service._protocol_cache.load_protocol = MagicMock(wraps=service._protocol_cache.load_protocol)
+
+    first = await service.get_protocol_function(model)
+    second = await service.get_protocol_function(model)
+
+    assert first is second
+    service._protocol_cache.load_protocol.assert_called_once()
+    assert service.loaded_protocol_stats.hits == 1
+    assert service.loaded_protocol_stats.misses == 1
+
+
+@pytest.mark.asyncio
+async def test_loaded_protocol_lru_evicts_least_recently_used() -> None:
+    service = SimulationService(
+        enable_failure_detection=False, loaded_protocol_cache=LoadedProtocolCache(max_entries=2)
+    )
+    models = [_cached_model(service, f"protocols.p{i}", f"v{i}") for i in range(3)]
+
+    for model in models:
+        await service.get_protocol_function(model)
+    await service.get_protocol_function(models[0])
+
+    assert service.loaded_protocol_stats.evictions == 2
+    assert service.loaded_protocol_stats.misses == 4
+
+
+@pytest.mark.asyncio
+async def test_loaded_protocol_lru_keys_on_source_hash_and_invalidates() -> None:
+    service = SimulationService(
+        enable_failure_detection=False, loaded_protocol_cache=LoadedProtocolCache()
+    )
+    model = _cached_model(service, "protocols.p0", "v1")
+    await service.get_protocol_function(model)
+
+    model.source_hash = "v2"
+    await service.get_protocol_function(model)
+    assert service.loaded_protocol_stats.misses == 2
+
+    assert service.invalidate_loaded_protocols("protocols.p0") == 2
+    await service.get_protocol_function(model)
+    assert service.loaded_protocol_stats.misses == 3
+
+
+def test_loaded_protocol_cache_is_shared_by_default() -> None:
+    first = SimulationService(enable_failure_detection=False)
+    second = SimulationService(enable_failure_detection=False)
+    assert first._loaded_protocols is loaded_protocols
+    assert second._loaded_protocols is loaded_protocols
+
+
+@pytest.mark.asyncio
+async def test_simulation_falls_back_to_cached_bytecode(session: MagicMock) -> None:
+    cache = LoadedProtocolCache()
+    service = SimulationService(
+        enable_failure_detection=False, max_workers=1, loaded_protocol_cache=cache
+    )
+    model = _cached_model(service, "protocols.moved", "v1")
+    model.module_name = "protocols_that_no_longer_exist"
+
+    results = await service.simulate_pending_protocols(session, [model])
+
+    assert results["protocols.moved"] is not None
+    assert cache.stats.misses == 1
+    # Re-caching the bytecode after the simulation drops the loaded callable.
+    assert cache.stats.invalidations == 1
+
+
+@pytest.mark.asyncio
+async def test_simulation_prefers_import_over_cached_bytecode(session: MagicMock) -> None:
+    cache = LoadedProtocolCache()
+    service = SimulationService(
+        enable_failure_detection=False, max_workers=1, loaded_protocol_cache=cache
+    )
+    model = _cached_model(service, "protocols.p0", "v1")
+
+    await service.simulate_pending_protocols(session, [model])
+
+    assert cache.stats.misses == 0
@@ -1,14 +1,20 @@
 """Tests for logging utilities in utils/logging.py."""
 
+import json
 import logging
+from logging.handlers import QueueHandler
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from praxis.backend.core.decorators.models import praxis_run_context_cv
 from praxis.backend.utils.logging import (
+    RateLimitFilter,
+    configure_logging,
     get_logger,
     log_async_runtime_errors,
     log_runtime_errors,
+    shutdown_logging,
 )
 
 
@@ -26,19 +32,87 @@ class TestGetLogger:
         logger = get_logger("my_test_logger")
         assert logger.name == "my_test_logger"
 
-    def test_logger_level_is_debug(self) -> None:
-        """Test that logger level is set to DEBUG."""
+    def test_logger_level_is_inherited(self) -> None:
+        """Test that get_logger leaves the level to the root logger."""
         logger = get_logger("test_logger")
-        assert logger.level == logging.DEBUG
-
-    def test_logger_has_stream_handler(self) -> None:
-        """Test that logger has a StreamHandler attached."""
-        logger = get_logger("test_logger")
-        # Check if any handler is a StreamHandler
-        has_stream_handler = any(
-            isinstance(handler, logging.StreamHandler) for handler in logger.handlers
-        )
-        assert has_stream_handler
+        assert logger.level == logging.NOTSET
+
+    def test_does_not_start_background_writer(self) -> None:
+        """Test that only configure_logging starts the listener thread."""
+        with patch("praxis.backend.utils.logging._start_listener") as start_listener:
+            get_logger("test_unconfigured_logger")
+        start_listener.assert_not_called()
+
+    def test_records_route_through_queue_handler(self) -> None:
+        """Test that reconfiguring keeps a single QueueHandler on the root logger."""
+        configure_logging(level=logging.WARNING)
+        configure_logging(level=logging.WARNING)
+        queue_handlers = [
+            handler for handler in logging.getLogger().handlers
+            if isinstance(handler, QueueHandler)
+        ]
+        assert len(queue_handlers) == 1
+
+    def test_repeated_calls_add_no_handlers(self) -> None:
+        """Test that get_logger is idempotent per name."""
+        logger = get_logger("test_idempotent_logger")
+        handlers = list(logger.handlers) + list(logging.getLogger().handlers)
+        assert get_logger("test_idempotent_logger") is logger
+        assert list(logger.handlers) + list(logging.getLogger().handlers) == handlers
+
+    def test_rate_limit_replaces_previous_filter(self) -> None:
+        """Test that a logger carries at most one rate limit filter."""
+        get_logger("test_rate_limited_logger", rate_limit=5)
+        logger = get_logger("test_rate_limited_logger", rate_limit=10)
+        limits = [f for f in logger.filters if isinstance(f, RateLimitFilter)]
+        assert [f.rate for f in limits] == [10]
+
+    def test_configured_file_receives_json_records(self, tmp_path) -> None:
+        """Test the background writer emits JSON lines with run context."""
+        log_file = tmp_path / "logs" / "praxis.log"
+        context = MagicMock(run_accession_id="run-1", current_call_log_db_accession_id="call-7")
+        token = praxis_run_context_cv.set(context)
+        try:
+            configure_logging(level=logging.INFO, log_file=str(log_file), json_format=True)
+            get_logger("test_json_logger").info("moved %d plates", 3)
+            shutdown_logging()
+        finally:
+            praxis_run_context_cv.reset(token)
+            configure_logging(level=logging.WARNING)
+
+        entry = json.loads(log_file.read_text().strip().splitlines()[-1])
+        assert entry["message"] == "moved 3 plates"
+        assert entry["logger"] == "test_json_logger"
+        assert entry["run_accession_id"] == "run-1"
+        assert entry["call_log_accession_id"] == "call-7"
+
+
+class TestRateLimitFilter:
+
+    """Tests for RateLimitFilter."""
+
+    @staticmethod
+    def _record(level: int = logging.INFO) -> logging.LogRecord:
+        return logging.LogRecord("hot", level, __file__, 1, "tick", None, None)
+
+    def test_drops_records_over_budget_and_reports_count(self) -> None:
+        """Test records past the burst are dropped and counted on the next one."""
+        limiter = RateLimitFilter(rate=2, burst=2)
+        with patch("praxis.backend.utils.logging.time.monotonic", return_value=100.0):
+            limiter._last = 100.0
+            results = [limiter.filter(self._record()) for _ in range(5)]
+        assert results == [True, True, False, False, False]
+
+        record = self._record()
+        with patch("praxis.backend.utils.logging.time.monotonic", return_value=101.0):
+            assert limiter.filter(record)
+        assert record.suppressed == 3
+
+    def test_errors_always_pass(self) -> None:
+        """Test error records bypass the budget."""
+        limiter = RateLimitFilter(rate=1, burst=1)
+        limiter.filter(self._record())
+        assert limiter.filter(self._record(logging.ERROR))
 
     def test_creates_different_loggers_for_different_names(self) -> None:
         """Test that different names create different logger instances."""
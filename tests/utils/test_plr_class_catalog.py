@@ -0,0 +1,124 @@
+"""Tests for the PyLabRobot class catalog in utils/plr_inspection/catalog.py."""
+
+import os
+import sys
+import textwrap
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from pylabrobot.resources import Deck
+from pylabrobot.resources.carrier import Carrier
+
+from praxis.backend.utils.plr_inspection import (
+    ClassCatalog,
+    get_all_carrier_classes,
+    get_class_catalog,
+    get_deck_classes,
+    reset_class_catalog,
+)
+from praxis.backend.utils.plr_inspection.catalog import package_fingerprint
+
+FILES = {
+    "__init__.py": "",
+    "base.py": """
+        import abc
+
+        class Base(abc.ABC):
+            @abc.abstractmethod
+            def run(self): ...
+
+        class Other:
+            pass
+    """,
+    "devices/__init__.py": "",
+    "devices/pump.py": """
+        from catalog_pkg.base import Base
+
+        class Pump(Base):
+            def run(self):
+                return "pumping"
+    """,
+    "devices/pump_tests.py": """
+        raise RuntimeError("test modules must not be imported")
+    """,
+}
+
+
+@pytest.fixture
+def fake_package(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    root = tmp_path / "src"
+    for relative, source in FILES.items():
+        path = root / "catalog_pkg" / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(textwrap.dedent(source))
+    monkeypatch.syspath_prepend(str(root))
+    yield root / "catalog_pkg"
+    for name in [m for m in sys.modules if m.split(".")[0] == "catalog_pkg"]:
+        del sys.modules[name]
+
+
+def test_build_indexes_classes_by_base(fake_package: Path) -> None:
+    catalog = ClassCatalog.build("catalog_pkg")
+
+    assert len(catalog) == 3
+    assert {r.fqn for r in catalog.records("catalog_pkg.base.Base")} == {
+        "catalog_pkg.base.Base",
+        "catalog_pkg.devices.pump.Pump",
+    }
+    assert [r.fqn for r in catalog.records("catalog_pkg.base.Base", concrete_only=True)] == [
+        "catalog_pkg.devices.pump.Pump",
+    ]
+    assert [r.fqn for r in catalog.records(modules="catalog_pkg.devices")] == [
+        "catalog_pkg.devices.pump.Pump",
+    ]
+    assert "catalog_pkg.devices.pump_tests" not in sys.modules
+
+
+def test_manifest_answers_queries_without_walking(fake_package: Path, tmp_path: Path) -> None:
+    cache_dir = tmp_path / "cache"
+    first = ClassCatalog.load("catalog_pkg", cache_dir=cache_dir)
+    assert (cache_dir / "catalog_pkg.json").exists()
+    for name in [m for m in sys.modules if m.split(".")[0] == "catalog_pkg"]:
+        del sys.modules[name]
+
+    with patch.object(ClassCatalog, "build", side_effect=AssertionError("walked")):
+        second = ClassCatalog.load("catalog_pkg", cache_dir=cache_dir)
+        assert second.fingerprint == first.fingerprint
+        assert "catalog_pkg.base" not in sys.modules
+
+        pump = second.classes(modules="catalog_pkg.devices")["catalog_pkg.devices.pump.Pump"]
+
+    assert pump().run() == "pumping"
+    assert "catalog_pkg.devices.pump" in sys.modules
+
+
+def test_manifest_is_rebuilt_when_sources_change(fake_package: Path, tmp_path: Path) -> None:
+    cache_dir = tmp_path / "cache"
+    ClassCatalog.load("catalog_pkg", cache_dir=cache_dir)
+    before = package_fingerprint("catalog_pkg")
+
+    pump = fake_package / "devices" / "pump.py"
+    pump.write_text(pump.read_text() + "\n\nclass Valve(Base):\n    def run(self):\n        pass\n")
+    stat = pump.stat()
+    os.utime(pump, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    del sys.modules["catalog_pkg.devices.pump"]
+
+    assert package_fingerprint("catalog_pkg") != before
+    rebuilt = ClassCatalog.load("catalog_pkg", cache_dir=cache_dir)
+    assert "catalog_pkg.devices.pump.Valve" in {r.fqn for r in rebuilt.records("catalog_pkg.base.Base")}
+
+
+def test_runtime_helpers_share_one_catalog() -> None:
+    reset_class_catalog()
+    with patch.object(ClassCatalog, "load", wraps=ClassCatalog.load) as load:
+        carriers = get_all_carrier_classes()
+        decks = get_deck_classes()
+        assert load.call_count == 1
+
+    assert carriers
+    assert Carrier not in carriers.values()
+    assert all(issubclass(deck, Deck) and deck is not Deck for deck in decks.values())
+    assert set(decks) == set(get_class_catalog().category("deck", concrete_only=True)) - {
+        "pylabrobot.resources.deck.Deck",
+    }
@@ -663,6 +663,65 @@ class TestTypeAnnotationAnalyzer:
     result = analyze_type_hint_string("Plate")
     assert result is None
 
+  def test_type_hint_analysis_is_memoized_by_normalized_hint(self):
+    """Test that spelling variants share one cached, immutable result."""
+    import dataclasses
+    from unittest.mock import patch
+
+    from praxis.backend.utils.plr_static_analysis.type_annotation_analyzer import (
+      analyze_type_hint_string,
+      clear_type_hint_cache,
+    )
+
+    clear_type_hint_cache()
+    with patch("libcst.parse_module", wraps=cst.parse_module) as parse:
+      first = analyze_type_hint_string("Sequence[ Well ] | None")
+      second = analyze_type_hint_string("Sequence[Well]|None")
+      assert parse.call_count == 1
+      assert analyze_type_hint_string("Lid") is None
+      assert parse.call_count == 2
+
+    assert first is second
+    assert first.field_type == "itemized-selector"
+    with pytest.raises(dataclasses.FrozenInstanceError):
+      first.items_x = 24
+
+  def test_common_type_hints_are_seeded_on_first_use(self):
+    """Test that common PLR hints are memoized without parsing each one."""
+    from unittest.mock import patch
+
+    from praxis.backend.utils.plr_static_analysis.type_annotation_analyzer import (
+      analyze_type_hint_string,
+      clear_type_hint_cache,
+    )
+
+    clear_type_hint_cache()
+    with patch("libcst.parse_module", wraps=cst.parse_module) as parse:
+      assert analyze_type_hint_string("Optional[ list[Well] ]").element_type == "Well"
+      assert analyze_type_hint_string("TipRack") is None
+      assert parse.call_count == 0
+
+  def test_type_annotation_analysis_uses_node_and_shares_memo(self):
+    """Test that CST annotations are analysed directly and keyed by their code."""
+    from unittest.mock import patch
+
+    from praxis.backend.utils.plr_static_analysis.type_annotation_analyzer import (
+      analyze_type_annotation,
+      analyze_type_hint_string,
+      clear_type_hint_cache,
+    )
+
+    clear_type_hint_cache()
+    node = cst.parse_expression("list[ TipSpot ]")
+    with patch("libcst.parse_module", wraps=cst.parse_module) as parse:
+      result = analyze_type_annotation(node)
+      assert analyze_type_annotation(cst.parse_expression("list[TipSpot]")) is result
+      assert analyze_type_hint_string("list[TipSpot]") is result
+      assert parse.call_count == 0
+
+    assert result.is_container is True
+    assert result.element_type == "TipSpot"
+
   def test_ansi_sbs_dimensions(self):
     """Test ANSI/SBS plate dimension constants."""
     from praxis.backend.utils.plr_static_analysis.type_annotation_analyzer import (